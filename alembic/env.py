@@ -17,7 +17,8 @@ from bot.database.base import Base
 from bot.database.models import (
     BotConfig, User, SubscriptionPlan, InvitationToken,
     VIPSubscriber, FreeChannelRequest, UserInterest,
-    UserRoleChangeLog, ContentPackage
+    UserRoleChangeLog, ContentPackage, PackageInterestCounter,
+    UserSearchTerm, VIPInviteLink
 )
 from bot.database.enums import UserRole, ContentCategory, RoleChangeReason, PackageType
 
@@ -47,6 +48,23 @@ config.set_main_option("sqlalchemy.url", DATABASE_URL_WITH_DRIVER)
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Exclude search structures managed outside Base.metadata from autogenerate.
+
+    The FTS5 virtual table (and its shadow tables) and the PostgreSQL
+    trigram/tsvector indexes are created by migrations and init_db; without
+    this filter autogenerate would propose dropping them.
+    """
+    from bot.database.search import CONTENT_FTS_TABLE, UNMANAGED_INDEXES
+
+    if type_ == "table" and reflected and name.startswith(CONTENT_FTS_TABLE):
+        return False
+    if type_ == "index" and reflected and name in UNMANAGED_INDEXES:
+        return False
+    return True
+
+
 def get_engine() -> AsyncEngine:
     """
     Create async engine for Alembic migrations.
@@ -102,6 +120,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -115,6 +134,7 @@ def do_run_migrations(connection):
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
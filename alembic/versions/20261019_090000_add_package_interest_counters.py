@@ -0,0 +1,50 @@
+"""Add package interest counters
+
+Revision ID: a7c3e91d2b40
+Revises: 29019dace4c7
+Create Date: 2026-10-19 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91d2b40'
+down_revision: Union[str, None] = '29019dace4c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('package_interest_counters',
+    sa.Column('package_id', sa.Integer(), nullable=False),
+    sa.Column('total_interests', sa.Integer(), nullable=False),
+    sa.Column('pending_interests', sa.Integer(), nullable=False),
+    sa.Column('last_interest_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['package_id'], ['content_packages.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('package_id')
+    )
+    op.create_index('idx_interest_counter_pending', 'package_interest_counters', ['pending_interests'], unique=False)
+
+    # Backfill desde user_interests existentes (un solo GROUP BY)
+    op.execute("""
+        INSERT INTO package_interest_counters
+            (package_id, total_interests, pending_interests, last_interest_at, updated_at)
+        SELECT
+            package_id,
+            COUNT(*),
+            SUM(CASE WHEN is_attended THEN 0 ELSE 1 END),
+            MAX(created_at),
+            CURRENT_TIMESTAMP
+        FROM user_interests
+        GROUP BY package_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_interest_counter_pending', table_name='package_interest_counters')
+    op.drop_table('package_interest_counters')
@@ -0,0 +1,90 @@
+"""Add user search terms index
+
+Revision ID: c41f8e2a9d17
+Revises: a7c3e91d2b40
+Create Date: 2026-10-19 09:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f8e2a9d17'
+down_revision: Union[str, None] = 'a7c3e91d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.create_table('user_search_terms',
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('term', sa.String(length=100), nullable=False),
+    sa.Column('field', sa.String(length=10), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'term', 'field')
+    )
+    op.create_index('idx_user_search_term', 'user_search_terms', ['term', 'field'], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Prefijo con LIKE 'q%' independiente de la collation + trigramas para búsqueda difusa
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX idx_user_search_term_pattern "
+            "ON user_search_terms (term varchar_pattern_ops)"
+        )
+        op.execute(
+            "CREATE INDEX idx_user_search_term_trgm "
+            "ON user_search_terms USING gin (term gin_trgm_ops)"
+        )
+
+    _backfill_terms(bind)
+
+
+def _backfill_terms(bind) -> None:
+    """Indexa usuarios existentes por lotes (keyset sobre user_id)."""
+    from bot.database.search import build_user_search_terms
+
+    terms_table = sa.table(
+        'user_search_terms',
+        sa.column('user_id', sa.BigInteger()),
+        sa.column('term', sa.String()),
+        sa.column('field', sa.String()),
+    )
+
+    last_user_id = None
+    while True:
+        query = "SELECT user_id, username, first_name, last_name FROM users"
+        params = {"limit": BACKFILL_BATCH_SIZE}
+        if last_user_id is not None:
+            query += " WHERE user_id > :last_user_id"
+            params["last_user_id"] = last_user_id
+        query += " ORDER BY user_id LIMIT :limit"
+
+        rows = bind.execute(sa.text(query), params).fetchall()
+        if not rows:
+            break
+
+        records = [
+            {"user_id": user_id, "term": term, "field": field}
+            for user_id, username, first_name, last_name in rows
+            for term, field in build_user_search_terms(username, first_name, last_name)
+        ]
+        if records:
+            op.bulk_insert(terms_table, records)
+
+        last_user_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_user_search_term_trgm")
+        op.execute("DROP INDEX IF EXISTS idx_user_search_term_pattern")
+    op.drop_index('idx_user_search_term', table_name='user_search_terms')
+    op.drop_table('user_search_terms')
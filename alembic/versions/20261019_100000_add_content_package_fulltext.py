@@ -0,0 +1,44 @@
+"""Add full-text search index for content packages
+
+Revision ID: e5b27d6c0f93
+Revises: c41f8e2a9d17
+Create Date: 2026-10-19 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b27d6c0f93'
+down_revision: Union[str, None] = 'c41f8e2a9d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    from bot.database.search import CONTENT_TSVECTOR_SQL, create_content_fts_sql
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Índice GIN de expresión: ContentService usa la misma expresión
+        op.execute(
+            "CREATE INDEX idx_content_packages_fts ON content_packages "
+            f"USING gin (({CONTENT_TSVECTOR_SQL}))"
+        )
+    elif bind.dialect.name == 'sqlite':
+        # Tabla virtual FTS5 (rowid = content_packages.id) + carga inicial
+        for statement in create_content_fts_sql():
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    from bot.database.search import CONTENT_FTS_TABLE
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_content_packages_fts")
+    elif bind.dialect.name == 'sqlite':
+        op.execute(f"DROP TABLE IF EXISTS {CONTENT_FTS_TABLE}")
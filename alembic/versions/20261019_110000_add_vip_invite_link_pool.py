@@ -0,0 +1,41 @@
+"""Add VIP invite link pool
+
+Revision ID: 8d2f6a1c4b57
+Revises: e5b27d6c0f93
+Create Date: 2026-10-19 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f6a1c4b57'
+down_revision: Union[str, None] = 'e5b27d6c0f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('vip_invite_link_pool',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('channel_id', sa.String(length=50), nullable=False),
+    sa.Column('invite_link', sa.String(length=255), nullable=False),
+    sa.Column('expire_date', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('claimed_by', sa.BigInteger(), nullable=True),
+    sa.Column('claimed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('invite_link')
+    )
+    op.create_index(
+        'idx_invite_pool_available', 'vip_invite_link_pool',
+        ['channel_id', 'claimed_by', 'expire_date'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_invite_pool_available', table_name='vip_invite_link_pool')
+    op.drop_table('vip_invite_link_pool')
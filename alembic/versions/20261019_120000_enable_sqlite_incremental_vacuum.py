@@ -0,0 +1,40 @@
+"""Enable SQLite incremental auto_vacuum
+
+Revision ID: 3b9e4f7a2c18
+Revises: 8d2f6a1c4b57
+Create Date: 2026-10-19 12:00:00.000000+00:00
+
+auto_vacuum only changes on an existing database after a full VACUUM,
+which cannot run inside a transaction. On large databases this upgrade
+rewrites the whole file once; afterwards the maintenance job reclaims
+free pages with PRAGMA incremental_vacuum. No-op on PostgreSQL.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e4f7a2c18'
+down_revision: Union[str, None] = '8d2f6a1c4b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _set_auto_vacuum(mode: str) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(f'PRAGMA auto_vacuum={mode}'))
+        op.execute(sa.text('VACUUM'))
+
+
+def upgrade() -> None:
+    _set_auto_vacuum('INCREMENTAL')
+
+
+def downgrade() -> None:
+    _set_auto_vacuum('NONE')
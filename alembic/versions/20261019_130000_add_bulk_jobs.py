@@ -0,0 +1,67 @@
+"""Add bulk admin operation jobs
+
+Revision ID: 6c1d8e3f5a92
+Revises: 3b9e4f7a2c18
+Create Date: 2026-10-19 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1d8e3f5a92'
+down_revision: Union[str, None] = '3b9e4f7a2c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('bulk_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('operation', sa.String(length=30), nullable=False),
+    sa.Column('params', sa.JSON(), nullable=True),
+    sa.Column('target_filter', sa.String(length=30), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('created_by', sa.BigInteger(), nullable=False),
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('progress_message_id', sa.Integer(), nullable=True),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('succeeded', sa.Integer(), nullable=False),
+    sa.Column('failed', sa.Integer(), nullable=False),
+    sa.Column('skipped', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_bulk_jobs_status'), 'bulk_jobs', ['status'], unique=False)
+
+    op.create_table('bulk_job_targets',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['bulk_jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'idx_bulk_target_job_status', 'bulk_job_targets',
+        ['job_id', 'status', 'id'], unique=False
+    )
+    op.create_index(
+        'idx_bulk_target_job_user', 'bulk_job_targets',
+        ['job_id', 'user_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_bulk_target_job_user', table_name='bulk_job_targets')
+    op.drop_index('idx_bulk_target_job_status', table_name='bulk_job_targets')
+    op.drop_table('bulk_job_targets')
+    op.drop_index(op.f('ix_bulk_jobs_status'), table_name='bulk_jobs')
+    op.drop_table('bulk_jobs')
@@ -1,16 +1,68 @@
 """
 Background Tasks - Module for automatic scheduled tasks.
 
-Exports functions to start and stop the scheduler.
+Exports functions to start and stop the scheduler, the admin
+notification dispatcher, the Free join request ingestor, the data
+retention pipeline, the admin data exports and bulk admin jobs.
 """
 from bot.background.tasks import (
     start_background_tasks,
     stop_background_tasks,
     get_scheduler_status
 )
+from bot.background.notifications import (
+    AdminNotificationDispatcher,
+    start_notification_dispatcher,
+    stop_notification_dispatcher,
+    get_notification_dispatcher,
+    get_notification_stats
+)
+from bot.background.join_ingest import (
+    JoinRequestIngestor,
+    start_join_ingestor,
+    stop_join_ingestor,
+    get_join_ingestor,
+    get_join_ingest_stats,
+    invalidate_join_ingest_config
+)
+from bot.background.retention import (
+    RetentionPipeline,
+    RetentionPolicy,
+    get_retention_pipeline,
+    get_retention_stats
+)
+from bot.background.exports import (
+    start_export,
+    get_export_stats
+)
+from bot.background.bulk_jobs import (
+    start_bulk_job,
+    resume_bulk_jobs,
+    get_bulk_job_stats
+)
 
 __all__ = [
     "start_background_tasks",
     "stop_background_tasks",
-    "get_scheduler_status"
+    "get_scheduler_status",
+    "AdminNotificationDispatcher",
+    "start_notification_dispatcher",
+    "stop_notification_dispatcher",
+    "get_notification_dispatcher",
+    "get_notification_stats",
+    "JoinRequestIngestor",
+    "start_join_ingestor",
+    "stop_join_ingestor",
+    "get_join_ingestor",
+    "get_join_ingest_stats",
+    "invalidate_join_ingest_config",
+    "RetentionPipeline",
+    "RetentionPolicy",
+    "get_retention_pipeline",
+    "get_retention_stats",
+    "start_export",
+    "get_export_stats",
+    "start_bulk_job",
+    "resume_bulk_jobs",
+    "get_bulk_job_stats"
 ]
@@ -0,0 +1,271 @@
+"""
+Bulk Jobs - Ejecución en background de operaciones masivas de admin.
+
+Cada job confirmado corre como tarea (start_bulk_job()): toma lotes de
+objetivos pendientes, los aplica con BulkOperationService y guarda el
+resultado en la misma transacción que los cambios del lote. El mensaje de
+progreso del chat admin se edita como máximo cada
+BULK_PROGRESS_INTERVAL_SECONDS con procesados, resultados y throughput.
+
+Al terminar se reporta el resumen y, si hubo fallidos u omitidos, un CSV
+con el motivo por usuario. Los jobs que quedaron en "running" por un
+reinicio se reanudan desde los pendientes (resume_bulk_jobs() al arrancar);
+un job fallido se puede reanudar con el botón del mensaje de error.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from aiogram import Bot
+from aiogram.types import FSInputFile
+from sqlalchemy import select
+
+from bot.database import get_session
+from bot.database.models import BulkJob, BulkJobTarget
+from bot.database.streaming import stream_partitions
+from bot.services.bulk_operations import OPERATIONS, BotApiLimiter, BulkOperationService
+from bot.utils.exports import write_csv_tempfile_async
+from bot.utils.keyboards import create_inline_keyboard
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Jobs en curso (job_id → tarea) y últimos reportes
+_running: Dict[int, asyncio.Task] = {}
+_history: deque = deque(maxlen=20)
+_runs = 0
+_failures = 0
+
+
+def describe_job(job: BulkJob) -> str:
+    """Descripción corta: "Extender VIP +3 días", "Cambiar rol a FREE"..."""
+    label = OPERATIONS.get(job.operation, job.operation)
+    if job.operation == "extend_vip":
+        return f"{label} +{job.params['days']} días"
+    if job.operation == "change_role":
+        return f"{label} a {job.params['role']}"
+    return label
+
+
+def _counts_text(job: BulkJob) -> str:
+    return f"✅ {job.succeeded:,}  ❌ {job.failed:,}  ⏭️ {job.skipped:,}"
+
+
+async def _edit(bot: Bot, job: BulkJob, text: str, reply_markup=None) -> None:
+    """Edita el mensaje de progreso (o envía uno nuevo si no hay)."""
+    try:
+        if job.progress_message_id:
+            await bot.edit_message_text(
+                text, chat_id=job.chat_id, message_id=job.progress_message_id,
+                reply_markup=reply_markup, parse_mode="HTML"
+            )
+        else:
+            await bot.send_message(job.chat_id, text, reply_markup=reply_markup, parse_mode="HTML")
+    except Exception as e:
+        logger.debug(f"No se pudo actualizar el progreso del job #{job.id}: {e}")
+
+
+async def _send_issues_csv(bot: Bot, job: BulkJob, session_factory: Callable) -> None:
+    """CSV con los objetivos fallidos u omitidos y su motivo."""
+    async with session_factory() as session:
+        stmt = (
+            select(BulkJobTarget.user_id, BulkJobTarget.status, BulkJobTarget.error)
+            .where(BulkJobTarget.job_id == job.id, BulkJobTarget.status != "done")
+            .order_by(BulkJobTarget.id)
+        )
+
+        async def rows():
+            async for partition in stream_partitions(session, stmt):
+                for row in partition:
+                    yield tuple(row)
+
+        path, _ = await write_csv_tempfile_async(
+            ["user_id", "status", "error"], rows(), prefix=f"bulk_{job.id}_"
+        )
+
+    try:
+        await bot.send_document(
+            job.chat_id,
+            FSInputFile(path, filename=f"operacion_{job.id}_incidencias.csv"),
+            caption=f"📄 Fallidos y omitidos de la operación #{job.id}"
+        )
+    finally:
+        os.remove(path)
+
+
+async def run_bulk_job(
+    bot: Bot,
+    job_id: int,
+    session_factory: Callable = get_session
+) -> Optional[dict]:
+    """
+    Procesa un job hasta agotar sus objetivos pendientes.
+
+    Args:
+        bot: Instancia del bot
+        job_id: ID del job (draft, running o failed)
+        session_factory: Fábrica de sesiones (default: get_session)
+
+    Returns:
+        Reporte con job_id, status, processed (en esta ejecución),
+        succeeded, failed, skipped, duration_ms y per_second;
+        None si el job no existe o ya terminó
+    """
+    global _runs, _failures
+
+    async with session_factory() as session:
+        job = await BulkOperationService(session, bot).start_job(job_id)
+        if job is None:
+            return None
+        await session.commit()
+        title = f"⚙️ <b>Operación #{job.id}</b>: {describe_job(job)}"
+
+    limiter = BotApiLimiter(Config.BULK_BOT_API_CONCURRENCY, Config.BULK_BOT_API_RATE)
+    interval = max(0, Config.BULK_PROGRESS_INTERVAL_SECONDS)
+    started = time.perf_counter()
+    last_progress = time.monotonic()
+    processed = 0
+    status = "completed"
+    error = None
+
+    logger.info(f"⚙️ Job masivo #{job_id} en ejecución: {describe_job(job)} ({job.total} objetivos)")
+
+    try:
+        while True:
+            async with session_factory() as session:
+                service = BulkOperationService(session, bot)
+                job = await service.get_job(job_id)
+                batch = await service.next_batch(job_id, Config.BULK_BATCH_SIZE)
+                if not batch:
+                    break
+                results = await service.apply_batch(job, batch, limiter)
+                await service.record_results(job_id, results)
+                await session.commit()
+                await session.refresh(job)
+
+            processed += len(batch)
+            if time.monotonic() - last_progress >= interval:
+                last_progress = time.monotonic()
+                done = job.succeeded + job.failed + job.skipped
+                percent = done * 100 // job.total if job.total else 100
+                elapsed = time.perf_counter() - started
+                await _edit(bot, job, (
+                    f"{title}\n\n"
+                    f"<i>{done:,} de {job.total:,} ({percent}%)</i>\n"
+                    f"{_counts_text(job)}\n"
+                    f"⚡ {processed / elapsed if elapsed else 0:,.0f} usuarios/s"
+                ))
+
+    except Exception as e:
+        status = "failed"
+        error = str(e)
+        logger.error(f"❌ Job masivo #{job_id} falló: {e}", exc_info=True)
+
+    async with session_factory() as session:
+        job = await BulkOperationService(session, bot).finish_job(job_id, status)
+        await session.commit()
+
+    elapsed = time.perf_counter() - started
+    report = {
+        "job_id": job_id,
+        "operation": job.operation,
+        "status": status,
+        "processed": processed,
+        "succeeded": job.succeeded,
+        "failed": job.failed,
+        "skipped": job.skipped,
+        "duration_ms": round(elapsed * 1000, 1),
+        "per_second": round(processed / elapsed, 1) if elapsed > 0 else float(processed),
+    }
+    _history.append(report)
+
+    if status == "failed":
+        _failures += 1
+        await _edit(
+            bot, job,
+            f"{title}\n\n❌ <b>Detenida por un error</b>\n<code>{error[:300]}</code>\n\n"
+            f"{_counts_text(job)}\nLos pendientes se conservan.",
+            reply_markup=create_inline_keyboard([
+                [{"text": "🔁 Reanudar", "callback_data": f"bulk:resume:{job_id}"}]
+            ])
+        )
+        return report
+
+    _runs += 1
+    await _edit(bot, job, (
+        f"{title}\n\n✅ <b>Completada</b>: {job.total:,} objetivos\n"
+        f"{_counts_text(job)}\n"
+        f"⏱️ {elapsed:.1f}s ({report['per_second']:,} usuarios/s)"
+    ))
+    if job.failed or job.skipped:
+        try:
+            await _send_issues_csv(bot, job, session_factory)
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo enviar el CSV de incidencias del job #{job_id}: {e}")
+
+    logger.info(
+        f"✅ Job masivo #{job_id} completado: {job.succeeded} ok, {job.failed} fallidos, "
+        f"{job.skipped} omitidos en {report['duration_ms']:.0f} ms"
+    )
+    return report
+
+
+def start_bulk_job(bot: Bot, job_id: int, session_factory: Callable = get_session) -> bool:
+    """
+    Lanza un job en background.
+
+    Args:
+        bot: Instancia del bot
+        job_id: ID del job
+        session_factory: Fábrica de sesiones (default: get_session)
+
+    Returns:
+        False si el job ya está en ejecución en este proceso
+    """
+    task = _running.get(job_id)
+    if task is not None and not task.done():
+        return False
+
+    task = asyncio.create_task(
+        run_bulk_job(bot, job_id, session_factory), name=f"bulk-job-{job_id}"
+    )
+    task.add_done_callback(lambda _: _running.pop(job_id, None))
+    _running[job_id] = task
+    return True
+
+
+async def resume_bulk_jobs(bot: Bot, session_factory: Callable = get_session) -> int:
+    """
+    Reanuda los jobs que quedaron en "running" (reinicio a mitad).
+
+    Returns:
+        Número de jobs reanudados
+    """
+    async with session_factory() as session:
+        job_ids = await BulkOperationService(session, bot).get_resumable_job_ids()
+
+    for job_id in job_ids:
+        start_bulk_job(bot, job_id, session_factory)
+    if job_ids:
+        logger.info(f"🔁 {len(job_ids)} job(s) masivo(s) reanudado(s): {job_ids}")
+    return len(job_ids)
+
+
+def get_bulk_job_stats() -> dict:
+    """
+    Métricas de operaciones masivas.
+
+    Returns:
+        Dict con runs, failures, running y last (último reporte o None)
+    """
+    tasks = list(_running.values())
+    history = list(_history)
+    return {
+        "runs": _runs,
+        "failures": _failures,
+        "running": sum(1 for task in tasks if not task.done()),
+        "last": history[-1] if history else None,
+    }
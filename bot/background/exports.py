@@ -0,0 +1,356 @@
+"""
+Data Exports - Exporte completo de tablas como CSV comprimido.
+
+Los listados del panel admin paginan de 10 en 10: sacar 20k suscriptores
+VIP para contabilidad eran cientos de clics y de consultas.
+
+Cada exporte (ver EXPORTS) recorre su consulta con un cursor del servidor
+(stream_partitions, lotes de EXPORT_BATCH_SIZE filas), escribe el CSV
+incrementalmente en un .csv.gz temporal y lo envía como documento: la
+memoria no depende del tamaño de la tabla.
+
+Corre como tarea en background (start_export()): el handler responde de
+inmediato y la tarea edita el mensaje de estado con el progreso (como
+máximo cada EXPORT_PROGRESS_INTERVAL_SECONDS) y al final reporta filas,
+tiempo y tamaño. Un exporte a la vez por chat.
+"""
+import asyncio
+import enum
+import json
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.types import FSInputFile
+from sqlalchemy import Select, func, select
+
+from bot.database import get_session
+from bot.database.models import (
+    InvitationToken,
+    SubscriptionPlan,
+    User,
+    UserRoleChangeLog,
+    VIPSubscriber,
+)
+from bot.database.streaming import stream_partitions
+from bot.utils.exports import write_csv_gzip_tempfile_async
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Límite de documentos enviados por bots (Bot API)
+TELEGRAM_DOCUMENT_LIMIT = 50 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """
+    Definición de un exporte.
+
+    Attributes:
+        kind: Identificador (callback export:<kind>)
+        title: Nombre para mensajes
+        filename: Prefijo del archivo enviado
+        header: Columnas del CSV (mismo orden que la consulta)
+        query: Consulta completa (ordenada por clave)
+        count: Consulta COUNT para el porcentaje de progreso
+    """
+    kind: str
+    title: str
+    filename: str
+    header: Tuple[str, ...]
+    query: Callable[[], Select]
+    count: Callable[[], Select]
+
+
+def _vip_query() -> Select:
+    """Suscriptores con datos del usuario y la tarifa del token canjeado."""
+    return (
+        select(
+            VIPSubscriber.user_id,
+            User.username,
+            User.first_name,
+            VIPSubscriber.status,
+            VIPSubscriber.join_date,
+            VIPSubscriber.expiry_date,
+            SubscriptionPlan.name,
+            SubscriptionPlan.price,
+            SubscriptionPlan.currency,
+            VIPSubscriber.token_id,
+        )
+        .outerjoin(User, User.user_id == VIPSubscriber.user_id)
+        .outerjoin(InvitationToken, InvitationToken.id == VIPSubscriber.token_id)
+        .outerjoin(SubscriptionPlan, SubscriptionPlan.id == InvitationToken.plan_id)
+        .order_by(VIPSubscriber.id)
+    )
+
+
+def _tokens_query() -> Select:
+    return (
+        select(
+            InvitationToken.id,
+            InvitationToken.token,
+            SubscriptionPlan.name,
+            InvitationToken.duration_hours,
+            InvitationToken.generated_by,
+            InvitationToken.created_at,
+            InvitationToken.used,
+            InvitationToken.used_by,
+            InvitationToken.used_at,
+        )
+        .outerjoin(SubscriptionPlan, SubscriptionPlan.id == InvitationToken.plan_id)
+        .order_by(InvitationToken.id)
+    )
+
+
+EXPORTS: Dict[str, ExportSpec] = {
+    spec.kind: spec for spec in (
+        ExportSpec(
+            kind="vip",
+            title="Suscriptores VIP",
+            filename="suscriptores_vip",
+            header=("user_id", "username", "first_name", "status", "join_date_utc",
+                    "expiry_date_utc", "plan", "price", "currency", "token_id"),
+            query=_vip_query,
+            count=lambda: select(func.count(VIPSubscriber.id)),
+        ),
+        ExportSpec(
+            kind="users",
+            title="Usuarios",
+            filename="usuarios",
+            header=("user_id", "username", "first_name", "last_name", "role", "created_at_utc"),
+            query=lambda: select(
+                User.user_id, User.username, User.first_name,
+                User.last_name, User.role, User.created_at,
+            ).order_by(User.user_id),
+            count=lambda: select(func.count(User.user_id)),
+        ),
+        ExportSpec(
+            kind="tokens",
+            title="Tokens de invitación",
+            filename="tokens",
+            header=("id", "token", "plan", "duration_hours", "generated_by", "created_at_utc",
+                    "used", "used_by", "used_at_utc"),
+            query=_tokens_query,
+            count=lambda: select(func.count(InvitationToken.id)),
+        ),
+        ExportSpec(
+            kind="role_log",
+            title="Cambios de rol",
+            filename="cambios_de_rol",
+            header=("id", "user_id", "previous_role", "new_role", "changed_by", "reason",
+                    "change_source", "change_metadata", "changed_at_utc"),
+            query=lambda: select(
+                UserRoleChangeLog.id, UserRoleChangeLog.user_id,
+                UserRoleChangeLog.previous_role, UserRoleChangeLog.new_role,
+                UserRoleChangeLog.changed_by, UserRoleChangeLog.reason,
+                UserRoleChangeLog.change_source, UserRoleChangeLog.change_metadata,
+                UserRoleChangeLog.changed_at,
+            ).order_by(UserRoleChangeLog.id),
+            count=lambda: select(func.count(UserRoleChangeLog.id)),
+        ),
+    )
+}
+
+# Exportes en curso (chat_id → tarea) y últimos reportes
+_running: Dict[int, asyncio.Task] = {}
+_history: deque = deque(maxlen=20)
+_runs = 0
+_failures = 0
+
+
+def _cell(value: Any) -> Any:
+    """Valor de la BD → celda CSV (fechas ISO, enums por valor, JSON)."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+async def export_to_file(
+    kind: str,
+    on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    session_factory: Callable = get_session
+) -> dict:
+    """
+    Exporta una tabla completa a un .csv.gz temporal.
+
+    Args:
+        kind: Clave de EXPORTS
+        on_progress: Callback (filas escritas, total) cada
+            EXPORT_PROGRESS_INTERVAL_SECONDS como máximo
+        session_factory: Fábrica de sesiones (default: get_session)
+
+    Returns:
+        Reporte con kind, path, filename, rows, bytes, duration_ms y
+        rows_per_second. El llamador elimina `path`.
+
+    Raises:
+        ValueError: Si kind no existe
+    """
+    spec = EXPORTS.get(kind)
+    if spec is None:
+        raise ValueError(f"Exporte desconocido: {kind}")
+
+    started = time.perf_counter()
+    interval = max(0, Config.EXPORT_PROGRESS_INTERVAL_SECONDS)
+
+    async with session_factory() as session:
+        total = (await session.execute(spec.count())).scalar_one()
+
+        async def rows():
+            written = 0
+            last_progress = time.monotonic()
+            async for partition in stream_partitions(
+                session, spec.query(), batch_size=Config.EXPORT_BATCH_SIZE
+            ):
+                for row in partition:
+                    yield [_cell(value) for value in row]
+                written += len(partition)
+                if on_progress is not None and time.monotonic() - last_progress >= interval:
+                    last_progress = time.monotonic()
+                    await on_progress(written, total)
+
+        path, count = await write_csv_gzip_tempfile_async(
+            spec.header, rows(),
+            prefix=f"{spec.filename}_",
+            compresslevel=Config.EXPORT_COMPRESS_LEVEL
+        )
+
+    elapsed = time.perf_counter() - started
+    return {
+        "kind": kind,
+        "path": path,
+        "filename": f"{spec.filename}_{datetime.utcnow().strftime('%Y%m%d-%H%M')}.csv.gz",
+        "rows": count,
+        "bytes": os.path.getsize(path),
+        "duration_ms": round(elapsed * 1000, 1),
+        "rows_per_second": round(count / elapsed) if elapsed > 0 else count,
+    }
+
+
+def _progress_text(spec: ExportSpec, written: int, total: int) -> str:
+    percent = f" ({written * 100 // total}%)" if total else ""
+    return (
+        f"📤 <b>Exportando {spec.title}</b>\n\n"
+        f"<i>{written:,} de {total:,} filas{percent}...</i>"
+    )
+
+
+async def _run_export(bot: Bot, chat_id: int, message_id: int, kind: str) -> None:
+    """Tarea de un exporte: progreso, envío del documento y reporte final."""
+    global _runs, _failures
+
+    spec = EXPORTS[kind]
+
+    async def on_progress(written: int, total: int) -> None:
+        try:
+            await bot.edit_message_text(
+                _progress_text(spec, written, total),
+                chat_id=chat_id, message_id=message_id, parse_mode="HTML"
+            )
+        except Exception as e:
+            logger.debug(f"No se pudo editar el progreso del exporte: {e}")
+
+    report = None
+    try:
+        report = await export_to_file(kind, on_progress=on_progress)
+        if report["bytes"] > TELEGRAM_DOCUMENT_LIMIT:
+            raise ValueError(
+                f"El archivo ({report['bytes'] / 1_048_576:.1f} MB) supera el límite "
+                f"de {TELEGRAM_DOCUMENT_LIMIT // 1_048_576} MB de Telegram"
+            )
+
+        summary = (
+            f"✅ <b>{spec.title}</b>: {report['rows']:,} filas\n"
+            f"📦 {report['bytes'] / 1_048_576:.2f} MB (gzip)\n"
+            f"⏱️ {report['duration_ms'] / 1000:.1f}s ({report['rows_per_second']:,} filas/s)"
+        )
+        await bot.send_document(
+            chat_id,
+            FSInputFile(report["path"], filename=report["filename"]),
+            caption=summary,
+            parse_mode="HTML"
+        )
+        await bot.edit_message_text(
+            summary, chat_id=chat_id, message_id=message_id, parse_mode="HTML"
+        )
+
+        _runs += 1
+        _history.append({k: v for k, v in report.items() if k != "path"})
+        logger.info(
+            f"📤 Exporte {kind}: {report['rows']} filas, {report['bytes'] // 1024} KB "
+            f"en {report['duration_ms']:.0f} ms"
+        )
+
+    except Exception as e:
+        _failures += 1
+        logger.error(f"❌ Error exportando {kind}: {e}", exc_info=True)
+        try:
+            await bot.edit_message_text(
+                f"❌ <b>Error exportando {spec.title}</b>\n\n<code>{str(e)[:500]}</code>",
+                chat_id=chat_id, message_id=message_id, parse_mode="HTML"
+            )
+        except Exception:
+            pass
+
+    finally:
+        if report is not None and os.path.exists(report["path"]):
+            os.remove(report["path"])
+        _running.pop(chat_id, None)
+
+
+def start_export(bot: Bot, chat_id: int, message_id: int, kind: str) -> bool:
+    """
+    Lanza un exporte en background.
+
+    Args:
+        bot: Instancia del bot
+        chat_id: Chat que recibe el documento
+        message_id: Mensaje de estado a editar con el progreso
+        kind: Clave de EXPORTS
+
+    Returns:
+        False si ya hay un exporte en curso para ese chat
+
+    Raises:
+        ValueError: Si kind no existe
+    """
+    if kind not in EXPORTS:
+        raise ValueError(f"Exporte desconocido: {kind}")
+
+    task = _running.get(chat_id)
+    if task is not None and not task.done():
+        return False
+
+    _running[chat_id] = asyncio.create_task(
+        _run_export(bot, chat_id, message_id, kind), name=f"export-{kind}-{chat_id}"
+    )
+    return True
+
+
+def get_export_stats() -> dict:
+    """
+    Métricas de exportes.
+
+    Returns:
+        Dict con runs, failures, running y last (último reporte o None)
+    """
+    tasks = list(_running.values())
+    history = list(_history)
+    return {
+        "runs": _runs,
+        "failures": _failures,
+        "running": sum(1 for task in tasks if not task.done()),
+        "last": history[-1] if history else None,
+    }
@@ -0,0 +1,381 @@
+"""
+Join Request Ingestor - Ingesta en lote de ChatJoinRequest del canal Free.
+
+Para picos virales del link del canal Free (miles de solicitudes por
+minuto). En lugar de 6+ sentencias y un commit por solicitud:
+
+1. El handler valida el canal contra config cacheada y llama submit()
+   (sin tocar la BD); los repetidos del mismo usuario se deduplican
+2. Cada Config.JOIN_INGEST_FLUSH_MS (o al llenar un lote) se escribe el
+   lote completo en una transacción (SubscriptionService.register_free_requests_bulk)
+3. Los avisos al usuario (nueva/duplicada) se envían tras el commit con
+   concurrencia acotada, usando wait_time y redes sociales cacheadas
+
+Se activa con Config.JOIN_INGEST_FLUSH_MS > 0.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from aiogram import Bot
+
+from bot.database import get_session
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Ingestor global (uno por proceso)
+_ingestor: Optional["JoinRequestIngestor"] = None
+
+
+@dataclass
+class JoinConfigSnapshot:
+    """Config necesaria para validar y responder, cacheada por TTL."""
+    free_channel_id: Optional[str]
+    wait_time_minutes: int
+    social_links: Dict[str, str]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class JoinRequestIngestor:
+    """
+    Buffer de solicitudes Free con flush periódico en lote.
+
+    Uso:
+        ingestor = JoinRequestIngestor(bot, flush_ms=500)
+        await ingestor.start()
+        ingestor.submit(user_id, username, first_name, last_name)
+        await ingestor.stop()
+    """
+
+    # Vigencia de la config cacheada (segundos)
+    CONFIG_TTL_SECONDS = 30
+
+    def __init__(
+        self,
+        bot: Bot,
+        flush_ms: int = 500,
+        max_batch: int = 500,
+        ack_concurrency: int = 10,
+        session_factory: Callable = get_session
+    ):
+        """
+        Inicializa el ingestor.
+
+        Args:
+            bot: Instancia del bot
+            flush_ms: Intervalo de flush (milisegundos)
+            max_batch: Solicitudes máximas por transacción (un lote lleno fuerza flush)
+            ack_concurrency: Avisos simultáneos máximos a usuarios
+            session_factory: Fábrica de sesiones (default: get_session)
+        """
+        self.bot = bot
+        self.flush_interval = max(1, flush_ms) / 1000
+        self.max_batch = max(1, max_batch)
+        self._session_factory = session_factory
+        self._ack_semaphore = asyncio.Semaphore(max(1, ack_concurrency))
+
+        # user_id → (username, first_name, last_name); el último perfil gana
+        self._buffer: Dict[int, Tuple[Optional[str], str, Optional[str]]] = {}
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._config: Optional[JoinConfigSnapshot] = None
+        self._config_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._ack_tasks: Set[asyncio.Task] = set()
+
+        self.received = 0
+        self.deduplicated = 0
+        self.flushed = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.acks_sent = 0
+        self.acks_failed = 0
+        self.last_flush_ms = 0.0
+        self._flush_ms_total = 0.0
+
+    # ===== CICLO DE VIDA =====
+
+    @property
+    def running(self) -> bool:
+        """True si el loop de flush está activo."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Carga la config y lanza el loop de flush."""
+        if self.running:
+            return
+        await self.get_config()
+        self._task = asyncio.create_task(self._flush_loop(), name="join-ingest-flush")
+        logger.info(
+            f"✅ Ingesta de solicitudes Free en lote iniciada "
+            f"(flush cada {self.flush_interval * 1000:.0f} ms, lote máx {self.max_batch})"
+        )
+
+    async def stop(self) -> None:
+        """Detiene el loop, escribe lo pendiente y espera los avisos en curso."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        while self._buffer:
+            if not await self.flush():
+                break
+        if self._ack_tasks:
+            await asyncio.gather(*self._ack_tasks, return_exceptions=True)
+        logger.info("✅ Ingesta de solicitudes Free detenida")
+
+    # ===== CONFIG CACHEADA =====
+
+    async def get_config(self) -> JoinConfigSnapshot:
+        """
+        Config del canal Free (ID, tiempo de espera, redes) con TTL.
+
+        Un solo lector recarga cuando expira; el resto usa la copia vigente.
+        """
+        snapshot = self._config
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < self.CONFIG_TTL_SECONDS:
+            return snapshot
+
+        async with self._config_lock:
+            snapshot = self._config
+            if snapshot is not None and time.monotonic() - snapshot.loaded_at < self.CONFIG_TTL_SECONDS:
+                return snapshot
+
+            from bot.services.config import ConfigService
+
+            async with self._session_factory() as session:
+                config_service = ConfigService(session)
+                bot_config = await config_service.get_config()
+                self._config = JoinConfigSnapshot(
+                    free_channel_id=bot_config.free_channel_id or None,
+                    wait_time_minutes=bot_config.wait_time_minutes,
+                    social_links=await config_service.get_social_media_links()
+                )
+            return self._config
+
+    def invalidate_config(self) -> None:
+        """Fuerza recargar la config en el próximo acceso."""
+        self._config = None
+
+    # ===== INGESTA =====
+
+    def submit(
+        self,
+        user_id: int,
+        username: Optional[str],
+        first_name: Optional[str],
+        last_name: Optional[str]
+    ) -> bool:
+        """
+        Agrega una solicitud al buffer sin tocar la BD.
+
+        Args:
+            user_id: ID del usuario
+            username: Username de Telegram
+            first_name: Nombre
+            last_name: Apellido
+
+        Returns:
+            True si es nueva en el buffer, False si se deduplicó
+        """
+        self.received += 1
+        is_new = user_id not in self._buffer
+        if not is_new:
+            self.deduplicated += 1
+        self._buffer[user_id] = (username, first_name or "Usuario", last_name)
+
+        if len(self._buffer) >= self.max_batch:
+            self._wake.set()
+        return is_new
+
+    async def _flush_loop(self) -> None:
+        """Vacía el buffer cada flush_interval o al llenarse un lote."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            while self._buffer:
+                if not await self.flush():
+                    break
+
+    async def flush(self) -> int:
+        """
+        Escribe un lote (hasta max_batch) en una transacción y agenda los avisos.
+
+        Si la transacción falla el lote vuelve al buffer para reintentarse.
+
+        Returns:
+            Solicitudes escritas
+        """
+        async with self._flush_lock:
+            if not self._buffer:
+                return 0
+
+            batch_ids = list(islice(self._buffer, self.max_batch))
+            batch = {user_id: self._buffer.pop(user_id) for user_id in batch_ids}
+            started = time.perf_counter()
+
+            try:
+                from bot.services.subscription import SubscriptionService
+
+                async with self._session_factory() as session:
+                    outcomes = await SubscriptionService(
+                        session, self.bot
+                    ).register_free_requests_bulk(batch)
+                    await session.commit()
+            except Exception as e:
+                self.failed_batches += 1
+                # Reencolar sin pisar solicitudes más recientes del mismo usuario
+                for user_id, profile in batch.items():
+                    self._buffer.setdefault(user_id, profile)
+                logger.error(f"❌ Error escribiendo lote de solicitudes Free: {e}", exc_info=True)
+                return 0
+
+            self.last_flush_ms = (time.perf_counter() - started) * 1000
+            self._flush_ms_total += self.last_flush_ms
+            self.batches += 1
+            self.flushed += len(batch)
+
+        config = await self.get_config()
+        task = asyncio.create_task(self._send_acks(outcomes, config))
+        self._ack_tasks.add(task)
+        task.add_done_callback(self._ack_tasks.discard)
+        return len(batch)
+
+    # ===== AVISOS =====
+
+    async def _send_acks(
+        self,
+        outcomes: Dict[int, Tuple[str, datetime]],
+        config: JoinConfigSnapshot
+    ) -> None:
+        """Envía el aviso de cada solicitud del lote (concurrencia acotada)."""
+        from bot.services.message import get_lucien_voice
+
+        flows = get_lucien_voice().user.flows
+        success_text, keyboard = flows.free_request_success(
+            wait_time_minutes=config.wait_time_minutes,
+            social_links=config.social_links
+        )
+        now = datetime.utcnow()
+
+        async def send(user_id: int, status: str, request_date: datetime) -> None:
+            if status == "created":
+                text, markup = success_text, keyboard
+            else:
+                minutes_since = int((now - request_date).total_seconds() / 60)
+                text = flows.free_request_duplicate(
+                    time_elapsed_minutes=minutes_since,
+                    time_remaining_minutes=max(0, config.wait_time_minutes - minutes_since)
+                )
+                markup = None
+
+            async with self._ack_semaphore:
+                try:
+                    await self.bot.send_message(
+                        chat_id=user_id, text=text, reply_markup=markup, parse_mode="HTML"
+                    )
+                    self.acks_sent += 1
+                except Exception as e:
+                    self.acks_failed += 1
+                    logger.warning(f"⚠️ No se pudo notificar a user {user_id}: {e}")
+
+        await asyncio.gather(*(
+            send(user_id, status, request_date)
+            for user_id, (status, request_date) in outcomes.items()
+        ))
+
+    # ===== MÉTRICAS =====
+
+    def get_stats(self) -> dict:
+        """
+        Métricas de la ingesta.
+
+        Returns:
+            Dict con buffered, received, deduplicated, flushed, batches,
+            failed_batches, acks_sent, acks_failed y tiempos de flush (ms)
+        """
+        return {
+            "running": self.running,
+            "buffered": len(self._buffer),
+            "received": self.received,
+            "deduplicated": self.deduplicated,
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "acks_sent": self.acks_sent,
+            "acks_failed": self.acks_failed,
+            "last_flush_ms": round(self.last_flush_ms, 1),
+            "avg_flush_ms": round(self._flush_ms_total / self.batches, 1) if self.batches else 0.0,
+        }
+
+
+# ===== INGESTOR GLOBAL =====
+
+async def start_join_ingestor(bot: Bot) -> Optional[JoinRequestIngestor]:
+    """
+    Crea e inicia el ingestor global si Config.JOIN_INGEST_FLUSH_MS > 0.
+
+    Args:
+        bot: Instancia del bot
+
+    Returns:
+        Ingestor iniciado, o None si la ingesta en lote está desactivada
+    """
+    global _ingestor
+
+    if Config.JOIN_INGEST_FLUSH_MS <= 0:
+        return None
+
+    if _ingestor is not None and _ingestor.running:
+        logger.warning("⚠️ Ingesta de solicitudes Free ya está corriendo")
+        return _ingestor
+
+    _ingestor = JoinRequestIngestor(
+        bot,
+        flush_ms=Config.JOIN_INGEST_FLUSH_MS,
+        max_batch=Config.JOIN_INGEST_MAX_BATCH,
+        ack_concurrency=Config.JOIN_INGEST_ACK_CONCURRENCY
+    )
+    await _ingestor.start()
+    return _ingestor
+
+
+async def stop_join_ingestor() -> None:
+    """Detiene el ingestor global escribiendo lo pendiente."""
+    global _ingestor
+
+    if _ingestor is None:
+        return
+
+    await _ingestor.stop()
+    _ingestor = None
+
+
+def get_join_ingestor() -> Optional[JoinRequestIngestor]:
+    """Ingestor global si está corriendo, None si no."""
+    if _ingestor is not None and _ingestor.running:
+        return _ingestor
+    return None
+
+
+def invalidate_join_ingest_config() -> None:
+    """Descarta la config cacheada del ingestor global (tras un cambio de admin)."""
+    if _ingestor is not None:
+        _ingestor.invalidate_config()
+
+
+def get_join_ingest_stats() -> dict:
+    """Métricas del ingestor global ({"running": False} si no está activo)."""
+    if _ingestor is None:
+        return {"running": False}
+    return _ingestor.get_stats()
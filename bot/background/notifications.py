@@ -0,0 +1,354 @@
+"""
+Admin Notification Dispatcher - Envío de notificaciones a admins fuera del hot path.
+
+Los handlers encolan la notificación (put_nowait) y responden al usuario
+de inmediato; un pool de workers la entrega con concurrencia acotada.
+
+Modo digest (Config.ADMIN_NOTIFY_DIGEST_SECONDS > 0):
+- Las notificaciones con digest_key se acumulan por admin
+- Cada ventana se envía un único resumen por admin
+  ("12 nuevas expresiones de interés en los últimos 5 min")
+- Si en la ventana llegó solo una, se envía la notificación original
+
+Métricas: profundidad de cola, pendientes de digest, enviados/fallidos/
+descartados y latencia de entrega (encolado → enviado).
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from aiogram import Bot
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Dispatcher global (uno por proceso)
+_dispatcher: Optional["AdminNotificationDispatcher"] = None
+
+# Título y botón del resumen por tipo de notificación
+DIGEST_FORMATS = {
+    "interest": (
+        "nuevas expresiones de interés",
+        InlineKeyboardMarkup(inline_keyboard=[[
+            InlineKeyboardButton(
+                text="📋 Ver Todos los Intereses",
+                callback_data="admin:interests:list:pending"
+            )
+        ]])
+    ),
+}
+
+# Líneas máximas listadas en un resumen
+DIGEST_MAX_LINES = 15
+
+
+@dataclass
+class AdminNotification:
+    """Notificación encolada para un admin."""
+    admin_id: int
+    text: str
+    reply_markup: Optional[InlineKeyboardMarkup] = None
+    digest_key: Optional[str] = None
+    digest_line: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class AdminNotificationDispatcher:
+    """
+    Cola de notificaciones a admins con workers en background.
+
+    Uso:
+        dispatcher = AdminNotificationDispatcher(bot, concurrency=4)
+        await dispatcher.start()
+        dispatcher.notify_admins(text, keyboard, digest_key="interest", digest_line="...")
+        await dispatcher.stop()
+    """
+
+    # Latencias recientes consideradas en las métricas
+    LATENCY_SAMPLES = 500
+
+    def __init__(
+        self,
+        bot: Bot,
+        concurrency: int = 4,
+        digest_seconds: int = 0,
+        max_queue: int = 1000
+    ):
+        """
+        Inicializa el dispatcher.
+
+        Args:
+            bot: Instancia del bot
+            concurrency: Workers (envíos simultáneos máximos)
+            digest_seconds: Ventana de resumen; 0 = envío individual
+            max_queue: Tamaño máximo de la cola (excedentes se descartan)
+        """
+        self.bot = bot
+        self.concurrency = max(1, concurrency)
+        self.digest_seconds = max(0, digest_seconds)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._digest_buffers: Dict[int, List[AdminNotification]] = defaultdict(list)
+        self._tasks: List[asyncio.Task] = []
+        self._latencies_ms: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.digests_sent = 0
+
+    # ===== CICLO DE VIDA =====
+
+    @property
+    def running(self) -> bool:
+        """True si los workers están activos."""
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Lanza los workers (y el flusher de digest si aplica)."""
+        if self.running:
+            return
+
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"admin-notify-{i}")
+            for i in range(self.concurrency)
+        ]
+        if self.digest_seconds:
+            self._tasks.append(
+                asyncio.create_task(self._digest_loop(), name="admin-notify-digest")
+            )
+
+        logger.info(
+            f"✅ Dispatcher de notificaciones iniciado "
+            f"({self.concurrency} workers, digest={self.digest_seconds}s)"
+        )
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Vacía digests pendientes, espera la cola (con timeout) y detiene workers.
+
+        Args:
+            timeout: Segundos máximos esperando entregas pendientes
+        """
+        self._flush_digests()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"⚠️ {self._queue.qsize()} notificación(es) sin entregar al detener dispatcher"
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("✅ Dispatcher de notificaciones detenido")
+
+    # ===== ENCOLADO =====
+
+    def notify_admins(
+        self,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None,
+        digest_key: Optional[str] = None,
+        digest_line: Optional[str] = None,
+        admin_ids: Optional[List[int]] = None
+    ) -> int:
+        """
+        Encola una notificación para cada admin sin esperar el envío.
+
+        Args:
+            text: Texto HTML de la notificación individual
+            reply_markup: Teclado de la notificación individual
+            digest_key: Tipo (clave de DIGEST_FORMATS) si puede resumirse
+            digest_line: Línea que la representa dentro del resumen
+            admin_ids: Destinatarios (default: Config.ADMIN_USER_IDS)
+
+        Returns:
+            Cantidad de notificaciones aceptadas
+        """
+        accepted = 0
+        for admin_id in admin_ids if admin_ids is not None else Config.ADMIN_USER_IDS:
+            notification = AdminNotification(
+                admin_id=admin_id,
+                text=text,
+                reply_markup=reply_markup,
+                digest_key=digest_key,
+                digest_line=digest_line
+            )
+            if self.digest_seconds and digest_key in DIGEST_FORMATS and digest_line:
+                self._digest_buffers[admin_id].append(notification)
+                accepted += 1
+            elif self._enqueue(notification):
+                accepted += 1
+        return accepted
+
+    def _enqueue(self, notification: AdminNotification) -> bool:
+        """Encola sin bloquear; descarta si la cola está llena."""
+        try:
+            self._queue.put_nowait(notification)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(
+                f"⚠️ Cola de notificaciones llena, descartada para admin {notification.admin_id}"
+            )
+            return False
+
+    # ===== DIGEST =====
+
+    async def _digest_loop(self) -> None:
+        """Cada digest_seconds convierte los buffers en resúmenes encolados."""
+        while True:
+            await asyncio.sleep(self.digest_seconds)
+            self._flush_digests()
+
+    def _flush_digests(self) -> None:
+        """Encola un resumen por admin (o la notificación original si es única)."""
+        buffers, self._digest_buffers = self._digest_buffers, defaultdict(list)
+
+        for admin_id, notifications in buffers.items():
+            if len(notifications) == 1:
+                self._enqueue(notifications[0])
+                continue
+
+            by_key: Dict[str, List[AdminNotification]] = defaultdict(list)
+            for notification in notifications:
+                by_key[notification.digest_key].append(notification)
+
+            for digest_key, group in by_key.items():
+                title, keyboard = DIGEST_FORMATS[digest_key]
+                self._enqueue(AdminNotification(
+                    admin_id=admin_id,
+                    text=self._format_digest(title, group),
+                    reply_markup=keyboard,
+                    # Latencia medida desde la notificación más antigua
+                    enqueued_at=group[0].enqueued_at
+                ))
+                self.digests_sent += 1
+
+    def _format_digest(self, title: str, group: List[AdminNotification]) -> str:
+        """Texto del resumen en la voz de Lucien."""
+        minutes = max(1, round(self.digest_seconds / 60))
+        lines = [f"• {n.digest_line}" for n in group[:DIGEST_MAX_LINES]]
+        if len(group) > DIGEST_MAX_LINES:
+            lines.append(f"<i>... y {len(group) - DIGEST_MAX_LINES} más</i>")
+
+        return (
+            f"🎩 <b>Lucien:</b> <i>Resumen de actividad...</i>\n\n"
+            f"<b>📬 {len(group)} {title}</b> en los últimos {minutes} min\n\n"
+            + "\n".join(lines)
+        )
+
+    # ===== ENTREGA =====
+
+    async def _worker(self) -> None:
+        """Consume la cola y envía cada notificación."""
+        while True:
+            notification = await self._queue.get()
+            try:
+                await self.bot.send_message(
+                    chat_id=notification.admin_id,
+                    text=notification.text,
+                    parse_mode="HTML",
+                    reply_markup=notification.reply_markup
+                )
+                self.sent += 1
+                self._latencies_ms.append((time.monotonic() - notification.enqueued_at) * 1000)
+                logger.debug(f"📤 Notificación entregada a admin {notification.admin_id}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(
+                    f"❌ No se pudo notificar a admin {notification.admin_id}: {e}"
+                )
+            finally:
+                self._queue.task_done()
+
+    # ===== MÉTRICAS =====
+
+    def get_stats(self) -> dict:
+        """
+        Métricas del dispatcher.
+
+        Returns:
+            Dict con queue_depth, digest_pending, sent, failed, dropped,
+            digests_sent y latencias de entrega (ms): avg, p95, max
+        """
+        # Copias atómicas: se lee desde el hilo del health server mientras
+        # el loop del bot agrega latencias y vacía los buffers de digest
+        latencies = sorted(list(self._latencies_ms))
+        digest_buffers = list(self._digest_buffers.values())
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else 0.0
+
+        return {
+            "running": self.running,
+            "workers": self.concurrency,
+            "digest_seconds": self.digest_seconds,
+            "queue_depth": self._queue.qsize(),
+            "digest_pending": sum(len(b) for b in digest_buffers),
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "digests_sent": self.digests_sent,
+            "latency_avg_ms": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            "latency_p95_ms": round(p95, 1),
+            "latency_max_ms": round(latencies[-1], 1) if latencies else 0.0,
+        }
+
+
+# ===== DISPATCHER GLOBAL =====
+
+async def start_notification_dispatcher(bot: Bot) -> AdminNotificationDispatcher:
+    """
+    Crea e inicia el dispatcher global con la configuración de Config.
+
+    Args:
+        bot: Instancia del bot
+
+    Returns:
+        Dispatcher iniciado
+    """
+    global _dispatcher
+
+    if _dispatcher is not None and _dispatcher.running:
+        logger.warning("⚠️ Dispatcher de notificaciones ya está corriendo")
+        return _dispatcher
+
+    _dispatcher = AdminNotificationDispatcher(
+        bot,
+        concurrency=Config.ADMIN_NOTIFY_CONCURRENCY,
+        digest_seconds=Config.ADMIN_NOTIFY_DIGEST_SECONDS,
+        max_queue=Config.ADMIN_NOTIFY_QUEUE_SIZE
+    )
+    await _dispatcher.start()
+    return _dispatcher
+
+
+async def stop_notification_dispatcher(timeout: float = 5.0) -> None:
+    """Detiene el dispatcher global entregando lo pendiente (con timeout)."""
+    global _dispatcher
+
+    if _dispatcher is None:
+        return
+
+    await _dispatcher.stop(timeout=timeout)
+    _dispatcher = None
+
+
+def get_notification_dispatcher() -> Optional[AdminNotificationDispatcher]:
+    """Dispatcher global si está corriendo, None si no."""
+    if _dispatcher is not None and _dispatcher.running:
+        return _dispatcher
+    return None
+
+
+def get_notification_stats() -> dict:
+    """Métricas del dispatcher global ({"running": False} si no está activo)."""
+    if _dispatcher is None:
+        return {"running": False}
+    return _dispatcher.get_stats()
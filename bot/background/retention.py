@@ -0,0 +1,304 @@
+"""
+Data Retention - Limpieza por lotes de las tablas que crecen sin límite.
+
+cleanup_old_data solo borraba solicitudes Free procesadas; tokens usados o
+vencidos, el log de cambios de rol, intereses atendidos y suscriptores VIP
+expirados crecían para siempre (y con ellos cada conteo de StatsService).
+
+Cada tabla tiene una política (días a conservar en Config, 0 = desactivada).
+El borrado se hace por lotes de RETENTION_CHUNK_SIZE filas, cada uno en su
+propia transacción, con una pausa de RETENTION_CHUNK_PAUSE_MS entre lotes:
+el lock de escritura de SQLite nunca se retiene mucho tiempo y los handlers
+pueden escribir entre lote y lote.
+
+Con dry_run (o RETENTION_DRY_RUN) solo se cuentan las filas que se
+eliminarían. Cada ejecución registra filas eliminadas, lotes y tiempo por
+tabla (get_retention_stats()).
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, delete, exists, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database import get_session
+from bot.database.models import (
+    FreeChannelRequest,
+    InvitationToken,
+    UserInterest,
+    UserRoleChangeLog,
+    VIPSubscriber,
+)
+from bot.services.interest import InterestService
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Política de retención de una tabla.
+
+    Attributes:
+        table: Nombre de la tabla (para reportes)
+        days_setting: Atributo de Config con los días a conservar
+        model: Modelo con columna id
+        condition: cutoff → condición de filas vencidas
+        purge: Borrado propio (session, days, limit) → filas eliminadas,
+            para tablas con efectos secundarios (contadores)
+    """
+    table: str
+    days_setting: str
+    model: type
+    condition: Callable[[datetime], object]
+    purge: Optional[Callable[[AsyncSession, int, int], Awaitable[int]]] = None
+
+    @property
+    def days(self) -> int:
+        """Días a conservar (0 = política desactivada)."""
+        return getattr(Config, self.days_setting)
+
+
+async def _purge_attended_interests(session: AsyncSession, days: int, limit: int) -> int:
+    """Intereses atendidos: InterestService ajusta los contadores por paquete."""
+    return await InterestService(session, bot=None).cleanup_old_attended(days_old=days, limit=limit)
+
+
+def _default_policies() -> List[RetentionPolicy]:
+    """Políticas en orden de ejecución (suscriptores antes que sus tokens)."""
+    return [
+        RetentionPolicy(
+            table="free_channel_requests",
+            days_setting="RETENTION_FREE_REQUEST_DAYS",
+            model=FreeChannelRequest,
+            condition=lambda cutoff: and_(
+                FreeChannelRequest.processed == True,
+                FreeChannelRequest.processed_at < cutoff
+            )
+        ),
+        RetentionPolicy(
+            table="user_interests",
+            days_setting="RETENTION_ATTENDED_INTEREST_DAYS",
+            model=UserInterest,
+            condition=lambda cutoff: and_(
+                UserInterest.is_attended == True,
+                UserInterest.attended_at < cutoff
+            ),
+            purge=_purge_attended_interests
+        ),
+        RetentionPolicy(
+            table="user_role_change_log",
+            days_setting="RETENTION_ROLE_LOG_DAYS",
+            model=UserRoleChangeLog,
+            condition=lambda cutoff: UserRoleChangeLog.changed_at < cutoff
+        ),
+        RetentionPolicy(
+            table="vip_subscribers",
+            days_setting="RETENTION_EXPIRED_VIP_DAYS",
+            model=VIPSubscriber,
+            condition=lambda cutoff: and_(
+                VIPSubscriber.status == "expired",
+                VIPSubscriber.expiry_date < cutoff
+            )
+        ),
+        RetentionPolicy(
+            table="invitation_tokens",
+            days_setting="RETENTION_TOKEN_DAYS",
+            model=InvitationToken,
+            # Usados hace N días o nunca canjeados y creados hace N días,
+            # siempre que ningún suscriptor los referencie
+            condition=lambda cutoff: and_(
+                or_(
+                    and_(InvitationToken.used == True, InvitationToken.used_at < cutoff),
+                    and_(InvitationToken.used == False, InvitationToken.created_at < cutoff)
+                ),
+                ~exists().where(VIPSubscriber.token_id == InvitationToken.id)
+            )
+        ),
+    ]
+
+
+class RetentionPipeline:
+    """
+    Ejecuta las políticas de retención por lotes.
+
+    Uso:
+        pipeline = RetentionPipeline()
+        report = await pipeline.run()            # Borra
+        report = await pipeline.run(dry_run=True)  # Solo cuenta
+    """
+
+    def __init__(
+        self,
+        policies: Optional[List[RetentionPolicy]] = None,
+        chunk_size: Optional[int] = None,
+        pause_ms: Optional[int] = None,
+        session_factory: Callable = get_session
+    ):
+        """
+        Inicializa el pipeline.
+
+        Args:
+            policies: Políticas a aplicar (default: todas las tablas)
+            chunk_size: Filas por transacción (default: RETENTION_CHUNK_SIZE)
+            pause_ms: Pausa entre lotes (default: RETENTION_CHUNK_PAUSE_MS)
+            session_factory: Fábrica de sesiones (default: get_session)
+        """
+        self.policies = policies if policies is not None else _default_policies()
+        self.chunk_size = max(1, chunk_size or Config.RETENTION_CHUNK_SIZE)
+        self.pause = max(0, Config.RETENTION_CHUNK_PAUSE_MS if pause_ms is None else pause_ms) / 1000
+        self._session_factory = session_factory
+
+        self.runs = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_report: Dict[str, dict] = {}
+        self.total_removed: Dict[str, int] = {}
+
+    async def _count(self, policy: RetentionPolicy, cutoff: datetime) -> int:
+        """Filas vencidas de la política (dry-run)."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(func.count(policy.model.id)).where(policy.condition(cutoff))
+            )
+            return result.scalar_one()
+
+    async def _purge_chunk(self, policy: RetentionPolicy, cutoff: datetime) -> int:
+        """Elimina un lote en su propia transacción."""
+        async with self._session_factory() as session:
+            if policy.purge is not None:
+                deleted = await policy.purge(session, policy.days, self.chunk_size)
+            else:
+                ids = (await session.execute(
+                    select(policy.model.id)
+                    .where(policy.condition(cutoff))
+                    .order_by(policy.model.id)
+                    .limit(self.chunk_size)
+                )).scalars().all()
+                if ids:
+                    await session.execute(
+                        delete(policy.model)
+                        .where(policy.model.id.in_(ids))
+                        .execution_options(synchronize_session=False)
+                    )
+                deleted = len(ids)
+
+            await session.commit()
+            return deleted
+
+    async def apply(self, policy: RetentionPolicy, dry_run: bool = False) -> dict:
+        """
+        Aplica una política.
+
+        Args:
+            policy: Política a aplicar
+            dry_run: Solo contar filas vencidas
+
+        Returns:
+            Dict con days, removed (o matched en dry-run), chunks y elapsed_ms
+        """
+        started = time.perf_counter()
+        cutoff = datetime.utcnow() - timedelta(days=policy.days)
+        entry = {"days": policy.days, "chunks": 0}
+
+        if dry_run:
+            entry["matched"] = await self._count(policy, cutoff)
+        else:
+            removed = 0
+            while True:
+                deleted = await self._purge_chunk(policy, cutoff)
+                if deleted:
+                    entry["chunks"] += 1
+                    removed += deleted
+                if deleted < self.chunk_size:
+                    break
+                await asyncio.sleep(self.pause)  # Deja escribir a los handlers
+            entry["removed"] = removed
+            self.total_removed[policy.table] = self.total_removed.get(policy.table, 0) + removed
+
+        entry["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return entry
+
+    async def run(self, dry_run: Optional[bool] = None) -> Dict[str, dict]:
+        """
+        Aplica todas las políticas activas (days > 0).
+
+        Un error en una tabla se registra y no detiene las demás.
+
+        Args:
+            dry_run: Solo reportar (default: RETENTION_DRY_RUN)
+
+        Returns:
+            Reporte por tabla (ver apply()); {"error": str} si la tabla falló
+        """
+        if dry_run is None:
+            dry_run = Config.RETENTION_DRY_RUN
+
+        report: Dict[str, dict] = {}
+        for policy in self.policies:
+            if policy.days <= 0:
+                continue
+            try:
+                report[policy.table] = await self.apply(policy, dry_run=dry_run)
+            except Exception as e:
+                logger.error(f"❌ Retención de {policy.table} falló: {e}", exc_info=True)
+                report[policy.table] = {"error": str(e)}
+
+        self.runs += 1
+        self.last_run_at = datetime.utcnow()
+        self.last_report = report
+        self._log_report(report, dry_run)
+        return report
+
+    @staticmethod
+    def _log_report(report: Dict[str, dict], dry_run: bool) -> None:
+        """Una línea por tabla con filas y tiempo."""
+        title = "🔎 Retención (dry-run)" if dry_run else "🗑️ Retención"
+        lines = [f"{title}:"]
+        for table, entry in report.items():
+            if "error" in entry:
+                lines.append(f"   {table:<22} error: {entry['error']}")
+                continue
+            rows = entry["matched"] if dry_run else entry["removed"]
+            lines.append(
+                f"   {table:<22} {rows:>7} fila(s) >{entry['days']}d "
+                f"en {entry['elapsed_ms']:.0f} ms ({entry['chunks']} lote(s))"
+            )
+        logger.info("\n".join(lines))
+
+    def get_stats(self) -> dict:
+        """
+        Métricas del pipeline.
+
+        Returns:
+            Dict con runs, last_run_at, last_report y total_removed por tabla
+        """
+        return {
+            "runs": self.runs,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_report": self.last_report,
+            "total_removed": dict(self.total_removed),
+        }
+
+
+# Pipeline global (uno por proceso)
+_pipeline: Optional[RetentionPipeline] = None
+
+
+def get_retention_pipeline() -> RetentionPipeline:
+    """Pipeline de retención del proceso (se crea en el primer uso)."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = RetentionPipeline()
+    return _pipeline
+
+
+def get_retention_stats() -> dict:
+    """Métricas de retención (vacías si nunca se ejecutó)."""
+    if _pipeline is None:
+        return {"runs": 0, "last_run_at": None, "last_report": {}, "total_removed": {}}
+    return _pipeline.get_stats()
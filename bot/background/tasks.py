@@ -5,8 +5,10 @@ Tareas:
 - Expulsión de VIPs expirados del canal
 - Procesamiento de cola Free (envío de invite links)
 - Limpieza de datos antiguos
+- Respaldo diario de la base de datos
 """
 import logging
+from datetime import datetime, timezone
 from typing import Optional
 
 from aiogram import Bot
@@ -15,7 +17,14 @@ from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
 from bot.database import get_session
+from bot.database.dialect import parse_database_url, DatabaseDialect
+from bot.database.backup import run_backup
+from bot.database.maintenance import run_sqlite_maintenance
+from bot.background.retention import get_retention_pipeline
+from bot.services.chat_metadata import get_chat_metadata_cache
 from bot.services.container import ServiceContainer
+from bot.services.message.session_history import get_session_history
+from bot.services.user import profile_buffer
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -118,33 +127,157 @@ async def process_free_queue(bot: Bot):
 
 async def cleanup_old_data(bot: Bot):
     """
-    Tarea: Limpieza de datos antiguos.
+    Tarea: Limpieza de datos antiguos (políticas de retención por tabla).
 
-    Proceso:
-    1. Elimina solicitudes Free procesadas hace más de 30 días
-    2. (Futuro: Limpiar tokens expirados muy antiguos)
+    Proceso (ver bot/background/retention.py):
+    1. Solicitudes Free procesadas, intereses atendidos, log de roles,
+       suscriptores VIP expirados y tokens usados/vencidos
+    2. Borrado por lotes de RETENTION_CHUNK_SIZE filas (una transacción
+       por lote, pausa entre lotes)
+    3. Con RETENTION_DRY_RUN solo se reporta cuántas filas se eliminarían
+    4. Reconstrucción de los contadores de intereses por paquete (corrige
+       desvíos por escrituras fuera de InterestService)
 
     Args:
         bot: Instancia del bot
     """
     logger.info("🔄 Ejecutando tarea: Limpieza de datos antiguos")
 
+    try:
+        await get_retention_pipeline().run()
+    except Exception as e:
+        logger.error(f"❌ Error en tarea de limpieza: {e}", exc_info=True)
+
+    try:
+        async with get_session() as session:
+            await ServiceContainer(session, bot).interest.rebuild_package_counters()
+    except Exception as e:
+        logger.error(f"❌ Error reconstruyendo contadores de intereses: {e}", exc_info=True)
+
+
+async def maintain_sqlite(bot: Bot):
+    """
+    Tarea: Mantenimiento de SQLite en horario de poco tráfico.
+
+    ANALYZE/optimize, incremental_vacuum (páginas liberadas por la
+    retención) y checkpoint del WAL (ver bot/database/maintenance.py).
+
+    Args:
+        bot: Instancia del bot
+    """
+    logger.info("🔄 Ejecutando tarea: Mantenimiento de SQLite")
+
+    try:
+        await run_sqlite_maintenance(vacuum_pages=Config.DB_MAINTENANCE_VACUUM_PAGES)
+    except Exception as e:
+        logger.error(f"❌ Error en mantenimiento de SQLite: {e}", exc_info=True)
+
+
+async def backup_database(bot: Bot):
+    """
+    Tarea: Respaldo online de la base de datos con rotación.
+
+    No bloquea escrituras (ver bot/database/backup.py).
+
+    Args:
+        bot: Instancia del bot
+    """
+    logger.info("🔄 Ejecutando tarea: Respaldo de base de datos")
+
+    try:
+        await run_backup()
+    except Exception as e:
+        logger.error(f"❌ Error en respaldo de base de datos: {e}", exc_info=True)
+
+
+async def flush_user_profiles(bot: Bot):
+    """
+    Tarea: Escribir en lote los cambios de perfil acumulados (write-behind).
+
+    Solo se programa con Config.USER_PROFILE_FLUSH_SECONDS > 0; también
+    se ejecuta en el shutdown para no perder cambios pendientes.
+
+    Args:
+        bot: Instancia del bot
+    """
+    if not len(profile_buffer):
+        return
+
     try:
         async with get_session() as session:
             container = ServiceContainer(session, bot)
+            await container.user.flush_profile_updates()
 
-            # Limpiar solicitudes Free antiguas
-            deleted_count = await container.subscription.cleanup_old_free_requests(
-                days_old=30
-            )
+    except Exception as e:
+        logger.error(f"❌ Error escribiendo perfiles en lote: {e}", exc_info=True)
+
+
+def sweep_session_history():
+    """
+    Tarea: Barrer sesiones expiradas del historial de mensajes (en memoria).
+
+    Reemplaza la limpieza probabilística en add_entry(); sin BD.
+    """
+    removed = get_session_history().sweep()
+    if removed:
+        logger.debug(f"🧹 Historial de sesión: {removed} usuario(s) expirados")
 
-            if deleted_count > 0:
-                logger.info(f"🗑️ {deleted_count} solicitud(es) Free antiguas eliminadas")
-            else:
-                logger.debug("✓ No hay datos antiguos para limpiar")
+
+async def refresh_chat_metadata(bot: Bot):
+    """
+    Tarea: Mantener fresca la metadata de los canales VIP/Free.
+
+    Refresca get_chat y el conteo de miembros antes de que venzan, así
+    los menús admin leen siempre del cache sin esperar a la Bot API.
+    Se ejecuta también al iniciar (precarga).
+
+    Args:
+        bot: Instancia del bot
+    """
+    try:
+        async with get_session() as session:
+            container = ServiceContainer(session, bot)
+            channel_ids = [
+                await container.channel.get_vip_channel_id(),
+                await container.channel.get_free_channel_id(),
+            ]
+
+        refreshed = await get_chat_metadata_cache().refresh(bot, channel_ids)
+        if refreshed:
+            logger.debug(f"🔄 Metadata de canales: {refreshed} consulta(s) a la API")
 
     except Exception as e:
-        logger.error(f"❌ Error en tarea de limpieza: {e}", exc_info=True)
+        logger.error(f"❌ Error refrescando metadata de canales: {e}", exc_info=True)
+
+
+async def maintain_vip_invite_pool(bot: Bot):
+    """
+    Tarea: Mantener el pool de enlaces VIP pre-generados.
+
+    Revoca los enlaces sin reclamar que ya no cubren la validez mínima y
+    repone el pool por lotes (ver VIPInvitePoolService). Se ejecuta también
+    al iniciar para que la etapa 3 tenga enlaces desde el principio.
+
+    Args:
+        bot: Instancia del bot
+    """
+    try:
+        async with get_session() as session:
+            container = ServiceContainer(session, bot)
+
+            vip_channel_id = await container.channel.get_vip_channel_id()
+            if not vip_channel_id:
+                return
+
+            result = await container.vip_invite_pool.maintain(vip_channel_id)
+            if result["retired"] or result["created"]:
+                logger.info(
+                    f"🔗 Pool VIP: {result['created']} creados, {result['retired']} revocados, "
+                    f"{result['depth']} disponibles"
+                )
+
+    except Exception as e:
+        logger.error(f"❌ Error manteniendo pool de enlaces VIP: {e}", exc_info=True)
 
 
 def start_background_tasks(bot: Bot):
@@ -155,6 +288,10 @@ def start_background_tasks(bot: Bot):
     - Expulsión VIP: Cada 60 minutos (configurable)
     - Procesamiento Free: Cada 5 minutos (o según wait_time)
     - Limpieza: Cada 24 horas (diaria a las 3 AM)
+    - Historial de sesión: Cada SESSION_HISTORY_SWEEP_SECONDS
+    - Mantenimiento SQLite: Diario a las DB_MAINTENANCE_HOUR:30 UTC (solo SQLite)
+    - Respaldo: Diario a las BACKUP_HOUR:00 UTC (si BACKUP_HOUR >= 0)
+    - Perfiles en lote: Cada USER_PROFILE_FLUSH_SECONDS (solo si > 0)
 
     Args:
         bot: Instancia del bot de Telegram
@@ -212,6 +349,94 @@ def start_background_tasks(bot: Bot):
     )
     logger.info("✅ Tarea programada: Limpieza (diaria 3 AM UTC)")
 
+    # Tarea 4: Barrido del historial de sesión (memoria)
+    _scheduler.add_job(
+        sweep_session_history,
+        trigger=IntervalTrigger(seconds=Config.SESSION_HISTORY_SWEEP_SECONDS, timezone="UTC"),
+        id="sweep_session_history",
+        name="Barrer historial de sesión",
+        replace_existing=True,
+        max_instances=1
+    )
+    logger.info(
+        f"✅ Tarea programada: Historial de sesión (cada {Config.SESSION_HISTORY_SWEEP_SECONDS}s)"
+    )
+
+    # Tarea 5: Refresh de metadata de canales (precarga al iniciar)
+    _scheduler.add_job(
+        refresh_chat_metadata,
+        trigger=IntervalTrigger(seconds=Config.CHAT_METADATA_REFRESH_SECONDS, timezone="UTC"),
+        args=[bot],
+        id="refresh_chat_metadata",
+        name="Refrescar metadata de canales",
+        replace_existing=True,
+        max_instances=1,
+        next_run_time=datetime.now(timezone.utc)
+    )
+    logger.info(
+        f"✅ Tarea programada: Metadata de canales (cada {Config.CHAT_METADATA_REFRESH_SECONDS}s)"
+    )
+
+    # Tarea 6: Pool de enlaces VIP pre-generados (opcional)
+    if Config.VIP_INVITE_POOL_SIZE > 0:
+        _scheduler.add_job(
+            maintain_vip_invite_pool,
+            trigger=IntervalTrigger(minutes=Config.VIP_INVITE_POOL_REFRESH_MINUTES, timezone="UTC"),
+            args=[bot],
+            id="maintain_vip_invite_pool",
+            name="Mantener pool de enlaces VIP",
+            replace_existing=True,
+            max_instances=1,
+            next_run_time=datetime.now(timezone.utc)
+        )
+        logger.info(
+            f"✅ Tarea programada: Pool de enlaces VIP (cada {Config.VIP_INVITE_POOL_REFRESH_MINUTES} min)"
+        )
+
+    # Tarea 7: Mantenimiento de SQLite (después de la limpieza diaria)
+    dialect, _ = parse_database_url(Config.DATABASE_URL)
+    if dialect == DatabaseDialect.SQLITE and Config.DB_MAINTENANCE_HOUR >= 0:
+        _scheduler.add_job(
+            maintain_sqlite,
+            trigger=CronTrigger(hour=Config.DB_MAINTENANCE_HOUR, minute=30, timezone="UTC"),
+            args=[bot],
+            id="maintain_sqlite",
+            name="Mantenimiento de SQLite",
+            replace_existing=True,
+            max_instances=1
+        )
+        logger.info(
+            f"✅ Tarea programada: Mantenimiento de SQLite ({Config.DB_MAINTENANCE_HOUR}:30 UTC)"
+        )
+
+    # Tarea 8: Respaldo diario (después del mantenimiento)
+    if Config.BACKUP_HOUR >= 0:
+        _scheduler.add_job(
+            backup_database,
+            trigger=CronTrigger(hour=Config.BACKUP_HOUR, minute=0, timezone="UTC"),
+            args=[bot],
+            id="backup_database",
+            name="Respaldo de base de datos",
+            replace_existing=True,
+            max_instances=1
+        )
+        logger.info(f"✅ Tarea programada: Respaldo ({Config.BACKUP_HOUR}:00 UTC)")
+
+    # Tarea 9: Write-behind de perfiles de usuario (opcional)
+    if Config.USER_PROFILE_FLUSH_SECONDS > 0:
+        _scheduler.add_job(
+            flush_user_profiles,
+            trigger=IntervalTrigger(seconds=Config.USER_PROFILE_FLUSH_SECONDS, timezone="UTC"),
+            args=[bot],
+            id="flush_user_profiles",
+            name="Escribir perfiles en lote",
+            replace_existing=True,
+            max_instances=1
+        )
+        logger.info(
+            f"✅ Tarea programada: Perfiles en lote (cada {Config.USER_PROFILE_FLUSH_SECONDS}s)"
+        )
+
     # Iniciar scheduler
     _scheduler.start()
     logger.info("✅ Background tasks iniciados correctamente")
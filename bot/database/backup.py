@@ -0,0 +1,432 @@
+"""
+Database Backup - Respaldo en caliente y restauración.
+
+El único respaldo era bot.db.backup (copia manual) y copiar el archivo de
+una base en modo WAL mientras el bot escribe puede dejarla inconsistente.
+
+run_backup() (tarea diaria + comando /backup):
+- SQLite: API de backup online de sqlite3 en pasos de BACKUP_PAGES_PER_STEP
+  páginas. El origen mantiene una transacción de lectura (snapshot WAL):
+  la copia es consistente, no se reinicia si hay escrituras y los writers
+  nunca quedan bloqueados
+- PostgreSQL: exportación lógica en streaming (COPY ... TO STDOUT por
+  tabla de la app, en un snapshot REPEATABLE READ)
+
+La salida se comprime con gzip en BACKUP_DIR. Tras cada respaldo se
+rotan los archivos: se conservan los BACKUP_KEEP más recientes y ninguno
+con más de BACKUP_RETENTION_DAYS días (el último siempre se conserva).
+
+restore_backup() restaura un archivo (comando /restore, con confirmación).
+Cada ejecución registra duración, tamaño y throughput (get_backup_stats()).
+"""
+import asyncio
+import gzip
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import Integer
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from bot.database.base import Base
+from bot.database.engine import get_engine
+import bot.database.models  # noqa: F401 - registra las tablas en Base.metadata
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Extensión por dialecto (determina cómo se restaura)
+SQLITE_SUFFIX = ".sqlite.gz"
+POSTGRES_SUFFIX = ".pgcopy.gz"
+
+# backup-20261019-040000.sqlite.gz
+BACKUP_NAME = re.compile(r"^backup-\d{8}-\d{6}(\.sqlite|\.pgcopy)\.gz$")
+
+# Cabeceras del formato de exportación de PostgreSQL
+PG_HEADER = "-- adminpro backup v1 postgresql\n"
+PG_TABLE_PREFIX = "-- TABLE "
+PG_END_OF_DATA = "\\.\n"
+
+# Chunk de compresión (bytes)
+_COPY_CHUNK = 1024 * 1024
+
+# Últimos respaldos (uno por proceso)
+_history: deque = deque(maxlen=20)
+_runs = 0
+_failures = 0
+
+
+def _backup_dir() -> str:
+    os.makedirs(Config.BACKUP_DIR, exist_ok=True)
+    return Config.BACKUP_DIR
+
+
+def _database_path(engine: AsyncEngine) -> str:
+    """Ruta del archivo SQLite (no se puede respaldar :memory:)."""
+    database = engine.url.database
+    if not database or database == ":memory:":
+        raise ValueError("No se puede respaldar una base SQLite en memoria")
+    return database
+
+
+def list_backups() -> List[Dict[str, object]]:
+    """
+    Respaldos disponibles en BACKUP_DIR, del más reciente al más antiguo.
+
+    Returns:
+        Lista de dicts con name, path, bytes y created_at (datetime)
+    """
+    if not os.path.isdir(Config.BACKUP_DIR):
+        return []
+
+    backups = []
+    for name in os.listdir(Config.BACKUP_DIR):
+        if not BACKUP_NAME.match(name):
+            continue
+        path = os.path.join(Config.BACKUP_DIR, name)
+        backups.append({
+            "name": name,
+            "path": path,
+            "bytes": os.path.getsize(path),
+            "created_at": datetime.strptime(name[7:22], "%Y%m%d-%H%M%S"),
+        })
+    return sorted(backups, key=lambda b: b["name"], reverse=True)
+
+
+def rotate_backups(keep: Optional[int] = None, retention_days: Optional[int] = None) -> List[str]:
+    """
+    Elimina respaldos sobrantes o vencidos (el más reciente nunca se borra).
+
+    Args:
+        keep: Máximo de archivos a conservar (default: BACKUP_KEEP, 0 = sin límite)
+        retention_days: Antigüedad máxima (default: BACKUP_RETENTION_DAYS, 0 = sin límite)
+
+    Returns:
+        Nombres de los archivos eliminados
+    """
+    keep = Config.BACKUP_KEEP if keep is None else keep
+    retention_days = Config.BACKUP_RETENTION_DAYS if retention_days is None else retention_days
+    cutoff = datetime.utcnow() - timedelta(days=retention_days) if retention_days > 0 else None
+
+    removed = []
+    for index, backup in enumerate(list_backups()):
+        if index == 0:
+            continue
+        if (keep > 0 and index >= keep) or (cutoff and backup["created_at"] < cutoff):
+            os.remove(backup["path"])
+            removed.append(backup["name"])
+
+    if removed:
+        logger.info(f"🗑️ Respaldos rotados: {', '.join(removed)}")
+    return removed
+
+
+def _compress(source_path: str, target_path: str) -> None:
+    """gzip en streaming (memoria constante)."""
+    with open(source_path, "rb") as src, gzip.open(target_path, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK)
+
+
+def _decompress(source_path: str, target_path: str) -> None:
+    with gzip.open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK)
+
+
+def _online_copy(source: sqlite3.Connection, target: sqlite3.Connection) -> int:
+    """
+    Copia página a página con pausas entre pasos.
+
+    Returns:
+        Páginas copiadas
+    """
+    pages_copied = 0
+    pause = max(0, Config.BACKUP_STEP_SLEEP_MS) / 1000
+
+    def progress(status, remaining, total):
+        nonlocal pages_copied
+        pages_copied = total - remaining
+        if pause and remaining:
+            time.sleep(pause)  # Corre en un thread: solo cede el lock de la BD
+
+    source.backup(target, pages=max(1, Config.BACKUP_PAGES_PER_STEP), progress=progress)
+    return pages_copied
+
+
+def _sqlite_backup_sync(database_path: str, target_path: str) -> int:
+    """
+    Respaldo online de SQLite a target_path (gzip).
+
+    Returns:
+        Bytes de la base sin comprimir
+    """
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(target_path)) as tmp:
+        snapshot_path = os.path.join(tmp, "snapshot.db")
+
+        source = sqlite3.connect(database_path, timeout=30, isolation_level=None)
+        target = sqlite3.connect(snapshot_path, isolation_level=None)
+        try:
+            # Transacción de lectura: snapshot fijo durante todos los pasos
+            source.execute("BEGIN")
+            source.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            _online_copy(source, target)
+            source.execute("ROLLBACK")
+
+            result = target.execute("PRAGMA quick_check").fetchone()[0]
+            if result != "ok":
+                raise RuntimeError(f"El respaldo no pasó quick_check: {result}")
+        finally:
+            source.close()
+            target.close()
+
+        raw_bytes = os.path.getsize(snapshot_path)
+        _compress(snapshot_path, target_path)
+        return raw_bytes
+
+
+def _sqlite_restore_sync(backup_path: str, database_path: str) -> int:
+    """
+    Restaura sobre la base activa con la API de backup (en pasos).
+
+    Returns:
+        Bytes restaurados (sin comprimir)
+    """
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(database_path))) as tmp:
+        snapshot_path = os.path.join(tmp, "restore.db")
+        _decompress(backup_path, snapshot_path)
+
+        source = sqlite3.connect(snapshot_path, isolation_level=None)
+        target = sqlite3.connect(database_path, timeout=30, isolation_level=None)
+        try:
+            result = source.execute("PRAGMA quick_check").fetchone()[0]
+            if result != "ok":
+                raise RuntimeError(f"El respaldo está dañado: {result}")
+            _online_copy(source, target)
+        finally:
+            source.close()
+            target.close()
+
+        return os.path.getsize(snapshot_path)
+
+
+def _app_tables():
+    """Tablas de la app en orden de dependencias (padres primero)."""
+    return Base.metadata.sorted_tables
+
+
+async def _postgres_backup(engine: AsyncEngine, target_path: str) -> int:
+    """
+    Exportación lógica en streaming: COPY TO STDOUT por tabla.
+
+    Returns:
+        Bytes exportados sin comprimir
+    """
+    raw_bytes = 0
+
+    with gzip.open(target_path, "wb", compresslevel=6) as out:
+        async def write(chunk: bytes):
+            nonlocal raw_bytes
+            raw_bytes += len(chunk)
+            out.write(chunk)
+
+        out.write(PG_HEADER.encode())
+        async with engine.connect() as conn:
+            driver = (await conn.get_raw_connection()).driver_connection
+            async with driver.transaction(isolation="repeatable_read", readonly=True):
+                for table in _app_tables():
+                    columns = [column.name for column in table.columns]
+                    out.write(f"{PG_TABLE_PREFIX}{table.name} ({','.join(columns)})\n".encode())
+                    await driver.copy_from_table(
+                        table.name, columns=columns, output=write, format="text"
+                    )
+                    out.write(PG_END_OF_DATA.encode())
+
+    return raw_bytes
+
+
+async def _postgres_restore(engine: AsyncEngine, backup_path: str) -> int:
+    """
+    Restaura una exportación lógica en una sola transacción.
+
+    Vacía las tablas de la app, carga cada sección con COPY FROM STDIN y
+    ajusta las secuencias.
+
+    Returns:
+        Bytes restaurados (sin comprimir)
+    """
+    restored = 0
+    tables = {table.name: table for table in _app_tables()}
+
+    with gzip.open(backup_path, "rb") as src:
+        if src.readline().decode() != PG_HEADER:
+            raise ValueError("El archivo no es un respaldo de PostgreSQL de este bot")
+
+        async def section():
+            nonlocal restored
+            for line in src:
+                if line.decode() == PG_END_OF_DATA:
+                    return
+                restored += len(line)
+                yield line
+
+        async with engine.connect() as conn:
+            driver = (await conn.get_raw_connection()).driver_connection
+            async with driver.transaction():
+                await driver.execute(
+                    f"TRUNCATE TABLE {', '.join(tables)} RESTART IDENTITY"
+                )
+                for line in src:
+                    header = line.decode()
+                    if not header.startswith(PG_TABLE_PREFIX):
+                        continue
+                    name, columns = header[len(PG_TABLE_PREFIX):].rstrip("\n").split(" ", 1)
+                    if name not in tables:
+                        raise ValueError(f"Tabla desconocida en el respaldo: {name}")
+                    await driver.copy_to_table(
+                        name,
+                        source=section(),
+                        columns=columns.strip("()").split(","),
+                        format="text"
+                    )
+
+                for table in tables.values():
+                    key = list(table.primary_key.columns)
+                    if len(key) != 1 or not isinstance(key[0].type, Integer):
+                        continue
+                    sequence = await driver.fetchval(
+                        "SELECT pg_get_serial_sequence($1, $2)", table.name, key[0].name
+                    )
+                    if sequence:
+                        await driver.execute(
+                            f"SELECT setval($1, COALESCE((SELECT MAX({key[0].name}) "
+                            f"FROM {table.name}), 0) + 1, false)",
+                            sequence
+                        )
+
+    return restored
+
+
+async def run_backup(engine: Optional[AsyncEngine] = None, rotate: bool = True) -> dict:
+    """
+    Respalda la base de datos en BACKUP_DIR (sin bloquear escrituras).
+
+    Args:
+        engine: Engine a respaldar (default: engine global)
+        rotate: Aplicar rotación y retención tras respaldar
+
+    Returns:
+        Reporte con name, path, dialect, bytes (comprimido), raw_bytes,
+        duration_ms, throughput_mb_s, rotated y finished_at
+
+    Raises:
+        Exception: Si el respaldo falla (el archivo parcial se elimina)
+    """
+    global _runs, _failures
+
+    engine = engine or get_engine()
+    dialect = engine.dialect.name
+    suffix = SQLITE_SUFFIX if dialect == "sqlite" else POSTGRES_SUFFIX
+    name = f"backup-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}{suffix}"
+    path = os.path.join(_backup_dir(), name)
+
+    started = time.perf_counter()
+    try:
+        if dialect == "sqlite":
+            raw_bytes = await asyncio.to_thread(_sqlite_backup_sync, _database_path(engine), path)
+        else:
+            raw_bytes = await _postgres_backup(engine, path)
+    except Exception:
+        _failures += 1
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+    elapsed = time.perf_counter() - started
+    report = {
+        "name": name,
+        "path": path,
+        "dialect": dialect,
+        "bytes": os.path.getsize(path),
+        "raw_bytes": raw_bytes,
+        "duration_ms": round(elapsed * 1000, 1),
+        "throughput_mb_s": round(raw_bytes / 1024 / 1024 / elapsed, 2) if elapsed > 0 else 0.0,
+        "rotated": rotate_backups() if rotate else [],
+        "finished_at": datetime.utcnow().isoformat(),
+    }
+    _runs += 1
+    _history.append(report)
+
+    logger.info(
+        f"💾 Respaldo {name}: {raw_bytes // 1024} KB → {report['bytes'] // 1024} KB "
+        f"en {report['duration_ms']:.0f} ms ({report['throughput_mb_s']} MB/s)"
+    )
+    return report
+
+
+async def restore_backup(name: str, engine: Optional[AsyncEngine] = None) -> dict:
+    """
+    Restaura un respaldo de BACKUP_DIR sobre la base activa.
+
+    Args:
+        name: Nombre del archivo (ver list_backups())
+        engine: Engine destino (default: engine global)
+
+    Returns:
+        Reporte con name, raw_bytes y duration_ms
+
+    Raises:
+        ValueError: Nombre inválido, archivo inexistente o de otro dialecto
+    """
+    if not BACKUP_NAME.match(name):
+        raise ValueError(f"Nombre de respaldo inválido: {name}")
+
+    path = os.path.join(Config.BACKUP_DIR, name)
+    if not os.path.exists(path):
+        raise ValueError(f"Respaldo no encontrado: {name}")
+
+    engine = engine or get_engine()
+    expected = SQLITE_SUFFIX if engine.dialect.name == "sqlite" else POSTGRES_SUFFIX
+    if not name.endswith(expected):
+        raise ValueError(f"El respaldo {name} no corresponde al dialecto {engine.dialect.name}")
+
+    logger.warning(f"♻️ Restaurando respaldo {name}...")
+    started = time.perf_counter()
+
+    if engine.dialect.name == "sqlite":
+        raw_bytes = await asyncio.to_thread(_sqlite_restore_sync, path, _database_path(engine))
+    else:
+        raw_bytes = await _postgres_restore(engine, path)
+
+    # Las conexiones abiertas no deben conservar páginas anteriores a la restauración
+    await engine.dispose()
+
+    report = {
+        "name": name,
+        "raw_bytes": raw_bytes,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.warning(f"✅ Respaldo {name} restaurado en {report['duration_ms']:.0f} ms")
+    return report
+
+
+def get_backup_stats() -> dict:
+    """
+    Métricas de respaldos.
+
+    Returns:
+        Dict con runs, failures, last (reporte del último respaldo o None)
+        y stored (archivos en BACKUP_DIR)
+    """
+    history = list(_history)
+    return {
+        "runs": _runs,
+        "failures": _failures,
+        "last": {k: v for k, v in history[-1].items() if k != "path"} if history else None,
+        "stored": len(list_backups()),
+    }
@@ -137,3 +137,55 @@ def is_production_database(url: str) -> bool:
             "Asumiendo desarrollo (False)."
         )
         return False
+
+
+def get_session_dialect(session) -> DatabaseDialect:
+    """
+    Detecta el dialecto de la conexión asociada a una sesión.
+
+    Útil para servicios que emiten SQL específico (upserts, índices de
+    búsqueda, PRAGMAs) sin depender de Config.DATABASE_URL.
+
+    Args:
+        session: AsyncSession, AsyncConnection o AsyncEngine
+
+    Returns:
+        DatabaseDialect de la conexión (UNSUPPORTED si no se puede determinar)
+    """
+    bind = getattr(session, "bind", None) or session
+    name = getattr(getattr(bind, "dialect", None), "name", "")
+
+    if name == "sqlite":
+        return DatabaseDialect.SQLITE
+    if name == "postgresql":
+        return DatabaseDialect.POSTGRESQL
+    return DatabaseDialect.UNSUPPORTED
+
+
+def dialect_insert(session, table):
+    """
+    Construye un INSERT con soporte de ON CONFLICT para el dialecto de la sesión.
+
+    SQLite (>= 3.24) y PostgreSQL comparten on_conflict_do_nothing() y
+    on_conflict_do_update(); ambos soportan RETURNING (SQLite >= 3.35).
+
+    Args:
+        session: AsyncSession, AsyncConnection o AsyncEngine
+        table: Modelo ORM o Table destino
+
+    Returns:
+        Insert específico del dialecto
+
+    Raises:
+        ValueError: Si el dialecto no soporta ON CONFLICT
+    """
+    dialect = get_session_dialect(session)
+
+    if dialect == DatabaseDialect.POSTGRESQL:
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == DatabaseDialect.SQLITE:
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Dialecto sin soporte de ON CONFLICT: {dialect.value}")
+
+    return insert(table)
@@ -18,6 +18,7 @@ from config import Config
 from bot.database.base import Base
 from bot.database.models import BotConfig
 from bot.database.dialect import parse_database_url, DatabaseDialect
+from bot.database.search import ensure_content_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -148,7 +149,7 @@ def create_async_engine_with_logging(
         raise ValueError(f"Dialecto no soportado: {dialect.value}")
 
 
-async def init_db(debug_mode: bool = False) -> None:
+async def init_db(debug_mode: bool = False, skip_create_all: bool = False) -> None:
     """
     Inicializa el engine con detección automática de dialecto.
 
@@ -160,6 +161,8 @@ async def init_db(debug_mode: bool = False) -> None:
 
     Args:
         debug_mode: Si True, habilita logging detallado de queries SQL
+        skip_create_all: Si True (esquema ya en head según Alembic), omite
+            Base.metadata.create_all; el índice FTS se verifica igual
     """
     global _engine, _session_factory
 
@@ -184,10 +187,17 @@ async def init_db(debug_mode: bool = False) -> None:
             "Use 'sqlite://' o 'postgresql://'"
         )
 
-    # Crear todas las tablas
+    # Crear todas las tablas (innecesario si las migraciones ya están en head)
     async with _engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        logger.info("✅ Tablas creadas/verificadas")
+        if skip_create_all:
+            logger.info("⏭️ Esquema en head: create_all omitido")
+        else:
+            await conn.run_sync(Base.metadata.create_all)
+            logger.info("✅ Tablas creadas/verificadas")
+
+        # Índice FTS5 de paquetes (tabla virtual, fuera de Base.metadata)
+        if dialect == DatabaseDialect.SQLITE:
+            await ensure_content_search_index(conn)
 
     # Crear session factory
     _session_factory = async_sessionmaker(
@@ -249,6 +259,7 @@ async def _create_sqlite_engine(url: str, debug_mode: bool = False) -> AsyncEngi
     - WAL mode (Write-Ahead Logging) para mejor concurrencia
     - NORMAL synchronous (balance performance/seguridad)
     - Cache de 64MB
+    - auto_vacuum INCREMENTAL (mantenimiento diario libera páginas)
     - NullPool (SQLite no necesita connection pooling)
 
     Args:
@@ -272,6 +283,10 @@ async def _create_sqlite_engine(url: str, debug_mode: bool = False) -> AsyncEngi
 
     # Configurar SQLite para mejor performance en Termux
     async with engine.begin() as conn:
+        # Vacuum incremental (solo aplica a bases nuevas; las existentes
+        # lo activan por migración). Ver bot/database/maintenance.py
+        await conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+
         # WAL mode: permite lecturas concurrentes mientras se escribe
         await conn.execute(text("PRAGMA journal_mode=WAL"))
 
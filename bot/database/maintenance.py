@@ -0,0 +1,176 @@
+"""
+SQLite Maintenance - Checkpoint del WAL, estadísticas del planner y vacuum incremental.
+
+Con journal_mode=WAL nada truncaba el archivo -wal (crece hasta cientos de
+MB tras semanas), las estadísticas del planner quedaban viejas y el espacio
+liberado por la retención nunca se recuperaba.
+
+run_sqlite_maintenance() (tarea diaria en horario de poco tráfico):
+1. PRAGMA optimize + ANALYZE: estadísticas frescas para el planner
+2. PRAGMA incremental_vacuum(N): devuelve páginas libres al sistema
+   (requiere auto_vacuum=INCREMENTAL, activado por migración)
+3. PRAGMA wal_checkpoint(TRUNCATE): vuelca el WAL a la BD y lo deja en 0 bytes
+
+get_sqlite_stats() / get_storage_summary() reportan tamaño del WAL, páginas
+y fragmentación para el health endpoint y el dashboard. En PostgreSQL ambas funciones no hacen nada.
+"""
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from bot.database.engine import get_engine
+
+logger = logging.getLogger(__name__)
+
+# Valores de PRAGMA auto_vacuum
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+# Último reporte de mantenimiento (uno por proceso)
+_last_report: Optional[dict] = None
+
+
+def _database_path(engine: AsyncEngine) -> Optional[str]:
+    """Ruta del archivo SQLite (None si es :memory:)."""
+    database = engine.url.database
+    if not database or database == ":memory:":
+        return None
+    return database
+
+
+async def get_sqlite_stats(engine: Optional[AsyncEngine] = None) -> Optional[Dict[str, object]]:
+    """
+    Tamaño y fragmentación de la base SQLite.
+
+    Args:
+        engine: Engine a inspeccionar (default: engine global)
+
+    Returns:
+        Dict con page_size, page_count, freelist_count, fragmentation_pct,
+        auto_vacuum, db_bytes y wal_bytes; None si no es SQLite
+    """
+    engine = engine or get_engine()
+    if engine.dialect.name != "sqlite":
+        return None
+
+    async with engine.connect() as conn:
+        page_size = (await conn.execute(text("PRAGMA page_size"))).scalar_one()
+        page_count = (await conn.execute(text("PRAGMA page_count"))).scalar_one()
+        freelist_count = (await conn.execute(text("PRAGMA freelist_count"))).scalar_one()
+        auto_vacuum = (await conn.execute(text("PRAGMA auto_vacuum"))).scalar_one()
+
+    path = _database_path(engine)
+    wal_path = f"{path}-wal" if path else None
+
+    return {
+        "page_size": page_size,
+        "page_count": page_count,
+        "freelist_count": freelist_count,
+        "fragmentation_pct": round(freelist_count / page_count * 100, 1) if page_count else 0.0,
+        "auto_vacuum": AUTO_VACUUM_MODES.get(auto_vacuum, str(auto_vacuum)),
+        "db_bytes": page_size * page_count,
+        "wal_bytes": os.path.getsize(wal_path) if wal_path and os.path.exists(wal_path) else 0,
+    }
+
+
+async def run_sqlite_maintenance(
+    vacuum_pages: int = 0,
+    engine: Optional[AsyncEngine] = None
+) -> Optional[dict]:
+    """
+    ANALYZE/optimize, vacuum incremental y checkpoint del WAL.
+
+    Cada PRAGMA corre fuera de transacción (AUTOCOMMIT): wal_checkpoint no
+    puede truncar el WAL con una transacción abierta en la misma conexión.
+
+    Args:
+        vacuum_pages: Páginas a liberar por ejecución (0 = todas las libres)
+        engine: Engine a mantener (default: engine global)
+
+    Returns:
+        Reporte con before/after (get_sqlite_stats), checkpoint (busy, log,
+        checkpointed), vacuumed_pages y elapsed_ms por paso; None si no es SQLite
+    """
+    global _last_report
+
+    engine = engine or get_engine()
+    if engine.dialect.name != "sqlite":
+        return None
+
+    before = await get_sqlite_stats(engine)
+    steps: Dict[str, float] = {}
+    report = {"before": before}
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        started = time.perf_counter()
+        await conn.execute(text("PRAGMA optimize"))
+        await conn.execute(text("ANALYZE"))
+        steps["analyze"] = (time.perf_counter() - started) * 1000
+
+        vacuumed = 0
+        if before["auto_vacuum"] == "incremental" and before["freelist_count"]:
+            started = time.perf_counter()
+            pages = vacuum_pages if vacuum_pages > 0 else before["freelist_count"]
+            await conn.execute(text(f"PRAGMA incremental_vacuum({int(pages)})"))
+            vacuumed = min(pages, before["freelist_count"])
+            steps["incremental_vacuum"] = (time.perf_counter() - started) * 1000
+
+        # Al final: ANALYZE y el vacuum también escriben en el WAL
+        started = time.perf_counter()
+        busy, log_frames, checkpointed = (
+            await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        ).one()
+        steps["wal_checkpoint"] = (time.perf_counter() - started) * 1000
+        report["checkpoint"] = {"busy": busy, "log": log_frames, "checkpointed": checkpointed}
+
+    report["vacuumed_pages"] = vacuumed
+    report["after"] = await get_sqlite_stats(engine)
+    report["elapsed_ms"] = {step: round(ms, 1) for step, ms in steps.items()}
+    report["ran_at"] = datetime.utcnow().isoformat()
+    _last_report = report
+
+    if busy:
+        logger.warning("⚠️ Checkpoint del WAL incompleto: hay lectores activos")
+    logger.info(
+        f"🧹 Mantenimiento SQLite: WAL {before['wal_bytes'] // 1024} KB → "
+        f"{report['after']['wal_bytes'] // 1024} KB, "
+        f"{vacuumed} página(s) liberadas, "
+        f"fragmentación {report['after']['fragmentation_pct']}% "
+        f"({sum(steps.values()):.0f} ms)"
+    )
+    return report
+
+
+def get_last_maintenance_report() -> Optional[dict]:
+    """Último reporte de run_sqlite_maintenance() (None si no se ejecutó)."""
+    return _last_report
+
+
+async def get_storage_summary() -> Optional[dict]:
+    """
+    Estado de almacenamiento para health endpoint y dashboard.
+
+    Returns:
+        get_sqlite_stats() más last_maintenance (ran_at y elapsed_ms del
+        último mantenimiento); None si no es SQLite o la BD no responde
+    """
+    try:
+        stats = await get_sqlite_stats()
+    except Exception as e:
+        logger.debug(f"Estadísticas de SQLite no disponibles: {e}")
+        return None
+
+    if stats is None:
+        return None
+
+    stats["last_maintenance"] = (
+        {"ran_at": _last_report["ran_at"], "elapsed_ms": _last_report["elapsed_ms"]}
+        if _last_report else None
+    )
+    return stats
@@ -1,6 +1,8 @@
 """Alembic migration runner for automatic schema updates on startup.
 
 This module provides:
+- In-process fast path: compares the DB alembic_version with the script
+  head through Alembic's Python API (no subprocess when already at head)
 - Automatic migration on production startup
 - Verbose logging for debugging
 - Fail-fast on migration errors
@@ -15,8 +17,9 @@ import logging
 import os
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 from config import Config as AppConfig
 from bot.database.dialect import parse_database_url
@@ -40,6 +43,27 @@ def is_production() -> bool:
     return os.getenv("ENV", "").lower() == "production"
 
 
+def find_alembic_ini() -> Optional[Path]:
+    """
+    Locate alembic.ini (project root, current directory or /app on Railway).
+
+    Returns:
+        Path to alembic.ini, or None if not found
+    """
+    # migrations.py is at: bot/database/migrations.py
+    # alembic.ini is at: alembic.ini (project root)
+    # So we need to go up 3 levels: database -> bot -> project_root
+    candidates = [
+        Path(__file__).parent.parent.parent / "alembic.ini",
+        Path.cwd() / "alembic.ini",
+        Path("/app") / "alembic.ini",  # Railway default
+    ]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return None
+
+
 def run_alembic_command(command_args: list[str]) -> tuple[int, str, str]:
     """
     Run alembic command using subprocess (completely isolated from async event loop).
@@ -50,31 +74,13 @@ def run_alembic_command(command_args: list[str]) -> tuple[int, str, str]:
     Returns:
         Tuple of (returncode, stdout, stderr)
     """
-    # Find alembic.ini in project root
-    # migrations.py is at: bot/database/migrations.py
-    # alembic.ini is at: alembic.ini (project root)
-    # So we need to go up 3 levels: database -> bot -> project_root
-    project_root = Path(__file__).parent.parent.parent
-    alembic_ini = project_root / "alembic.ini"
-
-    # Also check common locations (for Railway/Docker)
-    if not alembic_ini.exists():
-        # Try current working directory
-        cwd_ini = Path.cwd() / "alembic.ini"
-        if cwd_ini.exists():
-            alembic_ini = cwd_ini
-            project_root = Path.cwd()
-
-    # Try /app (Railway default)
-    if not alembic_ini.exists():
-        app_ini = Path("/app") / "alembic.ini"
-        if app_ini.exists():
-            alembic_ini = app_ini
-            project_root = Path("/app")
-
-    if not alembic_ini.exists():
-        logger.error(f"❌ alembic.ini not found at {alembic_ini}")
-        return 1, "", f"alembic.ini not found at {alembic_ini}"
+    alembic_ini = find_alembic_ini()
+
+    if alembic_ini is None:
+        logger.error("❌ alembic.ini not found")
+        return 1, "", "alembic.ini not found"
+
+    project_root = alembic_ini.parent
 
     # Build command
     cmd = [sys.executable, "-m", "alembic", "-c", str(alembic_ini)] + command_args
@@ -107,24 +113,87 @@ def run_alembic_command(command_args: list[str]) -> tuple[int, str, str]:
         return 1, "", str(e)
 
 
-async def get_current_revision() -> str | None:
+@dataclass(frozen=True)
+class SchemaRevision:
+    """Database revision vs. migration scripts head."""
+    current: Optional[str]
+    head: Optional[str]
+
+    @property
+    def at_head(self) -> bool:
+        """True if the database is already at the latest migration."""
+        return self.head is not None and self.current == self.head
+
+
+def get_script_head() -> Optional[str]:
+    """
+    Latest revision in alembic/versions (in-process, no subprocess).
+
+    Returns:
+        Head revision hash, or None if alembic.ini is missing or there
+        are multiple heads
+    """
+    from alembic.config import Config as AlembicConfig
+    from alembic.script import ScriptDirectory
+
+    alembic_ini = find_alembic_ini()
+    if alembic_ini is None:
+        return None
+
+    alembic_config = AlembicConfig(str(alembic_ini))
+    script_location = Path(alembic_config.get_main_option("script_location"))
+    if not script_location.is_absolute():
+        alembic_config.set_main_option(
+            "script_location", str(alembic_ini.parent / script_location)
+        )
+
+    try:
+        return ScriptDirectory.from_config(alembic_config).get_current_head()
+    except Exception as e:
+        logger.warning(f"Could not resolve migration head: {e}")
+        return None
+
+
+async def get_current_revision() -> Optional[str]:
     """
-    Get current database migration revision.
+    Get current database migration revision (alembic_version table).
+
+    Reads it in-process with Alembic's MigrationContext over a short-lived
+    connection (the application engine is not created yet at this point).
 
     Returns:
         Current revision hash or None if database is not migrated
     """
-    loop = asyncio.get_event_loop()
+    from alembic.runtime.migration import MigrationContext
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
 
-    def _get_current():
-        returncode, stdout, stderr = run_alembic_command(["current", "--verbose"])
-        if returncode != 0:
-            logger.warning(f"Could not get current revision: {stderr}")
-            return None
-        # Output is printed to stdout by alembic
-        return stdout.strip() if stdout else None
+    _, database_url_with_driver = parse_database_url(AppConfig.DATABASE_URL)
+    engine = create_async_engine(database_url_with_driver, poolclass=NullPool)
+
+    try:
+        async with engine.connect() as conn:
+            return await conn.run_sync(
+                lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+            )
+    except Exception as e:
+        logger.warning(f"Could not get current revision: {e}")
+        return None
+    finally:
+        await engine.dispose()
+
+
+async def check_schema_revision() -> SchemaRevision:
+    """
+    Compare the database revision with the scripts head (in-process).
 
-    return await loop.run_in_executor(None, _get_current)
+    Returns:
+        SchemaRevision with current and head revisions
+    """
+    loop = asyncio.get_event_loop()
+    head = await loop.run_in_executor(None, get_script_head)
+    current = await get_current_revision()
+    return SchemaRevision(current=current, head=head)
 
 
 async def show_migration_history() -> None:
@@ -210,37 +279,40 @@ async def run_migrations(
 
 async def run_migrations_if_needed() -> bool:
     """
-    Run migrations automatically if in production mode.
+    Bring the schema to head if needed.
 
-    In development mode, skip migrations (developer must run manually).
-    Logs warnings if migrations fail.
+    Fast path: if alembic_version already matches the scripts head, no
+    Alembic subprocess is spawned. Otherwise, in production mode the
+    upgrade runs automatically; in development mode it is skipped
+    (developer must run it manually).
 
     Returns:
-        True if migrations succeeded or were skipped, False if failed
+        True if the schema is at head after this call (init_db can skip
+        create_all), False if it is not (or could not be determined)
     """
+    revision = await check_schema_revision()
+
+    if revision.at_head:
+        logger.info(f"Schema at head ({revision.head}). Skipping migrations.")
+        return True
+
     if not is_production():
         logger.info(
             "Development mode detected. "
+            f"Schema at {revision.current or 'base'}, head is {revision.head}. "
             "Skipping automatic migrations. "
             "Run 'alembic upgrade head' manually if needed."
         )
-        return True
+        return False
 
     # Production mode: run migrations automatically
-    logger.info("Production mode detected. Running migrations...")
+    logger.info(
+        f"Production mode detected. Migrating {revision.current or 'base'} -> {revision.head}..."
+    )
 
     try:
-        # Show current state
-        logger.info("Current migration state:")
-        await get_current_revision()
-
-        # Run migrations to head
         await run_migrations("upgrade", "head")
-
-        # Show history for debugging
-        await show_migration_history()
-
-        return True
+        return revision.head is not None
 
     except Exception as e:
         logger.critical(
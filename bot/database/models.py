@@ -11,6 +11,11 @@ Tablas:
 - content_packages: Paquetes de contenido (FREE/VIP/PREMIUM)
 - user_interests: Intereses de usuario en paquetes de contenido
 - user_role_change_log: Auditoría de cambios de rol
+- package_interest_counters: Contadores pre-agregados de intereses por paquete
+- user_search_terms: Índice normalizado de búsqueda de usuarios
+- vip_invite_link_pool: Enlaces de invitación VIP pre-generados (un solo uso)
+- bulk_jobs: Operaciones masivas de admin (extensión VIP, expulsión, cambio de rol)
+- bulk_job_targets: Resultado por usuario de cada operación masiva
 """
 import logging
 from datetime import datetime
@@ -20,9 +25,11 @@ from sqlalchemy import (
     Column, Integer, String, Boolean, DateTime,
     BigInteger, JSON, ForeignKey, Index, Float, Enum, Numeric, desc
 )
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from bot.database.base import Base
+from bot.database.search import build_user_search_terms
 from bot.database.enums import UserRole, ContentCategory, RoleChangeReason, PackageType
 
 logger = logging.getLogger(__name__)
@@ -149,6 +156,42 @@ class User(Base):
         )
 
 
+class UserSearchTerm(Base):
+    """
+    Índice de búsqueda de usuarios (términos normalizados en minúsculas).
+
+    Cada usuario aporta su username (y sus partes) y cada palabra de su
+    nombre/apellido, normalizados sin acentos. El índice sobre `term`
+    permite búsquedas por prefijo con range scan en lugar de ILIKE '%q%'
+    sobre users. Se mantiene sincronizado con listeners de flush sobre User
+    (ver _sync_user_search_terms al final del módulo), por lo que cubre
+    cualquier alta/edición vía ORM. Los upserts Core de UserService no
+    disparan listeners y reindexan con user_search_term_rows().
+
+    Attributes:
+        user_id: ID del usuario (Foreign Key to users)
+        term: Término normalizado
+        field: Origen del término ("username", "part" o "name")
+    """
+
+    __tablename__ = "user_search_terms"
+
+    user_id = Column(
+        BigInteger,
+        ForeignKey("users.user_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    term = Column(String(100), primary_key=True)
+    field = Column(String(10), primary_key=True)
+
+    __table_args__ = (
+        Index('idx_user_search_term', 'term', 'field'),
+    )
+
+    def __repr__(self):
+        return f"<UserSearchTerm(user_id={self.user_id}, {self.field}='{self.term}')>"
+
+
 class SubscriptionPlan(Base):
     """
     Modelo de planes de suscripción/tarifas.
@@ -300,8 +343,9 @@ class VIPSubscriber(Base):
     token_id = Column(Integer, ForeignKey("invitation_tokens.id"), nullable=False)
     token = relationship("InvitationToken", back_populates="subscribers")
 
-    # Usuario (relación inversa)
-    user = relationship("User", uselist=False, lazy="selectin")
+    # Usuario (relación inversa). Se carga solo si la consulta lo pide
+    # con selectinload(VIPSubscriber.user); los recorridos usan read_models
+    user = relationship("User", uselist=False, lazy="raise_on_sql")
 
     # Índice compuesto para buscar activos próximos a expirar
     __table_args__ = (
@@ -323,6 +367,44 @@ class VIPSubscriber(Base):
         return f"<VIPSubscriber(user={self.user_id}, status={self.status}, days={days})>"
 
 
+class VIPInviteLink(Base):
+    """
+    Enlace de invitación VIP pre-generado (pool de la etapa 3 del ritual).
+
+    Una tarea en segundo plano mantiene el pool lleno con enlaces de un solo
+    uso (member_limit=1); la etapa 3 reclama uno sin esperar a la Bot API.
+    Los enlaces sin reclamar que ya no cubren la validez mínima se revocan.
+
+    Attributes:
+        id: ID del enlace (Primary Key)
+        channel_id: Canal VIP para el que se creó
+        invite_link: URL del enlace
+        expire_date: Expiración del enlace en Telegram (UTC)
+        created_at: Fecha de creación
+        claimed_by: Usuario que lo reclamó (NULL = disponible)
+        claimed_at: Fecha de reclamo
+    """
+
+    __tablename__ = "vip_invite_link_pool"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    channel_id = Column(String(50), nullable=False)
+    invite_link = Column(String(255), unique=True, nullable=False)
+    expire_date = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    claimed_by = Column(BigInteger, nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Reclamo: disponibles del canal ordenados por expiración
+        Index('idx_invite_pool_available', 'channel_id', 'claimed_by', 'expire_date'),
+    )
+
+    def __repr__(self):
+        status = f"reclamado por {self.claimed_by}" if self.claimed_by else "disponible"
+        return f"<VIPInviteLink(id={self.id}, channel={self.channel_id}, {status})>"
+
+
 class FreeChannelRequest(Base):
     """
     Solicitudes de acceso al canal Free (cola de espera).
@@ -338,7 +420,8 @@ class FreeChannelRequest(Base):
 
     # Usuario
     user_id = Column(BigInteger, ForeignKey("users.user_id"), nullable=False, index=True)  # ID Telegram
-    user = relationship("User", uselist=False, lazy="selectin")
+    # Opt-in por consulta (selectinload), ver bot/database/read_models.py
+    user = relationship("User", uselist=False, lazy="raise_on_sql")
 
     # Solicitud
     request_date = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -429,6 +512,46 @@ class UserInterest(Base):
     )
 
 
+class PackageInterestCounter(Base):
+    """
+    Contador pre-agregado de intereses por paquete.
+
+    Mantenido por InterestService.register_interest() y mark_as_attended()
+    para que las pantallas de admin lean conteos por paquete sin recorrer
+    user_interests. Puede reconstruirse con InterestService.rebuild_package_counters().
+
+    Attributes:
+        package_id: ID del paquete (Primary Key, Foreign Key to content_packages)
+        total_interests: Total de intereses registrados (pendientes + atendidos)
+        pending_interests: Intereses aún no atendidos
+        last_interest_at: Fecha del último interés registrado o re-expresado
+        updated_at: Última actualización del contador
+    """
+
+    __tablename__ = "package_interest_counters"
+
+    package_id = Column(
+        Integer,
+        ForeignKey("content_packages.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    total_interests = Column(Integer, nullable=False, default=0)
+    pending_interests = Column(Integer, nullable=False, default=0)
+    last_interest_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return (
+            f"<PackageInterestCounter(package_id={self.package_id}, "
+            f"total={self.total_interests}, pending={self.pending_interests})>"
+        )
+
+    __table_args__ = (
+        # Ranking de paquetes con más interés pendiente
+        Index('idx_interest_counter_pending', 'pending_interests'),
+    )
+
+
 class UserRoleChangeLog(Base):
     """
     Registro de auditoría para cambios de rol de usuario.
@@ -484,6 +607,89 @@ class UserRoleChangeLog(Base):
     )
 
 
+class BulkJob(Base):
+    """
+    Operación masiva de admin sobre una lista de usuarios.
+
+    Los objetivos (BulkJobTarget) se procesan por lotes; cada lote marca
+    sus objetivos en la misma transacción que sus cambios en la BD, así
+    un job interrumpido (status "running") se reanuda al reiniciar sin
+    repetir lo ya aplicado.
+
+    Attributes:
+        id: ID del job (Primary Key)
+        operation: extend_vip, expel o change_role
+        params: Parámetros JSON (ej: {"days": 3}, {"role": "free"})
+        target_filter: Filtro usado para elegir objetivos (NULL = lista de IDs)
+        status: draft, running, completed o failed
+        created_by: Admin que creó el job
+        chat_id: Chat donde se reporta el progreso
+        progress_message_id: Mensaje que se edita con el progreso
+        total / succeeded / failed / skipped: Contadores por objetivo
+        created_at / started_at / finished_at: Fechas del ciclo de vida
+    """
+
+    __tablename__ = "bulk_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    operation = Column(String(30), nullable=False)
+    params = Column(JSON, nullable=True)
+    target_filter = Column(String(30), nullable=True)
+    status = Column(String(20), nullable=False, default="draft", index=True)
+
+    created_by = Column(BigInteger, nullable=False)
+    chat_id = Column(BigInteger, nullable=False)
+    progress_message_id = Column(Integer, nullable=True)
+
+    total = Column(Integer, nullable=False, default=0)
+    succeeded = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<BulkJob(id={self.id}, operation={self.operation}, status={self.status}, "
+            f"{self.succeeded + self.failed + self.skipped}/{self.total})>"
+        )
+
+
+class BulkJobTarget(Base):
+    """
+    Usuario objetivo de una operación masiva y su resultado.
+
+    Attributes:
+        id: ID del objetivo (Primary Key, orden de procesamiento)
+        job_id: Job al que pertenece
+        user_id: Usuario objetivo
+        status: pending, done, failed o skipped
+        error: Motivo del fallo u omisión
+        processed_at: Fecha en que se procesó
+    """
+
+    __tablename__ = "bulk_job_targets"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("bulk_jobs.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(BigInteger, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    error = Column(String(255), nullable=True)
+    processed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Siguiente lote: pendientes del job en orden de id
+        Index('idx_bulk_target_job_status', 'job_id', 'status', 'id'),
+        # Un usuario una sola vez por job
+        Index('idx_bulk_target_job_user', 'job_id', 'user_id', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<BulkJobTarget(job={self.job_id}, user={self.user_id}, status={self.status})>"
+
+
 class ContentPackage(Base):
     """
     Paquete de contenido para el sistema.
@@ -565,3 +771,58 @@ class ContentPackage(Base):
         Index('idx_content_category_active', 'category', 'is_active'),
         Index('idx_content_type_active', 'type', 'is_active'),
     )
+
+
+# ===== SINCRONIZACIÓN DEL ÍNDICE DE BÚSQUEDA =====
+
+_USER_SEARCH_FIELDS = ("username", "first_name", "last_name")
+
+
+def user_search_term_rows(
+    user_id: int,
+    username: Optional[str],
+    first_name: Optional[str],
+    last_name: Optional[str]
+) -> List[dict]:
+    """
+    Filas de user_search_terms para un usuario.
+
+    Usado por los listeners ORM y por los upserts Core de UserService,
+    que no disparan los listeners.
+    """
+    return [
+        {"user_id": user_id, "term": term, "field": field}
+        for term, field in build_user_search_terms(username, first_name, last_name)
+    ]
+
+
+def _sync_user_search_terms(connection, target: User, replace: bool) -> None:
+    """
+    Reescribe los términos de búsqueda de un usuario dentro del mismo flush.
+
+    Args:
+        connection: Conexión del flush en curso
+        target: Usuario insertado o actualizado
+        replace: True para borrar los términos previos
+    """
+    table = UserSearchTerm.__table__
+    if replace:
+        connection.execute(table.delete().where(table.c.user_id == target.user_id))
+
+    rows = user_search_term_rows(
+        target.user_id, target.username, target.first_name, target.last_name
+    )
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+@event.listens_for(User, "after_insert")
+def _index_new_user(mapper, connection, target: User) -> None:
+    _sync_user_search_terms(connection, target, replace=False)
+
+
+@event.listens_for(User, "after_update")
+def _reindex_updated_user(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in _USER_SEARCH_FIELDS):
+        _sync_user_search_terms(connection, target, replace=True)
@@ -0,0 +1,85 @@
+"""
+Read Models - Registros livianos para recorridos y listados.
+
+Los recorridos en background (expiración VIP, expulsiones, aprobación de la
+cola Free) y los listados admin solo usan user_id y una o dos columnas, pero
+cargaban objetos ORM completos: identity map, estado de cambios y, con la
+relación user en selectin, una segunda consulta con cada User.
+
+Cada registro es un dataclass con __slots__ cuyos campos tienen el mismo
+nombre que las columnas del modelo: select_records() arma el select(...)
+solo con esas columnas y fetch_records() devuelve los registros. Las
+escrituras se hacen con UPDATE por lotes sobre los ids.
+
+Benchmark de memoria por fila: scripts/benchmark_read_models.py.
+"""
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import ClassVar, List, Optional, Type, TypeVar
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database.models import FreeChannelRequest, VIPSubscriber
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, slots=True)
+class VIPSubscriberRecord:
+    """Suscriptor VIP para recorridos (expiración, expulsión, conteos)."""
+    __model__: ClassVar[type] = VIPSubscriber
+
+    id: int
+    user_id: int
+    status: str
+    expiry_date: datetime
+    vip_entry_stage: Optional[int]
+
+    def is_expired(self) -> bool:
+        """Misma regla que VIPSubscriber.is_expired()."""
+        return datetime.utcnow() > self.expiry_date
+
+
+@dataclass(frozen=True, slots=True)
+class FreeRequestRecord:
+    """Solicitud Free para la cola y su aprobación."""
+    __model__: ClassVar[type] = FreeChannelRequest
+
+    id: int
+    user_id: int
+    request_date: datetime
+
+    def minutes_since_request(self) -> int:
+        """Misma regla que FreeChannelRequest.minutes_since_request()."""
+        return int((datetime.utcnow() - self.request_date).total_seconds() / 60)
+
+
+def select_records(record: Type[R]) -> Select:
+    """
+    select(...) con solo las columnas del registro.
+
+    Args:
+        record: Clase de registro (VIPSubscriberRecord, FreeRequestRecord)
+
+    Returns:
+        Select al que se le agregan where/order_by/limit
+    """
+    model = record.__model__
+    return select(*(getattr(model, field.name) for field in fields(record)))
+
+
+async def fetch_records(session: AsyncSession, record: Type[R], stmt: Select) -> List[R]:
+    """
+    Ejecuta un select_records() y construye los registros.
+
+    Args:
+        session: Sesión de BD
+        record: Clase de registro usada en select_records()
+        stmt: Consulta
+
+    Returns:
+        Lista de registros (sin objetos ORM ni identity map)
+    """
+    result = await session.execute(stmt)
+    return [record(*row) for row in result]
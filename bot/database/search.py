@@ -0,0 +1,218 @@
+"""
+Índices de búsqueda: normalización de texto y full-text de paquetes.
+
+Usado por:
+- Listeners de User que mantienen user_search_terms (bot/database/models.py)
+- UserSearchService (bot/services/user_search.py)
+- ContentService.search_packages (FTS5 en SQLite, tsvector en PostgreSQL)
+- init_db y migraciones de Alembic que crean/rellenan los índices
+"""
+import logging
+import re
+import unicodedata
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+FIELD_USERNAME = "username"
+FIELD_USERNAME_PART = "part"
+FIELD_NAME = "name"
+
+# Longitud máxima de un término (igual a la columna user_search_terms.term)
+MAX_TERM_LENGTH = 100
+
+_USERNAME_PART_RE = re.compile(r"[a-z]+|\d+")
+
+
+def normalize_search_text(value: Optional[str]) -> str:
+    """
+    Normaliza texto para indexar/buscar: minúsculas, sin acentos ni '@'.
+
+    Args:
+        value: Texto original (puede ser None)
+
+    Returns:
+        Texto normalizado ("" si value es vacío)
+
+    Examples:
+        >>> normalize_search_text("@José_Pérez")
+        'jose_perez'
+    """
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.lower().strip().lstrip("@")
+
+
+def build_user_search_terms(
+    username: Optional[str],
+    first_name: Optional[str],
+    last_name: Optional[str]
+) -> Set[Tuple[str, str]]:
+    """
+    Construye el conjunto de términos (term, field) de un usuario.
+
+    - username completo (field "username")
+    - partes del username separadas por '_', '.', dígitos (field "part"),
+      para que "doe" encuentre a "john_doe"
+    - cada palabra de nombre y apellido (field "name")
+
+    Args:
+        username: Username de Telegram
+        first_name: Nombre
+        last_name: Apellido
+
+    Returns:
+        Set de tuplas (term, field)
+    """
+    terms: Set[Tuple[str, str]] = set()
+
+    normalized_username = normalize_search_text(username)
+    if normalized_username:
+        terms.add((normalized_username[:MAX_TERM_LENGTH], FIELD_USERNAME))
+        parts = _USERNAME_PART_RE.findall(normalized_username)
+        if len(parts) > 1:
+            for part in parts[1:]:
+                terms.add((part[:MAX_TERM_LENGTH], FIELD_USERNAME_PART))
+
+    for value in (first_name, last_name):
+        for word in normalize_search_text(value).split():
+            terms.add((word[:MAX_TERM_LENGTH], FIELD_NAME))
+
+    return terms
+
+
+# Índices creados por migraciones con SQL específico de PostgreSQL
+# (fuera de Base.metadata; alembic/env.py los excluye de autogenerate)
+UNMANAGED_INDEXES = frozenset({
+    "idx_user_search_term_pattern",
+    "idx_user_search_term_trgm",
+    "idx_content_packages_fts",
+})
+
+
+# ===== FULL-TEXT DE PAQUETES DE CONTENIDO =====
+
+# Tabla FTS5 (SQLite): rowid = content_packages.id
+CONTENT_FTS_TABLE = "content_packages_fts"
+
+# Pesos bm25() por columna (name, description): el nombre pesa más
+CONTENT_FTS_WEIGHTS = (10.0, 1.0)
+
+# Expresión tsvector (PostgreSQL). Debe coincidir EXACTAMENTE con el índice
+# GIN de expresión creado por la migración para que el planner lo use.
+CONTENT_TSVECTOR_SQL = (
+    "setweight(to_tsvector('spanish', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('spanish', coalesce(description, '')), 'B')"
+)
+
+# Máximo de palabras consideradas en una consulta full-text
+MAX_FTS_TOKENS = 8
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def extract_search_tokens(value: Optional[str], strip_accents: bool = True) -> List[str]:
+    """
+    Extrae palabras normalizadas de una consulta, sin sintaxis FTS.
+
+    Descarta comillas, operadores y signos para que la entrada del admin
+    nunca se interprete como sintaxis de MATCH / to_tsquery.
+
+    Args:
+        value: Texto de búsqueda
+        strip_accents: False para conservar acentos (la configuración
+            'spanish' de PostgreSQL no los elimina al indexar)
+
+    Returns:
+        Lista de palabras (máximo MAX_FTS_TOKENS)
+    """
+    if strip_accents:
+        normalized = normalize_search_text(value)
+    else:
+        normalized = (value or "").lower()
+    return _WORD_RE.findall(normalized)[:MAX_FTS_TOKENS]
+
+
+def build_fts5_query(value: Optional[str]) -> str:
+    """
+    Construye una consulta FTS5 de prefijos: "pack"* "verano"*.
+
+    Returns:
+        Consulta MATCH ("" si no hay palabras)
+    """
+    return " ".join(f'"{token}"*' for token in extract_search_tokens(value))
+
+
+def build_tsquery(value: Optional[str]) -> str:
+    """
+    Construye una consulta to_tsquery de prefijos: pack:* & verano:*.
+
+    Returns:
+        Consulta tsquery ("" si no hay palabras)
+    """
+    return " & ".join(
+        f"{token}:*" for token in extract_search_tokens(value, strip_accents=False)
+    )
+
+
+async def content_fts_available(conn) -> bool:
+    """
+    Indica si la tabla FTS5 de paquetes existe (solo SQLite).
+
+    Args:
+        conn: AsyncSession o AsyncConnection
+
+    Returns:
+        True si content_packages_fts existe
+    """
+    result = await conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": CONTENT_FTS_TABLE}
+    )
+    return result.scalar() is not None
+
+
+def create_content_fts_sql() -> List[str]:
+    """
+    Sentencias para crear y poblar la tabla FTS5 de paquetes (SQLite).
+
+    unicode61 + remove_diacritics: "cancion" encuentra "canción".
+    """
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {CONTENT_FTS_TABLE} USING fts5("
+        f"name, description, tokenize = 'unicode61 remove_diacritics 2')",
+        f"INSERT INTO {CONTENT_FTS_TABLE} (rowid, name, description) "
+        f"SELECT id, name, coalesce(description, '') FROM content_packages "
+        f"WHERE id NOT IN (SELECT rowid FROM {CONTENT_FTS_TABLE})",
+    ]
+
+
+async def ensure_content_search_index(conn) -> bool:
+    """
+    Crea (si falta) y puebla el índice FTS5 de paquetes en SQLite.
+
+    Llamado por init_db tras create_all; idempotente. Si el SQLite
+    compilado no incluye FTS5, se registra y la búsqueda usa ILIKE.
+
+    Args:
+        conn: AsyncConnection de SQLite
+
+    Returns:
+        True si el índice FTS5 está disponible
+    """
+    if await content_fts_available(conn):
+        return True
+
+    try:
+        for statement in create_content_fts_sql():
+            await conn.execute(text(statement))
+    except Exception as e:
+        logger.warning(f"⚠️ FTS5 no disponible, búsqueda de paquetes con ILIKE: {e}")
+        return False
+
+    logger.info("✅ Índice FTS5 de paquetes creado")
+    return True
@@ -0,0 +1,132 @@
+"""
+Streaming - Recorridos de resultados grandes con memoria acotada.
+
+Los recorridos hacían result.scalars().all() y materializaban todo el
+resultado (todos los suscriptores expirados, todas las solicitudes listas).
+
+Dos formas de recorrer, según lo que haga el consumidor:
+
+- stream_scalars() / stream_records() / stream_partitions(): cursor del
+  servidor (AsyncSession.stream() + yield_per). Para lecturas y exportes:
+  el consumidor no escribe en las tablas que se recorren.
+- iter_key_batches(): lotes por keyset (WHERE key > último ORDER BY key
+  LIMIT n), una consulta por lote sin cursor abierto. Para jobs que
+  modifican las filas recorridas (p. ej. marcar expirados), donde un
+  cursor abierto sobre la misma tabla no es seguro en SQLite.
+
+Todos son async generators: `async for item in stream_scalars(...)`.
+"""
+from typing import Any, AsyncIterator, List, Type, TypeVar
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database.read_models import fetch_records
+
+R = TypeVar("R")
+
+# Filas por lote del cursor (yield_per) y por consulta keyset
+DEFAULT_BATCH_SIZE = 500
+
+
+async def stream_partitions(
+    session: AsyncSession,
+    stmt: Select,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[List[Any]]:
+    """
+    Recorre un resultado en lotes de filas (cursor del servidor).
+
+    Args:
+        session: Sesión de BD
+        stmt: Consulta
+        batch_size: Filas por lote (yield_per)
+
+    Yields:
+        Listas de hasta batch_size filas (Row)
+    """
+    result = await session.stream(stmt.execution_options(yield_per=batch_size))
+    try:
+        async for partition in result.partitions(batch_size):
+            yield partition
+    finally:
+        await result.close()
+
+
+async def stream_scalars(
+    session: AsyncSession,
+    stmt: Select,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[Any]:
+    """
+    Recorre la primera columna de un resultado (cursor del servidor).
+
+    Examples:
+        >>> async for user_id in stream_scalars(session, select(VIPSubscriber.user_id)):
+        ...     await bot.ban_chat_member(channel_id, user_id)
+    """
+    async for partition in stream_partitions(session, stmt, batch_size):
+        for row in partition:
+            yield row[0]
+
+
+async def stream_records(
+    session: AsyncSession,
+    record: Type[R],
+    stmt: Select,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[R]:
+    """
+    Recorre un select_records() como registros livianos (cursor del servidor).
+
+    Args:
+        session: Sesión de BD
+        record: Clase de registro (ver bot/database/read_models.py)
+        stmt: select_records(record) con filtros
+        batch_size: Filas por lote
+
+    Yields:
+        Registros
+    """
+    async for partition in stream_partitions(session, stmt, batch_size):
+        for row in partition:
+            yield record(*row)
+
+
+async def iter_key_batches(
+    session: AsyncSession,
+    record: Type[R],
+    stmt: Select,
+    key_column,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[List[R]]:
+    """
+    Recorre un select_records() en lotes por keyset (sin cursor abierto).
+
+    El consumidor puede modificar (o hacer que dejen de coincidir) las
+    filas de cada lote antes de pedir el siguiente.
+
+    Args:
+        session: Sesión de BD
+        record: Clase de registro con un campo llamado como key_column
+        stmt: select_records(record) con filtros (sin order_by ni limit)
+        key_column: Columna única y ordenable (p. ej. VIPSubscriber.id)
+        batch_size: Filas por lote
+
+    Yields:
+        Listas de hasta batch_size registros, en orden de key_column
+    """
+    last_key = None
+    while True:
+        batch_stmt = stmt.order_by(key_column).limit(batch_size)
+        if last_key is not None:
+            batch_stmt = batch_stmt.where(key_column > last_key)
+
+        batch = await fetch_records(session, record, batch_stmt)
+        if not batch:
+            return
+        yield batch
+
+        if len(batch) < batch_size:
+            return
+        last_key = getattr(batch[-1], key_column.key)
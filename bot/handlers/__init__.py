@@ -14,6 +14,7 @@ from bot.handlers.admin import admin_router
 from bot.handlers.user import user_router, free_join_router, vip_entry_router
 from bot.handlers.vip import vip_callbacks_router
 from bot.handlers.free import free_callbacks_router
+from bot.utils.callback_routing import install_callback_routing
 
 # Menu Handlers (for direct use in role-based handlers)
 from bot.handlers.admin.menu import show_admin_menu
@@ -40,6 +41,9 @@ def register_all_handlers(dispatcher: Dispatcher) -> None:
     dispatcher.include_router(vip_callbacks_router)  # VIP menu callbacks
     dispatcher.include_router(free_callbacks_router)  # Free menu callbacks
 
+    # Índice de callback_data → handler (evita evaluar todos los filtros por click)
+    install_callback_routing(dispatcher)
+
     logger.info("Handlers registrados correctamente")
 
 
@@ -1,11 +1,40 @@
 """Admin handlers module."""
 from bot.handlers.admin.main import admin_router
 from bot.handlers.admin.menu import show_admin_menu
-from bot.handlers.admin.profile import profile_router
-from bot.handlers.admin.tests import tests_router
+from bot.handlers.lazy import LazyRouter
 
-# Include routers
-admin_router.include_router(tests_router)
-admin_router.include_router(profile_router)
+# Routers de uso ocasional: se importan en su primer uso (ver bot/handlers/lazy.py)
+admin_router.include_router(LazyRouter(
+    "bot.handlers.admin.tests", "tests_router",
+    commands=("run_tests", "test_status", "smoke_test"),
+    callback_prefixes=("tests:",)
+))
+admin_router.include_router(LazyRouter(
+    "bot.handlers.admin.profile", "profile_router",
+    commands=("profile", "profile_stats", "analyzeQueries"),
+    callback_prefixes=("profile:",)
+))
+admin_router.include_router(LazyRouter(
+    "bot.handlers.admin.pricing", "pricing_router",
+    callback_data=("admin:pricing",),
+    callback_prefixes=("pricing:",)
+))
+admin_router.include_router(LazyRouter(
+    "bot.handlers.admin.backup", "backup_router",
+    commands=("backup", "backups", "restore"),
+    callback_prefixes=("backup:",)
+))
+admin_router.include_router(LazyRouter(
+    "bot.handlers.admin.export", "export_router",
+    commands=("export",),
+    callback_data=("admin:export",),
+    callback_prefixes=("export:",)
+))
+admin_router.include_router(LazyRouter(
+    "bot.handlers.admin.bulk", "bulk_router",
+    commands=("bulk",),
+    callback_data=("admin:bulk",),
+    callback_prefixes=("bulk:",)
+))
 
 __all__ = ["admin_router", "show_admin_menu"]
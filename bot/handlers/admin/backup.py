@@ -0,0 +1,156 @@
+"""
+Admin Backup Handler
+
+Respaldos de la base de datos desde Telegram:
+- /backup - Respaldo inmediato (online, sin bloquear escrituras)
+- /backups - Lista los respaldos disponibles
+- /restore <archivo> - Restaura un respaldo (pide confirmación)
+
+Solo accesible para administradores.
+"""
+
+import logging
+
+from aiogram import Router, F
+from aiogram.filters import Command
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
+
+from bot.database.backup import list_backups, restore_backup, run_backup
+from bot.middlewares import AdminAuthMiddleware
+
+logger = logging.getLogger(__name__)
+
+backup_router = Router(name="admin_backup")
+backup_router.message.middleware(AdminAuthMiddleware())
+backup_router.callback_query.middleware(AdminAuthMiddleware())
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1_048_576:.1f} MB"
+
+
+@backup_router.message(Command("backup"))
+async def cmd_backup(message: Message):
+    """
+    Ejecuta un respaldo inmediato y reporta tamaño y duración.
+
+    Args:
+        message: Mensaje del comando
+    """
+    logger.info(f"💾 Admin {message.from_user.id} solicitó un respaldo")
+    status_msg = await message.answer("💾 <i>Generando respaldo...</i>", parse_mode="HTML")
+
+    try:
+        report = await run_backup()
+    except Exception as e:
+        logger.exception("Error generando respaldo")
+        await status_msg.edit_text(
+            f"❌ <b>Error en el respaldo</b>\n\n<code>{str(e)[:500]}</code>",
+            parse_mode="HTML"
+        )
+        return
+
+    rotated = f"\n🗑️ Rotados: {len(report['rotated'])}" if report["rotated"] else ""
+    await status_msg.edit_text(
+        f"✅ <b>Respaldo completado</b>\n\n"
+        f"📄 <code>{report['name']}</code>\n"
+        f"📦 {_mb(report['raw_bytes'])} → {_mb(report['bytes'])}\n"
+        f"⏱️ {report['duration_ms'] / 1000:.1f}s ({report['throughput_mb_s']} MB/s)"
+        f"{rotated}",
+        parse_mode="HTML"
+    )
+
+
+@backup_router.message(Command("backups"))
+async def cmd_backups(message: Message):
+    """
+    Lista los respaldos disponibles (más reciente primero).
+
+    Args:
+        message: Mensaje del comando
+    """
+    backups = list_backups()
+    if not backups:
+        await message.answer("📭 No hay respaldos. Usa /backup para crear uno.")
+        return
+
+    lines = [
+        f"• <code>{backup['name']}</code> ({_mb(backup['bytes'])})"
+        for backup in backups
+    ]
+    await message.answer(
+        f"💾 <b>Respaldos disponibles ({len(backups)}):</b>\n\n"
+        + "\n".join(lines)
+        + "\n\n<i>Uso: /restore &lt;archivo&gt;</i>",
+        parse_mode="HTML"
+    )
+
+
+@backup_router.message(Command("restore"))
+async def cmd_restore(message: Message):
+    """
+    Pide confirmación para restaurar un respaldo.
+
+    Uso:
+        /restore backup-20261019-040000.sqlite.gz
+
+    Args:
+        message: Mensaje del comando
+    """
+    args = message.text.split()[1:] if message.text else []
+    names = {backup["name"] for backup in list_backups()}
+
+    if not args or args[0] not in names:
+        await message.answer(
+            "❌ <b>Respaldo no encontrado.</b>\n\n"
+            "Usa /backups para ver los disponibles.",
+            parse_mode="HTML"
+        )
+        return
+
+    name = args[0]
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="⚠️ Sí, restaurar", callback_data=f"backup:restore:{name}")],
+        [InlineKeyboardButton(text="❌ Cancelar", callback_data="backup:cancel")],
+    ])
+    await message.answer(
+        f"⚠️ <b>Restaurar</b> <code>{name}</code>\n\n"
+        f"Se reemplazarán TODOS los datos actuales por los del respaldo.\n"
+        f"Recomendado: ejecuta /backup antes de continuar.",
+        reply_markup=keyboard,
+        parse_mode="HTML"
+    )
+
+
+@backup_router.callback_query(F.data.startswith("backup:restore:"))
+async def callback_restore(callback: CallbackQuery):
+    """Restaura el respaldo confirmado."""
+    name = callback.data.split(":", 2)[2]
+    logger.warning(f"♻️ Admin {callback.from_user.id} confirmó restaurar {name}")
+
+    await callback.answer("Restaurando...")
+    await callback.message.edit_text(f"♻️ <i>Restaurando {name}...</i>", parse_mode="HTML")
+
+    try:
+        report = await restore_backup(name)
+    except Exception as e:
+        logger.exception("Error restaurando respaldo")
+        await callback.message.edit_text(
+            f"❌ <b>Error al restaurar</b>\n\n<code>{str(e)[:500]}</code>",
+            parse_mode="HTML"
+        )
+        return
+
+    await callback.message.edit_text(
+        f"✅ <b>Respaldo restaurado</b>\n\n"
+        f"📄 <code>{report['name']}</code>\n"
+        f"⏱️ {report['duration_ms'] / 1000:.1f}s",
+        parse_mode="HTML"
+    )
+
+
+@backup_router.callback_query(F.data == "backup:cancel")
+async def callback_cancel(callback: CallbackQuery):
+    """Cancela la restauración."""
+    await callback.answer()
+    await callback.message.edit_text("❌ Restauración cancelada.")
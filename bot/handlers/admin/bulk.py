@@ -0,0 +1,254 @@
+"""
+Admin Bulk Operations Handler
+
+Operaciones masivas sobre usuarios (/bulk o "⚙️ Operaciones Masivas"):
+- Extender VIP N días
+- Expulsar de los canales VIP y Free
+- Cambiar rol a FREE o VIP
+
+Objetivos por filtro (VIP activos, usuarios Free) o por lista de IDs
+(texto o archivo .txt/.csv). El job se crea en borrador, se confirma con
+el total de objetivos y corre en background (bot/background/bulk_jobs.py).
+"""
+import logging
+import re
+
+from aiogram import F, Router
+from aiogram.filters import Command
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery, Message
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.background.bulk_jobs import describe_job, start_bulk_job
+from bot.services.bulk_operations import BulkOperationService
+from bot.states.admin import BulkOperationStates
+from bot.utils.keyboards import create_inline_keyboard
+
+logger = logging.getLogger(__name__)
+
+# AdminAuth ya está en admin_router, que lo incluye
+bulk_router = Router(name="admin_bulk")
+
+# Tamaño máximo del archivo con IDs
+MAX_IDS_FILE_BYTES = 2 * 1024 * 1024
+
+_ID_PATTERN = re.compile(r"\d+")
+
+BULK_MENU_TEXT = (
+    "⚙️ <b>Operaciones Masivas</b>\n\n"
+    "Aplica una acción a muchos usuarios a la vez. Se procesa en segundo "
+    "plano, por lotes, y se reporta el progreso en este chat."
+)
+
+
+def _menu_keyboard():
+    return create_inline_keyboard([
+        [{"text": "⏳ Extender VIP", "callback_data": "bulk:op:extend_vip"}],
+        [{"text": "🚫 Expulsar de los canales", "callback_data": "bulk:op:expel"}],
+        [{"text": "🔄 Cambiar rol a FREE", "callback_data": "bulk:role:FREE"}],
+        [{"text": "🔄 Cambiar rol a VIP", "callback_data": "bulk:role:VIP"}],
+        [{"text": "🔙 Volver", "callback_data": "admin:users"}],
+    ])
+
+
+def _targets_keyboard():
+    return create_inline_keyboard([
+        [{"text": "👑 Todos los VIP activos", "callback_data": "bulk:target:vip_active"}],
+        [{"text": "📺 Todos los usuarios Free", "callback_data": "bulk:target:free_users"}],
+        [{"text": "📄 Enviar lista de IDs", "callback_data": "bulk:target:ids"}],
+        [{"text": "❌ Cancelar", "callback_data": "bulk:menu"}],
+    ])
+
+
+async def _show_menu(target: Message, state: FSMContext, edit: bool) -> None:
+    await state.clear()
+    if edit:
+        await target.edit_text(BULK_MENU_TEXT, reply_markup=_menu_keyboard(), parse_mode="HTML")
+    else:
+        await target.answer(BULK_MENU_TEXT, reply_markup=_menu_keyboard(), parse_mode="HTML")
+
+
+@bulk_router.message(Command("bulk"))
+async def cmd_bulk(message: Message, state: FSMContext):
+    """Muestra el menú de operaciones masivas."""
+    await _show_menu(message, state, edit=False)
+
+
+@bulk_router.callback_query(F.data.in_({"admin:bulk", "bulk:menu"}))
+async def callback_bulk_menu(callback: CallbackQuery, state: FSMContext):
+    """Muestra el menú de operaciones masivas (desde botones)."""
+    await callback.answer()
+    await _show_menu(callback.message, state, edit=True)
+
+
+@bulk_router.callback_query(F.data == "bulk:op:extend_vip")
+async def callback_extend_days(callback: CallbackQuery):
+    """Pide los días a extender."""
+    await callback.answer()
+    await callback.message.edit_text(
+        "⏳ <b>Extender VIP</b>\n\n¿Cuántos días se suman a la expiración?",
+        reply_markup=create_inline_keyboard([
+            [{"text": f"+{days} días", "callback_data": f"bulk:days:{days}"} for days in (1, 3, 7)],
+            [{"text": "+30 días", "callback_data": "bulk:days:30"}],
+            [{"text": "❌ Cancelar", "callback_data": "bulk:menu"}],
+        ]),
+        parse_mode="HTML"
+    )
+
+
+@bulk_router.callback_query(
+    F.data.startswith("bulk:days:") | F.data.startswith("bulk:role:") | (F.data == "bulk:op:expel")
+)
+async def callback_choose_targets(callback: CallbackQuery, state: FSMContext):
+    """Guarda operación y parámetros y pide los objetivos."""
+    _, kind, value = callback.data.split(":", 2)
+    if kind == "days":
+        operation, params = "extend_vip", {"days": int(value)}
+    elif kind == "role":
+        operation, params = "change_role", {"role": value}
+    else:
+        operation, params = "expel", {}
+
+    await state.set_data({"operation": operation, "params": params})
+    await callback.answer()
+    await callback.message.edit_text(
+        "🎯 <b>¿A quiénes se aplica?</b>",
+        reply_markup=_targets_keyboard(),
+        parse_mode="HTML"
+    )
+
+
+async def _confirm_draft(
+    target: Message,
+    session: AsyncSession,
+    state: FSMContext,
+    admin_id: int,
+    edit: bool,
+    **targets
+) -> None:
+    """Crea el job en borrador y muestra el total para confirmar."""
+    data = await state.get_data()
+    await state.clear()
+    if "operation" not in data:
+        await target.answer("❌ La operación expiró. Usa /bulk de nuevo.")
+        return
+
+    try:
+        job = await BulkOperationService(session, target.bot).create_job(
+            data["operation"], data["params"], created_by=admin_id,
+            chat_id=target.chat.id, **targets
+        )
+        await session.commit()
+    except ValueError as e:
+        await session.rollback()
+        await target.answer(f"❌ {e}")
+        return
+
+    if job.total == 0:
+        await BulkOperationService(session, target.bot).discard_draft(job.id)
+        await session.commit()
+        text, keyboard = "📭 No hay usuarios que coincidan.", _menu_keyboard()
+    else:
+        text = (
+            f"⚠️ <b>Confirmar operación #{job.id}</b>\n\n"
+            f"{describe_job(job)}\n"
+            f"👥 Objetivos: <b>{job.total:,}</b>\n\n"
+            f"<i>Los administradores se omiten automáticamente.</i>"
+        )
+        keyboard = create_inline_keyboard([
+            [{"text": "✅ Ejecutar", "callback_data": f"bulk:confirm:{job.id}"}],
+            [{"text": "❌ Cancelar", "callback_data": f"bulk:discard:{job.id}"}],
+        ])
+
+    if edit:
+        await target.edit_text(text, reply_markup=keyboard, parse_mode="HTML")
+    else:
+        await target.answer(text, reply_markup=keyboard, parse_mode="HTML")
+
+
+@bulk_router.callback_query(F.data.startswith("bulk:target:"))
+async def callback_target(callback: CallbackQuery, session: AsyncSession, state: FSMContext):
+    """Objetivos por filtro, o pasa a esperar la lista de IDs."""
+    target_filter = callback.data.split(":", 2)[2]
+    await callback.answer()
+
+    if target_filter == "ids":
+        await state.set_state(BulkOperationStates.waiting_for_ids)
+        await callback.message.edit_text(
+            "📄 <b>Envía la lista de IDs</b>\n\n"
+            "Como texto (separados por espacios, comas o líneas) o como "
+            "archivo .txt/.csv.",
+            reply_markup=create_inline_keyboard([
+                [{"text": "❌ Cancelar", "callback_data": "bulk:menu"}]
+            ]),
+            parse_mode="HTML"
+        )
+        return
+
+    await _confirm_draft(
+        callback.message, session, state, callback.from_user.id,
+        edit=True, target_filter=target_filter
+    )
+
+
+@bulk_router.message(BulkOperationStates.waiting_for_ids)
+async def process_ids(message: Message, session: AsyncSession, state: FSMContext):
+    """Recibe la lista de IDs como texto o documento."""
+    if message.document:
+        if message.document.file_size and message.document.file_size > MAX_IDS_FILE_BYTES:
+            await message.answer("❌ El archivo es demasiado grande (máximo 2 MB).")
+            return
+        content = await message.bot.download(message.document)
+        text = content.read().decode("utf-8", errors="ignore")
+    else:
+        text = message.text or ""
+
+    user_ids = [int(match) for match in _ID_PATTERN.findall(text)]
+    if not user_ids:
+        await message.answer("❌ No encontré IDs numéricos. Intenta de nuevo o cancela con /bulk.")
+        return
+
+    await _confirm_draft(
+        message, session, state, message.from_user.id,
+        edit=False, user_ids=user_ids
+    )
+
+
+@bulk_router.callback_query(F.data.startswith("bulk:discard:"))
+async def callback_discard(callback: CallbackQuery, session: AsyncSession):
+    """Descarta un job en borrador."""
+    job_id = int(callback.data.split(":")[2])
+    await BulkOperationService(session, callback.bot).discard_draft(job_id)
+    await session.commit()
+    await callback.answer()
+    await callback.message.edit_text("❌ Operación cancelada.")
+
+
+@bulk_router.callback_query(
+    F.data.startswith("bulk:confirm:") | F.data.startswith("bulk:resume:")
+)
+async def callback_run(callback: CallbackQuery, session: AsyncSession):
+    """Confirma (o reanuda) un job y lo lanza en background."""
+    action, job_id = callback.data.split(":")[1:]
+    job_id = int(job_id)
+
+    service = BulkOperationService(session, callback.bot)
+    job = await service.get_job(job_id)
+    expected = "draft" if action == "confirm" else "failed"
+    if job is None or job.status != expected:
+        await callback.answer("Esta operación ya no está disponible", show_alert=True)
+        return
+
+    job.progress_message_id = callback.message.message_id
+    await session.commit()
+
+    await callback.message.edit_text(
+        f"⚙️ <b>Operación #{job_id}</b>: {describe_job(job)}\n\n<i>Iniciando...</i>",
+        parse_mode="HTML"
+    )
+    if not start_bulk_job(callback.bot, job_id):
+        await callback.answer("⏳ Ya está en ejecución", show_alert=True)
+        return
+
+    logger.info(f"⚙️ Admin {callback.from_user.id} ejecutó job masivo #{job_id} ({action})")
+    await callback.answer("Ejecutando...")
@@ -4,6 +4,7 @@ Content Management Handlers - Admin interface for managing content packages.
 Handlers for listing, viewing, creating, editing, and deactivating content packages.
 """
 import logging
+import time
 from aiogram import Router, F
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
@@ -16,6 +17,7 @@ from bot.services.container import ServiceContainer
 from bot.states.admin import ContentPackageStates
 from bot.utils.pagination import Paginator, create_pagination_keyboard
 from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.edit_cache import edit_text_if_changed
 from typing import List, Optional
 from aiogram.types import InlineKeyboardMarkup
 
@@ -116,7 +118,8 @@ def _create_package_list_keyboard(
         ContentPackageStates.waiting_for_type,
         ContentPackageStates.waiting_for_price,
         ContentPackageStates.waiting_for_description,
-        ContentPackageStates.waiting_for_edit
+        ContentPackageStates.waiting_for_edit,
+        ContentPackageStates.waiting_for_search
     ])
 )
 async def callback_content_menu(callback: CallbackQuery, session: AsyncSession):
@@ -135,7 +138,8 @@ async def callback_content_menu(callback: CallbackQuery, session: AsyncSession):
     text, keyboard = container.message.admin.content.content_menu()
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -171,7 +175,8 @@ async def callback_content_list(callback: CallbackQuery, session: AsyncSession):
     if not all_packages:
         text, keyboard = container.message.admin.content.content_list_empty()
         try:
-            await callback.message.edit_text(
+            await edit_text_if_changed(
+                callback.message,
                 text=text,
                 reply_markup=keyboard,
                 parse_mode="HTML"
@@ -199,7 +204,8 @@ async def callback_content_list(callback: CallbackQuery, session: AsyncSession):
     )
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -258,7 +264,8 @@ async def callback_content_page(callback: CallbackQuery, session: AsyncSession):
     )
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -304,7 +311,8 @@ async def callback_content_view(callback: CallbackQuery, session: AsyncSession):
     text, keyboard = container.message.admin.content.package_detail(package)
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -318,6 +326,64 @@ async def callback_content_view(callback: CallbackQuery, session: AsyncSession):
     await callback.answer()
 
 
+# ===== SEARCH PACKAGES =====
+
+@content_router.callback_query(F.data == "admin:content:search")
+async def callback_content_search(callback: CallbackQuery, state: FSMContext, session: AsyncSession):
+    """
+    Inicia búsqueda full-text de paquetes.
+
+    Args:
+        callback: Callback query
+        state: FSM context
+        session: Sesión de BD
+    """
+    await state.set_state(ContentPackageStates.waiting_for_search)
+
+    container = ServiceContainer(session, callback.bot)
+    text, keyboard = container.message.admin.content.search_prompt()
+    try:
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
+    except Exception as e:
+        if "message is not modified" not in str(e):
+            logger.error(f"❌ Error editando mensaje de búsqueda: {e}")
+
+    await callback.answer()
+
+
+@content_router.message(ContentPackageStates.waiting_for_search)
+async def process_content_search(message: Message, state: FSMContext, session: AsyncSession):
+    """
+    Ejecuta la búsqueda y muestra resultados ordenados por relevancia.
+
+    Args:
+        message: Mensaje con el término de búsqueda
+        state: FSM context
+        session: Sesión de BD
+    """
+    query = (message.text or "").strip()
+
+    if not query or len(query) > 100:
+        await message.answer("❌ Búsqueda inválida. Debe tener 1-100 caracteres.")
+        return  # Keep state active for retry
+
+    container = ServiceContainer(session, message.bot)
+
+    started = time.perf_counter()
+    packages = await container.content.search_packages(query, limit=10)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    logger.info(
+        f"🔍 Búsqueda de paquetes '{query}' por {message.from_user.id}: "
+        f"{len(packages)} resultado(s) en {elapsed_ms:.1f} ms"
+    )
+
+    await state.clear()
+
+    text, keyboard = container.message.admin.content.search_results(query, packages, elapsed_ms)
+    await message.answer(text=text, reply_markup=keyboard, parse_mode="HTML")
+
+
 # ===== CREATE PACKAGE WIZARD (FSM) =====
 
 @content_router.callback_query(F.data == "admin:content:create:start")
@@ -337,7 +403,7 @@ async def callback_content_create_start(callback: CallbackQuery, state: FSMConte
     container = ServiceContainer(session, callback.bot)
     text, keyboard = container.message.admin.content.create_step_name()
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error editando mensaje de creación: {e}")
@@ -404,7 +470,7 @@ async def process_content_type(callback: CallbackQuery, state: FSMContext, sessi
     container = ServiceContainer(session, callback.bot)
     text, keyboard = container.message.admin.content.create_step_price()
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error editando mensaje paso precio: {e}")
@@ -428,7 +494,7 @@ async def skip_content_price(callback: CallbackQuery, state: FSMContext, session
     container = ServiceContainer(session, callback.bot)
     text, keyboard = container.message.admin.content.create_step_description()
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error editando mensaje paso descripción: {e}")
@@ -495,7 +561,7 @@ async def skip_content_description(callback: CallbackQuery, state: FSMContext, s
     # Show success message with action buttons
     text, keyboard = container.message.admin.content.create_success(package)
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error editando mensaje éxito: {e}")
@@ -601,7 +667,7 @@ async def callback_content_edit_field(callback: CallbackQuery, state: FSMContext
 
     text, keyboard = container.message.admin.content.edit_prompt(field_names[field], current_value)
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error editando mensaje edición: {e}")
@@ -631,7 +697,7 @@ async def callback_content_edit_cancel(callback: CallbackQuery, state: FSMContex
         if package:
             text, keyboard = container.message.admin.content.package_detail(package)
             try:
-                await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+                await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
             except Exception as e:
                 if "message is not modified" not in str(e):
                     logger.error(f"❌ Error volviendo a detalle: {e}")
@@ -730,7 +796,7 @@ async def callback_content_deactivate_confirm(callback: CallbackQuery, session:
 
     text, keyboard = container.message.admin.content.deactivate_confirm(package)
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error editando mensaje desactivación: {e}")
@@ -765,7 +831,7 @@ async def callback_content_deactivate(callback: CallbackQuery, session: AsyncSes
         if package:
             text, keyboard = container.message.admin.content.package_detail(package)
             try:
-                await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+                await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
             except Exception as e:
                 if "message is not modified" not in str(e):
                     logger.error(f"❌ Error editando mensaje después de desactivar: {e}")
@@ -806,7 +872,7 @@ async def callback_content_reactivate_confirm(callback: CallbackQuery, session:
 
     text, keyboard = container.message.admin.content.reactivate_confirm(package)
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error editando mensaje reactivación: {e}")
@@ -841,7 +907,7 @@ async def callback_content_reactivate(callback: CallbackQuery, session: AsyncSes
         if package:
             text, keyboard = container.message.admin.content.package_detail(package)
             try:
-                await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+                await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
             except Exception as e:
                 if "message is not modified" not in str(e):
                     logger.error(f"❌ Error editando mensaje después de reactivar: {e}")
@@ -859,7 +925,8 @@ async def callback_content_reactivate(callback: CallbackQuery, session: AsyncSes
         ContentPackageStates.waiting_for_type,
         ContentPackageStates.waiting_for_price,
         ContentPackageStates.waiting_for_description,
-        ContentPackageStates.waiting_for_edit
+        ContentPackageStates.waiting_for_edit,
+        ContentPackageStates.waiting_for_search
     ])
 )
 async def callback_content_create_cancel(callback: CallbackQuery, state: FSMContext, session: AsyncSession):
@@ -876,7 +943,7 @@ async def callback_content_create_cancel(callback: CallbackQuery, state: FSMCont
     container = ServiceContainer(session, callback.bot)
     text, keyboard = container.message.admin.content.content_menu()
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.error(f"❌ Error volviendo al menú contenido: {e}")
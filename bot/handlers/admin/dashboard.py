@@ -21,6 +21,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.handlers.admin.main import admin_router
 from bot.services.container import ServiceContainer
 from bot.background.tasks import get_scheduler_status
+from bot.database.maintenance import get_storage_summary
+from bot.services.message.session_history import get_session_history
 from bot.utils.keyboards import create_inline_keyboard
 
 logger = logging.getLogger(__name__)
@@ -38,6 +40,7 @@ async def callback_admin_dashboard(
     - Estado de configuración (canales, reacciones)
     - Estadísticas clave (VIP, Free, Tokens)
     - Background tasks (estado, próxima ejecución)
+    - Historial de sesión (usuarios en memoria, desalojos)
     - Health checks
     - Acciones rápidas
 
@@ -129,6 +132,8 @@ async def _gather_dashboard_data(container: ServiceContainer) -> dict:
         },
         "stats": overall_stats,
         "scheduler": scheduler_status,
+        "session_history": get_session_history().get_stats(),
+        "storage": await get_storage_summary(),
         "health": health,
         "timestamp": datetime.now(timezone.utc)
     }
@@ -305,6 +310,30 @@ def _format_dashboard_message(data: dict) -> str:
 
     message += "\n┗━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 
+    # Historial de sesión (memoria del proceso)
+    history = data.get("session_history")
+    if history:
+        message += "\n\n┏━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+        message += "\n┃ <b>💬 HISTORIAL DE SESIÓN</b>"
+        message += "\n┣━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+        message += f"\n┃ Usuarios: {history['total_users']}/{history['max_users']}"
+        message += f"\n┃ Entradas activas: {history['active_entries']}/{history['total_entries']}"
+        message += f"\n┃ Desalojados (LRU): {history['evictions']}"
+        message += "\n┗━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+    # Almacenamiento SQLite (WAL, páginas, fragmentación)
+    storage = data.get("storage")
+    if storage:
+        message += "\n\n┏━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+        message += "\n┃ <b>🗄️ ALMACENAMIENTO</b>"
+        message += "\n┣━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+        message += f"\n┃ Base: {storage['db_bytes'] / 1_048_576:.1f} MB ({storage['page_count']} páginas)"
+        message += f"\n┃ WAL: {storage['wal_bytes'] / 1_048_576:.1f} MB"
+        message += f"\n┃ Fragmentación: {storage['fragmentation_pct']}%"
+        last = storage["last_maintenance"]
+        message += f"\n┃ Mantenimiento: {last['ran_at'][:16].replace('T', ' ') if last else 'pendiente'}"
+        message += "\n┗━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
     # Footer con timestamp
     timestamp = data["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
     message += f"\n\n<i>Actualizado: {timestamp} UTC</i>"
@@ -0,0 +1,80 @@
+"""
+Admin Export Handler
+
+Exporte completo de datos como CSV comprimido (.csv.gz):
+- Botón "📤 Exportar Datos" del menú admin o /export
+- Suscriptores VIP (con tarifa y expiración), usuarios, tokens y cambios de rol
+
+El exporte corre en background (bot/background/exports.py): el mensaje de
+estado se edita con el progreso y el archivo llega como documento.
+
+Solo accesible para administradores.
+"""
+
+import logging
+
+from aiogram import Router, F
+from aiogram.filters import Command
+from aiogram.types import Message, CallbackQuery
+
+from bot.background.exports import EXPORTS, start_export
+from bot.middlewares import AdminAuthMiddleware
+from bot.utils.keyboards import create_inline_keyboard
+
+logger = logging.getLogger(__name__)
+
+export_router = Router(name="admin_export")
+export_router.message.middleware(AdminAuthMiddleware())
+export_router.callback_query.middleware(AdminAuthMiddleware())
+
+EXPORT_MENU_TEXT = (
+    "📤 <b>Exportar Datos</b>\n\n"
+    "Se genera un CSV comprimido (.csv.gz) con <b>todas</b> las filas y "
+    "se envía como documento. Puedes seguir usando el bot mientras tanto."
+)
+
+
+def _export_menu_keyboard():
+    return create_inline_keyboard(
+        [[{"text": f"📄 {spec.title}", "callback_data": f"export:{spec.kind}"}]
+         for spec in EXPORTS.values()]
+        + [[{"text": "🔙 Volver al Menú Principal", "callback_data": "admin:main"}]]
+    )
+
+
+@export_router.message(Command("export"))
+async def cmd_export(message: Message):
+    """Muestra las opciones de exporte."""
+    await message.answer(EXPORT_MENU_TEXT, reply_markup=_export_menu_keyboard(), parse_mode="HTML")
+
+
+@export_router.callback_query(F.data == "admin:export")
+async def callback_export_menu(callback: CallbackQuery):
+    """Muestra las opciones de exporte desde el menú admin."""
+    await callback.answer()
+    await callback.message.edit_text(
+        EXPORT_MENU_TEXT, reply_markup=_export_menu_keyboard(), parse_mode="HTML"
+    )
+
+
+@export_router.callback_query(F.data.startswith("export:"))
+async def callback_start_export(callback: CallbackQuery):
+    """Lanza el exporte elegido en background."""
+    kind = callback.data.split(":", 1)[1]
+    spec = EXPORTS.get(kind)
+    if spec is None:
+        await callback.answer("❌ Exporte desconocido", show_alert=True)
+        return
+
+    chat_id = callback.message.chat.id
+    status_msg = await callback.message.answer(
+        f"📤 <i>Preparando exporte de {spec.title}...</i>", parse_mode="HTML"
+    )
+
+    if not start_export(callback.bot, chat_id, status_msg.message_id, kind):
+        await callback.answer("⏳ Ya hay un exporte en curso", show_alert=True)
+        await status_msg.delete()
+        return
+
+    logger.info(f"📤 Admin {callback.from_user.id} inició exporte {kind}")
+    await callback.answer("Exportando...")
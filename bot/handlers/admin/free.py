@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.handlers.admin.main import admin_router
 from bot.states.admin import ChannelSetupStates, WaitTimeSetupStates
 from bot.services.container import ServiceContainer
+from bot.utils.edit_cache import edit_text_if_changed
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +63,8 @@ async def callback_free_menu(callback: CallbackQuery, session: AsyncSession):
         )
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -99,7 +101,8 @@ async def callback_free_setup(
     text, keyboard = container.message.admin.free.setup_channel_prompt()
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -202,7 +205,8 @@ async def callback_set_wait_time(
     text, keyboard = container.message.admin.free.wait_time_setup_prompt(current_wait_time)
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -299,7 +303,8 @@ async def callback_free_config(callback: CallbackQuery, session: AsyncSession):
     text, keyboard = container.message.admin.free.config_menu(wait_time)
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -327,14 +332,16 @@ async def callback_view_free_queue(callback: CallbackQuery, session: AsyncSessio
     container = ServiceContainer(session, callback.bot)
 
     try:
-        # Get pending requests
-        pending_requests = await container.subscription.get_pending_free_requests()
+        # Get pending requests (solo las 10 que se muestran + COUNT)
+        pending_requests = await container.subscription.get_pending_free_requests(limit=10)
+        pending_count = await container.subscription.get_pending_free_requests_count()
         wait_time = await container.config.get_wait_time()
 
         # Get message from provider
         text, keyboard = container.message.admin.free.free_queue_view(
             pending_requests=pending_requests,
-            wait_time_minutes=wait_time
+            wait_time_minutes=wait_time,
+            total_count=pending_count
         )
 
         await callback.message.edit_text(
@@ -4,6 +4,8 @@ Interest Management Handlers - Admin interface for managing user interests.
 Handlers for listing, viewing, filtering, and marking user interests as attended.
 """
 import logging
+from typing import Optional
+
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +13,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.database.enums import ContentCategory
 from bot.middlewares import DatabaseMiddleware
 from bot.services.container import ServiceContainer
+from bot.utils.callback_routing import CallbackArgs
+from bot.utils.edit_cache import edit_text_if_changed
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +52,7 @@ async def callback_interests_menu(callback: CallbackQuery, session: AsyncSession
     )
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -127,7 +131,7 @@ async def _show_interests_list_impl(
         text, keyboard = container.message.admin.interest.interests_empty(filter_type)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -166,7 +170,11 @@ async def callback_interests_list(callback: CallbackQuery, session: AsyncSession
 # ===== PAGINATION =====
 
 @interests_router.callback_query(F.data.startswith("admin:interests:page:"))
-async def callback_interests_page(callback: CallbackQuery, session: AsyncSession):
+async def callback_interests_page(
+    callback: CallbackQuery,
+    session: AsyncSession,
+    callback_args: Optional[CallbackArgs] = None
+):
     """
     Show specific page of interests list.
 
@@ -175,17 +183,16 @@ async def callback_interests_page(callback: CallbackQuery, session: AsyncSession
     Args:
         callback: Callback query
         session: Sesión de BD
+        callback_args: Segmentos ya parseados por el ruteo indexado
     """
-    # Extract page and filter from callback
-    parts = callback.data.split(":")
-    try:
-        page = int(parts[3]) if len(parts) > 3 else 1
-    except (ValueError, IndexError):
+    args = callback_args or CallbackArgs.parse(callback.data, "admin:interests:page:")
+    if args.parts and args.get_int(0) is None:
         logger.warning(f"⚠️ Invalid page number in callback: {callback.data}")
         await callback.answer("❌ Página inválida", show_alert=True)
         return
 
-    filter_type = parts[4] if len(parts) > 4 else "all"
+    page = args.get_int(0, default=1)
+    filter_type = args.get_str(1, default="all")
 
     await _show_interests_list_impl(callback, session, filter_type, page)
 
@@ -193,7 +200,11 @@ async def callback_interests_page(callback: CallbackQuery, session: AsyncSession
 # ===== VIEW DETAIL =====
 
 @interests_router.callback_query(F.data.startswith("admin:interest:view:"))
-async def callback_interests_view(callback: CallbackQuery, session: AsyncSession):
+async def callback_interests_view(
+    callback: CallbackQuery,
+    session: AsyncSession,
+    callback_args: Optional[CallbackArgs] = None
+):
     """
     Show detailed view of single interest.
 
@@ -202,13 +213,13 @@ async def callback_interests_view(callback: CallbackQuery, session: AsyncSession
     Args:
         callback: Callback query
         session: Sesión de BD
+        callback_args: Segmentos ya parseados por el ruteo indexado
     """
     container = ServiceContainer(session, callback.bot)
 
-    # Extract interest ID
-    try:
-        interest_id = int(callback.data.split(":")[-1])
-    except (ValueError, IndexError):
+    args = callback_args or CallbackArgs.parse(callback.data, "admin:interest:view:")
+    interest_id = args.get_int(0)
+    if interest_id is None:
         logger.warning(f"⚠️ Invalid interest ID in callback: {callback.data}")
         await callback.answer("❌ ID de interés inválido", show_alert=True)
         return
@@ -224,7 +235,7 @@ async def callback_interests_view(callback: CallbackQuery, session: AsyncSession
     text, keyboard = container.message.admin.interest.interest_detail(interest)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -257,7 +268,7 @@ async def callback_interests_filters(callback: CallbackQuery, session: AsyncSess
     text, keyboard = container.message.admin.interest.interests_filters(current_filter)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -289,7 +300,7 @@ async def callback_interests_stats(callback: CallbackQuery, session: AsyncSessio
     text, keyboard = container.message.admin.interest.interests_stats(stats)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -331,7 +342,7 @@ async def _show_attend_confirmation_impl(
     text, keyboard = container.message.admin.interest.mark_attended_confirm(interest)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -372,7 +383,11 @@ async def callback_interest_attend_confirm(callback: CallbackQuery, session: Asy
 # ===== MARK ATTENDED ACTION =====
 
 @interests_router.callback_query(F.data.startswith("admin:interest:confirm_attend:"))
-async def callback_interest_attend(callback: CallbackQuery, session: AsyncSession):
+async def callback_interest_attend(
+    callback: CallbackQuery,
+    session: AsyncSession,
+    callback_args: Optional[CallbackArgs] = None
+):
     """
     Mark interest as attended (confirmed).
 
@@ -381,13 +396,13 @@ async def callback_interest_attend(callback: CallbackQuery, session: AsyncSessio
     Args:
         callback: Callback query
         session: Sesión de BD
+        callback_args: Segmentos ya parseados por el ruteo indexado
     """
     container = ServiceContainer(session, callback.bot)
 
-    # Extract interest ID
-    try:
-        interest_id = int(callback.data.split(":")[-1])
-    except (ValueError, IndexError):
+    args = callback_args or CallbackArgs.parse(callback.data, "admin:interest:confirm_attend:")
+    interest_id = args.get_int(0)
+    if interest_id is None:
         logger.warning(f"⚠️ Invalid interest ID in callback: {callback.data}")
         await callback.answer("❌ ID de interés inválido", show_alert=True)
         return
@@ -407,7 +422,7 @@ async def callback_interest_attend(callback: CallbackQuery, session: AsyncSessio
         text, keyboard = container.message.admin.interest.mark_attended_success(interest)
 
         try:
-            await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+            await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
         except Exception as e:
             if "message is not modified" not in str(e):
                 logger.warning(f"Could not edit message: {e}")
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.middlewares import AdminAuthMiddleware, DatabaseMiddleware
 from bot.services.container import ServiceContainer
+from bot.utils.edit_cache import edit_text_if_changed
 from bot.handlers.admin import content as admin_content
 from bot.handlers.admin import interests as admin_interests
 from bot.handlers.admin import users as admin_users
@@ -31,7 +32,7 @@ admin_router.include_router(admin_users.users_router)
 
 # Importar handlers para que se registren sus callbacks
 # (usan @admin_router.callback_query decorator)
-from bot.handlers.admin import vip, free, pricing, stats, dashboard, broadcast, management
+from bot.handlers.admin import vip, free, stats, dashboard, broadcast, management
 
 # Registrar handlers de callbacks del menú
 from bot.handlers.admin.menu_callbacks import register_menu_callbacks
@@ -108,7 +109,8 @@ async def callback_admin_main(callback: CallbackQuery, session: AsyncSession):
 
     # Editar mensaje existente (no enviar nuevo)
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -145,7 +147,8 @@ async def callback_admin_config(callback: CallbackQuery, session: AsyncSession):
 
     # Editar mensaje con menú de config
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -191,7 +194,8 @@ async def callback_config_status(callback: CallbackQuery, session: AsyncSession)
     )
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
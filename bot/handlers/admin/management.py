@@ -26,6 +26,7 @@ from bot.utils.pagination import (
     format_items_list,
 )
 from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.edit_cache import edit_text_if_changed
 
 logger = logging.getLogger(__name__)
 
@@ -214,7 +215,8 @@ async def _show_vip_subscribers_page(
     )
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
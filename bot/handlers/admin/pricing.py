@@ -10,14 +10,13 @@ Handlers para:
 """
 import logging
 
-from aiogram import F
+from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database.models import InvitationToken
-from bot.handlers.admin.main import admin_router
 from bot.services.container import ServiceContainer
 from bot.states.admin import PricingSetupStates
 from bot.utils.formatters import format_currency
@@ -25,6 +24,10 @@ from bot.utils.keyboards import create_inline_keyboard
 
 logger = logging.getLogger(__name__)
 
+# Router de tarifas (se carga bajo demanda, ver bot/handlers/lazy.py)
+# AdminAuth ya está en admin_router, que lo incluye
+pricing_router = Router(name="admin_pricing")
+
 
 def _format_plan_summary(plan) -> str:
     """Formatea resumen de un plan."""
@@ -39,7 +42,7 @@ def _format_plan_summary(plan) -> str:
 
 # ===== MENÚ PRINCIPAL DE TARIFAS =====
 
-@admin_router.callback_query(F.data == "admin:pricing")
+@pricing_router.callback_query(F.data == "admin:pricing")
 async def callback_pricing_menu(
     callback: CallbackQuery,
     session: AsyncSession
@@ -94,7 +97,7 @@ async def callback_pricing_menu(
 
 # ===== CREAR NUEVA TARIFA (FSM) =====
 
-@admin_router.callback_query(F.data == "pricing:create")
+@pricing_router.callback_query(F.data == "pricing:create")
 async def callback_pricing_create_start(
     callback: CallbackQuery,
     state: FSMContext
@@ -132,7 +135,7 @@ async def callback_pricing_create_start(
     await callback.answer()
 
 
-@admin_router.message(PricingSetupStates.waiting_for_name)
+@pricing_router.message(PricingSetupStates.waiting_for_name)
 async def process_pricing_name(
     message: Message,
     state: FSMContext
@@ -181,7 +184,7 @@ async def process_pricing_name(
     )
 
 
-@admin_router.message(PricingSetupStates.waiting_for_days)
+@pricing_router.message(PricingSetupStates.waiting_for_days)
 async def process_pricing_days(
     message: Message,
     state: FSMContext
@@ -238,7 +241,7 @@ async def process_pricing_days(
     )
 
 
-@admin_router.message(PricingSetupStates.waiting_for_price)
+@pricing_router.message(PricingSetupStates.waiting_for_price)
 async def process_pricing_price(
     message: Message,
     state: FSMContext,
@@ -331,7 +334,7 @@ async def process_pricing_price(
         await state.clear()
 
 
-@admin_router.callback_query(F.data == "pricing:cancel")
+@pricing_router.callback_query(F.data == "pricing:cancel")
 async def callback_pricing_cancel(
     callback: CallbackQuery,
     state: FSMContext
@@ -358,7 +361,7 @@ async def callback_pricing_cancel(
 
 # ===== LISTAR TARIFAS =====
 
-@admin_router.callback_query(F.data == "pricing:list")
+@pricing_router.callback_query(F.data == "pricing:list")
 async def callback_pricing_list(
     callback: CallbackQuery,
     session: AsyncSession
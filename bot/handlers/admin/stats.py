@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.handlers.admin.main import admin_router
 from bot.services.container import ServiceContainer
 from bot.utils.keyboards import stats_menu_keyboard, back_to_main_menu_keyboard
+from bot.utils.edit_cache import edit_text_if_changed
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +83,8 @@ async def callback_stats_general(callback: CallbackQuery, session: AsyncSession)
         # Construir mensaje
         text = _format_overall_stats_message(stats)
 
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=stats_menu_keyboard(),
             parse_mode="HTML"
@@ -153,7 +155,8 @@ async def callback_stats_refresh(callback: CallbackQuery, session: AsyncSession)
 
         text = _format_overall_stats_message(stats)
 
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=stats_menu_keyboard(),
             parse_mode="HTML"
@@ -217,7 +220,8 @@ async def callback_stats_vip(callback: CallbackQuery, session: AsyncSession):
 
         text = _format_vip_stats_message(vip_stats)
 
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=stats_menu_keyboard(),
             parse_mode="HTML"
@@ -289,7 +293,8 @@ async def callback_stats_free(callback: CallbackQuery, session: AsyncSession):
 
         text = _format_free_stats_message(free_stats)
 
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=stats_menu_keyboard(),
             parse_mode="HTML"
@@ -360,7 +365,8 @@ async def callback_stats_tokens(callback: CallbackQuery, session: AsyncSession):
 
         text = _format_token_stats_message(token_stats)
 
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=stats_menu_keyboard(),
             parse_mode="HTML"
@@ -13,6 +13,7 @@ from bot.middlewares import DatabaseMiddleware
 from bot.services.container import ServiceContainer
 from bot.states.admin import UserManagementStates
 from bot.utils import CallbackParser, CallbackData
+from bot.utils.edit_cache import edit_text_if_changed
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,7 @@ async def callback_users_menu(callback: CallbackQuery, session: AsyncSession):
     )
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -138,7 +139,7 @@ async def callback_users_list(callback: CallbackQuery, session: AsyncSession):
         keyboard = keyboard.as_markup()
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -217,7 +218,7 @@ async def callback_users_page(callback: CallbackQuery, session: AsyncSession):
         keyboard = keyboard.as_markup()
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -249,7 +250,7 @@ async def callback_users_search(callback: CallbackQuery, state, session: AsyncSe
     text, keyboard = container.message.admin.user.user_search_prompt()
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -339,7 +340,7 @@ async def callback_user_view(callback: CallbackQuery, session: AsyncSession):
         text, keyboard = container.message.admin.user.user_detail_overview(user_info)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -425,7 +426,7 @@ async def callback_user_role(callback: CallbackQuery, session: AsyncSession):
     )
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard.as_markup(), parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard.as_markup(), parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -495,7 +496,7 @@ async def callback_user_role_confirm(callback: CallbackQuery, session: AsyncSess
         await callback.answer(f"❌ {message}", show_alert=True)
         text, keyboard = container.message.admin.user.action_error(message)
         try:
-            await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+            await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
         except Exception as e:
             if "message is not modified" not in str(e):
                 logger.warning(f"Could not edit message: {e}")
@@ -509,7 +510,7 @@ async def callback_user_role_confirm(callback: CallbackQuery, session: AsyncSess
     )
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -575,7 +576,7 @@ async def callback_user_expel(callback: CallbackQuery, session: AsyncSession):
     text, keyboard = container.message.admin.user.expel_confirm(user_info)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -630,7 +631,7 @@ async def callback_user_expel_confirm(callback: CallbackQuery, session: AsyncSes
         await callback.answer(f"❌ {message}", show_alert=True)
         text, keyboard = container.message.admin.user.action_error(message)
         try:
-            await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+            await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
         except Exception as e:
             if "message is not modified" not in str(e):
                 logger.warning(f"Could not edit message: {e}")
@@ -643,7 +644,7 @@ async def callback_user_expel_confirm(callback: CallbackQuery, session: AsyncSes
     )
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -713,7 +714,7 @@ async def callback_user_delete(callback: CallbackQuery, state, session: AsyncSes
     text, keyboard = container.message.admin.user.delete_confirm(user_info)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -773,7 +774,7 @@ async def callback_user_delete_confirm(callback: CallbackQuery, state, session:
         await callback.answer(f"❌ {message}", show_alert=True)
         text, keyboard = container.message.admin.user.action_error(message)
         try:
-            await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+            await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
         except Exception as e:
             if "message is not modified" not in str(e):
                 logger.warning(f"Could not edit message: {e}")
@@ -783,7 +784,7 @@ async def callback_user_delete_confirm(callback: CallbackQuery, state, session:
     text, keyboard = container.message.admin.user.delete_success(user_info=user_info)
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -852,7 +853,7 @@ async def callback_user_block(callback: CallbackQuery, session: AsyncSession):
     )
 
     try:
-        await callback.message.edit_text(text=placeholder_text, reply_markup=keyboard.as_markup(), parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=placeholder_text, reply_markup=keyboard.as_markup(), parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
@@ -909,7 +910,7 @@ async def callback_users_filters(callback: CallbackQuery, session: AsyncSession)
     )
 
     try:
-        await callback.message.edit_text(text=text, reply_markup=keyboard.as_markup(), parse_mode="HTML")
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard.as_markup(), parse_mode="HTML")
     except Exception as e:
         if "message is not modified" not in str(e):
             logger.warning(f"Could not edit message: {e}")
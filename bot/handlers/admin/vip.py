@@ -5,21 +5,27 @@ Handlers para:
 - Submenú VIP
 - Configuración del canal VIP
 - Generación de tokens de invitación con deep links
+- Generación de tokens en lote con exportación CSV
 
 All messages now use centralized AdminVIPMessages provider for voice consistency.
 """
 import logging
-from datetime import timedelta
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
 
 from aiogram import F
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery, FSInputFile, Message
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.handlers.admin.main import admin_router
 from bot.services.container import ServiceContainer
-from bot.states.admin import ChannelSetupStates
+from bot.states.admin import ChannelSetupStates, VIPTokenBulkStates
+from bot.utils.exports import write_csv_tempfile
 from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.edit_cache import edit_text_if_changed
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -54,8 +60,7 @@ async def callback_vip_menu(callback: CallbackQuery, session: AsyncSession):
 
         # Get subscriber count (optional - can be 0 if stats not available)
         try:
-            all_vips = await container.subscription.get_all_vip_subscribers(status="active")
-            subscriber_count = len(all_vips)
+            subscriber_count = await container.subscription.count_vip_subscribers(status="active")
         except Exception as e:
             logger.warning(f"Could not get VIP count: {e}")
             subscriber_count = 0
@@ -71,7 +76,8 @@ async def callback_vip_menu(callback: CallbackQuery, session: AsyncSession):
     )
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -111,7 +117,8 @@ async def callback_vip_setup(
     text, keyboard = container.message.admin.vip.setup_channel_prompt()
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
@@ -371,6 +378,296 @@ async def callback_generate_token_with_plan(
         )
 
 
+# ===== GENERACIÓN DE TOKENS EN LOTE =====
+
+@admin_router.callback_query(F.data == "vip:bulk:start")
+async def callback_bulk_tokens_select_plan(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession
+):
+    """
+    Muestra selección de tarifa para generar tokens en lote.
+
+    Args:
+        callback: Callback query
+        state: FSM context
+        session: Sesión de BD
+    """
+    await state.clear()
+
+    container = ServiceContainer(session, callback.bot)
+    plans = await container.pricing.get_all_plans(active_only=True)
+
+    if not plans:
+        text, keyboard = container.message.admin.vip.no_plans_configured()
+    else:
+        text, keyboard = container.message.admin.vip.select_plan_for_bulk_tokens([
+            {
+                "id": plan.id,
+                "name": plan.name,
+                "duration_days": plan.duration_days,
+                "price": plan.price,
+                "currency": plan.currency
+            }
+            for plan in plans
+        ])
+
+    try:
+        await edit_text_if_changed(callback.message, text=text, reply_markup=keyboard, parse_mode="HTML")
+    except Exception as e:
+        if "message is not modified" not in str(e):
+            logger.error(f"❌ Error mostrando planes para lote: {e}")
+
+    await callback.answer()
+
+
+@admin_router.callback_query(F.data.startswith("vip:bulk:plan:"))
+async def callback_bulk_tokens_plan_selected(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession
+):
+    """
+    Guarda la tarifa elegida y pide la cantidad de tokens.
+
+    Args:
+        callback: Callback query
+        state: FSM context
+        session: Sesión de BD
+    """
+    try:
+        plan_id = int(callback.data.split(":")[3])
+    except (IndexError, ValueError) as e:
+        logger.error(f"❌ Error parseando plan_id: {callback.data} - {e}")
+        await callback.answer("❌ Error al seleccionar tarifa", show_alert=True)
+        return
+
+    container = ServiceContainer(session, callback.bot)
+    plan = await container.pricing.get_plan_by_id(plan_id)
+
+    if not plan or not plan.active:
+        await callback.answer("❌ Tarifa no disponible", show_alert=True)
+        return
+
+    await state.set_state(VIPTokenBulkStates.waiting_for_count)
+    await state.update_data(plan_id=plan.id)
+
+    text, keyboard = container.message.admin.vip.bulk_tokens_count_prompt(
+        plan_name=plan.name,
+        max_count=container.subscription.MAX_BULK_TOKENS
+    )
+    await callback.message.edit_text(text=text, reply_markup=keyboard, parse_mode="HTML")
+    await callback.answer()
+
+
+@admin_router.callback_query(F.data == "vip:bulk:cancel")
+async def callback_bulk_tokens_cancel(
+    callback: CallbackQuery,
+    state: FSMContext,
+    session: AsyncSession
+):
+    """
+    Cancela la generación en lote y vuelve al menú VIP.
+
+    Args:
+        callback: Callback query
+        state: FSM context
+        session: Sesión de BD
+    """
+    await state.clear()
+    await callback_vip_menu(callback, session)
+
+
+@admin_router.message(VIPTokenBulkStates.waiting_for_count)
+async def process_bulk_tokens_count(
+    message: Message,
+    state: FSMContext,
+    session: AsyncSession
+):
+    """
+    Genera N tokens en una transacción y envía un CSV con sus deep links.
+
+    El CSV se escribe fila a fila a un archivo temporal (no se arma en
+    memoria) y se elimina después de enviarlo.
+
+    Args:
+        message: Mensaje con la cantidad
+        state: FSM context
+        session: Sesión de BD
+    """
+    container = ServiceContainer(session, message.bot)
+    max_count = container.subscription.MAX_BULK_TOKENS
+
+    try:
+        count = int((message.text or "").strip())
+    except ValueError:
+        count = 0
+
+    if not 1 <= count <= max_count:
+        await message.answer(f"❌ Cantidad inválida. Envía un número entre 1 y {max_count}.")
+        return  # Mantener estado para reintentar
+
+    data = await state.get_data()
+    await state.clear()
+
+    plan = await container.pricing.get_plan_by_id(data.get("plan_id"))
+    if not plan or not plan.active:
+        await message.answer("❌ Tarifa no disponible")
+        return
+
+    logger.info(
+        f"📦 Admin {message.from_user.id} generando {count} tokens en lote "
+        f"con plan: {plan.name} (ID: {plan.id})"
+    )
+
+    batch_at = datetime.utcnow()
+    try:
+        started = time.perf_counter()
+        tokens = await container.subscription.generate_vip_tokens_bulk(
+            generated_by=message.from_user.id,
+            count=count,
+            duration_hours=plan.duration_days * 24,
+            plan_id=plan.id,
+            created_at=batch_at
+        )
+        await session.commit()
+        elapsed = time.perf_counter() - started
+
+    except Exception as e:
+        # Nada quedó emitido: reintentar genera el lote desde cero
+        logger.error(f"❌ Error generando tokens en lote: {e}", exc_info=True)
+        await session.rollback()
+
+        error_msg = container.message.common.error(
+            context="al generar el lote de invitaciones",
+            suggestion="Intente con una cantidad menor"
+        )
+        await message.answer(
+            error_msg,
+            reply_markup=create_inline_keyboard([
+                [{"text": "🔄 Reintentar", "callback_data": "vip:bulk:start"}],
+                [{"text": "🔙 Volver", "callback_data": "admin:vip"}]
+            ]),
+            parse_mode="HTML"
+        )
+        return
+
+    logger.info(
+        f"✅ Lote generado: {len(tokens)} tokens | Plan: {plan.name} | "
+        f"{elapsed:.2f}s ({len(tokens) / elapsed if elapsed else 0:.0f} tokens/s)"
+    )
+    await _send_bulk_tokens_csv(message, container, plan, tokens, batch_at, elapsed)
+
+
+async def _send_bulk_tokens_csv(
+    message: Message,
+    container: ServiceContainer,
+    plan,
+    tokens,
+    batch_at: datetime,
+    elapsed: Optional[float] = None
+) -> bool:
+    """
+    Envía el CSV de un lote ya confirmado en la BD.
+
+    Si el envío falla, el botón de reintento solo reenvía el documento del
+    mismo lote (vip:bulk:resend); nunca vuelve a emitir invitaciones.
+
+    Args:
+        message: Mensaje del chat donde se envía el documento
+        container: ServiceContainer de la petición
+        plan: Plan del lote
+        tokens: Tokens del lote en orden de inserción
+        batch_at: Fecha compartida por el lote
+        elapsed: Tiempo de emisión en segundos (None al reenviar)
+
+    Returns:
+        True si el documento se envió
+    """
+    csv_path = None
+    try:
+        bot_username = (await message.bot.me()).username
+        expires_at = (batch_at + timedelta(days=plan.duration_days)).strftime("%Y-%m-%d %H:%M")
+        csv_path, _ = write_csv_tempfile(
+            ["token", "deep_link", "plan", "expires_at_utc"],
+            (
+                (token, f"https://t.me/{bot_username}?start={token}", plan.name, expires_at)
+                for token in tokens
+            ),
+            prefix="vip_tokens_"
+        )
+
+        caption, keyboard = container.message.admin.vip.bulk_tokens_generated(
+            plan_name=plan.name,
+            count=len(tokens),
+            elapsed_seconds=elapsed
+        )
+        await message.answer_document(
+            FSInputFile(csv_path, filename=f"invitaciones_{plan.id}_{len(tokens)}.csv"),
+            caption=caption,
+            reply_markup=keyboard,
+            parse_mode="HTML"
+        )
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Error enviando el CSV del lote de tokens: {e}", exc_info=True)
+
+        error_msg = container.message.common.error(
+            context="al enviar el documento del lote",
+            suggestion="Las invitaciones ya fueron emitidas; puede reenviar el documento"
+        )
+        await message.answer(
+            error_msg,
+            reply_markup=create_inline_keyboard([
+                [{
+                    "text": "📄 Reenviar Documento",
+                    "callback_data": f"vip:bulk:resend:{plan.id}:{batch_at:%Y%m%d%H%M%S%f}"
+                }],
+                [{"text": "🔙 Volver", "callback_data": "admin:vip"}]
+            ]),
+            parse_mode="HTML"
+        )
+        return False
+    finally:
+        if csv_path:
+            os.remove(csv_path)
+
+
+@admin_router.callback_query(F.data.startswith("vip:bulk:resend:"))
+async def callback_bulk_tokens_resend(callback: CallbackQuery, session: AsyncSession):
+    """
+    Reenvía el CSV de un lote ya emitido (no genera invitaciones nuevas).
+
+    Args:
+        callback: Callback query
+        session: Sesión de BD
+    """
+    try:
+        _, _, _, plan_id, batch_key = callback.data.split(":")
+        plan_id = int(plan_id)
+        batch_at = datetime.strptime(batch_key, "%Y%m%d%H%M%S%f")
+    except ValueError as e:
+        logger.error(f"❌ Error parseando lote: {callback.data} - {e}")
+        await callback.answer("❌ Lote no válido", show_alert=True)
+        return
+
+    container = ServiceContainer(session, callback.bot)
+    plan = await container.pricing.get_plan_by_id(plan_id)
+    tokens = await container.subscription.get_bulk_tokens(
+        generated_by=callback.from_user.id,
+        created_at=batch_at,
+        plan_id=plan_id
+    )
+    if not plan or not tokens:
+        await callback.answer("❌ Lote no encontrado", show_alert=True)
+        return
+
+    await callback.answer("📄 Reenviando...")
+    await _send_bulk_tokens_csv(callback.message, container, plan, tokens, batch_at)
+
+
 # ===== SUBMENÚ DE CONFIGURACIÓN VIP =====
 
 @admin_router.callback_query(F.data == "vip:config")
@@ -396,7 +693,8 @@ async def callback_vip_config(callback: CallbackQuery, session: AsyncSession):
     ])
 
     try:
-        await callback.message.edit_text(
+        await edit_text_if_changed(
+            callback.message,
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
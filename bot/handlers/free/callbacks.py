@@ -13,7 +13,7 @@ Pattern: Sigue estructura de VIP callbacks con router separado.
 """
 import logging
 
-from aiogram import Router
+from aiogram import F, Router
 from aiogram.types import CallbackQuery
 
 from bot.database.enums import ContentCategory
@@ -29,7 +29,7 @@ free_callbacks_router = Router()
 free_callbacks_router.callback_query.middleware(DatabaseMiddleware())
 
 
-@free_callbacks_router.callback_query(lambda c: c.data == "free:approved:enter")
+@free_callbacks_router.callback_query(F.data == "free:approved:enter")
 async def handle_free_approved_enter(callback: CallbackQuery, container):
     """
     Maneja el clic en "Ingresar al canal" desde el mensaje de aprobación.
@@ -73,7 +73,7 @@ async def handle_free_approved_enter(callback: CallbackQuery, container):
 # Register SPECIFIC handlers BEFORE GENERIC ones to avoid pattern matching conflicts
 # "user:packages:back" must be registered before "user:packages:{id}"
 
-@free_callbacks_router.callback_query(lambda c: c.data == "free:packages:back")
+@free_callbacks_router.callback_query(F.data == "free:packages:back")
 async def handle_packages_back_to_list(callback: CallbackQuery, container):
     """
     Vuelve al listado de paquetes Free (desde vista de detalle o confirmación).
@@ -87,7 +87,7 @@ async def handle_packages_back_to_list(callback: CallbackQuery, container):
     await handle_free_content(callback, container)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("free:packages:back:"))
+@free_callbacks_router.callback_query(F.data.startswith("free:packages:back:"))
 async def handle_packages_back_with_role(callback: CallbackQuery, container):
     """
     Vuelve al listado de paquetes desde confirmación de interés (con user_role y source_section).
@@ -107,7 +107,7 @@ async def handle_packages_back_with_role(callback: CallbackQuery, container):
     await handle_free_content(callback, container)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("free:packages:"))
+@free_callbacks_router.callback_query(F.data.startswith("free:packages:"))
 async def handle_package_detail(callback: CallbackQuery, container):
     """
     Muestra vista detallada de un paquete específico.
@@ -168,7 +168,7 @@ async def handle_package_detail(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error cargando detalles del paquete", show_alert=True)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("free:package:interest:"))
+@free_callbacks_router.callback_query(F.data.startswith("free:package:interest:"))
 async def handle_package_interest_confirm(callback: CallbackQuery, container):
     """
     Registra interés en paquete y muestra mensaje de confirmación con contacto directo.
@@ -284,7 +284,7 @@ async def handle_package_interest_confirm(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error registrando interés", show_alert=True)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data == "menu:free:content")
+@free_callbacks_router.callback_query(F.data == "menu:free:content")
 async def handle_free_content(callback: CallbackQuery, container):
     """
     Muestra sección "Mi Contenido" con paquetes FREE_CONTENT.
@@ -332,7 +332,7 @@ async def handle_free_content(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error cargando promos", show_alert=True)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data == "menu:free:vip")
+@free_callbacks_router.callback_query(F.data == "menu:free:vip")
 async def handle_vip_info(callback: CallbackQuery, container):
     """
     Muestra información sobre el canal VIP y suscripción.
@@ -408,7 +408,7 @@ async def handle_vip_info(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error cargando información VIP", show_alert=True)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data == "menu:free:social")
+@free_callbacks_router.callback_query(F.data == "menu:free:social")
 async def handle_social_media(callback: CallbackQuery):
     """
     Muestra redes sociales y contenido gratuito adicional.
@@ -458,7 +458,7 @@ async def handle_social_media(callback: CallbackQuery):
         await callback.answer("⚠️ Error cargando redes sociales", show_alert=True)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("interest:package:"))
+@free_callbacks_router.callback_query(F.data.startswith("interest:package:"))
 async def handle_package_interest(callback: CallbackQuery, container):
     """
     Registra interés de usuario en paquete FREE_CONTENT y notifica a admins.
@@ -548,7 +548,7 @@ async def handle_package_interest(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error registrando interés", show_alert=True)
 
 
-@free_callbacks_router.callback_query(lambda c: c.data == "menu:free:main")
+@free_callbacks_router.callback_query(F.data == "menu:free:main")
 async def handle_menu_back(callback: CallbackQuery, container):
     """
     Vuelve al menú principal Free.
@@ -586,7 +586,7 @@ async def handle_menu_back(callback: CallbackQuery, container):
 
 
 # DISABLED: Exit button removed from navigation (Quick Task 002)
-# @free_callbacks_router.callback_query(lambda c: c.data == "menu:exit")
+# @free_callbacks_router.callback_query(F.data == "menu:exit")
 # async def handle_menu_exit(callback: CallbackQuery):
 #     """
 #     Cierra el menú Free (elimina mensaje).
@@ -0,0 +1,103 @@
+"""
+Lazy Routers - Routers de uso poco frecuente importados en su primer uso.
+
+register_all_handlers() importaba todos los módulos de handlers (y sus
+dependencias: pyinstrument, test runner, query analyzer...) antes de poder
+atender el primer update. Los routers admin de uso ocasional (tests,
+profile, pricing) se registran como LazyRouter: un router liviano con los
+mismos puntos de entrada (comandos / callback_data) que, en el primer update
+que los usa, importa el módulo real, lo incluye como sub-router y deja que
+aiogram continúe la propagación hacia él.
+
+Los filtros de estado FSM (p. ej. PricingSetupStates) no necesitan entrada
+propia: solo se alcanzan después de un callback que ya cargó el módulo.
+"""
+import importlib
+import logging
+from typing import Any, Iterable, Optional
+
+from aiogram import F, Router
+from aiogram.dispatcher.event.bases import SkipHandler
+from aiogram.filters import Command
+
+from bot.utils.callback_routing import install_callback_routing
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouter(Router):
+    """
+    Router que importa `module.attribute` en el primer update que lo necesita.
+
+    Uso:
+        admin_router.include_router(LazyRouter(
+            "bot.handlers.admin.tests", "tests_router",
+            commands=("run_tests",), callback_prefixes=("tests:",)
+        ))
+    """
+
+    def __init__(
+        self,
+        module: str,
+        attribute: str,
+        commands: Iterable[str] = (),
+        callback_data: Iterable[str] = (),
+        callback_prefixes: Iterable[str] = (),
+        name: Optional[str] = None
+    ):
+        """
+        Registra los puntos de entrada del router real.
+
+        Args:
+            module: Módulo a importar (ej: "bot.handlers.admin.tests")
+            attribute: Router dentro del módulo (ej: "tests_router")
+            commands: Comandos que atiende el router real
+            callback_data: callback_data exactos que atiende
+            callback_prefixes: Prefijos de callback_data que atiende
+            name: Nombre del router (default: lazy:<module>)
+        """
+        super().__init__(name=name or f"lazy:{module}")
+        self.module = module
+        self.attribute = attribute
+        self.target: Optional[Router] = None
+
+        commands = tuple(commands)
+        if commands:
+            self.message.register(self._load_and_skip, Command(*commands))
+        for data in callback_data:
+            self.callback_query.register(self._load_and_skip, F.data == data)
+        for prefix in callback_prefixes:
+            self.callback_query.register(self._load_and_skip, F.data.startswith(prefix))
+
+    @property
+    def loaded(self) -> bool:
+        """True si el router real ya se importó."""
+        return self.target is not None
+
+    def load(self) -> Router:
+        """
+        Importa el router real y lo incluye como sub-router.
+
+        Los puntos de entrada se eliminan: los siguientes updates van
+        directo al router real.
+
+        Returns:
+            Router real
+        """
+        if self.target is None:
+            module = importlib.import_module(self.module)
+            self.target = getattr(module, self.attribute)
+
+            self.message.handlers.clear()
+            self.callback_query.handlers.clear()
+            self.include_router(self.target)
+            install_callback_routing(self.target)
+
+            logger.info(f"📦 Router cargado bajo demanda: {self.module}.{self.attribute}")
+
+        return self.target
+
+    async def _load_and_skip(self, event: Any) -> None:
+        """Carga el router real y cede el update (aiogram sigue con los sub-routers)."""
+        self.load()
+        raise SkipHandler()
@@ -9,6 +9,9 @@ Flujo moderno de Telegram para acceso Free:
 5. Si duplicada: Notifica tiempo restante con voz de Lucien
 6. Background task aprobará automáticamente después de N minutos con mensaje de bienvenida
 
+Con JOIN_INGEST_FLUSH_MS > 0 los pasos 3-5 se hacen en lote
+(ver bot/background/join_ingest.py).
+
 ESTE ES EL FLUJO PRINCIPAL - Los usuarios llegan por link público al canal,
 no por el bot. Nadie sabe del bot hasta después de solicitar acceso.
 """
@@ -18,6 +21,7 @@ from aiogram import Router, F
 from aiogram.types import ChatJoinRequest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bot.background.join_ingest import get_join_ingestor
 from bot.middlewares import DatabaseMiddleware
 from bot.services.container import ServiceContainer
 
@@ -51,8 +55,14 @@ async def handle_free_join_request(
 
     container = ServiceContainer(session, join_request.bot)
 
+    # Modo ingesta en lote (JOIN_INGEST_FLUSH_MS > 0): config cacheada, sin BD
+    ingestor = get_join_ingestor()
+
     # ===== VALIDACIÓN 1: Canal Free Configurado =====
-    configured_channel_id = await container.channel.get_free_channel_id()
+    if ingestor is not None:
+        configured_channel_id = (await ingestor.get_config()).free_channel_id
+    else:
+        configured_channel_id = await container.channel.get_free_channel_id()
 
     if not configured_channel_id:
         logger.warning("⚠️ Canal Free no configurado, declinando solicitud")
@@ -74,9 +84,21 @@ async def handle_free_join_request(
             logger.error(f"❌ Error declinando (canal no autorizado): {e}")
         return
 
+    tg_user = join_request.from_user
+
+    # ===== MODO INGESTA EN LOTE =====
+    # Se registra y se avisa al usuario en el próximo flush del ingestor
+    if ingestor is not None:
+        ingestor.submit(
+            user_id=user_id,
+            username=tg_user.username,
+            first_name=tg_user.first_name,
+            last_name=tg_user.last_name
+        )
+        return
+
     # ===== CREAR/VERIFICAR SOLICITUD =====
     # Pasar datos del usuario para crearlo si no existe
-    tg_user = join_request.from_user
     success, message, request = await container.subscription.create_free_request_from_join_request(
         user_id=user_id,
         from_chat_id=from_chat_id,
@@ -102,6 +102,16 @@ async def cmd_start(message: Message, session: AsyncSession):
         await _send_welcome_message(message, user, container, user_id)
 
 
+# Motivo de rechazo de claim_and_activate_token → (error_type, details) del provider
+_DEEPLINK_ERRORS = {
+    "invalid": ("invalid", ""),
+    "used": ("used", ""),
+    "expired": ("expired", ""),
+    "no_plan": ("no_plan", ""),
+    "plan_inactive": ("no_plan", "El plan fue desactivado."),
+}
+
+
 async def _activate_token_from_deeplink(
     message: Message,
     session: AsyncSession,
@@ -114,6 +124,9 @@ async def _activate_token_from_deeplink(
 
     NUEVO: Maneja la activación automática cuando el usuario hace click en el deep link.
 
+    Canje atómico (claim_and_activate_token): dos clicks simultáneos
+    sobre el mismo enlace no pueden canjear el token dos veces.
+
     Args:
         message: Mensaje original
         session: Sesión de BD
@@ -121,75 +134,33 @@ async def _activate_token_from_deeplink(
         user: Usuario del sistema
         token_string: String del token a activar
     """
-    # Extraer nombre de usuario
-    user_name = message.from_user.first_name or "Usuario"
-
     try:
-        # Validar token
-        is_valid, msg_result, token = await container.subscription.validate_token(token_string)
-
-        if not is_valid:
-            # Token invalid - delegate to provider
-            error_text = container.message.user.start.deep_link_activation_error(
-                error_type="invalid",
-                details=""
-            )
-            await message.answer(error_text, parse_mode="HTML")
-            return
-
-        # Verificar si el token tiene plan asociado (acceso directo a plan_id, sin lazy loading)
-        if not token.plan_id:
-            # Token antiguo sin plan asociado (compatibilidad)
-            error_text = container.message.user.start.deep_link_activation_error(
-                error_type="no_plan",
-                details=""
-            )
-            await message.answer(error_text, parse_mode="HTML")
-            return
-
-        # Cargar plan explícitamente (sin lazy loading)
-        plan = await container.pricing.get_plan_by_id(token.plan_id)
-
-        if not plan:
-            # Plan not found - delegate to provider
-            error_text = container.message.user.start.deep_link_activation_error(
-                error_type="no_plan",
-                details="El plan ya no existe en el sistema."
-            )
-            await message.answer(error_text, parse_mode="HTML")
-            return
+        # Canje atómico: reclama el token (UPDATE ... RETURNING con el plan)
+        # y crea/renueva el suscriptor (upsert) en la misma transacción
+        success, result, subscriber = await container.subscription.claim_and_activate_token(
+            token_str=token_string,
+            user_id=user.user_id
+        )
 
-        if not plan.active:
-            # Plan deactivated - delegate to provider
+        if not success:
+            # Token rechazado - delegate to provider
+            error_type, details = _DEEPLINK_ERRORS.get(result, ("invalid", ""))
             error_text = container.message.user.start.deep_link_activation_error(
-                error_type="no_plan",
-                details="El plan fue desactivado."
+                error_type=error_type,
+                details=details
             )
             await message.answer(error_text, parse_mode="HTML")
             return
 
-        # Marcar token como usado
-        token.used = True
-        token.used_by = user.user_id
-        token.used_at = datetime.utcnow()
-
-        # Activar suscripción VIP (inicia flujo ritualizado)
-        subscriber = await container.subscription.activate_vip_subscription(
-            user_id=user.user_id,
-            token_id=token.id,
-            duration_hours=plan.duration_days * 24
-        )
-
         # NO cambiar rol a VIP aún (UserRole se cambia en Stage 3)
         # user.role = UserRole.FREE  # Ya es FREE por defecto
 
         # Commit de la transacción
         await session.commit()
-        await session.refresh(subscriber)
 
         logger.info(
             f"✅ Usuario {user.user_id} activó suscripción VIP vía deep link | "
-            f"Plan: {plan.name} | Stage: {subscriber.vip_entry_stage}"
+            f"Plan: {result} | Stage: {subscriber.vip_entry_stage}"
         )
 
         # Iniciar flujo ritualizado (NO enviar enlace inmediato)
@@ -203,6 +174,8 @@ async def _activate_token_from_deeplink(
 
     except Exception as e:
         logger.error(f"❌ Error activando token desde deep link: {e}", exc_info=True)
+        # No dejar el token reclamado sin suscriptor (la sesión hace commit al salir)
+        await session.rollback()
 
         # Generic error - delegate to provider
         error_text = container.message.user.start.deep_link_activation_error(
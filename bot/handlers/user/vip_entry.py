@@ -25,7 +25,7 @@ Resumption:
 import logging
 from datetime import datetime
 
-from aiogram import Router
+from aiogram import F, Router
 from aiogram.filters import StateFilter
 from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
@@ -137,7 +137,7 @@ async def show_vip_entry_stage(
 
 
 @vip_entry_router.callback_query(
-    lambda c: c.data and c.data.startswith("vip_entry:stage_")
+    F.data.startswith("vip_entry:stage_")
 )
 async def handle_vip_entry_stage_transition(
     callback: CallbackQuery,
@@ -250,7 +250,7 @@ async def handle_vip_entry_stage_transition(
 
 
 @vip_entry_router.callback_query(
-    lambda c: c.data and c.data == "vip_entry:main_menu"
+    F.data == "vip_entry:main_menu"
 )
 async def handle_vip_entry_main_menu(
     callback: CallbackQuery,
@@ -8,6 +8,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from bot.background.notifications import get_notification_dispatcher
 from config import Config
 
 if TYPE_CHECKING:
@@ -30,6 +31,10 @@ async def send_admin_interest_notification(
     Esta función centralizada evita la duplicación de código entre
     los handlers de callbacks Free y VIP.
 
+    Si el dispatcher de notificaciones está corriendo, solo encola
+    (retorna de inmediato y el envío ocurre en background, con digest
+    opcional). Si no, envía directamente a cada admin.
+
     Args:
         bot: Instancia del bot
         container: ServiceContainer
@@ -101,6 +106,21 @@ async def send_admin_interest_notification(
             ]
         ])
 
+        # Fuera del hot path: encolar y retornar
+        dispatcher = get_notification_dispatcher()
+        if dispatcher is not None:
+            queued = dispatcher.notify_admins(
+                notification_text,
+                reply_markup=keyboard,
+                digest_key="interest",
+                digest_line=f"{username} ({user_role}) → {package_type_emoji} {package.name}"
+            )
+            logger.info(
+                f"📢 Interest notification queued for {queued}/{len(admin_ids)} admins "
+                f"(user: {user.id}, package: {package.id}, role: {user_role})"
+            )
+            return
+
         # Send notification to all admins
         sent_count = 0
         failed_admins = []
@@ -14,7 +14,7 @@ Pattern: Sigue estructura de admin callbacks con router separado.
 """
 import logging
 
-from aiogram import Router
+from aiogram import F, Router
 from aiogram.types import CallbackQuery
 
 from bot.database.enums import ContentCategory, UserRole
@@ -30,7 +30,7 @@ vip_callbacks_router = Router()
 vip_callbacks_router.callback_query.middleware(DatabaseMiddleware())
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data == "vip:premium")
+@vip_callbacks_router.callback_query(F.data == "vip:premium")
 async def handle_vip_premium(callback: CallbackQuery, container):
     """
     Muestra sección premium con paquetes VIP_PREMIUM.
@@ -80,7 +80,7 @@ async def handle_vip_premium(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error cargando contenido premium", show_alert=True)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data == "vip:free_content")
+@vip_callbacks_router.callback_query(F.data == "vip:free_content")
 async def handle_vip_free_content(callback: CallbackQuery, container):
     """
     Muestra contenido Free a un usuario VIP.
@@ -135,7 +135,7 @@ async def handle_vip_free_content(callback: CallbackQuery, container):
 # Register SPECIFIC handlers BEFORE GENERIC ones to avoid pattern matching conflicts
 # "vip:packages:back" must be registered before "vip:packages:{id}"
 
-@vip_callbacks_router.callback_query(lambda c: c.data == "vip:packages:back")
+@vip_callbacks_router.callback_query(F.data == "vip:packages:back")
 async def handle_packages_back_to_list(callback: CallbackQuery, container):
     """
     Vuelve al listado de paquetes VIP (desde vista de detalle o confirmación).
@@ -149,7 +149,7 @@ async def handle_packages_back_to_list(callback: CallbackQuery, container):
     await handle_vip_premium(callback, container)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("vip:packages:back:"))
+@vip_callbacks_router.callback_query(F.data.startswith("vip:packages:back:"))
 async def handle_packages_back_with_role(callback: CallbackQuery, container):
     """
     Vuelve al listado de paquetes desde confirmación de interés (con user_role y source_section).
@@ -184,7 +184,7 @@ async def handle_packages_back_with_role(callback: CallbackQuery, container):
         await handle_vip_premium(callback, container)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("vip:packages:"))
+@vip_callbacks_router.callback_query(F.data.startswith("vip:packages:"))
 async def handle_package_detail(callback: CallbackQuery, container):
     """
     Muestra vista detallada de un paquete específico.
@@ -246,7 +246,7 @@ async def handle_package_detail(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error cargando detalles del paquete", show_alert=True)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("vip:package:interest:"))
+@vip_callbacks_router.callback_query(F.data.startswith("vip:package:interest:"))
 async def handle_package_interest_confirm(callback: CallbackQuery, container):
     """
     Registra interés en paquete y muestra mensaje de confirmación con contacto directo.
@@ -363,7 +363,7 @@ async def handle_package_interest_confirm(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error registrando interés", show_alert=True)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data == "vip:status")
+@vip_callbacks_router.callback_query(F.data == "vip:status")
 async def handle_vip_status(callback: CallbackQuery, container):
     """
     Muestra el estado de la membresía VIP del usuario.
@@ -443,7 +443,7 @@ async def handle_vip_status(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error cargando estado de membresía", show_alert=True)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("interest:package:"))
+@vip_callbacks_router.callback_query(F.data.startswith("interest:package:"))
 async def handle_package_interest(callback: CallbackQuery, container):
     """
     Registra interés de usuario en paquete y notifica a admins.
@@ -531,7 +531,7 @@ async def handle_package_interest(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error registrando interés", show_alert=True)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data == "menu:vip:main")
+@vip_callbacks_router.callback_query(F.data == "menu:vip:main")
 async def handle_menu_vip_main(callback: CallbackQuery, container):
     """
     Vuelve al menú principal VIP (desde confirmación de interés).
@@ -545,7 +545,7 @@ async def handle_menu_vip_main(callback: CallbackQuery, container):
     await handle_menu_back(callback, container)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data == "menu:back")
+@vip_callbacks_router.callback_query(F.data == "menu:back")
 async def handle_menu_back(callback: CallbackQuery, container):
     """
     Vuelve al menú principal VIP.
@@ -582,7 +582,7 @@ async def handle_menu_back(callback: CallbackQuery, container):
 
 
 # DISABLED: Exit button removed from navigation (Quick Task 002)
-# @vip_callbacks_router.callback_query(lambda c: c.data == "menu:exit")
+# @vip_callbacks_router.callback_query(F.data == "menu:exit")
 # async def handle_menu_exit(callback: CallbackQuery):
 #     """
 #     Cierra el menú (elimina mensaje).
@@ -601,7 +601,7 @@ async def handle_menu_back(callback: CallbackQuery, container):
 # ===== VIP VIEWING FREE CONTENT HANDLERS =====
 # These handlers allow VIP users to browse and interact with Free content
 
-@vip_callbacks_router.callback_query(lambda c: c.data == "vip:free:packages:back")
+@vip_callbacks_router.callback_query(F.data == "vip:free:packages:back")
 async def handle_vip_free_packages_back(callback: CallbackQuery, container):
     """
     VIP returning from Free package detail back to Free content list.
@@ -614,7 +614,7 @@ async def handle_vip_free_packages_back(callback: CallbackQuery, container):
     await handle_vip_free_content(callback, container)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("vip:free:packages:"))
+@vip_callbacks_router.callback_query(F.data.startswith("vip:free:packages:"))
 async def handle_vip_free_package_detail(callback: CallbackQuery, container):
     """
     Muestra vista detallada de un paquete Free a un usuario VIP.
@@ -677,7 +677,7 @@ async def handle_vip_free_package_detail(callback: CallbackQuery, container):
         await callback.answer("⚠️ Error cargando detalles del paquete", show_alert=True)
 
 
-@vip_callbacks_router.callback_query(lambda c: c.data and c.data.startswith("vip:free:package:interest:"))
+@vip_callbacks_router.callback_query(F.data.startswith("vip:free:package:interest:"))
 async def handle_vip_free_package_interest(callback: CallbackQuery, container):
     """
     VIP registrando interés en un paquete Free.
@@ -726,7 +726,7 @@ async def handle_vip_free_package_interest(callback: CallbackQuery, container):
             )
 
             # Send admin notification
-            await _send_admin_interest_notification(
+            await send_admin_interest_notification(
                 bot=callback.bot,
                 container=container,
                 user=user,
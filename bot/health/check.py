@@ -7,10 +7,21 @@ Used by FastAPI health endpoints for Railway monitoring.
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import Dict
+from typing import Callable, Dict
 
 from config import Config
 from bot.database.engine import get_engine
+from bot.database.backup import get_backup_stats
+from bot.database.maintenance import get_storage_summary
+from bot.background.bulk_jobs import get_bulk_job_stats
+from bot.background.exports import get_export_stats
+from bot.background.join_ingest import get_join_ingest_stats
+from bot.background.notifications import get_notification_stats
+from bot.background.retention import get_retention_stats
+from bot.middlewares.singleflight import get_singleflight_stats
+from bot.services.chat_metadata import get_chat_metadata_stats
+from bot.services.vip_invite_pool import get_invite_pool_stats
+from bot.utils.edit_cache import get_edit_cache_stats
 from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
@@ -104,6 +115,24 @@ async def check_database_health() -> HealthStatus:
         return HealthStatus.UNHEALTHY
 
 
+def _safe_stats(name: str, get_stats: Callable[[], dict]) -> dict:
+    """
+    Lee las métricas de un subsistema sin propagar errores.
+
+    Args:
+        name: Clave del subsistema en el resumen
+        get_stats: Función que retorna sus métricas
+
+    Returns:
+        Métricas del subsistema, o {"error": ...} si fallaron
+    """
+    try:
+        return get_stats()
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudieron obtener métricas de {name}: {e}")
+        return {"error": str(e)}
+
+
 async def get_health_summary() -> Dict[str, any]:
     """
     Get comprehensive health summary for all components.
@@ -120,7 +149,10 @@ async def get_health_summary() -> Dict[str, any]:
             "components": {
                 "bot": "healthy" | "unhealthy",
                 "database": "healthy" | "unhealthy"
-            }
+            },
+            "admin_notifications": {"queue_depth": 0, "latency_p95_ms": 0.0, ...},
+            "join_ingest": {"buffered": 0, "flushed": 0, ...},
+            "edit_cache": {"skipped": 0, "not_modified": 0, ...}
         }
 
     Note:
@@ -150,8 +182,30 @@ async def get_health_summary() -> Dict[str, any]:
         "components": {
             "bot": bot_status.value,
             "database": db_status.value
-        }
+        },
     }
 
+    # Métricas informativas: no afectan el status. Cada subsistema se lee
+    # por separado para que un fallo en uno no tumbe /health
+    stats_providers = (
+        ("admin_notifications", get_notification_stats),
+        ("join_ingest", get_join_ingest_stats),
+        ("edit_cache", get_edit_cache_stats),
+        ("chat_metadata", get_chat_metadata_stats),
+        ("singleflight", get_singleflight_stats),
+        ("vip_invite_pool", get_invite_pool_stats),
+        ("retention", get_retention_stats),
+        ("backup", get_backup_stats),
+        ("exports", get_export_stats),
+        ("bulk_jobs", get_bulk_job_stats),
+    )
+    for name, get_stats in stats_providers:
+        summary[name] = _safe_stats(name, get_stats)
+    try:
+        summary["sqlite"] = await get_storage_summary()
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudieron obtener métricas de sqlite: {e}")
+        summary["sqlite"] = {"error": str(e)}
+
     logger.debug(f"Health summary: {overall_status}")
     return summary
@@ -24,6 +24,7 @@ _health_server_thread: Optional[threading.Thread] = None
 _shutdown_event = threading.Event()
 _started_event = threading.Event()
 _startup_success = False
+_uvicorn_server: Optional[uvicorn.Server] = None
 
 
 def is_port_available(host: str, port: int) -> bool:
@@ -67,7 +68,7 @@ def _run_server_in_thread(host: str, port: int, shutdown_event: threading.Event)
 
     This function runs in the background thread and blocks until shutdown.
     """
-    global _startup_success
+    global _startup_success, _uvicorn_server
 
     try:
         # Create new event loop for this thread
@@ -88,6 +89,7 @@ def _run_server_in_thread(host: str, port: int, shutdown_event: threading.Event)
         )
 
         server = uvicorn.Server(config)
+        _uvicorn_server = server
 
         # Signal that we're about to start
         _started_event.set()
@@ -131,17 +133,17 @@ async def start_health_server() -> Optional[threading.Thread]:
     Returns:
         Thread object if started successfully, None otherwise
     """
-    global _health_server_thread, _shutdown_event, _started_event, _startup_success
+    global _health_server_thread, _shutdown_event, _started_event, _startup_success, _uvicorn_server
 
     logger.info("🚀 Iniciando health API server...")
 
     port = Config.HEALTH_PORT
     host = Config.HEALTH_HOST
 
-    # Check port availability
+    # Check port availability (la espera corre en un thread: no bloquea el arranque)
     if not is_port_available(host, port):
         logger.warning(f"⚠️ Puerto {port} ocupado, esperando...")
-        if not wait_for_port_release(host, port, timeout=10):
+        if not await asyncio.to_thread(wait_for_port_release, host, port, 10):
             logger.error(f"❌ Puerto {port} no disponible")
             return None
 
@@ -149,6 +151,7 @@ async def start_health_server() -> Optional[threading.Thread]:
     _shutdown_event.clear()
     _started_event.clear()
     _startup_success = True
+    _uvicorn_server = None
 
     # Start server in background thread (pass shutdown_event so thread can monitor it)
     _health_server_thread = threading.Thread(
@@ -160,23 +163,21 @@ async def start_health_server() -> Optional[threading.Thread]:
 
     _health_server_thread.start()
 
-    # Wait for thread to signal it has started
-    _started_event.wait(timeout=5)
-
-    if not _started_event.is_set():
+    # Wait for thread to signal it has started (sin bloquear el event loop)
+    if not await asyncio.to_thread(_started_event.wait, 5):
         logger.error("❌ Health API thread no inició (timeout)")
         return None
 
-    # Give server a moment to actually bind to port
-    await asyncio.sleep(0.5)
+    # Esperar a que uvicorn haga bind (server.started) en vez de un sleep fijo
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and _health_server_thread.is_alive():
+        if _uvicorn_server is not None and _uvicorn_server.started:
+            logger.info(f"✅ Health API corriendo en http://{host}:{port}")
+            return _health_server_thread
+        await asyncio.sleep(0.05)
 
-    # Verify port is now in use (server is listening)
-    if not is_port_available(host, port):
-        logger.info(f"✅ Health API corriendo en http://{host}:{port}")
-        return _health_server_thread
-    else:
-        logger.error("❌ Health API no está escuchando en el puerto")
-        return None
+    logger.error("❌ Health API no está escuchando en el puerto")
+    return None
 
 
 async def stop_health_server():
@@ -4,9 +4,15 @@ Middlewares module - Procesamiento pre/post handlers.
 from bot.middlewares.admin_auth import AdminAuthMiddleware
 from bot.middlewares.database import DatabaseMiddleware
 from bot.middlewares.role_detection import RoleDetectionMiddleware
+from bot.middlewares.singleflight import (
+    SingleflightRequestMiddleware,
+    get_singleflight_middleware,
+)
 
 __all__ = [
     "AdminAuthMiddleware",
     "DatabaseMiddleware",
     "RoleDetectionMiddleware",
+    "SingleflightRequestMiddleware",
+    "get_singleflight_middleware",
 ]
@@ -0,0 +1,138 @@
+"""
+Singleflight Middleware - Combina lecturas idénticas en vuelo a la Bot API.
+
+Ráfagas de updates (doble tap en un botón, respuestas tras un broadcast)
+disparan lecturas concurrentes idénticas: get_chat_member(vip_channel_id,
+user_id) en RoleDetectionService, get_chat(channel_id) en ChannelService,
+get_me al iniciar...
+
+Este middleware de sesión (aiogram request middleware) hace que la primera
+llamada ejecute el request y las demás idénticas que llegan mientras está en
+vuelo esperen ese mismo resultado (o excepción). No es un cache: al terminar
+el request la siguiente llamada vuelve a la API.
+
+Solo aplica a los métodos de Config.SINGLEFLIGHT_METHODS (de solo lectura).
+
+Uso:
+    session = AiohttpSession(timeout=10)
+    session.middleware(get_singleflight_middleware())
+"""
+import asyncio
+import logging
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Middleware global (uno por proceso)
+_singleflight: Optional["SingleflightRequestMiddleware"] = None
+
+
+class SingleflightRequestMiddleware(BaseRequestMiddleware):
+    """
+    Request middleware que deduplica llamadas idénticas concurrentes.
+
+    La clave es (bot, método, parámetros). El request corre en su propia
+    task: si un llamador se cancela, los demás siguen esperando el resultado.
+    """
+
+    def __init__(self, methods: Iterable[str]):
+        """
+        Inicializa el middleware.
+
+        Args:
+            methods: Nombres de la Bot API permitidos (ej: "getChatMember")
+        """
+        self.methods: FrozenSet[str] = frozenset(methods)
+        self._in_flight: Dict[Tuple[Hashable, ...], asyncio.Task] = {}
+
+        self.requests = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _key(bot: Bot, method: TelegramMethod) -> Tuple[Hashable, ...]:
+        return (
+            bot.id,
+            method.__api_method__,
+            method.model_dump_json(exclude_none=True),
+        )
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        """
+        Ejecuta el request o se suma a uno idéntico en vuelo.
+
+        Args:
+            make_request: Siguiente eslabón de la cadena de middlewares
+            bot: Bot que hace el request
+            method: Método de la Bot API
+
+        Returns:
+            Response compartida por todos los llamadores
+        """
+        if method.__api_method__ not in self.methods:
+            return await make_request(bot, method)
+
+        key = self._key(bot, method)
+        task = self._in_flight.get(key)
+
+        if task is None:
+            self.requests += 1
+            task = asyncio.ensure_future(make_request(bot, method))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda finished: self._finish(key, finished))
+        else:
+            self.coalesced += 1
+            logger.debug(f"🔁 {method.__api_method__} combinado con request en vuelo")
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Tuple[Hashable, ...], task: asyncio.Task) -> None:
+        """Libera la clave y marca la excepción como recuperada."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict:
+        """
+        Métricas del middleware.
+
+        Returns:
+            Dict con requests, coalesced, in_flight y coalesced_ratio
+        """
+        calls = self.requests + self.coalesced
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            "coalesced_ratio": round(self.coalesced / calls, 3) if calls else 0.0,
+        }
+
+
+def get_singleflight_middleware() -> SingleflightRequestMiddleware:
+    """Middleware global (creado en el primer uso con Config.SINGLEFLIGHT_METHODS)."""
+    global _singleflight
+
+    if _singleflight is None:
+        _singleflight = SingleflightRequestMiddleware(Config.SINGLEFLIGHT_METHODS)
+
+    return _singleflight
+
+
+def get_singleflight_stats() -> dict:
+    """Métricas del middleware global."""
+    return get_singleflight_middleware().get_stats()
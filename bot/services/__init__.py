@@ -7,6 +7,7 @@ from bot.services.content import ContentService
 from bot.services.role_change import RoleChangeService
 from bot.services.interest import InterestService
 from bot.services.user_management import UserManagementService
+from bot.services.user_search import UserSearchService
 from bot.services.test_runner import TestRunnerService, TestResult
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     "RoleChangeService",
     "InterestService",
     "UserManagementService",
+    "UserSearchService",
     "TestRunnerService",
     "TestResult",
 ]
@@ -0,0 +1,501 @@
+"""
+Bulk Operations Service - Operaciones masivas de admin por lotes.
+
+UserManagementService cambia rol y expulsa de a un usuario por clic, con
+varias llamadas secuenciales a la BD y a la Bot API. Extender a todos los
+VIP activos tras una caída o expulsar una lista de contracargos no tenía
+un camino masivo.
+
+Un BulkJob se crea en borrador con sus objetivos (BulkJobTarget) elegidos
+por filtro (INSERT ... SELECT) o por lista de IDs, y se procesa por lotes
+de BULK_BATCH_SIZE objetivos:
+- extend_vip: un UPDATE por lote (executemany por PK) de expiry_date
+- change_role: un UPDATE por lote de users.role + auditoría en un INSERT
+- expel: ban en los canales con llamadas concurrentes a la Bot API
+  (BULK_BOT_API_CONCURRENCY, BULK_BOT_API_RATE por segundo, reintento
+  tras RetryAfter)
+
+El resultado de cada objetivo se guarda en la misma transacción que los
+cambios del lote: un job interrumpido se reanuda desde los pendientes.
+Mismas reglas de permisos que UserManagementService: nunca se modifica al
+admin que crea el job ni a los admins configurados, y solo el super admin
+modifica a otros admins.
+"""
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from sqlalchemy import delete, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database.enums import RoleChangeReason, UserRole
+from bot.database.models import BulkJob, BulkJobTarget, User, UserRoleChangeLog, VIPSubscriber
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Operaciones soportadas → descripción para mensajes
+OPERATIONS = {
+    "extend_vip": "Extender VIP",
+    "expel": "Expulsar de los canales",
+    "change_role": "Cambiar rol",
+}
+
+# Roles asignables en masa (ADMIN solo uno por uno)
+BULK_ROLES = (UserRole.FREE, UserRole.VIP)
+
+# Filtros de objetivos → consulta de user_id
+TARGET_FILTERS = {
+    "vip_active": lambda: select(VIPSubscriber.user_id).where(VIPSubscriber.status == "active"),
+    "free_users": lambda: select(User.user_id).where(User.role == UserRole.FREE),
+}
+
+# Filas por INSERT al cargar una lista de IDs
+_INSERT_CHUNK = 1000
+
+# Intentos por llamada a la Bot API (RetryAfter)
+BOT_API_ATTEMPTS = 3
+
+TargetResult = Tuple[str, Optional[str]]
+
+
+class BotApiLimiter:
+    """
+    Concurrencia y ritmo máximo de llamadas a la Bot API.
+
+    Cada llamada reserva un turno espaciado 1/rate segundos del anterior y
+    corre dentro de un semáforo de `concurrency`. RetryAfter espera lo que
+    pide Telegram y reintenta (BOT_API_ATTEMPTS en total).
+    """
+
+    def __init__(self, concurrency: int, per_second: float):
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._interval = 1 / per_second if per_second > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def _wait_turn(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def call(self, make_call: Callable[[], Awaitable]):
+        """
+        Ejecuta una llamada respetando concurrencia, ritmo y RetryAfter.
+
+        Args:
+            make_call: Función sin argumentos que crea la corrutina
+
+        Returns:
+            Resultado de la llamada (propaga el último error)
+        """
+        async with self._semaphore:
+            for attempt in range(1, BOT_API_ATTEMPTS + 1):
+                await self._wait_turn()
+                try:
+                    return await make_call()
+                except TelegramRetryAfter as e:
+                    if attempt == BOT_API_ATTEMPTS:
+                        raise
+                    logger.warning(f"⏳ Bot API pidió esperar {e.retry_after}s (bulk)")
+                    await asyncio.sleep(e.retry_after)
+
+
+class BulkOperationService:
+    """
+    Creación y procesamiento por lotes de operaciones masivas.
+
+    Uso:
+        service = BulkOperationService(session, bot)
+        job = await service.create_job("extend_vip", {"days": 3}, admin_id, chat_id,
+                                       target_filter="vip_active")
+        batch = await service.next_batch(job.id, 200)
+        results = await service.apply_batch(job, batch)
+        await service.record_results(job.id, results)
+        await session.commit()
+    """
+
+    def __init__(self, session: AsyncSession, bot: Optional[Bot]):
+        """
+        Inicializa el service.
+
+        Args:
+            session: Sesión de BD
+            bot: Instancia del bot (requerida para expel)
+        """
+        self.session = session
+        self.bot = bot
+
+    # ===== CREACIÓN =====
+
+    async def create_job(
+        self,
+        operation: str,
+        params: dict,
+        created_by: int,
+        chat_id: int,
+        target_filter: Optional[str] = None,
+        user_ids: Optional[Iterable[int]] = None
+    ) -> BulkJob:
+        """
+        Crea un job en borrador con sus objetivos.
+
+        Args:
+            operation: Clave de OPERATIONS
+            params: {"days": n} (extend_vip), {"role": "FREE"|"VIP"} (change_role)
+            created_by: Admin que crea el job
+            chat_id: Chat donde se reporta el progreso
+            target_filter: Clave de TARGET_FILTERS
+            user_ids: Lista de IDs (si no hay filtro); duplicados se ignoran
+
+        Returns:
+            BulkJob en status "draft" con total calculado
+
+        Raises:
+            ValueError: Operación, parámetros u objetivos inválidos
+        """
+        self._validate(operation, params)
+        if (target_filter is None) == (user_ids is None):
+            raise ValueError("Indica un filtro o una lista de IDs")
+        if target_filter is not None and target_filter not in TARGET_FILTERS:
+            raise ValueError(f"Filtro desconocido: {target_filter}")
+        if user_ids is not None:
+            user_ids = list(dict.fromkeys(int(user_id) for user_id in user_ids))
+            if not user_ids:
+                raise ValueError("La lista de IDs está vacía")
+            if len(user_ids) > Config.BULK_MAX_TARGETS:
+                raise ValueError(f"Máximo {Config.BULK_MAX_TARGETS} IDs por operación")
+
+        job = BulkJob(
+            operation=operation,
+            params=params,
+            target_filter=target_filter,
+            status="draft",
+            created_by=created_by,
+            chat_id=chat_id,
+            total=0, succeeded=0, failed=0, skipped=0,
+        )
+        self.session.add(job)
+        await self.session.flush()
+
+        if target_filter is not None:
+            user_query = TARGET_FILTERS[target_filter]().subquery()
+            await self.session.execute(
+                insert(BulkJobTarget).from_select(
+                    ["job_id", "user_id", "status"],
+                    select(literal(job.id), user_query.c.user_id, literal("pending"))
+                    .distinct()
+                )
+            )
+        else:
+            for start in range(0, len(user_ids), _INSERT_CHUNK):
+                await self.session.execute(insert(BulkJobTarget), [
+                    {"job_id": job.id, "user_id": user_id, "status": "pending"}
+                    for user_id in user_ids[start:start + _INSERT_CHUNK]
+                ])
+
+        job.total = (await self.session.execute(
+            select(func.count(BulkJobTarget.id)).where(BulkJobTarget.job_id == job.id)
+        )).scalar_one()
+
+        logger.info(
+            f"🧾 Job masivo #{job.id} creado: {operation} {params} "
+            f"({job.total} objetivos) por admin {created_by}"
+        )
+        return job
+
+    @staticmethod
+    def _validate(operation: str, params: dict) -> None:
+        if operation not in OPERATIONS:
+            raise ValueError(f"Operación desconocida: {operation}")
+        if operation == "extend_vip" and not (1 <= int(params.get("days", 0)) <= 365):
+            raise ValueError("Los días deben estar entre 1 y 365")
+        if operation == "change_role" and params.get("role") not in [r.value for r in BULK_ROLES]:
+            raise ValueError("Rol no permitido en operaciones masivas")
+
+    async def get_job(self, job_id: int) -> Optional[BulkJob]:
+        """Obtiene un job por ID."""
+        return await self.session.get(BulkJob, job_id)
+
+    async def start_job(self, job_id: int, progress_message_id: Optional[int] = None) -> Optional[BulkJob]:
+        """
+        Marca un job como "running" (borrador confirmado o reanudación).
+
+        Args:
+            job_id: ID del job
+            progress_message_id: Mensaje a editar con el progreso
+
+        Returns:
+            BulkJob o None si no existe o ya terminó
+        """
+        job = await self.get_job(job_id)
+        if job is None or job.status == "completed":
+            return None
+
+        job.status = "running"
+        job.started_at = job.started_at or datetime.utcnow()
+        if progress_message_id is not None:
+            job.progress_message_id = progress_message_id
+        return job
+
+    async def discard_draft(self, job_id: int) -> bool:
+        """Elimina un job en borrador (y sus objetivos)."""
+        job = await self.get_job(job_id)
+        if job is None or job.status != "draft":
+            return False
+        await self.session.execute(delete(BulkJobTarget).where(BulkJobTarget.job_id == job_id))
+        await self.session.delete(job)
+        return True
+
+    async def get_resumable_job_ids(self) -> List[int]:
+        """Jobs que quedaron en "running" (proceso reiniciado a mitad)."""
+        result = await self.session.execute(
+            select(BulkJob.id).where(BulkJob.status == "running").order_by(BulkJob.id)
+        )
+        return list(result.scalars().all())
+
+    # ===== PROCESAMIENTO =====
+
+    async def next_batch(self, job_id: int, limit: int) -> List[Tuple[int, int]]:
+        """
+        Siguiente lote de objetivos pendientes.
+
+        Returns:
+            Lista de (target_id, user_id) en orden de id
+        """
+        result = await self.session.execute(
+            select(BulkJobTarget.id, BulkJobTarget.user_id)
+            .where(BulkJobTarget.job_id == job_id, BulkJobTarget.status == "pending")
+            .order_by(BulkJobTarget.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result]
+
+    async def apply_batch(
+        self,
+        job: BulkJob,
+        batch: List[Tuple[int, int]],
+        limiter: Optional[BotApiLimiter] = None
+    ) -> Dict[int, TargetResult]:
+        """
+        Aplica la operación del job a un lote.
+
+        Args:
+            job: Job en ejecución
+            batch: (target_id, user_id) de next_batch()
+            limiter: Limitador de Bot API (expel; default: uno nuevo con Config)
+
+        Returns:
+            target_id → (status, error) con status done, failed o skipped
+        """
+        user_results = await self._apply_to_users(job, [user_id for _, user_id in batch], limiter)
+        return {target_id: user_results[user_id] for target_id, user_id in batch}
+
+    async def _apply_to_users(
+        self,
+        job: BulkJob,
+        user_ids: List[int],
+        limiter: Optional[BotApiLimiter]
+    ) -> Dict[int, TargetResult]:
+        if job.operation == "extend_vip":
+            return await self._extend_vip(user_ids, int(job.params["days"]))
+
+        results: Dict[int, TargetResult] = {}
+        roles = await self._filter_modifiable(job.created_by, user_ids, results)
+        if job.operation == "change_role":
+            results.update(await self._change_role(job, roles, UserRole(job.params["role"])))
+        else:
+            results.update(await self._expel(list(roles), limiter))
+        return results
+
+    async def _filter_modifiable(
+        self,
+        created_by: int,
+        user_ids: List[int],
+        results: Dict[int, TargetResult]
+    ) -> Dict[int, UserRole]:
+        """
+        Reglas de UserManagementService._can_modify_user para un lote.
+
+        Los omitidos se agregan a `results`.
+
+        Returns:
+            user_id → rol actual de los usuarios que se pueden modificar
+        """
+        roles = dict((await self.session.execute(
+            select(User.user_id, User.role).where(User.user_id.in_(user_ids))
+        )).all())
+        is_super_admin = bool(Config.ADMIN_USER_IDS) and created_by == Config.ADMIN_USER_IDS[0]
+
+        allowed = {}
+        for user_id in user_ids:
+            if user_id == created_by:
+                results[user_id] = ("skipped", "Es el admin que creó la operación")
+            elif user_id not in roles:
+                results[user_id] = ("skipped", "Usuario no encontrado")
+            elif user_id in Config.ADMIN_USER_IDS or (
+                roles[user_id] == UserRole.ADMIN and not is_super_admin
+            ):
+                results[user_id] = ("skipped", "Administrador protegido")
+            else:
+                allowed[user_id] = roles[user_id]
+        return allowed
+
+    async def _extend_vip(self, user_ids: List[int], days: int) -> Dict[int, TargetResult]:
+        """Suma `days` a la expiración de los VIP activos del lote (un UPDATE)."""
+        rows = (await self.session.execute(
+            select(VIPSubscriber.id, VIPSubscriber.user_id, VIPSubscriber.expiry_date)
+            .where(VIPSubscriber.user_id.in_(user_ids), VIPSubscriber.status == "active")
+        )).all()
+
+        delta = timedelta(days=days)
+        if rows:
+            await self.session.execute(
+                update(VIPSubscriber),
+                [{"id": sub_id, "expiry_date": expiry + delta} for sub_id, _, expiry in rows]
+            )
+
+        extended = {user_id for _, user_id, _ in rows}
+        return {
+            user_id: ("done", None) if user_id in extended
+            else ("skipped", "Sin suscripción VIP activa")
+            for user_id in user_ids
+        }
+
+    async def _change_role(
+        self,
+        job: BulkJob,
+        previous: Dict[int, UserRole],
+        new_role: UserRole
+    ) -> Dict[int, TargetResult]:
+        """UPDATE de users.role para el lote y auditoría en un solo INSERT."""
+        changed = [user_id for user_id, role in previous.items() if role != new_role]
+
+        if changed:
+            now = datetime.utcnow()
+            await self.session.execute(
+                update(User)
+                .where(User.user_id.in_(changed))
+                .values(role=new_role, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.execute(insert(UserRoleChangeLog), [
+                {
+                    "user_id": user_id,
+                    "previous_role": previous[user_id],
+                    "new_role": new_role,
+                    "changed_by": job.created_by,
+                    "reason": RoleChangeReason.MANUAL_CHANGE,
+                    "change_source": "ADMIN_BULK",
+                    "change_metadata": {"bulk_job_id": job.id},
+                    "changed_at": now,
+                }
+                for user_id in changed
+            ])
+
+        changed_set = set(changed)
+        return {
+            user_id: ("done", None) if user_id in changed_set
+            else ("skipped", f"Ya tiene el rol {new_role.value}")
+            for user_id in previous
+        }
+
+    async def _expel(
+        self,
+        user_ids: List[int],
+        limiter: Optional[BotApiLimiter]
+    ) -> Dict[int, TargetResult]:
+        """
+        Ban en los canales VIP y Free con llamadas concurrentes limitadas.
+
+        Igual que UserManagementService.expel_user_from_channels(): si un
+        canal falla, se deshacen los bans ya aplicados al usuario.
+        """
+        from bot.services.channel import ChannelService
+        from bot.services.user_management import UserManagementService
+
+        channel_service = ChannelService(self.session, self.bot)
+        user_management = UserManagementService(self.session, self.bot)
+        channels = [
+            (name, channel_id) for name, channel_id in (
+                ("VIP", await channel_service.get_vip_channel_id()),
+                ("Free", await channel_service.get_free_channel_id()),
+            ) if channel_id
+        ]
+        if not channels:
+            return {user_id: ("failed", "No hay canales configurados") for user_id in user_ids}
+
+        limiter = limiter or BotApiLimiter(Config.BULK_BOT_API_CONCURRENCY, Config.BULK_BOT_API_RATE)
+
+        channel_ids = dict(channels)
+
+        async def expel_one(user_id: int) -> Tuple[int, TargetResult]:
+            errors, expelled_from = [], []
+            for name, channel_id in channels:
+                try:
+                    await limiter.call(
+                        lambda chat_id=channel_id: self.bot.ban_chat_member(
+                            chat_id=chat_id, user_id=user_id
+                        )
+                    )
+                    expelled_from.append(name)
+                except Exception as e:
+                    errors.append(f"{name}: {e}")
+            if not errors:
+                return user_id, ("done", None)
+
+            error = "; ".join(errors)
+            if expelled_from:
+                await limiter.call(lambda: user_management._rollback_expulsion(
+                    user_id, channel_ids.get("VIP"), channel_ids.get("Free"), expelled_from
+                ))
+                error += f" (se deshizo la expulsión de {', '.join(expelled_from)})"
+            return user_id, ("failed", error[:255])
+
+        return dict(await asyncio.gather(*(expel_one(user_id) for user_id in user_ids)))
+
+    async def record_results(self, job_id: int, results: Dict[int, TargetResult]) -> Dict[str, int]:
+        """
+        Guarda el resultado de un lote (un UPDATE por status/error) y
+        actualiza los contadores del job.
+
+        Returns:
+            Conteo del lote por status
+        """
+        groups: Dict[TargetResult, List[int]] = defaultdict(list)
+        for target_id, result in results.items():
+            groups[result].append(target_id)
+
+        now = datetime.utcnow()
+        for (status, error), target_ids in groups.items():
+            await self.session.execute(
+                update(BulkJobTarget)
+                .where(BulkJobTarget.id.in_(target_ids))
+                .values(status=status, error=error, processed_at=now)
+            )
+
+        counts = Counter(status for status, _ in results.values())
+        await self.session.execute(
+            update(BulkJob)
+            .where(BulkJob.id == job_id)
+            .values(
+                succeeded=BulkJob.succeeded + counts["done"],
+                failed=BulkJob.failed + counts["failed"],
+                skipped=BulkJob.skipped + counts["skipped"],
+            )
+        )
+        return dict(counts)
+
+    async def finish_job(self, job_id: int, status: str = "completed") -> Optional[BulkJob]:
+        """Cierra el job (completed o failed)."""
+        job = await self.get_job(job_id)
+        if job is not None:
+            job.status = status
+            job.finished_at = datetime.utcnow()
+        return job
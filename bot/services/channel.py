@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from bot.database.models import BotConfig
+from bot.services.chat_metadata import get_chat_metadata_cache
 
 logger = logging.getLogger(__name__)
 
@@ -126,10 +127,18 @@ class ChannelService:
 
         # Guardar en configuración
         config = await self.get_bot_config()
+        previous_channel_id = config.vip_channel_id
         config.vip_channel_id = channel_id
 
         await self.session.commit()
 
+        # Metadata cacheada: descartar el canal anterior, precargar el nuevo
+        metadata = get_chat_metadata_cache()
+        if previous_channel_id:
+            metadata.invalidate(previous_channel_id)
+        metadata.invalidate(channel_id)
+        metadata.prime(channel_id, chat)
+
         logger.info(f"✅ Canal VIP configurado: {channel_id} ({chat.title})")
 
         return True, f"✅ Canal VIP configurado: <b>{chat.title}</b>"
@@ -166,10 +175,22 @@ class ChannelService:
 
         # Guardar en configuración
         config = await self.get_bot_config()
+        previous_channel_id = config.free_channel_id
         config.free_channel_id = channel_id
 
         await self.session.commit()
 
+        # Metadata cacheada: descartar el canal anterior, precargar el nuevo
+        metadata = get_chat_metadata_cache()
+        if previous_channel_id:
+            metadata.invalidate(previous_channel_id)
+        metadata.invalidate(channel_id)
+        metadata.prime(channel_id, chat)
+
+        # El ingestor de solicitudes Free cachea el canal
+        from bot.background.join_ingest import invalidate_join_ingest_config
+        invalidate_join_ingest_config()
+
         logger.info(f"✅ Canal Free configurado: {channel_id} ({chat.title})")
 
         return True, f"✅ Canal Free configurado: <b>{chat.title}</b>"
@@ -416,32 +437,27 @@ class ChannelService:
         """
         Obtiene información del canal.
 
+        Servida desde el cache de metadata (TTL + refresh en segundo plano);
+        solo consulta la Bot API si el canal nunca se cargó.
+
         Args:
             channel_id: ID del canal
 
         Returns:
             Chat si existe, None si error
         """
-        try:
-            chat = await self.bot.get_chat(channel_id)
-            return chat
-        except Exception as e:
-            logger.error(f"Error al obtener info de canal {channel_id}: {e}")
-            return None
+        return await get_chat_metadata_cache().get_chat(self.bot, channel_id)
 
     async def get_channel_member_count(self, channel_id: str) -> Optional[int]:
         """
         Obtiene cantidad de miembros del canal.
 
+        Servida desde el cache de metadata (TTL + refresh en segundo plano).
+
         Args:
             channel_id: ID del canal
 
         Returns:
             Cantidad de miembros, o None si error
         """
-        try:
-            count = await self.bot.get_chat_member_count(channel_id)
-            return count
-        except Exception as e:
-            logger.error(f"Error al obtener miembros de {channel_id}: {e}")
-            return None
+        return await get_chat_metadata_cache().get_member_count(self.bot, channel_id)
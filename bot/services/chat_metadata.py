@@ -0,0 +1,268 @@
+"""
+Chat Metadata Cache - Info de canales (get_chat) y conteo de miembros con TTL.
+
+El título y datos de los canales VIP/Free cambian una vez al mes, pero los
+menús admin (VIP, Free, dashboard) y approve_ready_free_requests llamaban a
+bot.get_chat / get_chat_member_count en cada render.
+
+Estrategia:
+- Cache en memoria por ID de canal (uno por proceso)
+- Vencido: se sirve el valor anterior y se refresca en segundo plano
+  (stale-while-revalidate); solo un cache vacío espera a la Bot API
+- Tarea periódica (refresh_chat_metadata) refresca los canales configurados
+  antes de que venzan, así el render de menús no llama a la API
+- setup_vip_channel / setup_free_channel invalidan el canal anterior y
+  precargan el nuevo
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set, Union
+
+from aiogram import Bot
+from aiogram.types import Chat
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+ChatId = Union[int, str]
+
+# Cache global (uno por proceso)
+_chat_metadata: Optional["ChatMetadataCache"] = None
+
+
+@dataclass
+class _ChatEntry:
+    """Metadata cacheada de un canal."""
+    chat: Optional[Chat] = None
+    chat_loaded_at: float = 0.0
+    member_count: Optional[int] = None
+    count_loaded_at: float = 0.0
+
+
+class ChatMetadataCache:
+    """
+    Cache de get_chat y get_chat_member_count por ID de canal.
+
+    Uso:
+        cache = get_chat_metadata_cache()
+        chat = await cache.get_chat(bot, channel_id)
+        members = await cache.get_member_count(bot, channel_id)
+    """
+
+    def __init__(self, ttl_seconds: int = 3600, member_count_ttl_seconds: int = 300):
+        """
+        Inicializa el cache.
+
+        Args:
+            ttl_seconds: Vigencia de la info del canal (get_chat)
+            member_count_ttl_seconds: Vigencia del conteo de miembros
+        """
+        self.ttl_seconds = ttl_seconds
+        self.member_count_ttl_seconds = member_count_ttl_seconds
+        self._entries: Dict[str, _ChatEntry] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+        self._pending: Set[tuple] = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.api_calls = 0
+        self.api_errors = 0
+
+    @staticmethod
+    def _key(chat_id: ChatId) -> str:
+        return str(chat_id)
+
+    def _entry(self, chat_id: ChatId) -> _ChatEntry:
+        return self._entries.setdefault(self._key(chat_id), _ChatEntry())
+
+    # ===== LECTURA =====
+
+    async def get_chat(self, bot: Bot, chat_id: ChatId) -> Optional[Chat]:
+        """
+        Info del canal (equivalente a bot.get_chat) desde el cache.
+
+        Args:
+            bot: Instancia del bot
+            chat_id: ID del canal
+
+        Returns:
+            Chat, o None si nunca se pudo obtener
+        """
+        entry = self._entry(chat_id)
+
+        if entry.chat is None:
+            self.misses += 1
+            await self._load_chat(bot, chat_id)
+            return entry.chat
+
+        if time.monotonic() - entry.chat_loaded_at < self.ttl_seconds:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+            self._refresh_in_background(self._load_chat, bot, chat_id)
+        return entry.chat
+
+    async def get_member_count(self, bot: Bot, chat_id: ChatId) -> Optional[int]:
+        """
+        Miembros del canal (equivalente a bot.get_chat_member_count) desde el cache.
+
+        Args:
+            bot: Instancia del bot
+            chat_id: ID del canal
+
+        Returns:
+            Cantidad de miembros, o None si nunca se pudo obtener
+        """
+        entry = self._entry(chat_id)
+
+        if entry.member_count is None:
+            self.misses += 1
+            await self._load_member_count(bot, chat_id)
+            return entry.member_count
+
+        if time.monotonic() - entry.count_loaded_at < self.member_count_ttl_seconds:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+            self._refresh_in_background(self._load_member_count, bot, chat_id)
+        return entry.member_count
+
+    # ===== CARGA DESDE LA API =====
+
+    async def _load_chat(self, bot: Bot, chat_id: ChatId) -> bool:
+        """Consulta bot.get_chat; si falla conserva el valor anterior."""
+        self.api_calls += 1
+        try:
+            chat = await bot.get_chat(chat_id)
+        except Exception as e:
+            self.api_errors += 1
+            logger.error(f"Error al obtener info de canal {chat_id}: {e}")
+            return False
+
+        self.prime(chat_id, chat)
+        return True
+
+    async def _load_member_count(self, bot: Bot, chat_id: ChatId) -> bool:
+        """Consulta bot.get_chat_member_count; si falla conserva el valor anterior."""
+        self.api_calls += 1
+        try:
+            count = await bot.get_chat_member_count(chat_id)
+        except Exception as e:
+            self.api_errors += 1
+            logger.error(f"Error al obtener miembros de {chat_id}: {e}")
+            return False
+
+        entry = self._entry(chat_id)
+        entry.member_count = count
+        entry.count_loaded_at = time.monotonic()
+        return True
+
+    def _refresh_in_background(self, loader, bot: Bot, chat_id: ChatId) -> None:
+        """Agenda un refresh sin bloquear (uno por canal y tipo a la vez)."""
+        key = (loader.__name__, self._key(chat_id))
+        if key in self._pending:
+            return
+
+        self._pending.add(key)
+        task = asyncio.create_task(loader(bot, chat_id))
+        self._refreshing.add(task)
+
+        def _done(finished: asyncio.Task) -> None:
+            self._refreshing.discard(finished)
+            self._pending.discard(key)
+
+        task.add_done_callback(_done)
+
+    async def refresh(self, bot: Bot, chat_ids: Iterable[ChatId]) -> int:
+        """
+        Refresca los canales dados si vencen antes del próximo ciclo.
+
+        Lo usa la tarea periódica para que los menús siempre lean del cache.
+
+        Args:
+            bot: Instancia del bot
+            chat_ids: Canales a mantener frescos
+
+        Returns:
+            Llamadas a la API realizadas con éxito
+        """
+        horizon = time.monotonic() + Config.CHAT_METADATA_REFRESH_SECONDS
+        refreshed = 0
+
+        for chat_id in chat_ids:
+            if not chat_id:
+                continue
+            entry = self._entry(chat_id)
+            if entry.chat is None or entry.chat_loaded_at + self.ttl_seconds <= horizon:
+                refreshed += await self._load_chat(bot, chat_id)
+            if (
+                entry.member_count is None
+                or entry.count_loaded_at + self.member_count_ttl_seconds <= horizon
+            ):
+                refreshed += await self._load_member_count(bot, chat_id)
+
+        return refreshed
+
+    # ===== INVALIDACIÓN =====
+
+    def prime(self, chat_id: ChatId, chat: Chat) -> None:
+        """
+        Guarda info de canal ya obtenida (p. ej. al configurar el canal).
+
+        Args:
+            chat_id: ID del canal
+            chat: Resultado de bot.get_chat
+        """
+        entry = self._entry(chat_id)
+        entry.chat = chat
+        entry.chat_loaded_at = time.monotonic()
+
+    def invalidate(self, chat_id: Optional[ChatId] = None) -> None:
+        """
+        Descarta la metadata de un canal (o de todos si chat_id es None).
+
+        Args:
+            chat_id: ID del canal a descartar
+        """
+        if chat_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(self._key(chat_id), None)
+
+    def get_stats(self) -> dict:
+        """
+        Métricas del cache.
+
+        Returns:
+            Dict con chats, hits, stale_hits, misses, api_calls y api_errors
+        """
+        return {
+            "chats": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "api_calls": self.api_calls,
+            "api_errors": self.api_errors,
+        }
+
+
+def get_chat_metadata_cache() -> ChatMetadataCache:
+    """Cache global de metadata de canales (creado en el primer uso)."""
+    global _chat_metadata
+
+    if _chat_metadata is None:
+        _chat_metadata = ChatMetadataCache(
+            ttl_seconds=Config.CHAT_METADATA_TTL_SECONDS,
+            member_count_ttl_seconds=Config.CHAT_MEMBER_COUNT_TTL_SECONDS
+        )
+
+    return _chat_metadata
+
+
+def get_chat_metadata_stats() -> dict:
+    """Métricas del cache global de metadata de canales."""
+    return get_chat_metadata_cache().get_stats()
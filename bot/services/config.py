@@ -17,6 +17,17 @@ from bot.database.models import BotConfig
 logger = logging.getLogger(__name__)
 
 
+def _invalidate_join_ingest_config() -> None:
+    """
+    El ingestor de solicitudes Free cachea canal, espera y redes sociales;
+    se descarta tras cambiarlos para que el próximo lote use los nuevos.
+    """
+    # Import local: bot.background importa los services
+    from bot.background.join_ingest import invalidate_join_ingest_config
+
+    invalidate_join_ingest_config()
+
+
 class ConfigService:
     """
     Service para gestionar configuración global del bot.
@@ -202,6 +213,7 @@ class ConfigService:
         config.wait_time_minutes = minutes
 
         await self.session.commit()
+        _invalidate_join_ingest_config()
 
         logger.info(
             f"⏱️ Tiempo de espera Free actualizado: "
@@ -296,6 +308,7 @@ class ConfigService:
         config.social_instagram = handle.strip()
 
         await self.session.commit()
+        _invalidate_join_ingest_config()
 
         logger.info(f"📸 Instagram actualizado: {handle.strip()}")
 
@@ -316,6 +329,7 @@ class ConfigService:
         config.social_tiktok = handle.strip()
 
         await self.session.commit()
+        _invalidate_join_ingest_config()
 
         logger.info(f"🎵 TikTok actualizado: {handle.strip()}")
 
@@ -336,6 +350,7 @@ class ConfigService:
         config.social_x = handle.strip()
 
         await self.session.commit()
+        _invalidate_join_ingest_config()
 
         logger.info(f"🐦 X actualizado: {handle.strip()}")
 
@@ -444,6 +459,7 @@ class ConfigService:
         config.subscription_fees = {"monthly": 10, "yearly": 100}
 
         await self.session.commit()
+        _invalidate_join_ingest_config()
 
         logger.warning("⚠️ Configuración reseteada a valores por defecto")
 
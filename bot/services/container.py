@@ -59,6 +59,8 @@ class ServiceContainer:
         self._interest_service = None
         self._user_management_service = None
         self._vip_entry_service = None
+        self._user_search_service = None
+        self._vip_invite_pool_service = None
 
         logger.debug("🏭 ServiceContainer inicializado (modo lazy)")
 
@@ -183,7 +185,8 @@ class ServiceContainer:
         """
         Servicio de mensajes con la voz de Lucien.
 
-        Se carga lazy (solo en primer acceso).
+        Se carga lazy (solo en primer acceso). La instancia es compartida por
+        todo el proceso (providers stateless, keyboards memoizados).
 
         Returns:
             LucienVoiceService: Instancia del servicio de mensajes
@@ -196,9 +199,9 @@ class ServiceContainer:
             success_msg = container.message.common.success('canal configurado')
         """
         if self._lucien_voice_service is None:
-            from bot.services.message import LucienVoiceService
+            from bot.services.message import get_lucien_voice
             logger.debug("🔄 Lazy loading: LucienVoiceService")
-            self._lucien_voice_service = LucienVoiceService()
+            self._lucien_voice_service = get_lucien_voice()
 
         return self._lucien_voice_service
 
@@ -209,7 +212,8 @@ class ServiceContainer:
         """
         Servicio de historial de sesión para selección de variantes consciente del contexto.
 
-        Se carga lazy (solo en primer acceso).
+        Es el store global del proceso (get_session_history()), no uno por
+        container: así _choose_variant ve los mensajes de updates anteriores.
 
         Returns:
             SessionMessageHistory: Instancia del servicio de historial
@@ -224,10 +228,9 @@ class ServiceContainer:
             # Provider internamente llama _choose_variant con session_history
         """
         if self._session_history is None:
-            from bot.services.message.session_history import SessionMessageHistory
-            logger.debug("🔄 Lazy loading: SessionMessageHistory")
-            # TTL 5 minutos, máximo 5 entradas por usuario
-            self._session_history = SessionMessageHistory(ttl_seconds=300, max_entries=5)
+            from bot.services.message.session_history import get_session_history
+            # Store global del proceso: el historial persiste entre updates
+            self._session_history = get_session_history()
 
         return self._session_history
 
@@ -387,6 +390,50 @@ class ServiceContainer:
 
         return self._vip_entry_service
 
+    # ===== VIP INVITE POOL SERVICE =====
+
+    @property
+    def vip_invite_pool(self):
+        """
+        Service del pool de enlaces de invitación VIP pre-generados.
+
+        Se carga lazy (solo en primer acceso).
+
+        Returns:
+            VIPInvitePoolService: Instancia del service
+
+        Usage:
+            stats = await container.vip_invite_pool.maintain(vip_channel_id)
+        """
+        if self._vip_invite_pool_service is None:
+            from bot.services.vip_invite_pool import VIPInvitePoolService
+            logger.debug("🔄 Lazy loading: VIPInvitePoolService")
+            self._vip_invite_pool_service = VIPInvitePoolService(self._session, self._bot)
+
+        return self._vip_invite_pool_service
+
+    # ===== USER SEARCH SERVICE =====
+
+    @property
+    def user_search(self):
+        """
+        Service de búsqueda indexada de usuarios (prefijo + difusa).
+
+        Se carga lazy (solo en primer acceso).
+
+        Returns:
+            UserSearchService: Instancia del service
+
+        Usage:
+            users = await container.user_search.search("juan", limit=10)
+        """
+        if self._user_search_service is None:
+            from bot.services.user_search import UserSearchService
+            logger.debug("🔄 Lazy loading: UserSearchService")
+            self._user_search_service = UserSearchService(self._session)
+
+        return self._user_search_service
+
     # ===== UTILIDADES =====
 
     def get_loaded_services(self) -> list[str]:
@@ -428,6 +475,10 @@ class ServiceContainer:
             loaded.append("user_management")
         if self._vip_entry_service is not None:
             loaded.append("vip_entry")
+        if self._user_search_service is not None:
+            loaded.append("user_search")
+        if self._vip_invite_pool_service is not None:
+            loaded.append("vip_invite_pool")
 
         return loaded
 
@@ -8,6 +8,7 @@ Responsibilidades:
 - Actualizar paquetes (update_package)
 - Desactivar paquetes (deactivate_package - soft delete)
 - Listar paquetes activos (get_active_packages)
+- Búsqueda full-text con ranking (search_packages)
 
 Pattern: Sigue SubscriptionService (async, session injection, sin commits)
 """
@@ -16,11 +17,20 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional, Tuple
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, and_, or_, func, case, text, table, column, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bot.database.dialect import DatabaseDialect, get_session_dialect
 from bot.database.models import ContentPackage
 from bot.database.enums import ContentCategory, PackageType
+from bot.database.search import (
+    CONTENT_FTS_TABLE,
+    CONTENT_FTS_WEIGHTS,
+    CONTENT_TSVECTOR_SQL,
+    build_fts5_query,
+    build_tsquery,
+    content_fts_available,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +118,9 @@ class ContentService:
         )
 
         self.session.add(package)
+        # Flush para obtener el ID y registrar el paquete en el índice de búsqueda
+        await self.session.flush()
+        await self._sync_search_index(package)
         # NO commit - dejar que el handler gestione la transacción
 
         logger.info(
@@ -287,6 +300,9 @@ class ContentService:
         # Actualizar timestamp
         package.updated_at = datetime.utcnow()
 
+        if 'name' in kwargs or 'description' in kwargs:
+            await self._sync_search_index(package)
+
         # NO commit - dejar que el handler gestione la transacción
 
         logger.info(f"✅ Paquete actualizado: {package_id} - {package.name}")
@@ -380,36 +396,127 @@ class ContentService:
         self,
         search_term: str,
         is_active: Optional[bool] = None,
-        limit: int = 50
+        limit: int = 50,
+        category: Optional[ContentCategory] = None,
+        package_type: Optional[PackageType] = None
     ) -> List[ContentPackage]:
         """
-        Busca paquetes por nombre o descripción.
+        Busca paquetes por nombre o descripción, ordenados por relevancia.
+
+        Estrategia según dialecto:
+        - SQLite: FTS5 (content_packages_fts) con bm25(), el nombre pesa más
+        - PostgreSQL: tsvector 'spanish' (índice GIN de expresión) con ts_rank_cd()
+        - Sin índice full-text: ILIKE, coincidencias en nombre primero
+
+        Cada palabra se busca como prefijo ("vera" encuentra "verano").
 
         Args:
             search_term: Término de búsqueda
             is_active: Filtrar por estado (opcional)
             limit: Máximo de resultados (default: 50)
+            category: Filtrar por categoría (opcional)
+            package_type: Filtrar por tipo de paquete (opcional)
 
         Returns:
-            Lista de ContentPackage que coinciden con la búsqueda
+            Lista de ContentPackage que coinciden, más relevantes primero
         """
-        search_pattern = f"%{search_term}%"
-
-        query = select(ContentPackage).where(
-            or_(
-                ContentPackage.name.ilike(search_pattern),
-                ContentPackage.description.ilike(search_pattern)
-            )
-        ).order_by(ContentPackage.created_at.desc())
-
+        filters = []
         if is_active is not None:
-            query = query.where(ContentPackage.is_active == is_active)
+            filters.append(ContentPackage.is_active == is_active)
+        if category is not None:
+            filters.append(ContentPackage.category == category)
+        if package_type is not None:
+            filters.append(ContentPackage.type == package_type)
 
-        query = query.limit(limit)
+        dialect = get_session_dialect(self.session)
+        if dialect == DatabaseDialect.POSTGRESQL:
+            query = self._tsvector_search_query(search_term, filters)
+        elif dialect == DatabaseDialect.SQLITE and await content_fts_available(self.session):
+            query = self._fts5_search_query(search_term, filters)
+        else:
+            query = self._ilike_search_query(search_term, filters)
 
-        result = await self.session.execute(query)
+        if query is None:
+            return []
+
+        result = await self.session.execute(query.limit(limit))
         packages = list(result.scalars().all())
 
         logger.debug(f"📦 Búsqueda '{search_term}': {len(packages)} resultados")
 
         return packages
+
+    def _fts5_search_query(self, search_term: str, filters: list):
+        """Query FTS5 (SQLite) ordenada por bm25; None si no hay palabras."""
+        match_query = build_fts5_query(search_term)
+        if not match_query:
+            return None
+
+        fts = table(CONTENT_FTS_TABLE, column("rowid"))
+        name_weight, description_weight = CONTENT_FTS_WEIGHTS
+        rank = literal_column(
+            f"bm25({CONTENT_FTS_TABLE}, {name_weight}, {description_weight})"
+        )
+
+        return select(ContentPackage).join(
+            fts, fts.c.rowid == ContentPackage.id
+        ).where(
+            text(f"{CONTENT_FTS_TABLE} MATCH :match_query").bindparams(match_query=match_query),
+            *filters
+        ).order_by(rank, ContentPackage.created_at.desc())
+
+    def _tsvector_search_query(self, search_term: str, filters: list):
+        """Query tsvector (PostgreSQL) ordenada por ts_rank_cd; None si no hay palabras."""
+        ts_query_text = build_tsquery(search_term)
+        if not ts_query_text:
+            return None
+
+        vector = literal_column(f"({CONTENT_TSVECTOR_SQL})")
+        ts_query = func.to_tsquery(literal_column("'spanish'"), ts_query_text)
+
+        return select(ContentPackage).where(
+            vector.op("@@")(ts_query),
+            *filters
+        ).order_by(
+            func.ts_rank_cd(vector, ts_query).desc(),
+            ContentPackage.created_at.desc()
+        )
+
+    def _ilike_search_query(self, search_term: str, filters: list):
+        """Query ILIKE de respaldo (sin índice full-text); nombre antes que descripción."""
+        search_pattern = f"%{search_term}%"
+        name_match = ContentPackage.name.ilike(search_pattern)
+
+        return select(ContentPackage).where(
+            or_(name_match, ContentPackage.description.ilike(search_pattern)),
+            *filters
+        ).order_by(
+            case((name_match, 0), else_=1),
+            ContentPackage.created_at.desc()
+        )
+
+    async def _sync_search_index(self, package: ContentPackage) -> None:
+        """
+        Actualiza la fila FTS5 del paquete (solo SQLite).
+
+        En PostgreSQL el índice GIN es de expresión y se mantiene solo.
+
+        Args:
+            package: Paquete creado o actualizado (con ID asignado)
+        """
+        if get_session_dialect(self.session) != DatabaseDialect.SQLITE:
+            return
+        if not await content_fts_available(self.session):
+            return
+
+        await self.session.execute(
+            text(f"DELETE FROM {CONTENT_FTS_TABLE} WHERE rowid = :id"),
+            {"id": package.id}
+        )
+        await self.session.execute(
+            text(
+                f"INSERT INTO {CONTENT_FTS_TABLE} (rowid, name, description) "
+                f"VALUES (:id, :name, :description)"
+            ),
+            {"id": package.id, "name": package.name, "description": package.description or ""}
+        )
@@ -8,11 +8,14 @@ evitar spam en notificaciones a administradores.
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, Dict, Any
-from sqlalchemy import select, and_, or_, desc
+from sqlalchemy import (
+    select, and_, or_, desc, func, case, delete, insert, literal, text, DateTime
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from bot.database.models import UserInterest, ContentPackage, User
+from bot.database.dialect import DatabaseDialect, dialect_insert, get_session_dialect
+from bot.database.models import UserInterest, ContentPackage, User, PackageInterestCounter
 from bot.database.enums import ContentCategory
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,7 @@ class InterestService:
     - Marcar intereses como atendidos
     - Obtener estadísticas de intereses
     - Verificar ventana de debounce para re-expresión de interés
+    - Mantener contadores pre-agregados por paquete (package_interest_counters)
 
     Patrón de deduplicación:
     - Un usuario puede expresar interés en el mismo paquete múltiples veces
@@ -61,6 +65,9 @@ class InterestService:
 
     DEBOUNCE_WINDOW_MINUTES = 5
 
+    # Mantener package_interest_counters en register/mark_as_attended/cleanup
+    MAINTAIN_PACKAGE_COUNTERS = True
+
     def __init__(self, session: AsyncSession, bot):
         """
         Inicializar InterestService.
@@ -139,6 +146,9 @@ class InterestService:
                 else:
                     # Update timestamp (re-interest after window)
                     existing_interest.created_at = datetime.utcnow()
+                    await self._bump_package_counter(
+                        package_id, touched_at=existing_interest.created_at
+                    )
                     logger.info(
                         f"Updated interest timestamp for user {user_id}, "
                         f"package {package_id} (debounce window expired)"
@@ -158,6 +168,12 @@ class InterestService:
                 self.session.add(new_interest)
                 # Flush to get ID
                 await self.session.flush()
+                await self._bump_package_counter(
+                    package_id,
+                    total_delta=1,
+                    pending_delta=1,
+                    touched_at=new_interest.created_at
+                )
                 logger.info(
                     f"Registered new interest for user {user_id}, package {package_id}"
                 )
@@ -229,12 +245,13 @@ class InterestService:
             if conditions:
                 stmt = stmt.where(and_(*conditions))
 
-            # Count total
-            count_stmt = select(UserInterest.__table__.c.id).join(ContentPackage)
+            # Count total (COUNT en BD; JOIN solo si se filtra por categoría)
+            count_stmt = select(func.count(UserInterest.id))
+            if package_type is not None:
+                count_stmt = count_stmt.join(ContentPackage)
             if conditions:
                 count_stmt = count_stmt.where(and_(*conditions))
-            count_result = await self.session.execute(count_stmt)
-            total_count = len(count_result.all())
+            total_count = (await self.session.execute(count_stmt)).scalar_one()
 
             # Apply sorting
             if sort_newest_first:
@@ -345,6 +362,8 @@ class InterestService:
 
             interest.is_attended = True
             interest.attended_at = datetime.utcnow()
+            await self.session.flush()
+            await self._bump_package_counter(interest.package_id, pending_delta=-1)
 
             logger.info(f"Marked interest {interest_id} as attended")
             return (True, "Interés marcado como atendido")
@@ -363,7 +382,8 @@ class InterestService:
             Diccionario con:
             - total_pending: Total de intereses pendientes
             - total_attended: Total de intereses atendidos
-            - by_package_type: Dict con conteo por tipo de paquete
+            - by_package_type: Dict con conteo por tipo de paquete (contadores)
+            - top_packages: Lista de (ContentPackage, pendientes), top 5
             - recent_interests: Lista de últimos 5 intereses (todos)
 
         Examples:
@@ -371,27 +391,33 @@ class InterestService:
             >>> print(f"Pendientes: {stats['total_pending']}")
         """
         try:
-            # Total pending
-            pending_stmt = select(UserInterest).where(UserInterest.is_attended == False)
-            pending_result = await self.session.execute(pending_stmt)
-            total_pending = len(pending_result.scalars().all())
-
-            # Total attended
-            attended_stmt = select(UserInterest).where(UserInterest.is_attended == True)
-            attended_result = await self.session.execute(attended_stmt)
-            total_attended = len(attended_result.scalars().all())
-
-            # By package type
-            stmt = select(UserInterest).options(
-                selectinload(UserInterest.package)
-            ).join(ContentPackage)
-            result = await self.session.execute(stmt)
-            all_interests = result.scalars().all()
+            # Pending / attended en un solo GROUP BY
+            status_stmt = select(
+                UserInterest.is_attended,
+                func.count(UserInterest.id)
+            ).group_by(UserInterest.is_attended)
+            status_result = await self.session.execute(status_stmt)
+            status_counts = {bool(attended): count for attended, count in status_result.all()}
+            total_pending = status_counts.get(False, 0)
+            total_attended = status_counts.get(True, 0)
+
+            # By package type: suma de contadores pre-agregados por categoría
+            category_stmt = select(
+                ContentPackage.category,
+                func.sum(PackageInterestCounter.total_interests)
+            ).select_from(PackageInterestCounter).join(
+                ContentPackage, PackageInterestCounter.package_id == ContentPackage.id
+            ).where(
+                PackageInterestCounter.total_interests > 0
+            ).group_by(ContentPackage.category)
+            category_result = await self.session.execute(category_stmt)
+            by_package_type = {
+                (category.value if category else "unknown"): int(count)
+                for category, count in category_result.all()
+            }
 
-            by_package_type = {}
-            for interest in all_interests:
-                pkg_type = interest.package.category.value if interest.package else "unknown"
-                by_package_type[pkg_type] = by_package_type.get(pkg_type, 0) + 1
+            # Paquetes con más intereses pendientes (contadores)
+            top_packages = await self.get_top_packages_by_interest(limit=5)
 
             # Recent interests (last 5)
             recent_stmt = select(UserInterest).options(
@@ -407,6 +433,7 @@ class InterestService:
                 "total_pending": total_pending,
                 "total_attended": total_attended,
                 "by_package_type": by_package_type,
+                "top_packages": top_packages,
                 "recent_interests": recent_interests
             }
 
@@ -416,17 +443,20 @@ class InterestService:
                 "total_pending": 0,
                 "total_attended": 0,
                 "by_package_type": {},
+                "top_packages": [],
                 "recent_interests": []
             }
 
     # ===== LIMPIEZA =====
 
-    async def cleanup_old_attended(self, days_old: int = 30) -> int:
+    async def cleanup_old_attended(self, days_old: int = 30, limit: Optional[int] = None) -> int:
         """
         Limpia intereses atendidos antiguos (background task).
 
         Args:
             days_old: Días de antigüedad para eliminar
+            limit: Máximo de registros a eliminar (None = todos). Permite
+                borrar por lotes (ver bot/background/retention.py)
 
         Returns:
             Número de registros eliminados
@@ -436,23 +466,40 @@ class InterestService:
             No eliminar intereses pendientes (is_attended=False).
         """
         try:
-            from sqlalchemy import delete
-
             cutoff_date = datetime.utcnow() - timedelta(days=days_old)
+            conditions = and_(
+                UserInterest.is_attended == True,
+                UserInterest.attended_at < cutoff_date
+            )
+            if limit is not None:
+                conditions = UserInterest.id.in_(
+                    select(UserInterest.id)
+                    .where(conditions)
+                    .order_by(UserInterest.id)
+                    .limit(limit)
+                    .scalar_subquery()
+                )
 
-            # Find old attended interests
-            stmt = select(UserInterest).where(
-                and_(
-                    UserInterest.is_attended == True,
-                    UserInterest.attended_at < cutoff_date
+            # Conteo por paquete para ajustar contadores (sin cargar filas)
+            per_package_stmt = select(
+                UserInterest.package_id,
+                func.count(UserInterest.id)
+            ).where(conditions).group_by(UserInterest.package_id)
+            per_package = (await self.session.execute(per_package_stmt)).all()
+
+            count = sum(package_count for _, package_count in per_package)
+            if count == 0:
+                logger.info(f"Cleaned up 0 attended interests older than {days_old} days")
+                return 0
+
+            await self.session.execute(
+                delete(UserInterest).where(conditions).execution_options(
+                    synchronize_session=False
                 )
             )
-            result = await self.session.execute(stmt)
-            old_interests = result.scalars().all()
 
-            count = len(old_interests)
-            for interest in old_interests:
-                await self.session.delete(interest)
+            for package_id, package_count in per_package:
+                await self._bump_package_counter(package_id, total_delta=-package_count)
 
             logger.info(f"Cleaned up {count} attended interests older than {days_old} days")
             return count
@@ -461,6 +508,179 @@ class InterestService:
             logger.error(f"Error cleaning up old interests: {e}", exc_info=True)
             return 0
 
+    # ===== CONTADORES PRE-AGREGADOS =====
+
+    async def get_package_interest_counts(
+        self,
+        package_ids: Optional[List[int]] = None
+    ) -> Dict[int, Dict[str, int]]:
+        """
+        Obtiene los contadores pre-agregados de intereses por paquete.
+
+        Lee package_interest_counters (una fila por paquete) en lugar de
+        contar user_interests, por lo que el costo no crece con los intereses.
+
+        Args:
+            package_ids: IDs de paquetes a consultar (None = todos)
+
+        Returns:
+            Dict {package_id: {"total": int, "pending": int}}
+        """
+        try:
+            stmt = select(
+                PackageInterestCounter.package_id,
+                PackageInterestCounter.total_interests,
+                PackageInterestCounter.pending_interests
+            )
+            if package_ids is not None:
+                if not package_ids:
+                    return {}
+                stmt = stmt.where(PackageInterestCounter.package_id.in_(package_ids))
+
+            result = await self.session.execute(stmt)
+            return {
+                package_id: {"total": total, "pending": pending}
+                for package_id, total, pending in result.all()
+            }
+        except Exception as e:
+            logger.error(f"Error getting package interest counts: {e}", exc_info=True)
+            return {}
+
+    async def get_top_packages_by_interest(
+        self,
+        limit: int = 5,
+        pending_only: bool = True
+    ) -> List[Tuple[ContentPackage, int]]:
+        """
+        Obtiene los paquetes con más intereses usando los contadores.
+
+        Args:
+            limit: Máximo de paquetes a retornar
+            pending_only: True para ordenar por pendientes, False por total
+
+        Returns:
+            Lista de tuplas (ContentPackage, count) ordenada descendente
+        """
+        try:
+            count_column = (
+                PackageInterestCounter.pending_interests
+                if pending_only
+                else PackageInterestCounter.total_interests
+            )
+            stmt = select(ContentPackage, count_column).join(
+                PackageInterestCounter,
+                PackageInterestCounter.package_id == ContentPackage.id
+            ).where(count_column > 0).order_by(desc(count_column)).limit(limit)
+
+            result = await self.session.execute(stmt)
+            return [(package, count) for package, count in result.all()]
+        except Exception as e:
+            logger.error(f"Error getting top packages by interest: {e}", exc_info=True)
+            return []
+
+    async def rebuild_package_counters(self) -> int:
+        """
+        Reconstruye package_interest_counters desde user_interests.
+
+        Útil tras importaciones masivas o si los contadores se desincronizan.
+        Borra y vuelve a llenar la tabla con un único INSERT ... SELECT
+        ... GROUP BY; no carga filas de intereses en memoria.
+
+        En PostgreSQL bloquea antes package_interest_counters en modo
+        EXCLUSIVE: los _bump_package_counter concurrentes esperan al commit
+        y aplican su delta sobre el contador ya reconstruido, en lugar de
+        ser pisados con valores viejos. En SQLite el DELETE ya toma el
+        bloqueo de escritura de toda la base.
+
+        Returns:
+            Número de paquetes con contador reconstruido
+        """
+        if get_session_dialect(self.session) == DatabaseDialect.POSTGRESQL:
+            await self.session.execute(
+                text("LOCK TABLE package_interest_counters IN EXCLUSIVE MODE")
+            )
+
+        await self.session.execute(delete(PackageInterestCounter))
+
+        aggregate_stmt = select(
+            UserInterest.package_id,
+            func.count(UserInterest.id),
+            func.sum(case((UserInterest.is_attended == False, 1), else_=0)),
+            func.max(UserInterest.created_at),
+            literal(datetime.utcnow(), DateTime)
+        ).group_by(UserInterest.package_id)
+        result = await self.session.execute(
+            insert(PackageInterestCounter).from_select(
+                [
+                    PackageInterestCounter.package_id,
+                    PackageInterestCounter.total_interests,
+                    PackageInterestCounter.pending_interests,
+                    PackageInterestCounter.last_interest_at,
+                    PackageInterestCounter.updated_at
+                ],
+                aggregate_stmt
+            )
+        )
+        rebuilt = result.rowcount
+
+        logger.info(f"Rebuilt interest counters for {rebuilt} packages")
+        return rebuilt
+
+    async def _bump_package_counter(
+        self,
+        package_id: int,
+        total_delta: int = 0,
+        pending_delta: int = 0,
+        touched_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Aplica un delta al contador de un paquete con un único upsert.
+
+        Si el paquete aún no tiene fila, el INSERT la siembra desde un COUNT
+        indexado por package_id (los cambios ya deben estar en flush); si la
+        fila existe (o la creó otra transacción en paralelo), ON CONFLICT
+        suma el delta sobre ella, sin carrera por la clave primaria.
+
+        Args:
+            package_id: ID del paquete
+            total_delta: Cambio en total_interests
+            pending_delta: Cambio en pending_interests
+            touched_at: Nueva fecha de último interés (opcional)
+        """
+        if not self.MAINTAIN_PACKAGE_COUNTERS:
+            return
+
+        now = datetime.utcnow()
+        seed = {
+            "total_interests": select(func.count(UserInterest.id)).where(
+                UserInterest.package_id == package_id
+            ).scalar_subquery(),
+            "pending_interests": select(func.count(UserInterest.id)).where(
+                UserInterest.package_id == package_id,
+                UserInterest.is_attended == False
+            ).scalar_subquery(),
+            "last_interest_at": select(func.max(UserInterest.created_at)).where(
+                UserInterest.package_id == package_id
+            ).scalar_subquery(),
+        }
+
+        table = PackageInterestCounter.__table__
+        increments = {
+            "total_interests": table.c.total_interests + total_delta,
+            "pending_interests": table.c.pending_interests + pending_delta,
+            "updated_at": now,
+        }
+        if touched_at is not None:
+            increments["last_interest_at"] = touched_at
+
+        stmt = dialect_insert(self.session, table).values(
+            package_id=package_id, updated_at=now, **seed
+        ).on_conflict_do_update(
+            index_elements=[table.c.package_id],
+            set_=increments
+        )
+        await self.session.execute(stmt)
+
     # ===== UTILIDADES =====
 
     def _is_within_debounce_window(self, created_at: datetime) -> bool:
@@ -7,9 +7,12 @@ Architecture:
 - BaseMessageProvider: Abstract base enforcing stateless interface
 - CommonMessages: Shared messages (errors, success, greetings)
 - LucienVoiceService: Main service container for all message providers
+- get_lucien_voice(): Process-wide LucienVoiceService shared by every container
 
 All providers are stateless: no session/bot stored as instance variables.
 All messages use formatters from bot.utils.formatters for dates/numbers.
+Because they are stateless, one registry serves the whole process: static
+keyboards (@static_keyboard) and static texts are built once and reused.
 
 Usage in handlers:
     from bot.services.container import ServiceContainer
@@ -19,6 +22,8 @@ Usage in handlers:
     msg = container.message.common.success('action completed')
 """
 
+from typing import Optional
+
 from .base import BaseMessageProvider
 from .common import CommonMessages
 
@@ -38,6 +43,7 @@ __all__ = [
     "BaseMessageProvider",
     "CommonMessages",
     "LucienVoiceService",
+    "get_lucien_voice",
     "AdminMessages",
     "AdminMainMessages",
     "AdminVIPMessages",
@@ -526,6 +532,32 @@ class LucienVoiceService:
             self._user = UserMessages()
         return self._user
 
+    def warm_up(self) -> int:
+        """
+        Instantiate every provider and build its static keyboards.
+
+        Called once at startup so the first user of each menu does not pay
+        for imports and keyboard construction.
+
+        Returns:
+            int: Number of static keyboards built
+        """
+        providers = [
+            self.common,
+            self.admin.main, self.admin.vip, self.admin.free,
+            self.admin.content, self.admin.interest, self.admin.user,
+            self.user.start, self.user.flows, self.user.menu, self.user.vip_entry,
+        ]
+
+        built = 0
+        for provider in providers:
+            for name in dir(type(provider)):
+                method = getattr(type(provider), name)
+                if hasattr(method, "cache_clear"):
+                    method(provider)
+                    built += 1
+        return built
+
     def get_session_context(self, container: "ServiceContainer"):
         """
         Get session history instance from container for passing to providers.
@@ -550,3 +582,22 @@ class LucienVoiceService:
             )
         """
         return container.session_history
+
+
+# Process-wide provider registry (providers are stateless)
+_lucien_voice: Optional[LucienVoiceService] = None
+
+
+def get_lucien_voice() -> LucienVoiceService:
+    """
+    Return the process-wide LucienVoiceService (created on first use).
+
+    Every ServiceContainer shares it, so providers and their memoized
+    keyboards/templates are built once per process instead of per update.
+    """
+    global _lucien_voice
+
+    if _lucien_voice is None:
+        _lucien_voice = LucienVoiceService()
+
+    return _lucien_voice
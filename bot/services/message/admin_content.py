@@ -10,7 +10,8 @@ from aiogram.types import InlineKeyboardMarkup
 
 from bot.database.enums import ContentCategory
 from bot.services.message.base import BaseMessageProvider
-from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.formatters import escape_html
+from bot.utils.keyboards import create_inline_keyboard, static_keyboard
 
 
 class AdminContentMessages(BaseMessageProvider):
@@ -119,6 +120,75 @@ class AdminContentMessages(BaseMessageProvider):
         keyboard = create_inline_keyboard([])  # Empty keyboard, handlers add list items
         return text, keyboard
 
+    def search_prompt(self) -> Tuple[str, InlineKeyboardMarkup]:
+        """
+        Generate prompt asking for a package search term.
+
+        Returns:
+            Tuple of (text, keyboard) with search instructions
+
+        Voice Rationale:
+            "Buscar en la colección" keeps gallery imagery.
+            Explains that partial words are enough (prefix search).
+        """
+        header = "🎩 <b>Lucien:</b>\n\n<i>Permítame buscar en la colección, curador...</i>"
+
+        body = (
+            f"<b>🔍 Buscar Paquete</b>\n\n"
+            f"<i>Envíe una o varias palabras del nombre o la descripción.</i>\n\n"
+            f"<i>Basta con el inicio de cada palabra: \"vera\" encuentra \"verano\".</i>"
+        )
+
+        text = self._compose(header, body)
+        keyboard = create_inline_keyboard([
+            [{"text": "❌ Cancelar", "callback_data": "admin:content"}],
+        ])
+        return text, keyboard
+
+    def search_results(
+        self,
+        query: str,
+        packages: list,
+        elapsed_ms: float
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """
+        Generate package search results ordered by relevance.
+
+        Args:
+            query: Search term sent by the admin
+            packages: ContentPackage list (most relevant first)
+            elapsed_ms: Search latency in milliseconds
+
+        Returns:
+            Tuple of (text, keyboard) with one button per package
+
+        Voice Rationale:
+            Reports how many treasures were found and how long it took,
+            so the curator can notice a slow catalog search.
+        """
+        header = "🎩 <b>Lucien:</b>\n\n<i>Esto es lo que la colección ofrece...</i>"
+
+        body = (
+            f'<b>🔍 Resultados: "{escape_html(query)}"</b>\n\n'
+            f"<i>{len(packages)} paquete(s) encontrado(s) en {elapsed_ms:.1f} ms</i>"
+        )
+        if not packages:
+            body += "\n\n<i>Ningún tesoro coincide con esa búsqueda.</i>"
+
+        text = self._compose(header, body)
+
+        buttons = [
+            [{
+                "text": f"{package.category.emoji if package.category else '📦'} {package.name}",
+                "callback_data": f"admin:content:view:{package.id}"
+            }]
+            for package in packages
+        ]
+        buttons.append([{"text": "🔍 Nueva Búsqueda", "callback_data": "admin:content:search"}])
+        buttons.append([{"text": "🔙 Volver", "callback_data": "admin:content"}])
+        keyboard = create_inline_keyboard(buttons)
+        return text, keyboard
+
     def package_summary(
         self,
         package: "ContentPackage",
@@ -629,6 +699,7 @@ class AdminContentMessages(BaseMessageProvider):
 
     # ===== PRIVATE KEYBOARD FACTORY METHODS =====
 
+    @static_keyboard
     def _content_menu_keyboard(self) -> InlineKeyboardMarkup:
         """
         Generate keyboard for main content management menu.
@@ -642,6 +713,7 @@ class AdminContentMessages(BaseMessageProvider):
         """
         return create_inline_keyboard([
             [{"text": "📋 Ver Paquetes", "callback_data": "admin:content:list"}],
+            [{"text": "🔍 Buscar Paquete", "callback_data": "admin:content:search"}],
             [{"text": "➕ Crear Paquete", "callback_data": "admin:content:create:start"}],
             [{"text": "🔙 Volver al Menú Principal", "callback_data": "admin:main"}],
         ])
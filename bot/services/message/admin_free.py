@@ -9,7 +9,7 @@ import random
 from aiogram.types import InlineKeyboardMarkup
 
 from bot.services.message.base import BaseMessageProvider
-from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.keyboards import create_inline_keyboard, static_keyboard
 from bot.utils.formatters import format_duration_minutes, format_relative_time
 from bot.database.models import FreeChannelRequest
 
@@ -292,6 +292,7 @@ class AdminFreeMessages(BaseMessageProvider):
 
     # ===== PRIVATE KEYBOARD FACTORIES =====
 
+    @static_keyboard
     def _free_configured_keyboard(self) -> InlineKeyboardMarkup:
         """Keyboard for configured Free menu."""
         return create_inline_keyboard([
@@ -301,6 +302,7 @@ class AdminFreeMessages(BaseMessageProvider):
             [{"text": "🔙 Volver", "callback_data": "admin:main"}]
         ])
 
+    @static_keyboard
     def _free_unconfigured_keyboard(self) -> InlineKeyboardMarkup:
         """Keyboard for unconfigured Free menu."""
         return create_inline_keyboard([
@@ -308,6 +310,7 @@ class AdminFreeMessages(BaseMessageProvider):
             [{"text": "🔙 Volver", "callback_data": "admin:main"}]
         ])
 
+    @static_keyboard
     def _free_config_submenu_keyboard(self) -> InlineKeyboardMarkup:
         """Keyboard for Free config submenu."""
         return create_inline_keyboard([
@@ -321,14 +324,17 @@ class AdminFreeMessages(BaseMessageProvider):
     def free_queue_view(
         self,
         pending_requests: List[FreeChannelRequest],
-        wait_time_minutes: int
+        wait_time_minutes: int,
+        total_count: Optional[int] = None
     ) -> Tuple[str, InlineKeyboardMarkup]:
         """
         Generate queue view message showing pending requests.
 
         Args:
-            pending_requests: List of pending FreeChannelRequest objects
+            pending_requests: Pending requests to list (first 10 are shown);
+                FreeChannelRequest objects or FreeRequestRecord
             wait_time_minutes: Current wait time configuration
+            total_count: Total pending requests (COUNT); defaults to len(pending_requests)
 
         Returns:
             Tuple of (message_text, inline_keyboard)
@@ -337,7 +343,7 @@ class AdminFreeMessages(BaseMessageProvider):
             "Lista de espera" and "visitantes aguardando" maintain Lucien's
             elegant tone. The vestibule metaphor is extended to the queue.
         """
-        count = len(pending_requests)
+        count = len(pending_requests) if total_count is None else total_count
         wait_time_str = format_duration_minutes(wait_time_minutes)
 
         if count == 0:
@@ -11,7 +11,7 @@ from datetime import datetime
 from aiogram.types import InlineKeyboardMarkup
 
 from bot.services.message.base import BaseMessageProvider
-from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.keyboards import create_inline_keyboard, static_keyboard
 
 logger = logging.getLogger(__name__)
 
@@ -358,6 +358,7 @@ class AdminInterestMessages(BaseMessageProvider):
                 - total_pending: int
                 - total_attended: int
                 - by_package_type: Dict[str, int]
+                - top_packages: List[Tuple[ContentPackage, int]]
                 - recent_interests: List[UserInterest]
 
         Returns:
@@ -373,6 +374,7 @@ class AdminInterestMessages(BaseMessageProvider):
         attended = stats.get("total_attended", 0)
         total = pending + attended
         by_type = stats.get("by_package_type", {})
+        top_packages = stats.get("top_packages", [])
         recent = stats.get("recent_interests", [])
 
         body = (
@@ -395,6 +397,13 @@ class AdminInterestMessages(BaseMessageProvider):
                 body += f"   {name}: {count}\n"
             body += "\n"
 
+        # Top packages by pending interests
+        if top_packages:
+            body += "<b>🔥 Más Solicitados (pendientes):</b>\n"
+            for idx, (package, count) in enumerate(top_packages, 1):
+                body += f"   {idx}. {package.name}: {count}\n"
+            body += "\n"
+
         # Recent interests
         if recent:
             body += "<b>🕒 Manifestaciones Recientes:</b>\n"
@@ -539,6 +548,7 @@ class AdminInterestMessages(BaseMessageProvider):
 
         return create_inline_keyboard(buttons)
 
+    @static_keyboard
     def _interests_empty_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for empty state."""
         return create_inline_keyboard([
@@ -546,6 +556,7 @@ class AdminInterestMessages(BaseMessageProvider):
             [{"text": "🔙 Volver al Menú", "callback_data": "admin:interests"}],
         ])
 
+    @static_keyboard
     def _interests_filters_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for filter selection."""
         return create_inline_keyboard([
@@ -564,6 +575,7 @@ class AdminInterestMessages(BaseMessageProvider):
             [{"text": "🔙 Volver al Menú", "callback_data": "admin:interests"}],
         ])
 
+    @static_keyboard
     def _interests_stats_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for stats view."""
         return create_inline_keyboard([
@@ -580,6 +592,7 @@ class AdminInterestMessages(BaseMessageProvider):
             ],
         ])
 
+    @static_keyboard
     def _mark_attended_success_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for mark attended success."""
         return create_inline_keyboard([
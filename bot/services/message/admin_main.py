@@ -10,7 +10,7 @@ from typing import Tuple, List, Optional
 from aiogram.types import InlineKeyboardMarkup
 
 from bot.services.message.base import BaseMessageProvider
-from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.keyboards import create_inline_keyboard, static_keyboard
 
 
 class AdminMainMessages(BaseMessageProvider):
@@ -37,6 +37,34 @@ class AdminMainMessages(BaseMessageProvider):
         True
     """
 
+    # Weighted greeting variations (common, moderate, rare)
+    _MENU_GREETINGS = [
+        "Ah, el custodio de los dominios de Diana...",
+        "Bienvenido de nuevo al sanctum, guardián...",
+        "Los portales del reino aguardan su dirección...",
+    ]
+    _MENU_GREETING_WEIGHTS = [0.5, 0.3, 0.2]
+
+    # Configured menu text depends only on the greeting variant
+    _CONFIGURED_MENU = {
+        greeting: (
+            f"🎩 <b>Lucien:</b>\n\n<i>{greeting}</i>\n\n"
+            f"<b>⚙️ Panel de Administración</b>\n\n"
+            f"✅ <b>Estado:</b> Todo está en orden.\n\n"
+            f"<i>¿Qué aspecto del reino requiere su atención hoy?</i>"
+        )
+        for greeting in _MENU_GREETINGS
+    }
+
+    # Fully static text (config submenu)
+    _CONFIG_MENU_TEXT = (
+        "🎩 <b>Lucien:</b>\n\n<i>La calibración del reino...</i>\n\n"
+        "<b>⚙️ Menú de Configuración</b>\n\n"
+        "<i>Desde aquí puede ajustar los parámetros del reino según "
+        "las preferencias de Diana...</i>\n\n"
+        "<i>Seleccione el aspecto que desea calibrar, custodio.</i>"
+    )
+
     def admin_menu_greeting(
         self,
         is_configured: bool,
@@ -75,42 +103,28 @@ class AdminMainMessages(BaseMessageProvider):
             >>> '✅' in text or 'orden' in text.lower()
             True
         """
-        # Weighted greeting variations (common, moderate, rare)
-        greetings = [
-            ("Ah, el custodio de los dominios de Diana...", 0.5),
-            ("Bienvenido de nuevo al sanctum, guardián...", 0.3),
-            ("Los portales del reino aguardan su dirección...", 0.2),
-        ]
-
         greeting = self._choose_variant(
-            [g[0] for g in greetings],
-            weights=[g[1] for g in greetings],
+            self._MENU_GREETINGS,
+            weights=self._MENU_GREETING_WEIGHTS,
             user_id=user_id,
             method_name="admin_menu_greeting",
             session_history=session_history
         )
 
-        header = f"🎩 <b>Lucien:</b>\n\n<i>{greeting}</i>"
-
-        # Conditional body based on configuration
+        # Configured body is static: precompiled per greeting variant
         if is_configured:
-            body = (
-                f"<b>⚙️ Panel de Administración</b>\n\n"
-                f"✅ <b>Estado:</b> Todo está en orden.\n\n"
-                f"<i>¿Qué aspecto del reino requiere su atención hoy?</i>"
-            )
-        else:
-            if missing_items is None:
-                missing_items = []
-            missing_text = ", ".join(missing_items)
-            body = (
-                f"<b>⚙️ Panel de Administración</b>\n\n"
-                f"⚠️ <b>Configuración Incompleta</b>\n"
-                f"<b>Faltante:</b> {missing_text}\n\n"
-                f"<i>Antes de que Diana pueda revelar sus secretos completos, "
-                f"el reino requiere cierta... calibración.</i>\n\n"
-                f"<i>Permítame asistirle en la configuración.</i>"
-            )
+            return self._CONFIGURED_MENU[greeting], self._admin_main_menu_keyboard()
+
+        header = f"🎩 <b>Lucien:</b>\n\n<i>{greeting}</i>"
+        missing_text = ", ".join(missing_items or [])
+        body = (
+            f"<b>⚙️ Panel de Administración</b>\n\n"
+            f"⚠️ <b>Configuración Incompleta</b>\n"
+            f"<b>Faltante:</b> {missing_text}\n\n"
+            f"<i>Antes de que Diana pueda revelar sus secretos completos, "
+            f"el reino requiere cierta... calibración.</i>\n\n"
+            f"<i>Permítame asistirle en la configuración.</i>"
+        )
 
         text = self._compose(header, body)
         keyboard = self._admin_main_menu_keyboard()
@@ -134,18 +148,7 @@ class AdminMainMessages(BaseMessageProvider):
             >>> 'parámetros' in text.lower() or 'ajustar' in text.lower()
             True
         """
-        header = "🎩 <b>Lucien:</b>\n\n<i>La calibración del reino...</i>"
-
-        body = (
-            f"<b>⚙️ Menú de Configuración</b>\n\n"
-            f"<i>Desde aquí puede ajustar los parámetros del reino según "
-            f"las preferencias de Diana...</i>\n\n"
-            f"<i>Seleccione el aspecto que desea calibrar, custodio.</i>"
-        )
-
-        text = self._compose(header, body)
-        keyboard = self._config_menu_keyboard()
-        return text, keyboard
+        return self._CONFIG_MENU_TEXT, self._config_menu_keyboard()
 
     def config_status(
         self,
@@ -212,6 +215,7 @@ class AdminMainMessages(BaseMessageProvider):
 
     # ===== PRIVATE KEYBOARD FACTORY METHODS =====
 
+    @static_keyboard
     def _admin_main_menu_keyboard(self) -> InlineKeyboardMarkup:
         """
         Generate keyboard for main admin menu.
@@ -239,9 +243,11 @@ class AdminMainMessages(BaseMessageProvider):
             [{"text": "👥 Gestión de Usuarios", "callback_data": "admin:users"}],
             [{"text": "⚙️ Calibración del Reino", "callback_data": "admin:config"}],
             [{"text": "💰 Planes de Suscripción", "callback_data": "admin:pricing"}],
+            [{"text": "📤 Exportar Datos", "callback_data": "admin:export"}],
             [{"text": "📈 Observaciones del Reino", "callback_data": "admin:stats"}],
         ])
 
+    @static_keyboard
     def _config_menu_keyboard(self) -> InlineKeyboardMarkup:
         """
         Generate keyboard for configuration submenu.
@@ -12,7 +12,7 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from bot.services.message.base import BaseMessageProvider
 from bot.database.enums import UserRole
-from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.keyboards import create_inline_keyboard, static_keyboard
 
 logger = logging.getLogger(__name__)
 
@@ -743,6 +743,7 @@ class AdminUserMessages(BaseMessageProvider):
 
     # ===== PRIVATE KEYBOARD FACTORY METHODS =====
 
+    @static_keyboard
     def _users_menu_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for users menu."""
         return create_inline_keyboard([
@@ -754,6 +755,7 @@ class AdminUserMessages(BaseMessageProvider):
                 {"text": "💎 Solo VIP", "callback_data": "admin:users:list:vip"},
                 {"text": "👤 Solo Free", "callback_data": "admin:users:list:free"}
             ],
+            [{"text": "⚙️ Operaciones Masivas", "callback_data": "admin:bulk"}],
             [{"text": "🔙 Volver al Menú Principal", "callback_data": "admin:main"}],
         ])
 
@@ -847,6 +849,7 @@ class AdminUserMessages(BaseMessageProvider):
             ],
         ])
 
+    @static_keyboard
     def _expel_success_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for expel success."""
         return create_inline_keyboard([
@@ -862,12 +865,14 @@ class AdminUserMessages(BaseMessageProvider):
             ],
         ])
 
+    @static_keyboard
     def _delete_success_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for delete success."""
         return create_inline_keyboard([
             [{"text": "👥 Volver a Lista", "callback_data": "admin:users:list:all"}],
         ])
 
+    @static_keyboard
     def _user_search_prompt_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for search prompt."""
         return create_inline_keyboard([
@@ -893,6 +898,7 @@ class AdminUserMessages(BaseMessageProvider):
 
         return create_inline_keyboard(buttons)
 
+    @static_keyboard
     def _action_error_keyboard(self) -> InlineKeyboardMarkup:
         """Generate keyboard for action error."""
         return create_inline_keyboard([
@@ -11,7 +11,7 @@ from typing import Tuple, List, Dict, Optional
 from aiogram.types import InlineKeyboardMarkup
 
 from bot.services.message.base import BaseMessageProvider
-from bot.utils.keyboards import create_inline_keyboard
+from bot.utils.keyboards import create_inline_keyboard, static_keyboard
 from bot.utils.formatters import format_datetime, format_currency
 
 
@@ -330,12 +330,118 @@ class AdminVIPMessages(BaseMessageProvider):
                 "text": f"{plan['name']} - {price_str}",
                 "callback_data": f"vip:generate:plan:{plan['id']}"
             }])
+        buttons.append([{"text": "📦 Emitir en Lote", "callback_data": "vip:bulk:start"}])
         buttons.append([{"text": "🔙 Volver", "callback_data": "admin:vip"}])
 
         keyboard = create_inline_keyboard(buttons)
         text = self._compose(header, body)
         return text, keyboard
 
+    def select_plan_for_bulk_tokens(
+        self,
+        plans: List[Dict]
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """
+        Generate plan selection menu for bulk token generation.
+
+        Args:
+            plans: List of plan dicts with keys: id, name, duration_days, price, currency
+
+        Returns:
+            Tuple of (text, keyboard) with plan selection options
+
+        Voice Rationale:
+            A batch of invitations is "un lote de invitaciones" - still
+            invitations, never "tokens", even when issued by the hundred.
+        """
+        header = "🎩 <b>Lucien:</b>\n\n<i>Una emisión numerosa... Diana tiene grandes planes.</i>"
+
+        body = (
+            f"<b>📦 Emisión de Invitaciones en Lote</b>\n\n"
+            f"<i>Todas las invitaciones del lote compartirán el mismo plan.</i>\n\n"
+            f"<i>Seleccione el plan:</i>"
+        )
+
+        buttons = []
+        for plan in plans:
+            price_str = format_currency(plan["price"], symbol=plan["currency"])
+            buttons.append([{
+                "text": f"{plan['name']} - {price_str}",
+                "callback_data": f"vip:bulk:plan:{plan['id']}"
+            }])
+        buttons.append([{"text": "🔙 Volver", "callback_data": "vip:generate_token"}])
+
+        keyboard = create_inline_keyboard(buttons)
+        text = self._compose(header, body)
+        return text, keyboard
+
+    def bulk_tokens_count_prompt(
+        self,
+        plan_name: str,
+        max_count: int
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """
+        Generate prompt asking how many invitations to issue.
+
+        Args:
+            plan_name: Name of the selected plan
+            max_count: Maximum invitations per batch
+
+        Returns:
+            Tuple of (text, keyboard) with instructions and cancel button
+        """
+        header = "🎩 <b>Lucien:</b>\n\n<i>¿Cuántas invitaciones desea que prepare?</i>"
+
+        body = (
+            f"<b>📦 Lote para:</b> {plan_name}\n\n"
+            f"<i>Envíe la cantidad (entre 1 y {max_count}).</i>\n\n"
+            f"<i>Recibirá un documento CSV con la invitación y su enlace "
+            f"de activación por fila.</i>"
+        )
+
+        keyboard = create_inline_keyboard([
+            [{"text": "❌ Cancelar", "callback_data": "vip:bulk:cancel"}]
+        ])
+        text = self._compose(header, body)
+        return text, keyboard
+
+    def bulk_tokens_generated(
+        self,
+        plan_name: str,
+        count: int,
+        elapsed_seconds: Optional[float] = None
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """
+        Generate caption for the bulk invitations CSV document.
+
+        Args:
+            plan_name: Name of the plan linked to the invitations
+            count: Number of invitations generated
+            elapsed_seconds: Generation time (insert + commit); None when
+                the document of an already issued batch is resent
+
+        Returns:
+            Tuple of (caption text, keyboard)
+        """
+        timing = ""
+        if elapsed_seconds is not None:
+            rate = count / elapsed_seconds if elapsed_seconds > 0 else float(count)
+            timing = f"<i>Emitidas en {elapsed_seconds:.2f} s ({rate:,.0f}/s)</i>\n"
+
+        text = (
+            f"🎩 <b>Lucien:</b>\n\n"
+            f"<b>📦 {count} invitaciones preparadas</b>\n"
+            f"<b>Plan:</b> {plan_name}\n"
+            f"{timing}\n"
+            f"<i>Cada enlace del documento activa un acceso una sola vez.</i>"
+        )
+
+        keyboard = create_inline_keyboard([
+            [{"text": "📦 Emitir Otro Lote", "callback_data": "vip:bulk:start"}],
+            [{"text": "🔙 Volver", "callback_data": "admin:vip"}]
+        ])
+        return text, keyboard
+
     def no_plans_configured(self) -> Tuple[str, InlineKeyboardMarkup]:
         """
         Generate error message when no pricing plans exist.
@@ -375,6 +481,7 @@ class AdminVIPMessages(BaseMessageProvider):
 
     # ===== PRIVATE KEYBOARD FACTORY METHODS =====
 
+    @static_keyboard
     def _vip_configured_keyboard(self) -> InlineKeyboardMarkup:
         """
         Generate keyboard for configured VIP channel state.
@@ -399,6 +506,7 @@ class AdminVIPMessages(BaseMessageProvider):
             [{"text": "🔙 Volver", "callback_data": "admin:main"}]
         ])
 
+    @static_keyboard
     def _vip_unconfigured_keyboard(self) -> InlineKeyboardMarkup:
         """
         Generate keyboard for unconfigured VIP channel state.
@@ -5,8 +5,9 @@ Tracks recent messages per user session to enable context-aware variation select
 Prevents message repetition fatigue by excluding recently-seen variants from
 the selection pool.
 
-Uses in-memory storage (dict + deque) with TTL auto-cleanup.
-Approximately 200 bytes per active user.
+Uses a single process-wide in-memory store (get_session_history()):
+OrderedDict of per-user deques kept in LRU order, with a global user cap
+and a periodic sweeper. Approximately 200 bytes per active user.
 
 Voice Rationale:
     By tracking which message variants each user has seen recently, Lucien can
@@ -15,14 +16,20 @@ Voice Rationale:
 
 Architecture:
     - SessionHistoryEntry: Lightweight dataclass with slots for memory efficiency
-    - SessionMessageHistory: In-memory service with lazy cleanup
-    - No database dependency: Session loss is acceptable for this convenience feature
+    - SessionMessageHistory: In-memory LRU store with TTL sweeper
+    - get_session_history(): Process-wide instance shared by every ServiceContainer
+    - No database dependency: Session loss is acceptable for this convenience feature;
+      an optional JSON snapshot (Config.SESSION_HISTORY_SNAPSHOT_PATH) survives restarts
 """
+import json
 import logging
+import os
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, List
+from typing import Deque, Dict, List, Optional
+
+from config import Config
 
 
 logger = logging.getLogger(__name__)
@@ -52,7 +59,8 @@ class SessionMessageHistory:
     user by excluding recently-seen variants from the selection pool.
 
     Memory Usage:
-        ~200 bytes per active user (deque(maxlen=5) + slots dataclass)
+        ~200 bytes per active user (deque(maxlen=5) + slots dataclass),
+        bounded by max_users: the least recently active user is evicted
 
     Thread Safety:
         Not required - bot is single-threaded async event loop
@@ -67,16 +75,27 @@ class SessionMessageHistory:
         >>> available_indices = [i for i in range(3) if i not in recent]
     """
 
-    def __init__(self, ttl_seconds: int = 300, max_entries: int = 5) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_entries: int = 5,
+        max_users: int = 10000
+    ) -> None:
         """Initialize session history service.
 
         Args:
             ttl_seconds: How long entries remain valid (default 5 minutes)
             max_entries: Maximum entries per user session (default 5)
+            max_users: Global cap of tracked users; LRU eviction beyond it
         """
         self._ttl_seconds: int = ttl_seconds
         self._max_entries: int = max_entries
-        self._sessions: Dict[int, Deque[SessionHistoryEntry]] = {}
+        self._max_users: int = max_users
+        # LRU order: least recently active user first
+        self._sessions: "OrderedDict[int, Deque[SessionHistoryEntry]]" = OrderedDict()
+        self._evictions: int = 0
+        self._sweeps: int = 0
+        self._swept_users: int = 0
 
     def add_entry(
         self,
@@ -86,24 +105,27 @@ class SessionMessageHistory:
     ) -> None:
         """Record a message selection for a user.
 
-        Lazy cleanup: Remove expired entries occasionally (~10% of calls)
-        to avoid dedicated cleanup thread complexity.
+        Marks the user as most recently active. If the store exceeds
+        max_users, the least recently active user is evicted. Expired
+        entries are reclaimed by sweep(), not here.
 
         Args:
             user_id: Telegram user ID
             method_name: Message method name (e.g., "greeting", "success")
             variant_index: Which variant was selected
         """
-        # Lazy cleanup: hash-based 10% probability
-        if hash(user_id) % 10 == 0:
-            self._cleanup_user(user_id)
-
-        # Get or create user's session deque with maxlen
-        if user_id not in self._sessions:
-            self._sessions[user_id] = deque(maxlen=self._max_entries)
+        session = self._sessions.get(user_id)
+        if session is None:
+            session = deque(maxlen=self._max_entries)
+            self._sessions[user_id] = session
+            if len(self._sessions) > self._max_users:
+                self._sessions.popitem(last=False)
+                self._evictions += 1
+        else:
+            self._sessions.move_to_end(user_id)
 
         # Append new entry (deque handles maxlen automatically)
-        self._sessions[user_id].append(
+        session.append(
             SessionHistoryEntry(method_name=method_name, variant_index=variant_index)
         )
 
@@ -191,7 +213,8 @@ class SessionMessageHistory:
     def cleanup_all(self) -> int:
         """Remove expired entries from all user sessions.
 
-        Called occasionally (not on every add_entry) to reclaim memory.
+        Full scan (also trims stale entries of live sessions). The periodic
+        sweeper uses the cheaper sweep().
 
         Returns:
             Number of entries removed
@@ -209,6 +232,34 @@ class SessionMessageHistory:
 
         return removed_count
 
+    def sweep(self) -> int:
+        """Drop users whose whole session has expired.
+
+        Sessions are kept in LRU order, so expired users are all at the
+        front: the sweep stops at the first user with a live entry and
+        costs O(expired users). Stale entries inside live sessions are
+        bounded by max_entries and already ignored by get_recent_variants().
+
+        Returns:
+            Number of users removed
+        """
+        cutoff = time.time() - self._ttl_seconds
+        removed = 0
+
+        while self._sessions:
+            user_id, session = next(iter(self._sessions.items()))
+            if session and session[-1].timestamp > cutoff:
+                break
+            del self._sessions[user_id]
+            removed += 1
+
+        self._sweeps += 1
+        self._swept_users += removed
+        if removed:
+            logger.debug("Session sweep: removed %d expired users", removed)
+
+        return removed
+
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about session memory usage.
 
@@ -217,13 +268,16 @@ class SessionMessageHistory:
                 - total_users: Number of users with sessions
                 - total_entries: Total entries (including expired)
                 - active_entries: Entries within TTL window
+                - max_users: Global user cap
+                - evictions: Users evicted by the cap (LRU)
+                - sweeps / swept_users: Sweeper runs and users removed
 
         Example:
             >>> history = SessionMessageHistory()
             >>> history.add_entry(12345, "greeting", 0)
             >>> stats = history.get_stats()
-            >>> stats
-            {'total_users': 1, 'total_entries': 1, 'active_entries': 1}
+            >>> stats["total_users"], stats["active_entries"]
+            (1, 1)
         """
         total_users = len(self._sessions)
         total_entries = sum(len(session) for session in self._sessions.values())
@@ -238,5 +292,107 @@ class SessionMessageHistory:
         return {
             "total_users": total_users,
             "total_entries": total_entries,
-            "active_entries": active_entries
+            "active_entries": active_entries,
+            "max_users": self._max_users,
+            "evictions": self._evictions,
+            "sweeps": self._sweeps,
+            "swept_users": self._swept_users
+        }
+
+    # ===== SNAPSHOT =====
+
+    def save_snapshot(self, path: str) -> int:
+        """Write live entries to a JSON file (atomic replace).
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Number of users written (0 on error)
+        """
+        cutoff = time.time() - self._ttl_seconds
+        data = {
+            str(user_id): [
+                [entry.method_name, entry.variant_index, entry.timestamp]
+                for entry in session
+                if entry.timestamp > cutoff
+            ]
+            for user_id, session in self._sessions.items()
         }
+        data = {user_id: entries for user_id, entries in data.items() if entries}
+
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "sessions": data}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("⚠️ Could not save session history snapshot: %s", e)
+            return 0
+
+        logger.info("💾 Session history snapshot saved: %d users", len(data))
+        return len(data)
+
+    def load_snapshot(self, path: str) -> int:
+        """Load a snapshot written by save_snapshot(), skipping expired entries.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            Number of users loaded (0 if missing or invalid)
+        """
+        if not os.path.exists(path):
+            return 0
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                sessions = json.load(f)["sessions"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("⚠️ Invalid session history snapshot %s: %s", path, e)
+            return 0
+
+        cutoff = time.time() - self._ttl_seconds
+        restored = []
+        for user_id, entries in sessions.items():
+            live = [
+                SessionHistoryEntry(method_name=method, variant_index=index, timestamp=ts)
+                for method, index, ts in entries
+                if ts > cutoff
+            ]
+            if live:
+                restored.append((int(user_id), live))
+
+        # Rebuild LRU order by last activity; keep only the newest max_users
+        restored.sort(key=lambda item: item[1][-1].timestamp)
+        for user_id, live in restored[-self._max_users:]:
+            self._sessions[user_id] = deque(live, maxlen=self._max_entries)
+            self._sessions.move_to_end(user_id)
+        while len(self._sessions) > self._max_users:
+            self._sessions.popitem(last=False)
+
+        loaded = min(len(restored), self._max_users)
+        logger.info("💾 Session history snapshot loaded: %d users", loaded)
+        return loaded
+
+
+# Process-wide store shared by every ServiceContainer
+_session_history: Optional[SessionMessageHistory] = None
+
+
+def get_session_history() -> SessionMessageHistory:
+    """Return the process-wide SessionMessageHistory (created on first use).
+
+    Configured from Config.SESSION_HISTORY_TTL_SECONDS,
+    SESSION_HISTORY_MAX_ENTRIES and SESSION_HISTORY_MAX_USERS.
+    """
+    global _session_history
+
+    if _session_history is None:
+        _session_history = SessionMessageHistory(
+            ttl_seconds=Config.SESSION_HISTORY_TTL_SECONDS,
+            max_entries=Config.SESSION_HISTORY_MAX_ENTRIES,
+            max_users=Config.SESSION_HISTORY_MAX_USERS
+        )
+
+    return _session_history
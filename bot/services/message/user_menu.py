@@ -16,10 +16,17 @@ from typing import Tuple, List, Optional
 from aiogram.types import InlineKeyboardMarkup
 
 from bot.services.message.base import BaseMessageProvider
-from bot.utils.keyboards import create_inline_keyboard, create_menu_navigation, create_content_with_navigation
+from bot.utils.keyboards import create_inline_keyboard, create_menu_navigation, create_content_with_navigation, static_keyboard
 from bot.utils.formatters import escape_html
 from bot.database.models import ContentPackage
 
+# Meses en español para localización de fechas
+_MESES_ES = {
+    1: "enero", 2: "febrero", 3: "marzo", 4: "abril",
+    5: "mayo", 6: "junio", 7: "julio", 8: "agosto",
+    9: "septiembre", 10: "octubre", 11: "noviembre", 12: "diciembre"
+}
+
 
 class UserMenuMessages(BaseMessageProvider):
     """
@@ -51,6 +58,25 @@ class UserMenuMessages(BaseMessageProvider):
         True
     """
 
+    # Weighted greeting variations (common, alternate, poetic)
+    _VIP_GREETINGS = [
+        "Ah, un miembro del círculo exclusivo...",
+        "Bienvenido de nuevo al sanctum...",
+        "Los portales del reino se abren para usted...",
+    ]
+    _VIP_GREETING_WEIGHTS = [0.6, 0.3, 0.1]
+
+    # Weighted greeting variations (welcoming, informative)
+    _FREE_GREETINGS = [
+        "Bienvenido al jardín público...",
+        "El vestíbulo de acceso aguarda su contemplación...",
+    ]
+    _FREE_GREETING_WEIGHTS = [0.7, 0.3]
+
+    # Headers precompiled per variant (only name/status are rendered per call)
+    _VIP_HEADERS = {g: f"🎩 <b>Lucien:</b>\n\n<i>{g}</i>" for g in _VIP_GREETINGS}
+    _FREE_HEADERS = {g: f"🎩 <b>Lucien:</b>\n\n<i>{g}</i>" for g in _FREE_GREETINGS}
+
     def __init__(self):
         """
         Initialize UserMenuMessages provider.
@@ -98,37 +124,22 @@ class UserMenuMessages(BaseMessageProvider):
         """
         safe_name = escape_html(user_name)
 
-        # Weighted greeting variations (common, alternate, poetic)
-        greetings = [
-            ("Ah, un miembro del círculo exclusivo...", 0.6),
-            ("Bienvenido de nuevo al sanctum...", 0.3),
-            ("Los portales del reino se abren para usted...", 0.1),
-        ]
-
         greeting = self._choose_variant(
-            [g[0] for g in greetings],
-            weights=[g[1] for g in greetings],
+            self._VIP_GREETINGS,
+            weights=self._VIP_GREETING_WEIGHTS,
             user_id=user_id,
             method_name="vip_menu_greeting",
             session_history=session_history
         )
 
-        header = f"🎩 <b>Lucien:</b>\n\n<i>{greeting}</i>"
-
-        # Meses en español para localización de fechas
-        MESES_ES = {
-            1: "enero", 2: "febrero", 3: "marzo", 4: "abril",
-            5: "mayo", 6: "junio", 7: "julio", 8: "agosto",
-            9: "septiembre", 10: "octubre", 11: "noviembre", 12: "diciembre"
-        }
+        header = self._VIP_HEADERS[greeting]
 
         # Subscription status section
         if vip_expires_at:
             # Check if subscription is still active (not expired)
-            from datetime import datetime
             if vip_expires_at > datetime.utcnow():
                 # Active subscription - show expiry date in Spanish
-                expiry_text = f"{vip_expires_at.day} de {MESES_ES[vip_expires_at.month]} de {vip_expires_at.year}"
+                expiry_text = f"{vip_expires_at.day} de {_MESES_ES[vip_expires_at.month]} de {vip_expires_at.year}"
                 subscription_status = f"<b>⏳ Su membresía expira el {expiry_text}</b>"
             else:
                 # Expired subscription - show warning
@@ -188,21 +199,15 @@ class UserMenuMessages(BaseMessageProvider):
         """
         safe_name = escape_html(user_name)
 
-        # Weighted greeting variations (welcoming, informative)
-        greetings = [
-            ("Bienvenido al jardín público...", 0.7),
-            ("El vestíbulo de acceso aguarda su contemplación...", 0.3),
-        ]
-
         greeting = self._choose_variant(
-            [g[0] for g in greetings],
-            weights=[g[1] for g in greetings],
+            self._FREE_GREETINGS,
+            weights=self._FREE_GREETING_WEIGHTS,
             user_id=user_id,
             method_name="free_menu_greeting",
             session_history=session_history
         )
 
-        header = f"🎩 <b>Lucien:</b>\n\n<i>{greeting}</i>"
+        header = self._FREE_HEADERS[greeting]
 
         # Queue status section (if applicable)
         queue_status = ""
@@ -620,6 +625,7 @@ class UserMenuMessages(BaseMessageProvider):
 
     # ===== PRIVATE KEYBOARD FACTORY METHODS =====
 
+    @static_keyboard
     def _vip_main_menu_keyboard(self) -> InlineKeyboardMarkup:
         """
         Generate keyboard for VIP main menu.
@@ -643,6 +649,7 @@ class UserMenuMessages(BaseMessageProvider):
             include_back=False  # Main menu has no navigation buttons (content only)
         )
 
+    @static_keyboard
     def _free_main_menu_keyboard(self) -> InlineKeyboardMarkup:
         """
         Generate keyboard for Free main menu.
@@ -15,13 +15,17 @@ from typing import Optional, List, Tuple, Dict, Any
 
 from aiogram import Bot
 from aiogram.types import ChatInviteLink
-from sqlalchemy import select, delete, func
+from sqlalchemy import (
+    select, delete, func, update, case, literal_column, type_coerce, bindparam,
+    BigInteger, DateTime, Integer, String
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from config import Config
 from bot.database.models import (
     InvitationToken,
+    SubscriptionPlan,
     VIPSubscriber,
     FreeChannelRequest,
     BotConfig,
@@ -29,7 +33,17 @@ from bot.database.models import (
     UserInterest,
     UserRoleChangeLog
 )
+from bot.database.dialect import DatabaseDialect, dialect_insert, get_session_dialect
+from bot.database.read_models import (
+    FreeRequestRecord,
+    VIPSubscriberRecord,
+    fetch_records,
+    select_records
+)
+from bot.database.streaming import iter_key_batches, stream_scalars
 from bot.services.container import ServiceContainer
+from bot.services.user import UserService
+from bot.services.chat_metadata import get_chat_metadata_cache
 from bot.database.enums import UserRole, RoleChangeReason
 
 logger = logging.getLogger(__name__)
@@ -52,6 +66,12 @@ class SubscriptionService:
     4. Usuario recibe invite link
     """
 
+    # Máximo de tokens por generación en lote
+    MAX_BULK_TOKENS = 10000
+
+    # Filas por INSERT en generación en lote
+    BULK_TOKEN_BATCH_SIZE = 500
+
     def __init__(self, session: AsyncSession, bot: Bot):
         """
         Inicializa el service.
@@ -77,7 +97,7 @@ class SubscriptionService:
 
         El token:
         - Tiene 16 caracteres alfanuméricos
-        - Es único (verifica duplicados)
+        - Es único (restricción UNIQUE, reintenta si colisiona)
         - Expira después de duration_hours
         - Puede usarse solo 1 vez
         - Opcionalmente vinculado a un plan de suscripción
@@ -97,24 +117,30 @@ class SubscriptionService:
         if duration_hours < 1:
             raise ValueError("duration_hours debe ser al menos 1")
 
-        # Generar token único
+        # Insert-and-retry: la restricción UNIQUE de token detecta colisiones
+        # (ON CONFLICT DO NOTHING no devuelve fila), sin SELECT previo
         max_attempts = 10
-        token_str = None
+        token = None
 
         for attempt in range(max_attempts):
-            # secrets.token_urlsafe(12) genera ~16 chars después de strip
-            token_str = secrets.token_urlsafe(12)[:16]
+            stmt = dialect_insert(self.session, InvitationToken).values(
+                token=self._new_token_string(),
+                generated_by=generated_by,
+                created_at=datetime.utcnow(),
+                duration_hours=duration_hours,
+                used=False,
+                plan_id=plan_id  # Vincular con plan (opcional)
+            ).on_conflict_do_nothing(
+                index_elements=[InvitationToken.token]
+            ).returning(InvitationToken)
 
-            # Verificar que no exista
             result = await self.session.execute(
-                select(InvitationToken).where(
-                    InvitationToken.token == token_str
-                )
+                select(InvitationToken).from_statement(stmt)
             )
-            existing = result.scalar_one_or_none()
+            token = result.scalar_one_or_none()
 
-            if existing is None:
-                # Token único encontrado
+            if token is not None:
+                # Token único insertado
                 break
 
             logger.warning(f"⚠️ Token duplicado generado (intento {attempt + 1})")
@@ -124,17 +150,6 @@ class SubscriptionService:
                 "No se pudo generar token único después de 10 intentos"
             )
 
-        # Crear token
-        token = InvitationToken(
-            token=token_str,
-            generated_by=generated_by,
-            created_at=datetime.utcnow(),
-            duration_hours=duration_hours,
-            used=False,
-            plan_id=plan_id  # Vincular con plan (opcional)
-        )
-
-        self.session.add(token)
         # No commit - dejar que el handler maneje la transacción
 
         logger.info(
@@ -144,6 +159,125 @@ class SubscriptionService:
 
         return token
 
+    async def generate_vip_tokens_bulk(
+        self,
+        generated_by: int,
+        count: int,
+        duration_hours: int = 24,
+        plan_id: Optional[int] = None,
+        created_at: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Genera N tokens VIP en la transacción actual.
+
+        Inserta por lotes de BULK_TOKEN_BATCH_SIZE filas con
+        INSERT ... ON CONFLICT (token) DO NOTHING RETURNING token:
+        las colisiones simplemente no vuelven en RETURNING y se
+        regeneran en el siguiente lote. No se cargan objetos ORM,
+        por lo que 10k tokens cuestan ~20 sentencias.
+
+        Args:
+            generated_by: User ID del admin que genera los tokens
+            count: Cantidad de tokens (1 - MAX_BULK_TOKENS)
+            duration_hours: Duración de cada token en horas (default: 24h)
+            plan_id: ID del plan de suscripción (opcional)
+            created_at: Fecha compartida por todo el lote (default: ahora);
+                identifica el lote en get_bulk_tokens()
+
+        Returns:
+            Lista de strings de token en orden de inserción
+
+        Raises:
+            ValueError: Si count o duration_hours son inválidos
+            RuntimeError: Si las colisiones no se resuelven tras 10 lotes seguidos
+        """
+        if duration_hours < 1:
+            raise ValueError("duration_hours debe ser al menos 1")
+        if not 1 <= count <= self.MAX_BULK_TOKENS:
+            raise ValueError(f"count debe estar entre 1 y {self.MAX_BULK_TOKENS}")
+
+        created_at = created_at or datetime.utcnow()
+        tokens: List[str] = []
+        failed_batches = 0
+
+        while len(tokens) < count:
+            batch_size = min(count - len(tokens), self.BULK_TOKEN_BATCH_SIZE)
+            # set(): descarta duplicados dentro del propio lote
+            candidates = {self._new_token_string() for _ in range(batch_size)}
+
+            stmt = dialect_insert(self.session, InvitationToken.__table__).on_conflict_do_nothing(
+                index_elements=[InvitationToken.token]
+            ).returning(InvitationToken.token)
+
+            # executemany + RETURNING: SQLAlchemy agrupa las filas en
+            # INSERT ... VALUES multi-fila ("insertmanyvalues")
+            inserted = (await self.session.execute(stmt, [
+                {
+                    "token": token_str,
+                    "generated_by": generated_by,
+                    "created_at": created_at,
+                    "duration_hours": duration_hours,
+                    "used": False,
+                    "plan_id": plan_id,
+                }
+                for token_str in candidates
+            ])).scalars().all()
+            tokens.extend(inserted)
+
+            if len(inserted) < batch_size:
+                failed_batches += 1
+                logger.warning(
+                    f"⚠️ {batch_size - len(inserted)} token(s) duplicado(s) en lote, "
+                    f"regenerando (intento {failed_batches})"
+                )
+                if failed_batches >= 10:
+                    raise RuntimeError(
+                        "No se pudieron generar tokens únicos después de 10 lotes"
+                    )
+            else:
+                failed_batches = 0
+
+        # No commit - dejar que el handler maneje la transacción
+
+        logger.info(
+            f"✅ {len(tokens)} tokens VIP generados en lote "
+            f"(válidos por {duration_hours}h, plan_id: {plan_id}, generado por {generated_by})"
+        )
+
+        return tokens
+
+    async def get_bulk_tokens(
+        self,
+        generated_by: int,
+        created_at: datetime,
+        plan_id: Optional[int] = None
+    ) -> List[str]:
+        """
+        Tokens de un lote ya emitido (para reenviar su documento).
+
+        Args:
+            generated_by: User ID del admin que generó el lote
+            created_at: Fecha del lote (la pasada a generate_vip_tokens_bulk)
+            plan_id: ID del plan del lote
+
+        Returns:
+            Lista de strings de token en orden de inserción
+        """
+        result = await self.session.execute(
+            select(InvitationToken.token).where(
+                InvitationToken.generated_by == generated_by,
+                InvitationToken.created_at == created_at,
+                InvitationToken.plan_id == plan_id
+            ).order_by(InvitationToken.id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _new_token_string() -> str:
+        """Genera un token aleatorio de 16 caracteres URL-safe."""
+        # secrets.token_urlsafe(12) genera 16 chars (12 bytes en base64)
+        return secrets.token_urlsafe(12)[:16]
+
     async def validate_token(
         self,
         token_str: str
@@ -184,6 +318,243 @@ class SubscriptionService:
 
         return True, "✅ Token válido", token
 
+    async def claim_and_activate_token(
+        self,
+        token_str: str,
+        user_id: int
+    ) -> Tuple[bool, str, Optional[VIPSubscriber]]:
+        """
+        Canjea un token de deep link de forma atómica (camino caliente de /start).
+
+        Tres sentencias en la transacción actual:
+        1. UPDATE invitation_tokens SET used = true ... WHERE token = :t
+           AND used = false AND no expirado AND plan activo RETURNING
+           (con duración y nombre del plan como subconsultas correlacionadas).
+           Solo una de dos redenciones concurrentes obtiene la fila.
+        2. SELECT status, expiry_date del suscriptor previo (FOR UPDATE en
+           PostgreSQL): decide el unban igual que activate_vip_subscription()
+        3. INSERT INTO vip_subscribers ... ON CONFLICT (user_id) DO UPDATE
+           (alta nueva o renovación) RETURNING el suscriptor.
+
+        Solo si el UPDATE no reclama el token se consulta su estado para
+        explicar el motivo (camino frío).
+
+        Args:
+            token_str: String del token del deep link
+            user_id: ID del usuario que canjea (debe existir en users)
+
+        Returns:
+            Tuple[bool, str, Optional[VIPSubscriber]]:
+                - bool: True si el token fue canjeado
+                - str: Nombre del plan si éxito; si no, motivo:
+                  "invalid", "used", "expired", "no_plan", "plan_inactive"
+                - Optional[VIPSubscriber]: Suscriptor creado/renovado
+        """
+        now = datetime.utcnow()
+        claim_stmt, upsert_stmt = self._get_redemption_statements()
+
+        claimed = (await self.session.execute(
+            claim_stmt,
+            {"p_token": token_str, "p_user_id": user_id, "p_now": now}
+        )).first()
+        if claimed is None:
+            reason = await self._token_rejection_reason(token_str, now)
+            logger.info(f"🚫 Token {token_str} rechazado para user {user_id}: {reason}")
+            return False, reason, None
+
+        token_id, duration_days, plan_name = claimed
+        duration_hours = duration_days * 24
+        fresh_expiry = now + timedelta(hours=duration_hours)
+
+        # Estado previo al upsert: el unban depende de status, no solo de la fecha
+        previous = (await self.session.execute(
+            select(VIPSubscriber.status, VIPSubscriber.expiry_date)
+            .where(VIPSubscriber.user_id == user_id)
+            .with_for_update()
+        )).first()
+
+        result = await self.session.execute(
+            upsert_stmt,
+            {
+                "p_user_id": user_id,
+                "p_token_id": token_id,
+                "p_now": now,
+                "p_fresh_expiry": fresh_expiry,
+                "p_hours": duration_hours,
+            },
+            execution_options={"populate_existing": True}
+        )
+        subscriber = result.scalar_one()
+
+        was_renewal_of_expired = previous is not None and (
+            previous.expiry_date < now or previous.status == "expired"
+        )
+
+        if was_renewal_of_expired:
+            from bot.services.channel import ChannelService
+            channel_service = ChannelService(self.session, self.bot)
+            vip_channel_id = await channel_service.get_vip_channel_id()
+            if vip_channel_id:
+                await self.unban_from_vip_channel(user_id, vip_channel_id)
+
+        # No commit - dejar que el handler maneje la transacción
+
+        logger.info(
+            f"✅ Token {token_str} canjeado por user {user_id} | Plan: {plan_name} | "
+            f"stage={subscriber.vip_entry_stage}, renovación expirada={was_renewal_of_expired}"
+        )
+
+        return True, plan_name, subscriber
+
+    # Sentencias del canje atómico, construidas una vez por dialecto
+    _redemption_statements: Dict[DatabaseDialect, Tuple[Any, Any]] = {}
+
+    def _get_redemption_statements(self) -> Tuple[Any, Any]:
+        """
+        Retorna (claim, upsert) para el dialecto de la sesión.
+
+        Se construyen una sola vez con bindparam(): el UPDATE queda en la
+        caché de compilación de SQLAlchemy y el upsert (ON CONFLICT no es
+        cacheable) al menos no se reconstruye en cada canje.
+        """
+        dialect = get_session_dialect(self.session)
+        statements = SubscriptionService._redemption_statements.get(dialect)
+        if statements is None:
+            statements = (
+                self._build_claim_statement(dialect),
+                self._build_upsert_statement(dialect)
+            )
+            SubscriptionService._redemption_statements[dialect] = statements
+        return statements
+
+    @classmethod
+    def _build_claim_statement(cls, dialect: DatabaseDialect):
+        """UPDATE condicional que reclama el token y retorna datos del plan."""
+        tokens = InvitationToken.__table__
+        plans = SubscriptionPlan.__table__
+        p_now = bindparam("p_now", type_=DateTime)
+
+        return update(tokens).where(
+            tokens.c.token == bindparam("p_token", type_=String),
+            tokens.c.used.is_(False),
+            cls._add_hours(dialect, tokens.c.created_at, tokens.c.duration_hours) > p_now,
+            select(plans.c.id).where(
+                plans.c.id == tokens.c.plan_id,
+                plans.c.active.is_(True)
+            ).exists()
+        ).values(
+            used=True,
+            used_by=bindparam("p_user_id", type_=BigInteger),
+            used_at=p_now
+        ).returning(
+            tokens.c.id,
+            select(plans.c.duration_days).where(
+                plans.c.id == tokens.c.plan_id
+            ).scalar_subquery(),
+            select(plans.c.name).where(
+                plans.c.id == tokens.c.plan_id
+            ).scalar_subquery()
+        )
+
+    @classmethod
+    def _build_upsert_statement(cls, dialect: DatabaseDialect):
+        """
+        INSERT ... ON CONFLICT (user_id) DO UPDATE del suscriptor VIP.
+
+        Mismas reglas que activate_vip_subscription():
+        - Nuevo: expira en now + duración, vip_entry_stage = 1
+        - Vigente por fecha: extiende desde su expiry_date actual (aunque
+          su status sea "expired")
+        - Expirado por fecha (VIPSubscriber.is_expired()): parte desde now
+        - vip_entry_stage reinicia a 1 solo si el ritual estaba incompleto
+        """
+        table = VIPSubscriber.__table__
+        p_now = bindparam("p_now", type_=DateTime)
+        p_fresh_expiry = bindparam("p_fresh_expiry", type_=DateTime)
+        p_token_id = bindparam("p_token_id", type_=Integer)
+
+        if dialect == DatabaseDialect.POSTGRESQL:
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(table).values(
+            user_id=bindparam("p_user_id", type_=BigInteger),
+            token_id=p_token_id,
+            join_date=p_now,
+            expiry_date=p_fresh_expiry,
+            status="active",
+            vip_entry_stage=1  # Phase 13: Start ritual at stage 1
+        )
+        was_expired = table.c.expiry_date < p_now
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={
+                "expiry_date": case(
+                    (was_expired, p_fresh_expiry),
+                    else_=cls._add_hours(dialect, table.c.expiry_date, bindparam("p_hours", type_=Integer))
+                ),
+                "status": "active",
+                "token_id": p_token_id,
+                "vip_entry_stage": case(
+                    (table.c.vip_entry_stage.is_not(None), 1),
+                    else_=None
+                ),
+            }
+        ).returning(*table.c)
+
+        # user no se carga (opt-in): en /start el User ya está en la sesión y
+        # el acceso se resuelve desde el identity map
+        return select(VIPSubscriber).from_statement(stmt)
+
+    @staticmethod
+    def _add_hours(dialect: DatabaseDialect, timestamp_column, hours):
+        """
+        Expresión SQL timestamp + N horas.
+
+        PostgreSQL: aritmética de intervalos.
+        SQLite: strftime() con modificador, conservando los microsegundos
+        originales (mismo formato de texto que guarda SQLAlchemy).
+        """
+        if dialect == DatabaseDialect.POSTGRESQL:
+            return timestamp_column + hours * literal_column("interval '1 hour'")
+        shifted = func.strftime(
+            "%Y-%m-%d %H:%M:%S",
+            timestamp_column,
+            func.printf("%+d hours", hours)
+        )
+        return type_coerce(shifted.concat(func.substr(timestamp_column, 20)), DateTime)
+
+    async def _token_rejection_reason(self, token_str: str, now: datetime) -> str:
+        """
+        Motivo por el que un token no pudo reclamarse (solo camino de error).
+
+        Returns:
+            "invalid", "used", "expired", "no_plan" o "plan_inactive"
+        """
+        result = await self.session.execute(
+            select(
+                InvitationToken.used,
+                InvitationToken.created_at,
+                InvitationToken.duration_hours,
+                InvitationToken.plan_id,
+                SubscriptionPlan.active
+            ).outerjoin(
+                SubscriptionPlan, SubscriptionPlan.id == InvitationToken.plan_id
+            ).where(InvitationToken.token == token_str)
+        )
+        row = result.first()
+
+        if row is None:
+            return "invalid"
+        if row.used:
+            return "used"
+        if row.created_at + timedelta(hours=row.duration_hours) <= now:
+            return "expired"
+        if row.plan_id is None or row.active is None:
+            return "no_plan"
+        return "plan_inactive"
+
     async def redeem_vip_token(
         self,
         token_str: str,
@@ -466,55 +837,65 @@ class SubscriptionService:
         Returns:
             Cantidad de suscriptores expirados
         """
-        # Buscar suscriptores activos con fecha de expiración pasada
-        result = await self.session.execute(
-            select(VIPSubscriber).where(
+        # Suscriptores activos con fecha de expiración pasada, en lotes por id
+        # (registros livianos; cada lote se marca antes de pedir el siguiente)
+        count = 0
+        async for expired_subscribers in iter_key_batches(
+            self.session,
+            VIPSubscriberRecord,
+            select_records(VIPSubscriberRecord).where(
                 VIPSubscriber.status == "active",
                 VIPSubscriber.expiry_date < datetime.utcnow()
+            ),
+            VIPSubscriber.id
+        ):
+            await self.session.execute(
+                update(VIPSubscriber)
+                .where(
+                    VIPSubscriber.id.in_([subscriber.id for subscriber in expired_subscribers]),
+                    VIPSubscriber.status == "active"
+                )
+                .values(status="expired")
             )
-        )
-        expired_subscribers = result.scalars().all()
 
-        count = 0
-        for subscriber in expired_subscribers:
-            subscriber.status = "expired"
-            count += 1
-            logger.info(f"⏱️ VIP expirado: user {subscriber.user_id}")
+            for subscriber in expired_subscribers:
+                count += 1
+                logger.info(f"⏱️ VIP expirado: user {subscriber.user_id}")
 
-            # Phase 13: Cancel entry flow if incomplete (stages 1 or 2)
-            if container and subscriber.vip_entry_stage in (1, 2):
-                try:
-                    await container.vip_entry.cancel_entry_on_expiry(
-                        user_id=subscriber.user_id
-                    )
-                    logger.info(
-                        f"🚫 Cancelled VIP entry flow for user {subscriber.user_id} "
-                        f"(subscription expired at stage {subscriber.vip_entry_stage})"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error cancelling VIP entry flow for user {subscriber.user_id}: {e}"
-                    )
+                # Phase 13: Cancel entry flow if incomplete (stages 1 or 2)
+                if container and subscriber.vip_entry_stage in (1, 2):
+                    try:
+                        await container.vip_entry.cancel_entry_on_expiry(
+                            user_id=subscriber.user_id
+                        )
+                        logger.info(
+                            f"🚫 Cancelled VIP entry flow for user {subscriber.user_id} "
+                            f"(subscription expired at stage {subscriber.vip_entry_stage})"
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Error cancelling VIP entry flow for user {subscriber.user_id}: {e}"
+                        )
 
-            # Log role change if container provided
-            if container and container.role_change:
-                try:
-                    await container.role_change.log_role_change(
-                        user_id=subscriber.user_id,
-                        new_role=UserRole.FREE,
-                        changed_by=0,  # SYSTEM
-                        reason=RoleChangeReason.VIP_EXPIRED,
-                        change_source="SYSTEM",
-                        previous_role=UserRole.VIP,
-                        change_metadata={
-                            "vip_subscriber_id": subscriber.id,
-                            "expired_at": datetime.utcnow().isoformat(),
-                            "original_expiry": subscriber.expiry_date.isoformat() if subscriber.expiry_date else None
-                        }
-                    )
-                    logger.debug(f"✅ Role change logged for expired VIP user {subscriber.user_id}")
-                except Exception as e:
-                    logger.error(f"Error logging role change for user {subscriber.user_id}: {e}")
+                # Log role change if container provided
+                if container and container.role_change:
+                    try:
+                        await container.role_change.log_role_change(
+                            user_id=subscriber.user_id,
+                            new_role=UserRole.FREE,
+                            changed_by=0,  # SYSTEM
+                            reason=RoleChangeReason.VIP_EXPIRED,
+                            change_source="SYSTEM",
+                            previous_role=UserRole.VIP,
+                            change_metadata={
+                                "vip_subscriber_id": subscriber.id,
+                                "expired_at": datetime.utcnow().isoformat(),
+                                "original_expiry": subscriber.expiry_date.isoformat() if subscriber.expiry_date else None
+                            }
+                        )
+                        logger.debug(f"✅ Role change logged for expired VIP user {subscriber.user_id}")
+                    except Exception as e:
+                        logger.error(f"Error logging role change for user {subscriber.user_id}: {e}")
 
         if count > 0:
             await self.session.commit()
@@ -538,29 +919,29 @@ class SubscriptionService:
         Returns:
             Cantidad de usuarios baneados
         """
-        # Buscar suscriptores expirados
-        result = await self.session.execute(
-            select(VIPSubscriber).where(
+        # Suscriptores expirados (solo user_id, cursor del servidor)
+        expired_user_ids = stream_scalars(
+            self.session,
+            select(VIPSubscriber.user_id).where(
                 VIPSubscriber.status == "expired"
             )
         )
-        expired_subscribers = result.scalars().all()
 
         banned_count = 0
-        for subscriber in expired_subscribers:
+        async for user_id in expired_user_ids:
             try:
                 # Banear del canal (permanente - sin unban)
                 await self.bot.ban_chat_member(
                     chat_id=channel_id,
-                    user_id=subscriber.user_id
+                    user_id=user_id
                 )
 
                 banned_count += 1
-                logger.info(f"🚫 Usuario baneado de VIP (suscripción expirada): {subscriber.user_id}")
+                logger.info(f"🚫 Usuario baneado de VIP (suscripción expirada): {user_id}")
 
             except Exception as e:
                 logger.warning(
-                    f"⚠️ No se pudo banear a user {subscriber.user_id}: {e}"
+                    f"⚠️ No se pudo banear a user {user_id}: {e}"
                 )
 
         if banned_count > 0:
@@ -629,6 +1010,23 @@ class SubscriptionService:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def count_vip_subscribers(self, status: Optional[str] = None) -> int:
+        """
+        Cuenta suscriptores VIP (COUNT en BD, sin cargar filas).
+
+        Args:
+            status: Filtrar por status ("active", "expired", None=todos)
+
+        Returns:
+            Cantidad de suscriptores
+        """
+        query = select(func.count(VIPSubscriber.id))
+        if status:
+            query = query.where(VIPSubscriber.status == status)
+
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
     async def get_all_vip_subscribers_with_users(
         self,
         status: Optional[str] = None,
@@ -766,40 +1164,15 @@ class SubscriptionService:
                 - str: Mensaje descriptivo
                 - Optional[FreeChannelRequest]: Solicitud creada o existente
         """
-        # ===== CREAR/VERIFICAR USUARIO PRIMERO =====
-        # El usuario debe existir antes de crear la solicitud (FK constraint)
-        result = await self.session.execute(
-            select(User).where(User.user_id == user_id)
+        # ===== CREAR/ACTUALIZAR USUARIO PRIMERO =====
+        # El usuario debe existir antes de crear la solicitud (FK constraint).
+        # Upsert de una sentencia: sin carrera si llegan dos join requests a la vez
+        await UserService(self.session).upsert_user(
+            user_id=user_id,
+            username=username,
+            first_name=first_name or "Usuario",
+            last_name=last_name
         )
-        user = result.scalar_one_or_none()
-
-        if not user:
-            # Crear usuario nuevo con datos disponibles
-            user = User(
-                user_id=user_id,
-                username=username,
-                first_name=first_name or "Usuario",
-                last_name=last_name,
-                role=UserRole.FREE
-            )
-            self.session.add(user)
-            await self.session.flush()  # Flush para crear el usuario sin commit aún
-            logger.info(f"✅ Usuario creado desde ChatJoinRequest: {user_id}")
-        else:
-            # Actualizar datos del usuario si han cambiado
-            updated = False
-            if username is not None and user.username != username:
-                user.username = username
-                updated = True
-            if first_name is not None and user.first_name != first_name:
-                user.first_name = first_name
-                updated = True
-            if last_name is not None and user.last_name != last_name:
-                user.last_name = last_name
-                updated = True
-            if updated:
-                await self.session.flush()
-                logger.debug(f"📝 Datos de usuario actualizados: {user_id}")
 
         # ===== BUSCAR SOLICITUD EXISTENTE =====
         # Buscar CUALQUIER solicitud pendiente del usuario (no solo recientes)
@@ -905,6 +1278,88 @@ class SubscriptionService:
 
         return True, "Solicitud creada exitosamente", request
 
+    async def register_free_requests_bulk(
+        self,
+        profiles: Dict[int, Tuple[Optional[str], str, Optional[str]]]
+    ) -> Dict[int, Tuple[str, datetime]]:
+        """
+        Versión en lote de create_free_request_from_join_request().
+
+        Mismas reglas por usuario (recrear si la pendiente cumplió el tiempo,
+        duplicado dentro de la ventana anti-spam, reactivar si no), pero con
+        sentencias por lote: upsert de usuarios, un SELECT de pendientes,
+        un DELETE, un UPDATE y un INSERT. No hace commit.
+
+        Args:
+            profiles: {user_id: (username, first_name, last_name)}, ya deduplicado
+
+        Returns:
+            {user_id: (estado, request_date)} con estado "created",
+            "reactivated" o "duplicate"
+        """
+        if not profiles:
+            return {}
+
+        await UserService(self.session).upsert_users_bulk(profiles)
+
+        now = datetime.utcnow()
+        user_ids = list(profiles)
+        result = await self.session.execute(
+            select(
+                FreeChannelRequest.id,
+                FreeChannelRequest.user_id,
+                FreeChannelRequest.request_date
+            ).where(
+                FreeChannelRequest.user_id.in_(user_ids),
+                FreeChannelRequest.processed == False
+            ).order_by(FreeChannelRequest.request_date)
+        )
+        # La más reciente por usuario (orden ascendente → la última gana)
+        pending = {row.user_id: row for row in result.all()}
+
+        expired_cutoff = now - timedelta(minutes=Config.DEFAULT_WAIT_TIME_MINUTES)
+        spam_cutoff = now - timedelta(minutes=Config.FREE_REQUEST_SPAM_WINDOW_MINUTES)
+
+        outcomes: Dict[int, Tuple[str, datetime]] = {}
+        reactivate_ids = []
+        for user_id in user_ids:
+            existing = pending.get(user_id)
+            if existing is None or existing.request_date <= expired_cutoff:
+                outcomes[user_id] = ("created", now)
+            elif existing.request_date >= spam_cutoff:
+                outcomes[user_id] = ("duplicate", existing.request_date)
+            else:
+                reactivate_ids.append(existing.id)
+                outcomes[user_id] = ("reactivated", now)
+
+        created = [user_id for user_id, (status, _) in outcomes.items() if status == "created"]
+        if created:
+            # Misma limpieza total que el flujo individual
+            await self.session.execute(
+                delete(FreeChannelRequest).where(FreeChannelRequest.user_id.in_(created))
+            )
+            await self.session.execute(
+                FreeChannelRequest.__table__.insert(),
+                [
+                    {"user_id": user_id, "request_date": now, "processed": False}
+                    for user_id in created
+                ]
+            )
+
+        if reactivate_ids:
+            await self.session.execute(
+                update(FreeChannelRequest)
+                .where(FreeChannelRequest.id.in_(reactivate_ids))
+                .values(request_date=now)
+            )
+
+        logger.info(
+            f"✅ Lote de solicitudes Free: {len(created)} nuevas, "
+            f"{len(reactivate_ids)} reactivadas, "
+            f"{len(user_ids) - len(created) - len(reactivate_ids)} duplicadas"
+        )
+        return outcomes
+
     async def process_free_queue(self, wait_time_minutes: int) -> List[FreeChannelRequest]:
         """
         Procesa la cola de solicitudes Free que cumplieron el tiempo de espera.
@@ -991,141 +1446,145 @@ class SubscriptionService:
         # Calcular timestamp límite
         cutoff_time = datetime.utcnow() - timedelta(minutes=wait_time_minutes)
 
-        # Buscar solicitudes listas para aprobar
-        result = await self.session.execute(
-            select(FreeChannelRequest).where(
+        # Solicitudes listas para aprobar, en lotes por id (registros livianos)
+        ready_batches = iter_key_batches(
+            self.session,
+            FreeRequestRecord,
+            select_records(FreeRequestRecord).where(
                 FreeChannelRequest.processed == False,
                 FreeChannelRequest.request_date <= cutoff_time
-            ).order_by(FreeChannelRequest.request_date.asc())
+            ),
+            FreeChannelRequest.id,
+            batch_size=100
         )
-        ready_requests = result.scalars().all()
-
-        if not ready_requests:
-            logger.debug("✓ No hay solicitudes Free listas para aprobar")
-            return 0, 0
 
         success_count = 0
         error_count = 0
+        channel_name = None
 
-        # Obtener info del canal una vez (evita N+1 queries)
-        try:
-            channel_info = await self.bot.get_chat(free_channel_id)
-            channel_name = channel_info.title or "Canal Free"
-        except Exception as e:
-            logger.warning(f"⚠️ No se pudo obtener info del canal Free: {e}")
-            channel_name = "Canal Free"
-
-        # Aprobar cada solicitud usando Telegram API
-        for request in ready_requests:
-            try:
-                # 1. Aprobar ChatJoinRequest directamente
-                await self.bot.approve_chat_join_request(
-                    chat_id=free_channel_id,
-                    user_id=request.user_id
-                )
+        async for ready_requests in ready_batches:
+            processed_ids: List[int] = []
 
-                # 2. Obtener enlace del canal (stored or fallback to public URL)
-                # Import UserFlowMessages
-                from bot.services.message.user_flows import UserFlowMessages
-
-                # Get stored invite link from BotConfig
-                config_result = await self.session.execute(
-                    select(BotConfig).where(BotConfig.id == 1)
-                )
-                bot_config = config_result.scalar_one_or_none()
+            # Info del canal desde el cache de metadata (sin get_chat por corrida)
+            if channel_name is None:
+                channel_info = await get_chat_metadata_cache().get_chat(self.bot, free_channel_id)
+                channel_name = (channel_info.title if channel_info else None) or "Canal Free"
 
-                # Use stored link or fallback to public t.me URL
-                channel_link = None
-                if bot_config and bot_config.free_channel_invite_link:
-                    channel_link = bot_config.free_channel_invite_link
-                else:
-                    # Fallback: construct public URL from channel_id
-                    # Assumes channel_id is numeric or @username format
-                    if free_channel_id.startswith('@'):
-                        channel_link = f"t.me/{free_channel_id[1:]}"
-                        logger.warning(
-                            "⚠️ free_channel_invite_link not configured in BotConfig. "
-                            "Using fallback URL. Admin should set stored invite link for better UX."
-                        )
-                    elif free_channel_id.startswith('-100'):
-                        # Extract numeric ID for public channel lookup
-                        # This won't work for private channels, but it's a best-effort fallback
-                        channel_link = None  # Will skip sending message
-                        # Better: admin should set stored link
-                        logger.warning(
-                            f"⚠️ No stored invite link found. "
-                            f"Admin should set free_channel_invite_link in BotConfig."
-                        )
-                    else:
-                        channel_link = f"t.me/{free_channel_id}"
-                        logger.warning(
-                            "⚠️ free_channel_invite_link not configured in BotConfig. "
-                            "Using fallback URL. Admin should set stored invite link for better UX."
-                        )
+            # Aprobar cada solicitud usando Telegram API
+            for request in ready_requests:
+                try:
+                    # 1. Aprobar ChatJoinRequest directamente
+                    await self.bot.approve_chat_join_request(
+                        chat_id=free_channel_id,
+                        user_id=request.user_id
+                    )
 
-                # 3. Enviar mensaje de aprobación con Lucien's voice
-                if channel_link:
-                    try:
-                        flows = UserFlowMessages()
-                        approval_text, keyboard = flows.free_request_approved(
-                            channel_name=channel_name,
-                            channel_link=channel_link
-                        )
+                    # 2. Obtener enlace del canal (stored or fallback to public URL)
+                    # Import UserFlowMessages
+                    from bot.services.message.user_flows import UserFlowMessages
 
-                        await self.bot.send_message(
-                            chat_id=request.user_id,
-                            text=approval_text,
-                            reply_markup=keyboard,
-                            parse_mode="HTML"
-                        )
+                    # Get stored invite link from BotConfig
+                    config_result = await self.session.execute(
+                        select(BotConfig).where(BotConfig.id == 1)
+                    )
+                    bot_config = config_result.scalar_one_or_none()
 
-                        logger.info(
-                            f"✅ Aprobación enviada a user {request.user_id} con enlace al canal"
-                        )
-                    except Exception as notify_error:
-                        # Distinguir entre usuario que bloqueó el bot vs otros errores
-                        error_type = type(notify_error).__name__
-                        if "Forbidden" in error_type or "blocked" in str(notify_error).lower():
+                    # Use stored link or fallback to public t.me URL
+                    channel_link = None
+                    if bot_config and bot_config.free_channel_invite_link:
+                        channel_link = bot_config.free_channel_invite_link
+                    else:
+                        # Fallback: construct public URL from channel_id
+                        # Assumes channel_id is numeric or @username format
+                        if free_channel_id.startswith('@'):
+                            channel_link = f"t.me/{free_channel_id[1:]}"
+                            logger.warning(
+                                "⚠️ free_channel_invite_link not configured in BotConfig. "
+                                "Using fallback URL. Admin should set stored invite link for better UX."
+                            )
+                        elif free_channel_id.startswith('-100'):
+                            # Extract numeric ID for public channel lookup
+                            # This won't work for private channels, but it's a best-effort fallback
+                            channel_link = None  # Will skip sending message
+                            # Better: admin should set stored link
                             logger.warning(
-                                f"⚠️ Usuario {request.user_id} bloqueó el bot, no se envió confirmación"
+                                f"⚠️ No stored invite link found. "
+                                f"Admin should set free_channel_invite_link in BotConfig."
                             )
                         else:
-                            logger.error(
-                                f"❌ Error inesperado enviando confirmación a {request.user_id}: {notify_error}"
+                            channel_link = f"t.me/{free_channel_id}"
+                            logger.warning(
+                                "⚠️ free_channel_invite_link not configured in BotConfig. "
+                                "Using fallback URL. Admin should set stored invite link for better UX."
                             )
-                        # No falla la aprobación si el mensaje no se envía
 
-                # 4. Marcar como procesada
-                request.processed = True
-                request.processed_at = datetime.utcnow()
+                    # 3. Enviar mensaje de aprobación con Lucien's voice
+                    if channel_link:
+                        try:
+                            flows = UserFlowMessages()
+                            approval_text, keyboard = flows.free_request_approved(
+                                channel_name=channel_name,
+                                channel_link=channel_link
+                            )
 
-                success_count += 1
-                logger.info(f"✅ Solicitud Free aprobada: user {request.user_id}")
+                            await self.bot.send_message(
+                                chat_id=request.user_id,
+                                text=approval_text,
+                                reply_markup=keyboard,
+                                parse_mode="HTML"
+                            )
 
-            except Exception as e:
-                error_count += 1
-                error_msg = str(e).lower()
-
-                # Verificar si es un error de solicitud expirada/cancelada
-                # Esto ocurre cuando el ChatJoinRequest de Telegram expiró o fue cancelado
-                is_expired_error = any(
-                    keyword in error_msg
-                    for keyword in ["expired", "not found", "no pending", "request expired", "user_not_participant"]
-                )
+                            logger.info(
+                                f"✅ Aprobación enviada a user {request.user_id} con enlace al canal"
+                            )
+                        except Exception as notify_error:
+                            # Distinguir entre usuario que bloqueó el bot vs otros errores
+                            error_type = type(notify_error).__name__
+                            if "Forbidden" in error_type or "blocked" in str(notify_error).lower():
+                                logger.warning(
+                                    f"⚠️ Usuario {request.user_id} bloqueó el bot, no se envió confirmación"
+                                )
+                            else:
+                                logger.error(
+                                    f"❌ Error inesperado enviando confirmación a {request.user_id}: {notify_error}"
+                                )
+                            # No falla la aprobación si el mensaje no se envía
+
+                    # 4. Marcar como procesada (UPDATE por lotes al final)
+                    processed_ids.append(request.id)
 
-                if is_expired_error:
-                    # Marcar como procesada para no volver a intentar
-                    request.processed = True
-                    request.processed_at = datetime.utcnow()
-                    logger.warning(
-                        f"⚠️ Solicitud de user {request.user_id} expiró o fue cancelada. "
-                        f"Marcada como procesada para evitar reintentos."
-                    )
-                else:
-                    logger.error(
-                        f"❌ Error aprobando solicitud de user {request.user_id}: {e}"
+                    success_count += 1
+                    logger.info(f"✅ Solicitud Free aprobada: user {request.user_id}")
+
+                except Exception as e:
+                    error_count += 1
+                    error_msg = str(e).lower()
+
+                    # Verificar si es un error de solicitud expirada/cancelada
+                    # Esto ocurre cuando el ChatJoinRequest de Telegram expiró o fue cancelado
+                    is_expired_error = any(
+                        keyword in error_msg
+                        for keyword in ["expired", "not found", "no pending", "request expired", "user_not_participant"]
                     )
 
+                    if is_expired_error:
+                        # Marcar como procesada para no volver a intentar
+                        processed_ids.append(request.id)
+                        logger.warning(
+                            f"⚠️ Solicitud de user {request.user_id} expiró o fue cancelada. "
+                            f"Marcada como procesada para evitar reintentos."
+                        )
+                    else:
+                        logger.error(
+                            f"❌ Error aprobando solicitud de user {request.user_id}: {e}"
+                        )
+
+            await self._mark_free_requests_processed(processed_ids)
+
+        if channel_name is None:
+            logger.debug("✓ No hay solicitudes Free listas para aprobar")
+            return 0, 0
+
         # Commit todos los cambios
         await self.session.commit()
 
@@ -1186,7 +1645,7 @@ class SubscriptionService:
     async def get_pending_free_requests(
         self,
         limit: int = 100
-    ) -> List[FreeChannelRequest]:
+    ) -> List[FreeRequestRecord]:
         """
         Obtiene todas las solicitudes Free pendientes.
 
@@ -1194,15 +1653,27 @@ class SubscriptionService:
             limit: Máximo de solicitudes a retornar (default: 100)
 
         Returns:
-            Lista de FreeChannelRequest pendientes, ordenadas por fecha (más antiguas primero)
+            Lista de FreeRequestRecord (id, user_id, request_date) pendientes,
+            ordenadas por fecha (más antiguas primero)
         """
-        result = await self.session.execute(
-            select(FreeChannelRequest)
+        return await fetch_records(
+            self.session,
+            FreeRequestRecord,
+            select_records(FreeRequestRecord)
             .where(FreeChannelRequest.processed == False)
             .order_by(FreeChannelRequest.request_date.asc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+
+    async def _mark_free_requests_processed(self, request_ids: List[int]) -> None:
+        """Marca solicitudes Free como procesadas en un solo UPDATE (sin commit)."""
+        if not request_ids:
+            return
+        await self.session.execute(
+            update(FreeChannelRequest)
+            .where(FreeChannelRequest.id.in_(request_ids))
+            .values(processed=True, processed_at=datetime.utcnow())
+        )
 
     async def get_pending_free_requests_count(self) -> int:
         """
@@ -1239,6 +1710,8 @@ class SubscriptionService:
                 logger.debug("No hay más solicitudes Free pendientes para aprobar")
                 break
 
+            processed_ids: List[int] = []
+
             for request in pending_requests:
                 try:
                     # Aprobar solicitud en Telegram
@@ -1247,9 +1720,8 @@ class SubscriptionService:
                         user_id=request.user_id
                     )
 
-                    # Marcar como procesada
-                    request.processed = True
-                    request.processed_at = datetime.utcnow()
+                    # Marcar como procesada (UPDATE por lotes)
+                    processed_ids.append(request.id)
 
                     success_count += 1
                     logger.info(f"✅ Solicitud Free aprobada (bulk): user {request.user_id}")
@@ -1260,6 +1732,7 @@ class SubscriptionService:
                         f"⚠️ Error aprobando solicitud de user {request.user_id}: {e}"
                     )
 
+            await self._mark_free_requests_processed(processed_ids)
             await self.session.commit()
 
         logger.info(
@@ -1291,6 +1764,8 @@ class SubscriptionService:
                 logger.debug("No hay más solicitudes Free pendientes para rechazar")
                 break
 
+            processed_ids: List[int] = []
+
             for request in pending_requests:
                 try:
                     # Rechazar solicitud en Telegram
@@ -1299,9 +1774,8 @@ class SubscriptionService:
                         user_id=request.user_id
                     )
 
-                    # Marcar como procesada
-                    request.processed = True
-                    request.processed_at = datetime.utcnow()
+                    # Marcar como procesada (UPDATE por lotes)
+                    processed_ids.append(request.id)
 
                     success_count += 1
                     logger.info(f"🚫 Solicitud Free rechazada (bulk): user {request.user_id}")
@@ -1312,6 +1786,7 @@ class SubscriptionService:
                         f"⚠️ Error rechazando solicitud de user {request.user_id}: {e}"
                     )
 
+            await self._mark_free_requests_processed(processed_ids)
             await self.session.commit()
 
         logger.info(
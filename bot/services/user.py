@@ -8,19 +8,63 @@ Proporciona operaciones para:
 - Verificar permisos
 """
 import logging
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import (
+    BigInteger, DateTime, String, bindparam, exists, or_, select, union_all
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
 from aiogram.types import User as TelegramUser
 
-from bot.database.models import User
+from bot.database.dialect import DatabaseDialect, get_session_dialect
+from bot.database.models import User, UserSearchTerm, user_search_term_rows
 from bot.database.enums import UserRole
+from config import Config
 
 logger = logging.getLogger(__name__)
 
 
+class ProfileRefreshBuffer:
+    """
+    Buffer write-behind de cambios de perfil (username/nombre/apellido).
+
+    Guarda solo el último perfil visto por usuario: N refrescos del mismo
+    usuario dentro de la ventana se escriben como una sola actualización
+    en UserService.flush_profile_updates().
+    """
+
+    def __init__(self):
+        self._pending: Dict[int, Tuple[Optional[str], str, Optional[str]]] = {}
+        self.coalesced = 0
+
+    def record(
+        self,
+        user_id: int,
+        username: Optional[str],
+        first_name: str,
+        last_name: Optional[str]
+    ) -> None:
+        """Registra el perfil más reciente del usuario."""
+        if user_id in self._pending:
+            self.coalesced += 1
+        self._pending[user_id] = (username, first_name, last_name)
+
+    def drain(self) -> Dict[int, Tuple[Optional[str], str, Optional[str]]]:
+        """Retorna y vacía los perfiles pendientes."""
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+# Buffer global (uno por proceso); lo vacía la tarea flush_user_profiles
+profile_buffer = ProfileRefreshBuffer()
+
+
 class UserService:
     """
     Servicio para gestionar usuarios del sistema.
@@ -46,6 +90,11 @@ class UserService:
         """
         Obtiene un usuario existente o lo crea si no existe.
 
+        Delega en upsert_user(). Con write-behind activo
+        (Config.USER_PROFILE_FLUSH_SECONDS > 0) los cambios de perfil de
+        usuarios existentes se acumulan en profile_buffer y se escriben en
+        lote; el usuario retornado conserva el perfil anterior hasta el flush.
+
         Args:
             telegram_user: Objeto User de Telegram
             default_role: Rol por defecto si se crea (default: FREE)
@@ -56,55 +105,284 @@ class UserService:
         Examples:
             >>> user = await service.get_or_create_user(message.from_user)
         """
-        # Buscar usuario existente
+        if Config.USER_PROFILE_FLUSH_SECONDS > 0:
+            user = await self.session.get(User, telegram_user.id)
+            if user is not None:
+                if self._profile_differs(
+                    user, telegram_user.username, telegram_user.first_name, telegram_user.last_name
+                ):
+                    profile_buffer.record(
+                        telegram_user.id,
+                        telegram_user.username,
+                        telegram_user.first_name,
+                        telegram_user.last_name
+                    )
+                return user
+
+        return await self.upsert_user(
+            user_id=telegram_user.id,
+            username=telegram_user.username,
+            first_name=telegram_user.first_name,
+            last_name=telegram_user.last_name,
+            default_role=default_role
+        )
+
+    async def upsert_user(
+        self,
+        user_id: int,
+        username: Optional[str],
+        first_name: str,
+        last_name: Optional[str],
+        default_role: UserRole = UserRole.FREE
+    ) -> User:
+        """
+        Crea el usuario o actualiza su perfil en una sola sentencia.
+
+        INSERT ... ON CONFLICT (user_id) DO UPDATE ... WHERE algún campo
+        difiere: inserciones concurrentes del mismo usuario no fallan y un
+        perfil sin cambios no reescribe la fila. El rol solo se aplica al
+        crear.
+
+        - PostgreSQL: un único statement (CTE) que retorna la fila siempre
+        - SQLite (sin DML en CTE): lectura por PK (identity map primero) y
+          upsert solo si no existe o cambió; así un perfil sin cambios no
+          toma el lock de escritura de la BD
+
+        Mantiene user_search_terms (el upsert Core no dispara listeners ORM).
+
+        Args:
+            user_id: ID de Telegram
+            username: Username (None si no tiene)
+            first_name: Nombre
+            last_name: Apellido (None si no tiene)
+            default_role: Rol si se crea (default: FREE)
+
+        Returns:
+            User del sistema (cargado en la sesión)
+        """
+        dialect = get_session_dialect(self.session)
+
+        if dialect != DatabaseDialect.POSTGRESQL:
+            user = await self.session.get(User, user_id)
+            if user is not None and not self._profile_differs(
+                user, username, first_name, last_name
+            ):
+                return user
+
+        now = datetime.utcnow()
+        upsert_stmt, returning_stmt = self._get_upsert_statements(dialect)
+        statement = returning_stmt if dialect == DatabaseDialect.POSTGRESQL else (
+            upsert_stmt.returning(*User.__table__.c)
+        )
+
         result = await self.session.execute(
-            select(User).where(User.user_id == telegram_user.id)
+            select(User).from_statement(statement).execution_options(populate_existing=True),
+            {
+                "p_user_id": user_id,
+                "p_username": username,
+                "p_first_name": first_name,
+                "p_last_name": last_name,
+                "p_role": default_role,
+                "p_now": now,
+            }
         )
         user = result.scalar_one_or_none()
 
-        if user:
-            # Usuario existe - actualizar datos si cambiaron
-            updated = False
+        if user is None:
+            # PostgreSQL: fila insertada por otra transacción tras nuestro snapshot
+            user = await self.session.get(User, user_id, populate_existing=True)
+            return user
 
-            if user.username != telegram_user.username:
-                user.username = telegram_user.username
-                updated = True
+        if user.created_at == now:
+            await self._reindex_search_terms([user], replace=False)
+            logger.info(
+                f"✅ Usuario creado: {user.user_id} (@{user.username}) - "
+                f"Rol: {user.role.value}"
+            )
+        elif user.updated_at == now:
+            await self._reindex_search_terms([user], replace=True)
+            logger.debug(f"👤 Usuario actualizado: {user.user_id}")
 
-            if user.first_name != telegram_user.first_name:
-                user.first_name = telegram_user.first_name
-                updated = True
+        return user
 
-            if user.last_name != telegram_user.last_name:
-                user.last_name = telegram_user.last_name
-                updated = True
+    async def flush_profile_updates(self) -> int:
+        """
+        Escribe en lote los cambios de perfil acumulados en profile_buffer.
 
-            if updated:
-                user.updated_at = datetime.utcnow()
-                # No commit - dejar que el handler maneje la transacción
-                logger.debug(f"👤 Usuario actualizado: {user.user_id}")
+        No hace commit.
 
-            return user
+        Returns:
+            Cantidad de usuarios actualizados
+        """
+        pending = profile_buffer.drain()
+        if not pending:
+            return 0
 
-        # Usuario no existe - crear
-        user = User(
-            user_id=telegram_user.id,
-            username=telegram_user.username,
-            first_name=telegram_user.first_name,
-            last_name=telegram_user.last_name,
-            role=default_role,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+        changed = await self.upsert_users_bulk(pending)
+        logger.info(
+            f"👤 Perfiles actualizados en lote: {changed}/{len(pending)} "
+            f"(coalescidos: {profile_buffer.coalesced})"
         )
+        return changed
 
-        self.session.add(user)
-        # No commit - dejar que el handler maneje la transacción
+    async def upsert_users_bulk(
+        self,
+        profiles: Dict[int, Tuple[Optional[str], str, Optional[str]]],
+        default_role: UserRole = UserRole.FREE
+    ) -> int:
+        """
+        Crea o actualiza muchos usuarios con un solo executemany del upsert.
 
-        logger.info(
-            f"✅ Usuario creado: {user.user_id} (@{user.username}) - "
-            f"Rol: {default_role.value}"
+        Solo las filas nuevas o con perfil distinto se escriben y reindexan.
+        No hace commit.
+
+        Args:
+            profiles: {user_id: (username, first_name, last_name)}
+            default_role: Rol de los usuarios que se creen
+
+        Returns:
+            Cantidad de usuarios creados o actualizados
+        """
+        if not profiles:
+            return 0
+
+        now = datetime.utcnow()
+        upsert_stmt, _ = self._get_upsert_statements(get_session_dialect(self.session))
+        users = User.__table__
+
+        result = await self.session.execute(
+            upsert_stmt.returning(
+                users.c.user_id, users.c.username, users.c.first_name, users.c.last_name
+            ),
+            [
+                {
+                    "p_user_id": user_id,
+                    "p_username": username,
+                    "p_first_name": first_name,
+                    "p_last_name": last_name,
+                    "p_role": default_role,
+                    "p_now": now,
+                }
+                for user_id, (username, first_name, last_name) in profiles.items()
+            ]
+        )
+        changed = result.all()
+        await self._reindex_search_terms(changed, replace=True)
+
+        # Refrescar instancias ya cargadas en esta sesión
+        for row in changed:
+            cached = self.session.identity_map.get(identity_key(User, row.user_id))
+            if cached is not None:
+                set_committed_value(cached, "username", row.username)
+                set_committed_value(cached, "first_name", row.first_name)
+                set_committed_value(cached, "last_name", row.last_name)
+
+        return len(changed)
+
+    @staticmethod
+    def _profile_differs(
+        user: User,
+        username: Optional[str],
+        first_name: str,
+        last_name: Optional[str]
+    ) -> bool:
+        """True si el perfil de Telegram difiere del almacenado."""
+        return (
+            user.username != username
+            or user.first_name != first_name
+            or user.last_name != last_name
         )
 
-        return user
+    async def _reindex_search_terms(self, users, replace: bool) -> None:
+        """
+        Reescribe user_search_terms de los usuarios dados.
+
+        Args:
+            users: Objetos con user_id, username, first_name y last_name
+            replace: True para borrar los términos previos
+        """
+        if not users:
+            return
+
+        table = UserSearchTerm.__table__
+        if replace:
+            await self.session.execute(
+                table.delete().where(table.c.user_id.in_([u.user_id for u in users]))
+            )
+
+        rows = [
+            row
+            for u in users
+            for row in user_search_term_rows(u.user_id, u.username, u.first_name, u.last_name)
+        ]
+        if rows:
+            await self.session.execute(table.insert(), rows)
+
+    # Upsert precompilado por dialecto (ON CONFLICT no es cacheable por SQLAlchemy)
+    _upsert_statements: Dict[DatabaseDialect, Tuple[Any, Any]] = {}
+
+    @classmethod
+    def _get_upsert_statements(cls, dialect: DatabaseDialect) -> Tuple[Any, Any]:
+        """
+        Retorna (upsert, upsert_o_select) para el dialecto.
+
+        - upsert: INSERT ... ON CONFLICT DO UPDATE ... WHERE difiere
+          (sin RETURNING; se agrega según el uso)
+        - upsert_o_select: solo PostgreSQL; CTE con el upsert que retorna la
+          fila también cuando no hubo cambios (None en otros dialectos)
+        """
+        statements = cls._upsert_statements.get(dialect)
+        if statements is not None:
+            return statements
+
+        if dialect == DatabaseDialect.POSTGRESQL:
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        users = User.__table__
+        p_user_id = bindparam("p_user_id", type_=BigInteger)
+        p_now = bindparam("p_now", type_=DateTime)
+
+        stmt = insert(users).values(
+            user_id=p_user_id,
+            username=bindparam("p_username", type_=String),
+            first_name=bindparam("p_first_name", type_=String),
+            last_name=bindparam("p_last_name", type_=String),
+            role=bindparam("p_role", type_=users.c.role.type),
+            created_at=p_now,
+            updated_at=p_now
+        )
+        excluded = stmt.excluded
+        upsert = stmt.on_conflict_do_update(
+            index_elements=[users.c.user_id],
+            set_={
+                "username": excluded.username,
+                "first_name": excluded.first_name,
+                "last_name": excluded.last_name,
+                "updated_at": excluded.updated_at,
+            },
+            where=or_(
+                users.c.username.is_distinct_from(excluded.username),
+                users.c.first_name.is_distinct_from(excluded.first_name),
+                users.c.last_name.is_distinct_from(excluded.last_name),
+            )
+        )
+
+        upsert_or_select = None
+        if dialect == DatabaseDialect.POSTGRESQL:
+            upserted = upsert.returning(*users.c).cte("upserted")
+            upsert_or_select = union_all(
+                select(upserted),
+                select(users).where(
+                    users.c.user_id == p_user_id,
+                    ~exists(select(upserted.c.user_id))
+                )
+            )
+
+        statements = (upsert, upsert_or_select)
+        cls._upsert_statements[dialect] = statements
+        return statements
 
     async def get_user(self, user_id: int) -> Optional[User]:
         """
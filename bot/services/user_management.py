@@ -503,35 +503,21 @@ class UserManagementService:
         limit: int = 10
     ) -> List[User]:
         """
-        Busca usuarios por username o user_id.
+        Busca usuarios por ID, username, nombre o apellido.
+
+        Usa el índice user_search_terms (prefijo + coincidencia difusa)
+        mediante UserSearchService; resultados ordenados por relevancia.
 
         Args:
-            query: Query de búsqueda (username o user_id como string)
+            query: Query de búsqueda (user_id, @username o nombre)
             limit: Máximo de resultados
 
         Returns:
             Lista de usuarios coincidentes
         """
         try:
-            # Try to parse as user_id
-            try:
-                user_id = int(query)
-                id_stmt = select(User).where(User.user_id == user_id)
-                id_result = await self.session.execute(id_stmt)
-                user = id_result.scalar_one_or_none()
-                if user:
-                    return [user]
-            except ValueError:
-                pass  # Not a number, search by username
-
-            # Search by username
-            username_query = f"%{query}%"
-            stmt = select(User).where(
-                User.username.ilike(username_query)
-            ).limit(limit)
-
-            result = await self.session.execute(stmt)
-            return result.scalars().all()
+            from bot.services.user_search import UserSearchService
+            return await UserSearchService(self.session).search(query, limit=limit)
 
         except Exception as e:
             logger.error(f"Error searching users with query '{query}': {e}", exc_info=True)
@@ -0,0 +1,274 @@
+"""
+User Search Service - Búsqueda indexada del directorio de usuarios.
+
+Resuelve búsquedas del panel de administración sobre user_search_terms
+(username y palabras del nombre normalizados en minúsculas y sin acentos,
+mantenidos por listeners de User en bot/database/models.py):
+- ID exacto de Telegram
+- Prefijo sobre username, nombre y apellido (range scan sobre índice)
+- Coincidencia difusa: pg_trgm + GIN en PostgreSQL; en SQLite, candidatos
+  acotados por prefijo corto y similitud calculada en Python
+
+Todas las consultas están acotadas por PREFIX_CANDIDATES / FUZZY_CANDIDATES,
+por lo que la latencia no depende del tamaño de la tabla users.
+"""
+import logging
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, delete, func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database.dialect import DatabaseDialect, get_session_dialect
+from bot.database.models import User, UserSearchTerm
+from bot.database.search import (
+    FIELD_NAME,
+    FIELD_USERNAME,
+    FIELD_USERNAME_PART,
+    build_user_search_terms,
+    normalize_search_text,
+)
+
+logger = logging.getLogger(__name__)
+
+# Carácter mayor que cualquier otro: límite superior del range scan por prefijo
+_PREFIX_UPPER_BOUND = chr(0x10FFFF)
+
+# Score base por campo: (coincidencia exacta, prefijo)
+_FIELD_SCORES = {
+    FIELD_USERNAME: (1.0, 0.8),
+    FIELD_NAME: (0.9, 0.7),
+    FIELD_USERNAME_PART: (0.85, 0.65),
+}
+
+
+class UserSearchService:
+    """
+    Service de búsqueda de usuarios sobre el índice user_search_terms.
+
+    Ranking (0.0 - 1.0):
+    - Username exacto: 1.0
+    - Palabra del nombre exacta: 0.9
+    - Parte del username exacta ("doe" en "john_doe"): 0.85
+    - Prefijo de username / nombre / parte: 0.8 / 0.7 / 0.65
+      (+ bonus por cobertura del término)
+    - Coincidencia difusa: similitud * 0.6
+
+    Con varias palabras en la query, el usuario debe coincidir con todas
+    y su score es el promedio.
+    """
+
+    # Máximo de postings leídos por palabra de la query (prefijo)
+    PREFIX_CANDIDATES = 200
+
+    # Máximo de candidatos evaluados por palabra en búsqueda difusa
+    FUZZY_CANDIDATES = 500
+
+    # Similitud mínima para aceptar un candidato difuso
+    FUZZY_MIN_SCORE = 0.6
+
+    # Máximo de palabras consideradas en la query
+    MAX_QUERY_TOKENS = 4
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el service.
+
+        Args:
+            session: Sesión de base de datos
+        """
+        self.session = session
+        self._dialect = get_session_dialect(session)
+        logger.debug("✅ UserSearchService inicializado")
+
+    # ===== MANTENIMIENTO DEL ÍNDICE =====
+
+    async def rebuild_index(self, batch_size: int = 1000) -> int:
+        """
+        Reconstruye el índice completo desde la tabla users.
+
+        Necesario solo para usuarios insertados fuera del ORM (SQL directo,
+        importaciones); las altas/ediciones normales se indexan solas.
+        Recorre users por keyset (user_id) en lotes para no cargar la tabla
+        completa en memoria.
+
+        Args:
+            batch_size: Usuarios por lote
+
+        Returns:
+            Número de usuarios indexados
+        """
+        await self.session.execute(delete(UserSearchTerm))
+
+        indexed = 0
+        last_user_id: Optional[int] = None
+        while True:
+            stmt = select(
+                User.user_id, User.username, User.first_name, User.last_name
+            ).order_by(User.user_id).limit(batch_size)
+            if last_user_id is not None:
+                stmt = stmt.where(User.user_id > last_user_id)
+
+            rows = (await self.session.execute(stmt)).all()
+            if not rows:
+                break
+
+            self.session.add_all([
+                UserSearchTerm(user_id=user_id, term=term, field=field)
+                for user_id, username, first_name, last_name in rows
+                for term, field in build_user_search_terms(username, first_name, last_name)
+            ])
+            await self.session.flush()
+
+            indexed += len(rows)
+            last_user_id = rows[-1].user_id
+
+        logger.info(f"🔎 Índice de búsqueda reconstruido: {indexed} usuarios")
+        return indexed
+
+    # ===== BÚSQUEDA =====
+
+    async def search(self, query: str, limit: int = 10) -> List[User]:
+        """
+        Busca usuarios por ID, username, nombre o apellido.
+
+        Args:
+            query: Texto de búsqueda (ID, @username o nombre)
+            limit: Máximo de resultados
+
+        Returns:
+            Lista de usuarios ordenada por relevancia
+        """
+        query = (query or "").strip()
+        if not query:
+            return []
+
+        # ID exacto
+        if query.lstrip("-").isdigit():
+            user = await self.session.get(User, int(query))
+            if user:
+                return [user]
+
+        tokens = normalize_search_text(query).split()[:self.MAX_QUERY_TOKENS]
+        if not tokens:
+            return []
+
+        per_token_scores: List[Dict[int, float]] = []
+        for token in tokens:
+            scores = await self._prefix_scores(token)
+            if len(scores) < limit:
+                for user_id, score in (await self._fuzzy_scores(token)).items():
+                    scores[user_id] = max(scores.get(user_id, 0.0), score)
+            per_token_scores.append(scores)
+
+        ranked = self._combine_scores(per_token_scores)[:limit]
+        if not ranked:
+            return []
+
+        result = await self.session.execute(
+            select(User).where(User.user_id.in_([user_id for user_id, _ in ranked]))
+        )
+        users_by_id = {user.user_id: user for user in result.scalars().all()}
+        return [users_by_id[user_id] for user_id, _ in ranked if user_id in users_by_id]
+
+    async def _prefix_scores(self, token: str) -> Dict[int, float]:
+        """
+        Scores de coincidencia por prefijo para una palabra.
+
+        Args:
+            token: Palabra normalizada
+
+        Returns:
+            Dict {user_id: score}
+        """
+        stmt = select(
+            UserSearchTerm.user_id, UserSearchTerm.term, UserSearchTerm.field
+        ).where(
+            self._prefix_condition(token)
+        ).order_by(UserSearchTerm.term).limit(self.PREFIX_CANDIDATES)
+
+        scores: Dict[int, float] = {}
+        for user_id, term, field in (await self.session.execute(stmt)).all():
+            exact_score, prefix_score = _FIELD_SCORES.get(field, _FIELD_SCORES[FIELD_NAME])
+            if term == token:
+                score = exact_score
+            else:
+                score = prefix_score + 0.1 * (len(token) / len(term))
+            scores[user_id] = max(scores.get(user_id, 0.0), score)
+        return scores
+
+    async def _fuzzy_scores(self, token: str) -> Dict[int, float]:
+        """
+        Scores de coincidencia difusa para una palabra.
+
+        PostgreSQL: operador % de pg_trgm (índice GIN) y similarity().
+        SQLite: candidatos por prefijo de 2 caracteres y SequenceMatcher.
+
+        Args:
+            token: Palabra normalizada
+
+        Returns:
+            Dict {user_id: score}
+        """
+        if len(token) < 3:
+            return {}
+
+        scores: Dict[int, float] = {}
+
+        if self._dialect == DatabaseDialect.POSTGRESQL:
+            similarity = func.similarity(UserSearchTerm.term, token)
+            stmt = select(UserSearchTerm.user_id, similarity).where(
+                UserSearchTerm.term.op("%")(token)
+            ).order_by(similarity.desc()).limit(self.FUZZY_CANDIDATES)
+            rows: Iterable[Tuple[int, float]] = (await self.session.execute(stmt)).all()
+        else:
+            stmt = select(UserSearchTerm.user_id, UserSearchTerm.term).where(
+                self._prefix_condition(token[:2])
+            ).limit(self.FUZZY_CANDIDATES)
+            rows = [
+                (user_id, SequenceMatcher(None, token, term).ratio())
+                for user_id, term in (await self.session.execute(stmt)).all()
+            ]
+
+        for user_id, similarity_score in rows:
+            if similarity_score < self.FUZZY_MIN_SCORE:
+                continue
+            score = float(similarity_score) * 0.6
+            scores[user_id] = max(scores.get(user_id, 0.0), score)
+        return scores
+
+    def _prefix_condition(self, prefix: str):
+        """
+        Condición indexable de prefijo sobre UserSearchTerm.term.
+
+        SQLite compara binario: un range scan usa el índice directamente.
+        PostgreSQL usa LIKE 'prefix%' (índice varchar_pattern_ops).
+        """
+        if self._dialect == DatabaseDialect.POSTGRESQL:
+            return UserSearchTerm.term.startswith(prefix, autoescape=True)
+        return and_(
+            UserSearchTerm.term >= prefix,
+            UserSearchTerm.term < prefix + _PREFIX_UPPER_BOUND
+        )
+
+    @staticmethod
+    def _combine_scores(per_token_scores: List[Dict[int, float]]) -> List[Tuple[int, float]]:
+        """
+        Combina scores por palabra: exige todas las palabras y promedia.
+
+        Returns:
+            Lista (user_id, score) ordenada por score descendente
+        """
+        if not per_token_scores:
+            return []
+
+        common = set(per_token_scores[0])
+        for scores in per_token_scores[1:]:
+            common &= set(scores)
+
+        combined = [
+            (user_id, sum(scores[user_id] for scores in per_token_scores) / len(per_token_scores))
+            for user_id in common
+        ]
+        combined.sort(key=lambda item: (-item[1], item[0]))
+        return combined
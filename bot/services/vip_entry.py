@@ -16,12 +16,14 @@ from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
 from aiogram import Bot
-from aiogram.types import ChatInviteLink
+from aiogram.types import ChatInviteLink, User as TelegramUser
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database.models import VIPSubscriber, User
 from bot.services.subscription import SubscriptionService
+from bot.services.vip_invite_pool import VIPInvitePoolService
+from config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +63,7 @@ class VIPEntryService:
         self.session = session
         self.bot = bot
         self.subscription = SubscriptionService(session, bot)
+        self.invite_pool = VIPInvitePoolService(session, bot)
         logger.debug("✅ VIPEntryService inicializado")
 
     # ===== STAGE VALIDATION =====
@@ -225,10 +228,13 @@ class VIPEntryService:
         Crea enlace de invitación al canal VIP con validez de 24 horas.
 
         Características:
-        - Validez: 24 horas desde generación
+        - Validez: al menos 24 horas desde la entrega
         - Uso: member_limit=1 (un solo uso)
         - Timestamp: invite_link_sent_at actualizado
 
+        Se reclama un enlace pre-generado del pool (sin round trip a
+        Telegram); si el pool está vacío se crea en el momento.
+
         Args:
             user_id: ID del usuario
 
@@ -254,7 +260,22 @@ class VIPEntryService:
             logger.error("❌ VIP channel not configured")
             return None
 
-        # Create invite link via SubscriptionService
+        # Claim a pre-generated link from the pool (no Bot API round trip)
+        if Config.VIP_INVITE_POOL_SIZE > 0:
+            pooled = await self.invite_pool.claim(vip_channel_id, user_id)
+            if pooled:
+                subscriber.invite_link_sent_at = datetime.utcnow()
+                return ChatInviteLink(
+                    invite_link=pooled.invite_link,
+                    creator=TelegramUser(id=self.bot.id, is_bot=True, first_name="Bot"),
+                    creates_join_request=False,
+                    is_primary=False,
+                    is_revoked=False,
+                    expire_date=pooled.expire_date,
+                    member_limit=1
+                )
+
+        # Pool empty/disabled: create invite link via SubscriptionService
         try:
             invite_link = await self.subscription.create_invite_link(
                 channel_id=vip_channel_id,
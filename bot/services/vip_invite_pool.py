@@ -0,0 +1,294 @@
+"""
+VIP Invite Pool Service - Enlaces de invitación VIP pre-generados.
+
+La etapa 3 del ritual de entrada VIP creaba el enlace con
+bot.create_chat_invite_link en el momento: el usuario esperaba un round trip
+a Telegram (más reintentos bajo rate limit) justo en el momento clave.
+
+Estrategia:
+- Tarea en segundo plano (maintain_vip_invite_pool) mantiene
+  VIP_INVITE_POOL_SIZE enlaces de un solo uso (member_limit=1) en BD
+- La etapa 3 reclama uno de forma atómica (UPDATE condicionado a
+  claimed_by IS NULL, reintenta si otro usuario lo ganó)
+- Enlaces sin reclamar que ya no cubren VIP_INVITE_POOL_MIN_VALID_HOURS (o de
+  un canal anterior) se revocan y se reponen por lotes
+- Pool vacío: VIPEntryService vuelve a crear el enlace en el momento
+"""
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from aiogram import Bot
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database.models import VIPInviteLink
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Reintentos de reclamo cuando otro usuario gana el mismo enlace
+CLAIM_ATTEMPTS = 3
+
+
+class InvitePoolMetrics:
+    """Métricas de proceso del pool (profundidad y latencia de reclamo)."""
+
+    def __init__(self):
+        self.depth = 0
+        self.claims = 0
+        self.misses = 0
+        self.created = 0
+        self.revoked = 0
+        self.claim_latency_total_ms = 0.0
+        self.claim_latency_max_ms = 0.0
+
+    def record_claim(self, elapsed_ms: float) -> None:
+        """Registra un reclamo exitoso."""
+        self.claims += 1
+        self.depth = max(0, self.depth - 1)
+        self.claim_latency_total_ms += elapsed_ms
+        self.claim_latency_max_ms = max(self.claim_latency_max_ms, elapsed_ms)
+
+    def get_stats(self) -> dict:
+        """
+        Métricas del pool.
+
+        Returns:
+            Dict con depth, claims, misses, created, revoked y latencias (ms)
+        """
+        return {
+            "depth": self.depth,
+            "claims": self.claims,
+            "misses": self.misses,
+            "created": self.created,
+            "revoked": self.revoked,
+            "claim_latency_avg_ms": (
+                round(self.claim_latency_total_ms / self.claims, 2) if self.claims else 0.0
+            ),
+            "claim_latency_max_ms": round(self.claim_latency_max_ms, 2),
+        }
+
+
+# Métricas globales (una por proceso)
+_metrics = InvitePoolMetrics()
+
+
+def get_invite_pool_stats() -> dict:
+    """Métricas del pool de enlaces VIP."""
+    return _metrics.get_stats()
+
+
+class VIPInvitePoolService:
+    """
+    Service del pool de enlaces de invitación VIP.
+
+    Métodos:
+    - claim(): Reclama un enlace disponible (etapa 3)
+    - replenish(): Crea enlaces hasta llenar el pool (por lotes)
+    - retire_stale(): Revoca enlaces sin reclamar que ya no sirven
+    - maintain(): retire_stale() + replenish() (tarea en segundo plano)
+    """
+
+    def __init__(self, session: AsyncSession, bot: Bot):
+        """
+        Inicializa el service.
+
+        Args:
+            session: Sesión de base de datos
+            bot: Instancia del bot de Telegram
+        """
+        self.session = session
+        self.bot = bot
+        logger.debug("✅ VIPInvitePoolService inicializado")
+
+    @staticmethod
+    def _min_valid_until() -> datetime:
+        """Expiración mínima que debe tener un enlace para entregarse."""
+        return datetime.utcnow() + timedelta(hours=Config.VIP_INVITE_POOL_MIN_VALID_HOURS)
+
+    async def count_available(self, channel_id: str) -> int:
+        """
+        Enlaces disponibles para reclamar en el canal.
+
+        Args:
+            channel_id: ID del canal VIP
+
+        Returns:
+            Cantidad de enlaces sin reclamar con validez suficiente
+        """
+        result = await self.session.execute(
+            select(func.count(VIPInviteLink.id)).where(
+                VIPInviteLink.channel_id == str(channel_id),
+                VIPInviteLink.claimed_by.is_(None),
+                VIPInviteLink.expire_date >= self._min_valid_until()
+            )
+        )
+        return result.scalar_one()
+
+    async def claim(self, channel_id: str, user_id: int) -> Optional[VIPInviteLink]:
+        """
+        Reclama un enlace del pool de forma atómica.
+
+        Entrega primero el que vence antes (siempre con al menos
+        VIP_INVITE_POOL_MIN_VALID_HOURS de validez).
+
+        Args:
+            channel_id: ID del canal VIP
+            user_id: Usuario que recibe el enlace
+
+        Returns:
+            VIPInviteLink reclamado, o None si el pool está vacío
+        """
+        started = time.perf_counter()
+
+        for _ in range(CLAIM_ATTEMPTS):
+            link_id = (await self.session.execute(
+                select(VIPInviteLink.id)
+                .where(
+                    VIPInviteLink.channel_id == str(channel_id),
+                    VIPInviteLink.claimed_by.is_(None),
+                    VIPInviteLink.expire_date >= self._min_valid_until()
+                )
+                .order_by(VIPInviteLink.expire_date)
+                .limit(1)
+            )).scalar_one_or_none()
+
+            if link_id is None:
+                break
+
+            result = await self.session.execute(
+                update(VIPInviteLink)
+                .where(VIPInviteLink.id == link_id, VIPInviteLink.claimed_by.is_(None))
+                .values(claimed_by=user_id, claimed_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1:
+                link = await self.session.get(VIPInviteLink, link_id, populate_existing=True)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                _metrics.record_claim(elapsed_ms)
+                logger.info(
+                    f"🔗 Enlace VIP del pool reclamado por user {user_id} ({elapsed_ms:.1f} ms)"
+                )
+                return link
+
+        _metrics.misses += 1
+        logger.warning(f"⚠️ Pool de enlaces VIP vacío (user {user_id})")
+        return None
+
+    async def replenish(self, channel_id: str) -> int:
+        """
+        Crea enlaces hasta VIP_INVITE_POOL_SIZE (máximo un lote por llamada).
+
+        Se detiene en el primer error (p. ej. rate limit); el siguiente
+        ciclo continúa.
+
+        Args:
+            channel_id: ID del canal VIP
+
+        Returns:
+            Enlaces creados
+        """
+        available = await self.count_available(channel_id)
+        missing = min(
+            Config.VIP_INVITE_POOL_SIZE - available,
+            Config.VIP_INVITE_POOL_BATCH_SIZE
+        )
+
+        created = 0
+        for _ in range(max(0, missing)):
+            expire_date = datetime.utcnow() + timedelta(hours=Config.VIP_INVITE_POOL_LINK_HOURS)
+            try:
+                invite_link = await self.bot.create_chat_invite_link(
+                    chat_id=channel_id,
+                    name="VIP pool",
+                    expire_date=expire_date,
+                    member_limit=1  # Un solo uso
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ No se pudo crear enlace para el pool VIP: {e}")
+                break
+
+            self.session.add(VIPInviteLink(
+                channel_id=str(channel_id),
+                invite_link=invite_link.invite_link,
+                expire_date=expire_date
+            ))
+            created += 1
+
+        if created:
+            await self.session.flush()
+            _metrics.created += created
+            logger.info(f"🔗 Pool VIP: {created} enlace(s) creados")
+
+        return created
+
+    async def retire_stale(self, channel_id: str) -> int:
+        """
+        Revoca (por lotes) enlaces sin reclamar que ya no se entregarían.
+
+        Incluye los que no cubren la validez mínima y los de otro canal
+        (el canal VIP cambió). Borra además los reclamados ya vencidos.
+
+        Args:
+            channel_id: ID del canal VIP actual
+
+        Returns:
+            Enlaces revocados y eliminados del pool
+        """
+        now = datetime.utcnow()
+        stale = (await self.session.execute(
+            select(VIPInviteLink)
+            .where(
+                VIPInviteLink.claimed_by.is_(None),
+                or_(
+                    VIPInviteLink.channel_id != str(channel_id),
+                    VIPInviteLink.expire_date < self._min_valid_until()
+                )
+            )
+            .order_by(VIPInviteLink.expire_date)
+            .limit(Config.VIP_INVITE_POOL_BATCH_SIZE)
+        )).scalars().all()
+
+        for link in stale:
+            if link.expire_date > now:
+                try:
+                    await self.bot.revoke_chat_invite_link(
+                        chat_id=link.channel_id,
+                        invite_link=link.invite_link
+                    )
+                except Exception as e:
+                    logger.debug(f"Enlace {link.id} no revocado (se descarta igual): {e}")
+            await self.session.delete(link)
+
+        await self.session.execute(
+            delete(VIPInviteLink).where(
+                VIPInviteLink.claimed_by.is_not(None),
+                VIPInviteLink.expire_date < now
+            )
+        )
+
+        if stale:
+            await self.session.flush()
+            _metrics.revoked += len(stale)
+            logger.info(f"🗑️ Pool VIP: {len(stale)} enlace(s) revocados")
+
+        return len(stale)
+
+    async def maintain(self, channel_id: str) -> dict:
+        """
+        Ciclo de mantenimiento: revoca vencidos y repone el pool.
+
+        Args:
+            channel_id: ID del canal VIP
+
+        Returns:
+            Dict con retired, created y depth
+        """
+        retired = await self.retire_stale(channel_id)
+        created = await self.replenish(channel_id)
+        depth = await self.count_available(channel_id)
+        _metrics.depth = depth
+
+        return {"retired": retired, "created": created, "depth": depth}
@@ -142,6 +142,46 @@ class PricingSetupStates(StatesGroup):
     waiting_for_price = State()
 
 
+class VIPTokenBulkStates(StatesGroup):
+    """
+    Estados para generar invitaciones VIP en lote.
+
+    Flujo:
+    1. Admin selecciona "Emitir en Lote" y un plan
+    2. Bot guarda plan_id y entra en waiting_for_count
+    3. Admin envía cantidad: "500"
+    4. Bot genera los tokens en una transacción y envía un CSV de deep links
+    5. Bot sale del estado
+
+    Validación:
+    - Cantidad: Número entero entre 1 y SubscriptionService.MAX_BULK_TOKENS
+    - Si no es válido → Error y mantener estado
+    """
+
+    # Esperando cantidad de tokens a generar
+    waiting_for_count = State()
+
+
+class BulkOperationStates(StatesGroup):
+    """
+    Estados para operaciones masivas de admin.
+
+    Flujo:
+    1. Admin elige operación (y días o rol) en /bulk
+    2. Admin elige "Enviar lista de IDs"
+    3. Bot entra en waiting_for_ids
+    4. Admin envía los IDs como texto o archivo .txt/.csv
+    5. Bot crea el job en borrador y pide confirmación
+
+    Validación:
+    - Al menos un ID numérico, máximo Config.BULK_MAX_TARGETS
+    - Si no es válido → Error y mantener estado
+    """
+
+    # Esperando lista de IDs (texto o documento)
+    waiting_for_ids = State()
+
+
 class ContentPackageStates(StatesGroup):
     """
     Estados para creación de paquetes de contenido.
@@ -179,6 +219,7 @@ class ContentPackageStates(StatesGroup):
     - waiting_for_price: Esperando precio (número o /skip) - CREACIÓN
     - waiting_for_description: Esperando descripción (texto o /skip) - CREACIÓN
     - waiting_for_edit: Esperando nuevo valor de campo (inline prompt) - EDICIÓN
+    - waiting_for_search: Esperando término de búsqueda - BÚSQUEDA
     """
 
     # ===== CREACIÓN (4-step wizard) =====
@@ -200,6 +241,11 @@ class ContentPackageStates(StatesGroup):
     # Para editar campos de paquetes existentes (name, price, description)
     waiting_for_edit = State()  # For inline prompt editing
 
+    # ===== BÚSQUEDA =====
+
+    # Esperando término de búsqueda full-text
+    waiting_for_search = State()
+
 
 class UserManagementStates(StatesGroup):
     """
@@ -11,6 +11,7 @@ from bot.utils.callback_parser import (
     parse_user_expel_callback,
     parse_users_list_callback,
 )
+from bot.utils.callback_routing import CallbackArgs, install_callback_routing
 
 __all__ = [
     "CallbackParser",
@@ -19,4 +20,6 @@ __all__ = [
     "parse_user_role_callback",
     "parse_user_expel_callback",
     "parse_users_list_callback",
+    "CallbackArgs",
+    "install_callback_routing",
 ]
@@ -0,0 +1,356 @@
+"""
+Callback Routing - Indexed dispatch of CallbackQuery by callback data.
+
+aiogram checks every callback handler of every router in order, evaluating
+its filters until one matches. With 100+ handlers keyed on
+`F.data == "..."` / `F.data.startswith("...")` that is dozens of MagicFilter
+resolutions per click.
+
+install_callback_routing() walks the router tree once at startup and, for
+each router, indexes its callback handlers by the callback data they accept:
+
+- Exact patterns (`F.data == "admin:main"`) in a hash table
+- Prefix patterns (`F.data.startswith("admin:user:view:")`) in a prefix trie
+- Anything else (no data filter, lambdas) is kept as "always check"
+
+On each CallbackQuery only the candidate handlers are checked (in their
+original registration order, with all their filters), so matching semantics
+and router middlewares are unchanged. The matched route is passed to the
+handler as `callback_args` (pre-parsed, typed segments after the pattern).
+
+Overlapping patterns (a handler that can never run because an earlier,
+unconditional prefix already captures its data) are logged at install time.
+"""
+import logging
+import operator
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from aiogram import Dispatcher, Router
+from aiogram.dispatcher.event.bases import UNHANDLED, SkipHandler
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.dispatcher.event.telegram import TelegramEventObserver
+from magic_filter import MagicFilter
+from magic_filter.operations import CallOperation, ComparatorOperation, GetAttributeOperation
+
+logger = logging.getLogger(__name__)
+
+EXACT = "exact"
+PREFIX = "prefix"
+
+
+@dataclass(frozen=True)
+class CallbackArgs:
+    """
+    Pre-parsed callback data for the route that matched.
+
+    Attributes:
+        pattern: Pattern that matched (exact value or prefix)
+        parts: Segments after the pattern split by ':' (digits converted to int)
+        raw: Original callback data
+
+    Examples:
+        >>> args = CallbackArgs.parse("admin:interests:page:2:pending", "admin:interests:page:")
+        >>> args.parts
+        (2, 'pending')
+        >>> args.get_int(0), args.get_str(1)
+        (2, 'pending')
+    """
+    pattern: str
+    parts: Tuple[Union[int, str], ...]
+    raw: str
+
+    @classmethod
+    def parse(cls, data: str, pattern: str) -> "CallbackArgs":
+        """
+        Parse the segments of `data` that follow `pattern`.
+
+        Args:
+            data: Raw callback data
+            pattern: Matched pattern (prefix or exact value)
+
+        Returns:
+            CallbackArgs with typed segments
+        """
+        rest = data[len(pattern):] if data.startswith(pattern) else data
+        parts = tuple(
+            int(part) if part.lstrip("-").isdigit() else part
+            for part in rest.split(":")
+            if part
+        )
+        return cls(pattern=pattern, parts=parts, raw=data)
+
+    def get_int(self, index: int, default: Optional[int] = None) -> Optional[int]:
+        """Segment at `index` as int (default if missing or not numeric)."""
+        if index < len(self.parts) and isinstance(self.parts[index], int):
+            return self.parts[index]
+        return default
+
+    def get_str(self, index: int, default: Optional[str] = None) -> Optional[str]:
+        """Segment at `index` as str (default if missing)."""
+        if index < len(self.parts):
+            return str(self.parts[index])
+        return default
+
+
+def extract_data_pattern(handler: HandlerObject) -> Optional[Tuple[str, str]]:
+    """
+    Find the callback data pattern a handler filters on.
+
+    Recognizes `F.data == "value"` and `F.data.startswith("prefix")` in any
+    position of the handler filters (all filters are ANDed).
+
+    Args:
+        handler: aiogram HandlerObject
+
+    Returns:
+        (EXACT | PREFIX, pattern) or None if the handler is not indexable
+    """
+    for filter_object in handler.filters or []:
+        magic = filter_object.magic or filter_object.callback
+        if not isinstance(magic, MagicFilter):
+            continue
+
+        operations = magic._operations
+        if not operations or not isinstance(operations[0], GetAttributeOperation):
+            continue
+        if operations[0].name != "data":
+            continue
+
+        if (
+            len(operations) == 2
+            and isinstance(operations[1], ComparatorOperation)
+            and operations[1].comparator is operator.eq
+            and isinstance(operations[1].right, str)
+        ):
+            return EXACT, operations[1].right
+
+        if (
+            len(operations) == 3
+            and isinstance(operations[1], GetAttributeOperation)
+            and operations[1].name == "startswith"
+            and isinstance(operations[2], CallOperation)
+            and len(operations[2].args) == 1
+            and isinstance(operations[2].args[0], str)
+            and not operations[2].kwargs
+        ):
+            return PREFIX, operations[2].args[0]
+
+    return None
+
+
+def _handler_name(handler: HandlerObject) -> str:
+    """Readable handler name for logs."""
+    callback = handler.callback
+    return f"{getattr(callback, '__module__', '?')}.{getattr(callback, '__qualname__', repr(callback))}"
+
+
+class CallbackIndex:
+    """
+    Index of one router's callback handlers.
+
+    Replaces the observer's linear trigger: only handlers whose pattern can
+    match the callback data (plus non-indexable ones) are checked.
+    """
+
+    def __init__(self, observer: TelegramEventObserver):
+        """
+        Build the index for an observer.
+
+        Args:
+            observer: Router.callback_query observer
+        """
+        self.observer = observer
+        self.lookups = 0
+        self.candidates_checked = 0
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """(Re)index the observer handlers (called when handlers change)."""
+        self._handlers: List[HandlerObject] = list(self.observer.handlers)
+        self._exact: Dict[str, List[int]] = {}
+        self._trie: Dict[str, Any] = {}
+        self._unindexed: List[int] = []
+        self._patterns: List[Optional[Tuple[str, str]]] = []
+
+        for position, handler in enumerate(self._handlers):
+            pattern = extract_data_pattern(handler)
+            self._patterns.append(pattern)
+
+            if pattern is None:
+                self._unindexed.append(position)
+            elif pattern[0] == EXACT:
+                self._exact.setdefault(pattern[1], []).append(position)
+            else:
+                node = self._trie
+                for char in pattern[1]:
+                    node = node.setdefault(char, {})
+                node.setdefault("", []).append(position)
+
+    @property
+    def size(self) -> int:
+        """Handlers covered by the index."""
+        return len(self._handlers)
+
+    @property
+    def indexed(self) -> int:
+        """Handlers reachable through the hash table or trie."""
+        return len(self._handlers) - len(self._unindexed)
+
+    def candidates(self, data: Optional[str]) -> List[Tuple[int, Optional[str]]]:
+        """
+        Handlers that may accept `data`, in registration order.
+
+        Args:
+            data: Callback data (None for callbacks without data)
+
+        Returns:
+            List of (handler position, matched pattern or None)
+        """
+        found: List[Tuple[int, Optional[str]]] = [(i, None) for i in self._unindexed]
+
+        if data is not None:
+            for position in self._exact.get(data, ()):
+                found.append((position, data))
+
+            node = self._trie
+            for length, char in enumerate(data):
+                for position in node.get("", ()):
+                    found.append((position, data[:length]))
+                node = node.get(char)
+                if node is None:
+                    break
+            else:
+                for position in node.get("", ()):
+                    found.append((position, data))
+
+        if len(found) > 1:
+            found.sort()
+        return found
+
+    async def trigger(self, event: Any, **kwargs: Any) -> Any:
+        """
+        Same contract as TelegramEventObserver.trigger, over candidates only.
+
+        Every candidate still runs its full filter check, so state filters,
+        SkipHandler and router middlewares behave exactly as before.
+        """
+        observer = self.observer
+        if len(observer.handlers) != len(self._handlers):
+            self.rebuild()
+
+        self.lookups += 1
+        for position, pattern in self.candidates(getattr(event, "data", None)):
+            handler = self._handlers[position]
+            self.candidates_checked += 1
+            kwargs["handler"] = handler
+            result, data = await handler.check(event, **kwargs)
+            if result:
+                kwargs.update(data)
+                if pattern is not None:
+                    kwargs["callback_args"] = CallbackArgs.parse(event.data, pattern)
+                try:
+                    wrapped_inner = observer.outer_middleware.wrap_middlewares(
+                        observer._resolve_middlewares(),
+                        handler.call,
+                    )
+                    return await wrapped_inner(event, kwargs)
+                except SkipHandler:
+                    kwargs.pop("callback_args", None)
+                    continue
+
+        return UNHANDLED
+
+
+@dataclass
+class _Route:
+    """Registered pattern with its origin (for overlap detection)."""
+    kind: str
+    pattern: str
+    name: str
+    unconditional: bool
+
+
+def find_overlaps(routes: List[_Route]) -> List[str]:
+    """
+    Detect handlers shadowed by earlier patterns.
+
+    A route is shadowed when an earlier route without extra filters
+    accepts every callback data the later one accepts.
+
+    Args:
+        routes: Routes in propagation order
+
+    Returns:
+        Human readable warnings
+    """
+    warnings = []
+    for later_index, later in enumerate(routes):
+        for earlier in routes[:later_index]:
+            if not earlier.unconditional:
+                continue
+            if earlier.kind == EXACT:
+                shadowed = later.kind == EXACT and later.pattern == earlier.pattern
+            else:
+                shadowed = later.pattern.startswith(earlier.pattern)
+            if shadowed:
+                warnings.append(
+                    f"'{later.pattern}' ({later.name}) queda eclipsado por "
+                    f"'{earlier.pattern}' ({earlier.name})"
+                )
+                break
+    return warnings
+
+
+def install_callback_routing(dispatcher: Union[Dispatcher, Router]) -> Dict[str, int]:
+    """
+    Index the callback handlers of every router in the tree.
+
+    Call once after all routers are included. Routers that gain handlers
+    later are re-indexed automatically on their next callback.
+
+    Args:
+        dispatcher: Root Dispatcher (or Router)
+
+    Returns:
+        Dict with routers, handlers, indexed and overlaps counts
+    """
+    routes: List[_Route] = []
+    routers = handlers = indexed = 0
+
+    for router in dispatcher.chain_tail:
+        observer = router.callback_query
+        if not observer.handlers:
+            continue
+
+        index = CallbackIndex(observer)
+        observer.trigger = index.trigger
+        observer.callback_index = index
+
+        routers += 1
+        handlers += index.size
+        indexed += index.indexed
+
+        for handler, pattern in zip(index._handlers, index._patterns):
+            if pattern is not None:
+                routes.append(_Route(
+                    kind=pattern[0],
+                    pattern=pattern[1],
+                    name=_handler_name(handler),
+                    unconditional=len(handler.filters or []) == 1,
+                ))
+
+    overlaps = find_overlaps(routes)
+    for warning in overlaps:
+        logger.warning(f"⚠️ Callback solapado: {warning}")
+
+    logger.info(
+        f"🧭 Ruteo de callbacks indexado: {indexed}/{handlers} handlers "
+        f"en {routers} routers ({len(overlaps)} solapamientos)"
+    )
+    return {
+        "routers": routers,
+        "handlers": handlers,
+        "indexed": indexed,
+        "overlaps": len(overlaps),
+    }
@@ -0,0 +1,185 @@
+"""
+Edit Cache - Omite edit_text cuyo contenido ya está en el mensaje.
+
+Los handlers de menús re-renderizan y llaman a edit_text en cada click
+(refrescar stats, volver al mismo submenú...). Si el texto y el teclado no
+cambiaron, Telegram responde "message is not modified": un round trip
+desperdiciado que además consume rate limit.
+
+edit_text_if_changed() guarda una huella (hash de texto + markup + opciones)
+por (chat_id, message_id) en un LRU acotado y omite la llamada cuando la
+huella coincide. Para no omitir por error si el mensaje se editó por otra
+vía, la huella solo es válida mientras edit_date del mensaje sea el que
+Telegram devolvió tras nuestra última edición.
+
+Uso:
+    from bot.utils.edit_cache import edit_text_if_changed
+
+    await edit_text_if_changed(callback.message, text, reply_markup=keyboard, parse_mode="HTML")
+    await callback.answer()
+"""
+import logging
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from aiogram.types import Message
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Cache global (uno por proceso)
+_edit_cache: Optional["EditFingerprintCache"] = None
+
+
+def render_fingerprint(text: str, options: dict) -> int:
+    """
+    Huella del contenido que se enviaría en edit_text.
+
+    Args:
+        text: Texto del mensaje
+        options: Resto de argumentos de edit_text (reply_markup, parse_mode...)
+
+    Returns:
+        Hash estable dentro del proceso
+    """
+    parts = [text]
+    for key in sorted(options):
+        value = options[key]
+        if hasattr(value, "model_dump_json"):
+            value = value.model_dump_json(exclude_none=True)
+        parts.append(f"{key}={value!r}")
+    return hash(tuple(parts))
+
+
+class EditFingerprintCache:
+    """
+    LRU de huellas de render por mensaje.
+
+    Cada entrada: (chat_id, message_id) → (huella, edit_date observado).
+    """
+
+    def __init__(self, max_messages: int = 5000):
+        """
+        Inicializa el cache.
+
+        Args:
+            max_messages: Mensajes recordados (se desaloja el menos reciente)
+        """
+        self.max_messages = max(1, max_messages)
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], Tuple[int, Any]]" = OrderedDict()
+
+        self.edits = 0
+        self.skipped = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(message: Message) -> Tuple[Hashable, Hashable]:
+        return message.chat.id, message.message_id
+
+    def is_current(self, message: Message, fingerprint: int) -> bool:
+        """
+        True si el mensaje ya muestra exactamente ese render.
+
+        Args:
+            message: Mensaje actual (p. ej. callback.message)
+            fingerprint: Huella del render nuevo
+        """
+        entry = self._entries.get(self._key(message))
+        if entry is None:
+            return False
+        stored, edit_date = entry
+        return stored == fingerprint and edit_date == message.edit_date
+
+    def remember(self, message: Message, fingerprint: int, edit_date: Any) -> None:
+        """
+        Registra el render vigente de un mensaje.
+
+        Args:
+            message: Mensaje editado
+            fingerprint: Huella del render
+            edit_date: edit_date que tendrá el mensaje en el próximo update
+        """
+        key = self._key(message)
+        self._entries[key] = (fingerprint, edit_date)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_messages:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def forget(self, message: Message) -> None:
+        """Descarta la huella de un mensaje (p. ej. tras un error)."""
+        self._entries.pop(self._key(message), None)
+
+    def get_stats(self) -> dict:
+        """
+        Métricas del cache.
+
+        Returns:
+            Dict con messages, max_messages, edits, skipped, not_modified,
+            evictions y avoided_ratio (omitidas / intentos)
+        """
+        attempts = self.edits + self.skipped + self.not_modified
+        return {
+            "messages": len(self._entries),
+            "max_messages": self.max_messages,
+            "edits": self.edits,
+            "skipped": self.skipped,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "avoided_ratio": round(self.skipped / attempts, 3) if attempts else 0.0,
+        }
+
+
+def get_edit_cache() -> EditFingerprintCache:
+    """Cache global de huellas (creado en el primer uso)."""
+    global _edit_cache
+
+    if _edit_cache is None:
+        _edit_cache = EditFingerprintCache(max_messages=Config.EDIT_CACHE_MAX_MESSAGES)
+
+    return _edit_cache
+
+
+def get_edit_cache_stats() -> dict:
+    """Métricas del cache global de huellas."""
+    return get_edit_cache().get_stats()
+
+
+async def edit_text_if_changed(message: Message, text: str, **kwargs: Any) -> bool:
+    """
+    Edita el mensaje solo si el render cambió.
+
+    "message is not modified" se absorbe (y se recuerda la huella); el
+    resto de errores se propagan como con message.edit_text.
+
+    Args:
+        message: Mensaje a editar (callback.message)
+        text: Texto nuevo
+        **kwargs: Argumentos de edit_text (reply_markup, parse_mode...)
+
+    Returns:
+        True si se llamó a la Bot API y editó el mensaje, False si se omitió
+    """
+    cache = get_edit_cache()
+    fingerprint = render_fingerprint(text, kwargs)
+
+    if cache.is_current(message, fingerprint):
+        cache.skipped += 1
+        logger.debug(f"♻️ edit_text omitido (sin cambios) en mensaje {message.message_id}")
+        return False
+
+    try:
+        result = await message.edit_text(text=text, **kwargs)
+    except Exception as e:
+        if "message is not modified" in str(e):
+            cache.not_modified += 1
+            cache.remember(message, fingerprint, message.edit_date)
+            return False
+        cache.forget(message)
+        raise
+
+    cache.edits += 1
+    cache.remember(message, fingerprint, getattr(result, "edit_date", None))
+    return True
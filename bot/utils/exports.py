@@ -0,0 +1,121 @@
+"""
+Exports - Escritura de documentos exportables (CSV) para enviar por Telegram.
+
+Las filas se consumen de un iterable (o async iterable, p. ej. los
+recorridos de bot/database/streaming.py) y se escriben directamente a un
+archivo temporal, sin construir el documento completo en memoria.
+write_csv_gzip_tempfile_async() comprime a medida que escribe (.csv.gz),
+para exportes grandes que no caben en el límite de documentos de Telegram.
+El llamador envía el archivo (FSInputFile) y lo elimina después.
+"""
+import csv
+import gzip
+import os
+import tempfile
+from typing import Any, AsyncIterable, Iterable, Sequence, Tuple
+
+
+def write_csv_tempfile(
+    header: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    prefix: str = "export_"
+) -> Tuple[str, int]:
+    """
+    Escribe filas CSV (UTF-8) en un archivo temporal.
+
+    Args:
+        header: Nombres de columnas
+        rows: Iterable de filas (puede ser un generador)
+        prefix: Prefijo del nombre del archivo temporal
+
+    Returns:
+        Tuple (ruta del archivo, filas escritas sin contar el header)
+
+    Examples:
+        >>> path, count = write_csv_tempfile(["token"], (["ABC"],))
+        >>> count
+        1
+    """
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=".csv")
+    count = 0
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+    except Exception:
+        os.remove(path)
+        raise
+
+    return path, count
+
+
+async def write_csv_tempfile_async(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    prefix: str = "export_"
+) -> Tuple[str, int]:
+    """
+    Igual que write_csv_tempfile() para filas de un async iterable.
+
+    Args:
+        header: Nombres de columnas
+        rows: Async iterable de filas (p. ej. stream_partitions() de la BD)
+        prefix: Prefijo del nombre del archivo temporal
+
+    Returns:
+        Tuple (ruta del archivo, filas escritas sin contar el header)
+    """
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=".csv")
+    count = 0
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            async for row in rows:
+                writer.writerow(row)
+                count += 1
+    except Exception:
+        os.remove(path)
+        raise
+
+    return path, count
+
+
+async def write_csv_gzip_tempfile_async(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    prefix: str = "export_",
+    compresslevel: int = 6
+) -> Tuple[str, int]:
+    """
+    Igual que write_csv_tempfile_async() pero comprimido con gzip (.csv.gz).
+
+    Args:
+        header: Nombres de columnas
+        rows: Async iterable de filas
+        prefix: Prefijo del nombre del archivo temporal
+        compresslevel: Nivel de gzip (1 = rápido, 9 = más pequeño)
+
+    Returns:
+        Tuple (ruta del archivo, filas escritas sin contar el header)
+    """
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=".csv.gz")
+    os.close(fd)
+    count = 0
+    try:
+        with gzip.open(
+            path, "wt", newline="", encoding="utf-8", compresslevel=compresslevel
+        ) as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            async for row in rows:
+                writer.writerow(row)
+                count += 1
+    except Exception:
+        os.remove(path)
+        raise
+
+    return path, count
@@ -5,13 +5,58 @@ Funciones:
 - create_inline_keyboard: Crea teclado a partir de estructura de botones
 - create_menu_navigation: Crea filas de navegación estándar (Volver/Salir)
 - create_content_with_navigation: Combina contenido con navegación
+- static_keyboard: Memoiza keyboards que no dependen de parámetros
 
 Centraliza la creación de keyboards para consistencia visual y navegación.
+
+Los keyboards memoizados son compartidos por todo el proceso: tratarlos
+como inmutables (no modificar inline_keyboard del objeto retornado).
 """
-from typing import List, Optional
+import functools
+from typing import Callable, List, Optional
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 
+def static_keyboard(factory: Callable[..., InlineKeyboardMarkup]) -> Callable[..., InlineKeyboardMarkup]:
+    """
+    Memoiza un keyboard estático (se construye una sola vez por proceso).
+
+    Sirve para funciones sin argumentos y para métodos de providers
+    stateless (el argumento self se ignora: todas las instancias comparten
+    el mismo keyboard).
+
+    Ejemplo:
+        @static_keyboard
+        def back_keyboard() -> InlineKeyboardMarkup:
+            return create_inline_keyboard([[{"text": "🔙", "callback_data": "back"}]])
+
+    Returns:
+        Función que retorna siempre la misma instancia de InlineKeyboardMarkup
+        (con cache_clear() para tests y benchmarks)
+    """
+    cached: List[InlineKeyboardMarkup] = []
+
+    @functools.wraps(factory)
+    def wrapper(*args) -> InlineKeyboardMarkup:
+        if not cached:
+            cached.append(factory(*args))
+        return cached[0]
+
+    wrapper.cache_clear = cached.clear
+    _static_keyboards.append(wrapper)
+    return wrapper
+
+
+# Registro de keyboards memoizados (para precalentar o limpiar en bloque)
+_static_keyboards: List[Callable[..., InlineKeyboardMarkup]] = []
+
+
+def clear_static_keyboards() -> None:
+    """Descarta todos los keyboards memoizados (se reconstruyen al usarse)."""
+    for keyboard in _static_keyboards:
+        keyboard.cache_clear()
+
+
 def create_inline_keyboard(
     buttons: List[List[dict]],
     **kwargs
@@ -61,6 +106,7 @@ def create_inline_keyboard(
     return InlineKeyboardMarkup(inline_keyboard=inline_keyboard, **kwargs)
 
 
+@static_keyboard
 def admin_main_menu_keyboard() -> InlineKeyboardMarkup:
     """
     Keyboard del menú principal de admin.
@@ -71,6 +117,7 @@ def admin_main_menu_keyboard() -> InlineKeyboardMarkup:
     - Vestíbulo de Acceso
     - Calibración del Reino
     - Planes de Suscripción
+    - Exportar Datos
     - Observaciones del Reino
 
     Returns:
@@ -82,10 +129,12 @@ def admin_main_menu_keyboard() -> InlineKeyboardMarkup:
         [{"text": "📺 Vestíbulo de Acceso", "callback_data": "admin:free"}],
         [{"text": "⚙️ Calibración del Reino", "callback_data": "admin:config"}],
         [{"text": "💰 Planes de Suscripción", "callback_data": "admin:pricing"}],
+        [{"text": "📤 Exportar Datos", "callback_data": "admin:export"}],
         [{"text": "📈 Observaciones del Reino", "callback_data": "admin:stats"}],
     ])
 
 
+@static_keyboard
 def back_to_main_menu_keyboard() -> InlineKeyboardMarkup:
     """
     Keyboard con solo botón "Volver al menú principal".
@@ -100,6 +149,7 @@ def back_to_main_menu_keyboard() -> InlineKeyboardMarkup:
     ])
 
 
+@static_keyboard
 def stats_menu_keyboard() -> InlineKeyboardMarkup:
     """
     Keyboard del menú de estadísticas.
@@ -145,6 +195,7 @@ def yes_no_keyboard(
     ])
 
 
+@static_keyboard
 def config_menu_keyboard() -> InlineKeyboardMarkup:
     """
     Keyboard del menú de configuración.
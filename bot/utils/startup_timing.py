@@ -0,0 +1,195 @@
+"""
+Startup Timing - Desglose de tiempos por fase del arranque.
+
+Uso:
+    timer = StartupTimer()
+    with timer.phase("migraciones"):
+        await run_migrations_if_needed()
+    with timer.phase("base de datos"):
+        await init_db()
+    timer.log_summary()
+
+Fases con dependencias (las independientes corren en paralelo):
+    results = await timer.run_graph({
+        "migraciones": ((), lambda r: run_migrations_if_needed()),
+        "base de datos": (("migraciones",), lambda r: init_db(skip_create_all=r["migraciones"])),
+        "health API": ((), lambda r: start_health_server()),
+    })
+
+Costo de importación por módulo (python -X importtime, usado por
+python main.py --measure-startup):
+    for module, self_us, cumulative_us in measure_import_costs("main", "bot.handlers")[:10]:
+        ...
+
+Salida en logs:
+    ⏱️ Arranque en 0.84s:
+       migraciones           0.12s  14%
+       base de datos         0.31s  37%
+       ...
+"""
+import asyncio
+import logging
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fase del grafo: (dependencias, fn(resultados de fases previas) -> awaitable)
+PhaseSpec = Tuple[Sequence[str], Callable[[Dict[str, Any]], Awaitable[Any]]]
+
+
+class StartupTimer:
+    """Acumula la duración de cada fase del arranque."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Mide una fase (se registra aunque falle).
+
+        Args:
+            name: Nombre de la fase para el resumen
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    async def run_graph(self, phases: Dict[str, PhaseSpec]) -> Dict[str, Any]:
+        """
+        Ejecuta fases async respetando dependencias.
+
+        Cada fase arranca en cuanto terminan sus dependencias; las
+        independientes corren en paralelo. Cada fase se mide con phase().
+
+        Args:
+            phases: nombre → (dependencias, fn). Las dependencias deben
+                declararse antes que la fase que las usa.
+
+        Returns:
+            Resultado de cada fase por nombre
+
+        Raises:
+            La primera excepción de una fase (las demás se cancelan)
+        """
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(name: str, deps: Sequence[str], fn) -> Any:
+            if deps:
+                await asyncio.gather(*(tasks[dep] for dep in deps))
+            with self.phase(name):
+                results[name] = await fn(results)
+            return results[name]
+
+        declared = set()
+        for name, (deps, _) in phases.items():
+            missing = [dep for dep in deps if dep not in declared]
+            if missing:
+                raise ValueError(f"Fase '{name}' depende de fases no declaradas: {missing}")
+            declared.add(name)
+
+        for name, (deps, fn) in phases.items():
+            tasks[name] = asyncio.ensure_future(run(name, deps, fn))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return results
+
+    @property
+    def total(self) -> float:
+        """Segundos desde la creación del timer."""
+        return time.perf_counter() - self.started_at
+
+    def summary(self) -> str:
+        """
+        Resumen legible: una línea por fase con segundos y porcentaje.
+
+        Con fases en paralelo la suma de porcentajes puede superar 100%.
+
+        Returns:
+            Texto multilínea del desglose
+        """
+        total = self.total
+        lines = [f"⏱️ Arranque en {total:.2f}s:"]
+        for name, elapsed in self.phases:
+            share = elapsed / total * 100 if total else 0.0
+            lines.append(f"   {name:<24} {elapsed:>6.2f}s {share:>4.0f}%")
+        return "\n".join(lines)
+
+    def as_dict(self) -> dict:
+        """Fases y total en segundos (para métricas / --measure-startup)."""
+        return {
+            "total": round(self.total, 4),
+            "phases": {name: round(elapsed, 4) for name, elapsed in self.phases},
+        }
+
+    def log_summary(self) -> None:
+        """Escribe el resumen en el log (INFO)."""
+        logger.info(self.summary())
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """
+    Parsea la salida de `python -X importtime`.
+
+    Formato de cada línea:
+        import time: self [us] | cumulative | imported package
+
+    Args:
+        output: stderr del intérprete con -X importtime
+
+    Returns:
+        (módulo, propio_us, acumulado_us) ordenado por acumulado descendente
+    """
+    costs = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # Encabezado
+        costs.append((parts[2].strip(), self_us, cumulative_us))
+
+    costs.sort(key=lambda cost: cost[2], reverse=True)
+    return costs
+
+
+def measure_import_costs(*modules: str, timeout: float = 60.0) -> List[Tuple[str, int, int]]:
+    """
+    Importa `modules` en un intérprete nuevo con -X importtime.
+
+    Un subproceso evita que los módulos ya cargados en este proceso
+    oculten su costo.
+
+    Args:
+        modules: Módulos a importar (ej: "main", "bot.handlers")
+        timeout: Segundos máximos del subproceso
+
+    Returns:
+        Ver parse_importtime()
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    return parse_importtime(result.stderr)
@@ -116,6 +116,166 @@ class Config:
         os.getenv("PROCESS_FREE_QUEUE_MINUTES", "1")
     )
 
+    # Write-behind de perfiles de usuario (segundos). 0 = escribir en el acto
+    # Con N > 0, cambios de username/nombre se acumulan y se escriben en lote
+    USER_PROFILE_FLUSH_SECONDS: int = int(
+        os.getenv("USER_PROFILE_FLUSH_SECONDS", "0")
+    )
+
+    # ===== SESSION HISTORY (variantes de mensajes) =====
+    # Historial en memoria compartido por todo el proceso
+    SESSION_HISTORY_TTL_SECONDS: int = int(
+        os.getenv("SESSION_HISTORY_TTL_SECONDS", "300")
+    )
+    SESSION_HISTORY_MAX_ENTRIES: int = int(
+        os.getenv("SESSION_HISTORY_MAX_ENTRIES", "5")
+    )
+
+    # Tope global de usuarios en memoria (se desaloja el menos reciente)
+    SESSION_HISTORY_MAX_USERS: int = int(
+        os.getenv("SESSION_HISTORY_MAX_USERS", "10000")
+    )
+
+    # Intervalo del barrido de sesiones expiradas (segundos)
+    SESSION_HISTORY_SWEEP_SECONDS: int = int(
+        os.getenv("SESSION_HISTORY_SWEEP_SECONDS", "60")
+    )
+
+    # Snapshot JSON para conservar el historial entre reinicios ("" = desactivado)
+    SESSION_HISTORY_SNAPSHOT_PATH: str = os.getenv("SESSION_HISTORY_SNAPSHOT_PATH", "")
+
+    # ===== EDIT CACHE (huellas de mensajes renderizados) =====
+    # Mensajes (chat_id, message_id) recordados para omitir edit_text idénticos
+    EDIT_CACHE_MAX_MESSAGES: int = int(
+        os.getenv("EDIT_CACHE_MAX_MESSAGES", "5000")
+    )
+
+    # ===== CHAT METADATA (info de canales cacheada) =====
+    # Vigencia de get_chat (título, etc.) y del conteo de miembros (segundos)
+    CHAT_METADATA_TTL_SECONDS: int = int(
+        os.getenv("CHAT_METADATA_TTL_SECONDS", "3600")
+    )
+    CHAT_MEMBER_COUNT_TTL_SECONDS: int = int(
+        os.getenv("CHAT_MEMBER_COUNT_TTL_SECONDS", "300")
+    )
+
+    # Intervalo del refresh en segundo plano de los canales configurados
+    CHAT_METADATA_REFRESH_SECONDS: int = int(
+        os.getenv("CHAT_METADATA_REFRESH_SECONDS", "120")
+    )
+
+    # ===== SINGLEFLIGHT (lecturas Bot API deduplicadas) =====
+    # Métodos de solo lectura cuyas llamadas idénticas en vuelo se combinan
+    # (nombres de la Bot API separados por comas; vacío desactiva)
+    SINGLEFLIGHT_METHODS: frozenset = frozenset(
+        method.strip()
+        for method in os.getenv(
+            "SINGLEFLIGHT_METHODS",
+            "getMe,getChat,getChatMember,getChatMemberCount,getChatAdministrators"
+        ).split(",")
+        if method.strip()
+    )
+
+    # ===== VIP INVITE POOL (enlaces pre-generados para la etapa 3) =====
+    # Enlaces disponibles a mantener por canal VIP (0 desactiva el pool)
+    VIP_INVITE_POOL_SIZE: int = int(os.getenv("VIP_INVITE_POOL_SIZE", "10"))
+
+    # Máximo de enlaces creados/revocados por ciclo de mantenimiento
+    VIP_INVITE_POOL_BATCH_SIZE: int = int(os.getenv("VIP_INVITE_POOL_BATCH_SIZE", "5"))
+
+    # Validez de cada enlace al crearse y validez mínima al reclamarlo (horas)
+    VIP_INVITE_POOL_LINK_HOURS: int = int(os.getenv("VIP_INVITE_POOL_LINK_HOURS", "48"))
+    VIP_INVITE_POOL_MIN_VALID_HOURS: int = int(
+        os.getenv("VIP_INVITE_POOL_MIN_VALID_HOURS", "24")
+    )
+
+    # Intervalo de mantenimiento del pool (minutos)
+    VIP_INVITE_POOL_REFRESH_MINUTES: int = int(
+        os.getenv("VIP_INVITE_POOL_REFRESH_MINUTES", "5")
+    )
+
+    # ===== DATA RETENTION (limpieza por lotes de tablas que crecen) =====
+    # Días a conservar por tabla (0 desactiva la política)
+    RETENTION_FREE_REQUEST_DAYS: int = int(os.getenv("RETENTION_FREE_REQUEST_DAYS", "30"))
+    RETENTION_ATTENDED_INTEREST_DAYS: int = int(
+        os.getenv("RETENTION_ATTENDED_INTEREST_DAYS", "30")
+    )
+    RETENTION_ROLE_LOG_DAYS: int = int(os.getenv("RETENTION_ROLE_LOG_DAYS", "180"))
+    RETENTION_EXPIRED_VIP_DAYS: int = int(os.getenv("RETENTION_EXPIRED_VIP_DAYS", "365"))
+    RETENTION_TOKEN_DAYS: int = int(os.getenv("RETENTION_TOKEN_DAYS", "90"))
+
+    # Filas por transacción y pausa entre lotes (no retener el lock de SQLite)
+    RETENTION_CHUNK_SIZE: int = int(os.getenv("RETENTION_CHUNK_SIZE", "500"))
+    RETENTION_CHUNK_PAUSE_MS: int = int(os.getenv("RETENTION_CHUNK_PAUSE_MS", "100"))
+
+    # Solo reportar cuántas filas se eliminarían (no borra nada)
+    RETENTION_DRY_RUN: bool = os.getenv("RETENTION_DRY_RUN", "").lower() in ("true", "1", "yes")
+
+    # ===== SQLITE MAINTENANCE (checkpoint WAL, ANALYZE, incremental vacuum) =====
+    # Hora UTC del mantenimiento diario (-1 lo desactiva). Corre a los :30,
+    # después de la limpieza de datos de las 3:00
+    DB_MAINTENANCE_HOUR: int = int(os.getenv("DB_MAINTENANCE_HOUR", "3"))
+
+    # Páginas libres a devolver por ejecución (0 = todas)
+    DB_MAINTENANCE_VACUUM_PAGES: int = int(os.getenv("DB_MAINTENANCE_VACUUM_PAGES", "0"))
+
+    # ===== BACKUPS (respaldo online + rotación) =====
+    # Directorio de respaldos comprimidos
+    BACKUP_DIR: str = os.getenv("BACKUP_DIR", "backups")
+
+    # Hora UTC del respaldo diario (-1 lo desactiva). Corre a las :00,
+    # después del mantenimiento de SQLite
+    BACKUP_HOUR: int = int(os.getenv("BACKUP_HOUR", "4"))
+
+    # Rotación: respaldos a conservar y antigüedad máxima (0 = sin límite)
+    BACKUP_KEEP: int = int(os.getenv("BACKUP_KEEP", "7"))
+    BACKUP_RETENTION_DAYS: int = int(os.getenv("BACKUP_RETENTION_DAYS", "30"))
+
+    # SQLite: páginas copiadas por paso y pausa entre pasos (ms)
+    BACKUP_PAGES_PER_STEP: int = int(os.getenv("BACKUP_PAGES_PER_STEP", "1024"))
+    BACKUP_STEP_SLEEP_MS: int = int(os.getenv("BACKUP_STEP_SLEEP_MS", "5"))
+
+    # ===== EXPORTS (CSV comprimido desde el panel admin) =====
+    # Filas por lote del cursor de la BD durante un exporte
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # Segundos mínimos entre ediciones del mensaje de progreso
+    EXPORT_PROGRESS_INTERVAL_SECONDS: int = int(os.getenv("EXPORT_PROGRESS_INTERVAL_SECONDS", "3"))
+
+    # Nivel de gzip del archivo exportado (1 = rápido, 9 = más pequeño)
+    EXPORT_COMPRESS_LEVEL: int = int(os.getenv("EXPORT_COMPRESS_LEVEL", "6"))
+
+    # ===== BULK OPERATIONS (operaciones masivas de admin) =====
+    # Objetivos por lote (una transacción por lote)
+    BULK_BATCH_SIZE: int = int(os.getenv("BULK_BATCH_SIZE", "200"))
+
+    # Máximo de IDs en una lista subida por el admin
+    BULK_MAX_TARGETS: int = int(os.getenv("BULK_MAX_TARGETS", "50000"))
+
+    # Bot API (expulsiones): llamadas simultáneas y llamadas por segundo
+    BULK_BOT_API_CONCURRENCY: int = int(os.getenv("BULK_BOT_API_CONCURRENCY", "8"))
+    BULK_BOT_API_RATE: int = int(os.getenv("BULK_BOT_API_RATE", "25"))
+
+    # Segundos mínimos entre ediciones del mensaje de progreso
+    BULK_PROGRESS_INTERVAL_SECONDS: int = int(os.getenv("BULK_PROGRESS_INTERVAL_SECONDS", "5"))
+
+    # ===== ADMIN NOTIFICATIONS =====
+    # Envíos simultáneos máximos del dispatcher de notificaciones a admins
+    ADMIN_NOTIFY_CONCURRENCY: int = int(
+        os.getenv("ADMIN_NOTIFY_CONCURRENCY", "4")
+    )
+
+    # Ventana de resumen (segundos). 0 = una notificación por evento
+    # Ej: 300 → "12 nuevas expresiones de interés en los últimos 5 min"
+    ADMIN_NOTIFY_DIGEST_SECONDS: int = int(
+        os.getenv("ADMIN_NOTIFY_DIGEST_SECONDS", "0")
+    )
+
+    # Tamaño máximo de la cola (las notificaciones excedentes se descartan)
+    ADMIN_NOTIFY_QUEUE_SIZE: int = int(
+        os.getenv("ADMIN_NOTIFY_QUEUE_SIZE", "1000")
+    )
+
     # ===== FREE CHANNEL SETTINGS =====
     # Ventana anti-spam para solicitudes Free (minutos)
     # Previene que usuarios soliciten acceso repetidamente en corto tiempo
@@ -123,6 +283,18 @@ class Config:
         os.getenv("FREE_REQUEST_SPAM_WINDOW_MINUTES", "5")
     )
 
+    # Ingesta en lote de ChatJoinRequest (picos virales del canal Free)
+    # Intervalo de flush en ms. 0 = flujo por solicitud (default)
+    JOIN_INGEST_FLUSH_MS: int = int(os.getenv("JOIN_INGEST_FLUSH_MS", "0"))
+
+    # Solicitudes máximas por transacción
+    JOIN_INGEST_MAX_BATCH: int = int(os.getenv("JOIN_INGEST_MAX_BATCH", "500"))
+
+    # Avisos simultáneos a usuarios (Telegram limita ~30 mensajes/s)
+    JOIN_INGEST_ACK_CONCURRENCY: int = int(
+        os.getenv("JOIN_INGEST_ACK_CONCURRENCY", "10")
+    )
+
     # ===== HEALTH CHECK =====
     # Puerto para el endpoint de health check (FastAPI)
     # Default: 8000 (no debe colisionar con otros servicios)
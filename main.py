@@ -2,6 +2,11 @@
 Entry point del Bot de Administración VIP/Free.
 Gestiona el ciclo de vida completo del bot en Termux.
 """
+import time
+
+# Inicio del proceso (antes de importar aiogram/SQLAlchemy) para --measure-startup
+_PROCESS_STARTED = time.perf_counter()
+
 import asyncio
 import logging
 import sys
@@ -17,8 +22,21 @@ from aiogram.client.session.aiohttp import AiohttpSession
 from config import Config
 from bot.database import init_db, close_db
 from bot.database.migrations import run_migrations_if_needed
-from bot.background import start_background_tasks, stop_background_tasks
+from bot.background import (
+    start_background_tasks,
+    stop_background_tasks,
+    start_notification_dispatcher,
+    stop_notification_dispatcher,
+    start_join_ingestor,
+    stop_join_ingestor,
+    resume_bulk_jobs
+)
+from bot.background.notifications import get_notification_dispatcher
+from bot.background.tasks import flush_user_profiles
+from bot.services.message import get_lucien_voice
+from bot.services.message.session_history import get_session_history
 from bot.health.runner import start_health_server
+from bot.utils.startup_timing import StartupTimer, measure_import_costs
 
 # Flag global para señalizar shutdown
 _shutdown_requested = False
@@ -76,39 +94,35 @@ async def _get_bot_info_with_retry(bot: Bot, max_retries: int = 2, timeout: int
             return None
 
 
-async def on_startup_webhook(bot: Bot, dispatcher: Dispatcher) -> None:
-    """
-    Callback de startup específico para modo webhook.
-
-    Configura el webhook antes de iniciar el servidor.
-    """
-    logger.info("🚀 Iniciando bot en modo WEBHOOK...")
-
-    # Validar configuración
-    if not Config.validate():
-        logger.error("❌ Configuración inválida. Revisa tu archivo .env")
-        sys.exit(1)
-
-    logger.info(Config.get_summary())
-
-    # Ejecutar migraciones automáticas
+async def _start_health_api() -> None:
+    """Fase: health check API en thread separado (no bloquea el arranque si falla)."""
+    # El health server corre en su propio thread con su propio event loop
+    # para evitar conflictos con uvicorn y las señales de aiogram
     try:
-        await run_migrations_if_needed()
+        health_thread = await start_health_server()
+        if health_thread is not None:
+            logger.info("✅ Health check API iniciado en background thread")
+        else:
+            logger.warning("⚠️ Health API no disponible - bot continúa sin health checks")
+            logger.warning("   Esto no afecta la funcionalidad del bot")
     except Exception as e:
-        logger.error(f"❌ Error ejecutando migraciones: {e}")
-        sys.exit(1)
+        logger.error(f"❌ Error iniciando health API: {e}")
+        logger.warning("⚠️ Bot continuará sin health check endpoint")
 
-    # Inicializar base de datos
-    try:
-        await init_db()
-    except Exception as e:
-        logger.error(f"❌ Error al inicializar BD: {e}")
-        sys.exit(1)
 
-    # Iniciar background tasks
-    start_background_tasks(bot)
+async def _warm_caches() -> None:
+    """Fase: caches en memoria (no dependen de la BD)."""
+    # Restaurar historial de sesión del último apagado (opcional)
+    if Config.SESSION_HISTORY_SNAPSHOT_PATH:
+        get_session_history().load_snapshot(Config.SESSION_HISTORY_SNAPSHOT_PATH)
+
+    # Precompilar providers de mensajes y keyboards estáticos
+    keyboards = get_lucien_voice().warm_up()
+    logger.info(f"🎩 Providers de mensajes precompilados ({keyboards} keyboards estáticos)")
 
-    # Configurar webhook
+
+async def _set_webhook(bot: Bot) -> None:
+    """Fase: registrar el webhook en Telegram."""
     webhook_url = f"{Config.WEBHOOK_BASE_URL}{Config.WEBHOOK_PATH}"
     logger.info(f"🔗 Configurando webhook: {webhook_url}")
 
@@ -121,105 +135,149 @@ async def on_startup_webhook(bot: Bot, dispatcher: Dispatcher) -> None:
         logger.info("✅ Webhook configurado correctamente")
     except Exception as e:
         logger.error(f"❌ Error configurando webhook: {e}")
-        sys.exit(1)
+        raise
 
-    # Iniciar health check API en thread separado
-    try:
-        health_thread = await start_health_server()
-        if health_thread is not None:
-            logger.info("✅ Health check API iniciado en background thread")
-        else:
-            logger.warning("⚠️ Health API no disponible - bot continúa sin health checks")
-            logger.warning("   Esto no afecta la funcionalidad del bot")
-    except Exception as e:
-        logger.error(f"❌ Error iniciando health API: {e}")
-        logger.warning("⚠️ Bot continuará sin health check endpoint")
 
+async def _start_background(bot: Bot) -> None:
+    """Fase: tareas programadas e ingesta en lote (requieren la BD)."""
+    start_background_tasks(bot)
 
-async def on_startup(bot: Bot, dispatcher: Dispatcher) -> None:
+    # Ingesta en lote de solicitudes Free (solo si JOIN_INGEST_FLUSH_MS > 0)
+    await start_join_ingestor(bot)
+
+    # Operaciones masivas interrumpidas por el reinicio
+    await resume_bulk_jobs(bot)
+
+
+async def run_startup(bot: Bot, webhook: bool = False) -> StartupTimer:
     """
-    Callback ejecutado al iniciar el bot.
+    Arranque como grafo de dependencias: las fases independientes corren en paralelo.
 
-    Tareas:
-    - Validar configuración
-    - Inicializar base de datos
-    - Iniciar background tasks
-    - Notificar a admins que el bot está online
+    Grafo:
+        migraciones → base de datos → tareas en segundo plano
+        caches en memoria          (independiente)
+        notificaciones             (independiente)
+        health API                 (independiente)
+        webhook                    (independiente, solo modo webhook)
+
+    La validación de configuración corre antes (si falla no hay nada que
+    paralelizar). El aviso de "bot online" a los admins no forma parte del
+    arranque: lo envía announce_startup() en segundo plano.
 
     Args:
         bot: Instancia del bot
-        dispatcher: Instancia del dispatcher
+        webhook: True para registrar el webhook como fase adicional
+
+    Returns:
+        StartupTimer con el desglose por fase
     """
-    logger.info("🚀 Iniciando bot...")
+    timer = StartupTimer()
 
     # Validar configuración
-    if not Config.validate():
-        logger.error("❌ Configuración inválida. Revisa tu archivo .env")
-        sys.exit(1)
+    with timer.phase("configuración"):
+        if not Config.validate():
+            logger.error("❌ Configuración inválida. Revisa tu archivo .env")
+            sys.exit(1)
 
     logger.info(Config.get_summary())
 
-    # Ejecutar migraciones automáticas (producción)
-    # En producción, esto corre "alembic upgrade head" automáticamente
-    # En desarrollo, omite este paso (developer debe correr manualmente)
+    phases = {
+        # Fast path in-process: si alembic_version ya está en head no se lanza
+        # ningún subproceso; si no, en producción corre "alembic upgrade head"
+        "migraciones": ((), lambda results: run_migrations_if_needed()),
+        # Sin create_all si el esquema ya está en head
+        "base de datos": (
+            ("migraciones",),
+            lambda results: init_db(skip_create_all=results["migraciones"])
+        ),
+        "caches en memoria": ((), lambda results: _warm_caches()),
+        # Dispatcher de notificaciones a admins (envío fuera de los handlers)
+        "notificaciones": ((), lambda results: start_notification_dispatcher(bot)),
+        "health API": ((), lambda results: _start_health_api()),
+        "tareas en segundo plano": (("base de datos",), lambda results: _start_background(bot)),
+    }
+    if webhook:
+        phases["webhook"] = ((), lambda results: _set_webhook(bot))
+
     try:
-        await run_migrations_if_needed()
+        await timer.run_graph(phases)
     except Exception as e:
-        logger.error(f"❌ Error ejecutando migraciones: {e}")
+        logger.error(f"❌ Error en el arranque: {e}")
         logger.error(
-            "💥 El bot no puede iniciar sin migraciones exitosas. "
-            "Fix the migration issue and restart."
+            "💥 El bot no puede iniciar sin migraciones ni BD. "
+            "Fix the issue and restart."
         )
         sys.exit(1)
 
-    # Inicializar base de datos
-    try:
-        await init_db()
-    except Exception as e:
-        logger.error(f"❌ Error al inicializar BD: {e}")
-        sys.exit(1)
+    timer.log_summary()
+    return timer
 
-    # Iniciar background tasks
-    start_background_tasks(bot)
 
-    # Iniciar health check API en thread separado
-    # El health server corre en su propio thread con su propio event loop
-    # para evitar conflictos con uvicorn y las señales de aiogram
-    try:
-        health_thread = await start_health_server()
-        if health_thread is not None:
-            logger.info("✅ Health check API iniciado en background thread")
-        else:
-            logger.warning("⚠️ Health API no disponible - bot continúa sin health checks")
-            logger.warning("   Esto no afecta la funcionalidad del bot")
-    except Exception as e:
-        logger.error(f"❌ Error iniciando health API: {e}")
-        logger.warning("⚠️ Bot continuará sin health check endpoint")
+_announce_task: asyncio.Task | None = None
 
-    # Notificar a admins que el bot está online (con reintentos)
-    bot_info = await _get_bot_info_with_retry(bot)
 
-    if bot_info:
-        startup_message = (
-            f"✅ Bot <b>@{bot_info.username}</b> iniciado correctamente\n\n"
-            f"🤖 ID: <code>{bot_info.id}</code>\n"
-            f"📝 Nombre: {bot_info.first_name}\n"
-            f"🔧 Versión: ONDA 1 (MVP)\n\n"
-            f"Usa /admin para gestionar los canales."
-        )
+async def announce_startup(bot: Bot) -> None:
+    """
+    Verifica el bot (get_me con reintentos) y avisa a los admins que está online.
 
-        for admin_id in Config.ADMIN_USER_IDS:
-            try:
-                await bot.send_message(
-                    chat_id=admin_id,
-                    text=startup_message,
-                    parse_mode="HTML"
-                )
-                logger.info(f"📨 Notificación enviada a admin {admin_id}")
-            except Exception as e:
-                logger.warning(f"⚠️ No se pudo notificar a admin {admin_id}: {e}")
-    else:
+    Corre en segundo plano: el polling empieza sin esperar la red. Los
+    mensajes se encolan en el dispatcher de notificaciones.
+
+    Args:
+        bot: Instancia del bot
+    """
+    bot_info = await _get_bot_info_with_retry(bot)
+
+    if not bot_info:
         logger.warning("⚠️ Bot iniciado pero sin verificación de conectividad. Revisa tu conexión de red.")
+        return
+
+    startup_message = (
+        f"✅ Bot <b>@{bot_info.username}</b> iniciado correctamente\n\n"
+        f"🤖 ID: <code>{bot_info.id}</code>\n"
+        f"📝 Nombre: {bot_info.first_name}\n"
+        f"🔧 Versión: ONDA 1 (MVP)\n\n"
+        f"Usa /admin para gestionar los canales."
+    )
+
+    dispatcher = get_notification_dispatcher()
+    if dispatcher is not None:
+        queued = dispatcher.notify_admins(startup_message)
+        logger.info(f"📨 Aviso de inicio encolado para {queued} admin(s)")
+
+
+async def on_startup_webhook(bot: Bot, dispatcher: Dispatcher) -> None:
+    """
+    Callback de startup específico para modo webhook.
+
+    Configura el webhook (en paralelo con el resto del arranque) antes de
+    iniciar el servidor.
+    """
+    logger.info("🚀 Iniciando bot en modo WEBHOOK...")
+    await run_startup(bot, webhook=True)
+
+
+async def on_startup(bot: Bot, dispatcher: Dispatcher) -> None:
+    """
+    Callback ejecutado al iniciar el bot.
+
+    Tareas:
+    - Validar configuración
+    - Migraciones + base de datos, caches, health API (en paralelo)
+    - Iniciar background tasks
+    - Notificar a admins que el bot está online (en segundo plano)
+
+    Args:
+        bot: Instancia del bot
+        dispatcher: Instancia del dispatcher
+    """
+    global _announce_task
+
+    logger.info("🚀 Iniciando bot...")
+    await run_startup(bot)
+
+    # Aviso a admins fuera del arranque (get_me + envío no retrasan el polling)
+    _announce_task = asyncio.create_task(announce_startup(bot))
 
     logger.info("✅ Bot iniciado y listo para recibir mensajes")
 
@@ -246,6 +304,19 @@ async def on_shutdown(bot: Bot, dispatcher: Dispatcher) -> None:
     # Detener background tasks (sin bloquear)
     stop_background_tasks()
 
+    # Escribir solicitudes Free pendientes del buffer de ingesta
+    await stop_join_ingestor()
+
+    # Escribir cambios de perfil pendientes (write-behind)
+    await flush_user_profiles(bot)
+
+    # Guardar historial de sesión para el próximo arranque (opcional)
+    if Config.SESSION_HISTORY_SNAPSHOT_PATH:
+        get_session_history().save_snapshot(Config.SESSION_HISTORY_SNAPSHOT_PATH)
+
+    # Entregar notificaciones pendientes a admins (máx 5s)
+    await stop_notification_dispatcher(timeout=5.0)
+
     # Detener health check API usando función explícita
     logger.info("🛑 Deteniendo health check API...")
     try:
@@ -285,22 +356,24 @@ async def on_shutdown(bot: Bot, dispatcher: Dispatcher) -> None:
     logger.info("✅ Bot cerrado correctamente")
 
 
-async def main() -> None:
+def create_bot() -> Bot:
     """
-    Función principal que ejecuta el bot.
+    Crea el bot con la sesión HTTP customizada.
 
-    Soporta dos modos:
-    - Polling: Bot hace requests a Telegram (default para desarrollo)
-    - Webhook: Telegram envía updates al bot (óptimo para Railway)
+    Returns:
+        Instancia del bot
     """
-    # Crear instancia del bot con sesión customizada
     # AiohttpSession timeout: 10s para shutdown responsivo
     # NOTA: Este es el timeout para request HTTP, NO para handlers
     # Los handlers pueden tardar más tiempo, esto es solo para conexiones HTTP
     # Un timeout más corto permite que el bot responda a Ctrl+C rápidamente
     session = AiohttpSession(timeout=10)
 
-    bot = Bot(
+    # Combinar lecturas idénticas en vuelo (get_chat_member, get_chat, get_me...)
+    from bot.middlewares import get_singleflight_middleware
+    session.middleware(get_singleflight_middleware())
+
+    return Bot(
         token=Config.BOT_TOKEN,
         session=session,
         default=DefaultBotProperties(
@@ -308,6 +381,14 @@ async def main() -> None:
         )
     )
 
+
+def create_dispatcher() -> Dispatcher:
+    """
+    Crea el dispatcher con middlewares y handlers registrados.
+
+    Returns:
+        Dispatcher listo para recibir updates
+    """
     # Crear storage para FSM (estados de conversación)
     storage = MemoryStorage()
 
@@ -324,6 +405,64 @@ async def main() -> None:
     from bot.handlers import register_all_handlers
     register_all_handlers(dp)
 
+    return dp
+
+
+async def measure_startup(top: int = 15) -> None:
+    """
+    Modo --measure-startup: mide el arranque sin conectarse a Telegram.
+
+    Reporta:
+    - Tiempo hasta el primer update: inicio del proceso → dispatcher con
+      handlers registrados y fases de arranque completas (punto en que
+      start_polling pediría el primer update)
+    - Desglose por fase (StartupTimer)
+    - Módulos más caros de importar (python -X importtime)
+
+    Args:
+        top: Cantidad de módulos a listar
+    """
+    bot = create_bot()
+    try:
+        dp = create_dispatcher()
+        timer = await run_startup(bot)
+        ready_at = time.perf_counter() - _PROCESS_STARTED
+    finally:
+        # Los jobs con next_run_time=now se cancelan a medio camino:
+        # sus errores no son parte de la medición
+        logging.disable(logging.ERROR)
+        stop_background_tasks()
+        await stop_join_ingestor()
+        await stop_notification_dispatcher(timeout=1.0)
+        from bot.health.runner import stop_health_server
+        await stop_health_server()
+        await close_db()
+        await bot.session.close()
+        logging.disable(logging.NOTSET)
+
+    print(f"\n⏱️ Tiempo hasta el primer update: {ready_at:.3f}s")
+    print(f"   importaciones + handlers: {ready_at - timer.total:.3f}s")
+    print(f"   routers registrados: {len(dp.sub_routers)}")
+    print(timer.summary())
+
+    costs = await asyncio.to_thread(measure_import_costs, "main", "bot.handlers")
+    print(f"\n📦 Importaciones más caras (-X importtime, top {top}):")
+    print(f"   {'acumulado':>10} {'propio':>9}  módulo")
+    for module, self_us, cumulative_us in costs[:top]:
+        print(f"   {cumulative_us / 1000:>8.1f}ms {self_us / 1000:>7.1f}ms  {module}")
+
+
+async def main() -> None:
+    """
+    Función principal que ejecuta el bot.
+
+    Soporta dos modos:
+    - Polling: Bot hace requests a Telegram (default para desarrollo)
+    - Webhook: Telegram envía updates al bot (óptimo para Railway)
+    """
+    bot = create_bot()
+    dp = create_dispatcher()
+
     # Detectar modo de operación
     use_webhook = should_use_webhook()
 
@@ -426,6 +565,7 @@ if __name__ == "__main__":
 
     Uso:
         python main.py
+        python main.py --measure-startup   # Mide el arranque y termina
 
     Para ejecutar en background (Termux):
         nohup python main.py > bot.log 2>&1 &
@@ -434,6 +574,11 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, _global_signal_handler)
     signal.signal(signal.SIGTERM, _global_signal_handler)
 
+    if "--measure-startup" in sys.argv:
+        logging.getLogger().setLevel(logging.WARNING)  # Solo el reporte
+        asyncio.run(measure_startup())
+        sys.exit(0)
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Ruteo de callbacks (cadena lineal de filtros vs índice)
+
+Registra todos los routers reales del bot y, para cada callback_data
+conocido, mide el costo de encontrar el handler:
+
+- Lineal: como aiogram, cada router revisa sus handlers en orden
+  evaluando filtros hasta el primero que acepta
+- Índice: solo los candidatos del hash/trie de install_callback_routing
+
+No ejecuta los handlers (solo la selección), así que no necesita BD.
+
+Uso:
+    python scripts/benchmark_callback_routing.py
+    python scripts/benchmark_callback_routing.py --rounds 200
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from aiogram import Dispatcher
+from aiogram.types import CallbackQuery, Chat, Message, User
+
+from bot.handlers import register_all_handlers
+from bot.utils.callback_routing import EXACT
+
+# Callbacks con parámetros (prefijos) más frecuentes en producción
+PARAMETERIZED = [
+    "admin:user:view:123456:overview",
+    "admin:users:page:3:vip",
+    "admin:interests:page:2:pending",
+    "admin:interest:view:42",
+    "admin:content:view:7",
+    "vip:packages:12",
+    "free:packages:5",
+    "interest:package:9",
+    "vip_entry:stage_2",
+]
+
+
+def _make_callback(data: str) -> CallbackQuery:
+    user = User(id=1, is_bot=False, first_name="Bench")
+    message = Message(
+        message_id=1, date=datetime.now(), chat=Chat(id=1, type="private"), from_user=user
+    )
+    return CallbackQuery(id="1", from_user=user, chat_instance="1", data=data, message=message)
+
+
+async def _linear(routers, event, kwargs) -> int:
+    """Filtros evaluados hasta el primer handler que acepta (cadena de aiogram)."""
+    checks = 0
+    for router in routers:
+        for handler in router.callback_query.handlers:
+            checks += 1
+            result, _ = await handler.check(event, **kwargs)
+            if result:
+                return checks
+    return checks
+
+
+async def _indexed(routers, event, kwargs) -> int:
+    """Filtros evaluados usando solo los candidatos del índice."""
+    checks = 0
+    for router in routers:
+        index = router.callback_query.callback_index
+        for position, _ in index.candidates(event.data):
+            checks += 1
+            result, _ = await index._handlers[position].check(event, **kwargs)
+            if result:
+                return checks
+    return checks
+
+
+async def run_benchmark(rounds: int) -> None:
+    """Mide ambos modos sobre todos los callbacks conocidos."""
+    dispatcher = Dispatcher()
+    register_all_handlers(dispatcher)
+    routers = [
+        router for router in dispatcher.chain_tail
+        if router.callback_query.handlers
+    ]
+
+    exact = sorted({
+        pattern[1]
+        for router in routers
+        for pattern in router.callback_query.callback_index._patterns
+        if pattern and pattern[0] == EXACT
+    })
+    events = [_make_callback(data) for data in exact + PARAMETERIZED]
+    kwargs = {"raw_state": None}
+
+    print("=" * 64)
+    print(f"⏱️  Benchmark: Ruteo de callbacks ({len(events)} callbacks × {rounds} rondas)")
+    print("=" * 64)
+
+    results = {}
+    for name, strategy in (("Lineal", _linear), ("Índice", _indexed)):
+        checks = 0
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for event in events:
+                checks += await strategy(routers, event, kwargs)
+        elapsed = time.perf_counter() - started
+        dispatches = rounds * len(events)
+        results[name] = elapsed / dispatches * 1_000_000
+        print(
+            f"{name:<8} {results[name]:>8.1f} µs/callback | "
+            f"{checks / dispatches:>6.1f} filtros evaluados por callback"
+        )
+
+    print(f"Mejora: {results['Lineal'] / results['Índice']:.1f}x")
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+
+    parser = argparse.ArgumentParser(description="Benchmark de ruteo de callbacks")
+    parser.add_argument("--rounds", type=int, default=100, help="Rondas sobre todos los callbacks")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Ingesta de ChatJoinRequest del canal Free (por solicitud vs lote)
+
+Simula un pico viral sobre SQLite temporal (archivo, WAL):
+
+- Por solicitud: el trabajo de BD de handle_free_join_request (canal,
+  create_free_request_from_join_request, redes, wait_time) con una
+  sesión por update y N updates concurrentes, como aiogram
+- Lote: JoinRequestIngestor (submit en memoria + flush periódico)
+
+Reporta solicitudes/minuto, errores (p. ej. "database is locked") y si
+se alcanza el objetivo (default: 1000 solicitudes/min).
+
+Uso:
+    python scripts/benchmark_join_ingest.py
+    python scripts/benchmark_join_ingest.py --requests 5000 --concurrency 50 --flush-ms 250
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+# Agregar el directorio raíz al path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bot.background.join_ingest import JoinRequestIngestor
+from bot.database.base import Base
+from bot.database.models import BotConfig, FreeChannelRequest
+from bot.services.channel import ChannelService
+from bot.services.config import ConfigService
+from bot.services.subscription import SubscriptionService
+
+FREE_CHANNEL_ID = "-1000000000001"
+
+
+async def _legacy_request(session_factory, bot, user_id: int) -> None:
+    """Trabajo de BD del handler por solicitud (sin enviar mensajes)."""
+    async with session_factory() as session:
+        await ChannelService(session, bot).get_free_channel_id()
+        await SubscriptionService(session, bot).create_free_request_from_join_request(
+            user_id=user_id,
+            from_chat_id=FREE_CHANNEL_ID,
+            username=f"user{user_id}",
+            first_name="Visitante"
+        )
+        config_service = ConfigService(session)
+        await config_service.get_social_media_links()
+        await config_service.get_wait_time()
+        await session.commit()
+
+
+async def _run_legacy(session_factory, bot, user_ids, concurrency: int):
+    """N solicitudes con `concurrency` handlers simultáneos."""
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = []
+
+    async def handle(user_id):
+        async with semaphore:
+            try:
+                await _legacy_request(session_factory, bot, user_id)
+            except Exception as e:
+                errors.append(type(e).__name__)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handle(user_id) for user_id in user_ids))
+    return time.perf_counter() - started, errors
+
+
+async def _run_ingest(session_factory, bot, user_ids, flush_ms: int):
+    """Submit de todas las solicitudes y espera hasta que estén en BD."""
+    ingestor = JoinRequestIngestor(bot, flush_ms=flush_ms, session_factory=session_factory)
+    await ingestor.start()
+
+    started = time.perf_counter()
+    for user_id in user_ids:
+        ingestor.submit(user_id, f"user{user_id}", "Visitante", None)
+        # Updates llegando del webhook: ceder el loop entre solicitudes
+        await asyncio.sleep(0)
+
+    while ingestor.flushed + ingestor.get_stats()["failed_batches"] < len(user_ids):
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    await ingestor.stop()
+    return elapsed, ingestor.get_stats()
+
+
+async def _make_engine(path: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 5})
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add(BotConfig(id=1, free_channel_id=FREE_CHANNEL_ID, wait_time_minutes=5))
+        await session.commit()
+    return engine, session_factory
+
+
+async def _count_requests(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(FreeChannelRequest))
+
+
+async def run_benchmark(requests: int, concurrency: int, flush_ms: int, target: int) -> None:
+    """Ejecuta ambos escenarios sobre BDs separadas."""
+    tmp_dir = tempfile.mkdtemp(prefix="join_bench_")
+    bot = AsyncMock()
+    user_ids = list(range(1, requests + 1))
+
+    print("=" * 60)
+    print(f"⏱️  Benchmark: Ingesta de solicitudes Free ({requests} solicitudes)")
+    print("=" * 60)
+
+    engine, session_factory = await _make_engine(os.path.join(tmp_dir, "legacy.db"))
+    elapsed, errors = await _run_legacy(session_factory, bot, user_ids, concurrency)
+    stored = await _count_requests(session_factory)
+    await engine.dispose()
+    print(
+        f"Por solicitud ({concurrency} concurrentes): {elapsed:.2f}s → "
+        f"{requests / elapsed * 60:,.0f} sol/min | guardadas {stored}, "
+        f"errores {len(errors)}{f' ({errors[0]})' if errors else ''}"
+    )
+
+    engine, session_factory = await _make_engine(os.path.join(tmp_dir, "ingest.db"))
+    elapsed, stats = await _run_ingest(session_factory, bot, user_ids, flush_ms)
+    stored = await _count_requests(session_factory)
+    await engine.dispose()
+    rate = requests / elapsed * 60
+    print(
+        f"Lote (flush {flush_ms} ms):            {elapsed:.2f}s → {rate:,.0f} sol/min | "
+        f"guardadas {stored}, lotes {stats['batches']}, "
+        f"flush medio {stats['avg_flush_ms']} ms, avisos {stats['acks_sent']}"
+    )
+
+    status = "✅ OK" if rate >= target and stored == requests else "❌ NO ALCANZA"
+    print(f"Objetivo {target:,} sol/min: {status}")
+
+    for name in os.listdir(tmp_dir):
+        os.remove(os.path.join(tmp_dir, name))
+    os.rmdir(tmp_dir)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("bot").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark de ingesta de solicitudes Free")
+    parser.add_argument("--requests", type=int, default=3000, help="Solicitudes simuladas")
+    parser.add_argument("--concurrency", type=int, default=20, help="Handlers simultáneos (por solicitud)")
+    parser.add_argument("--flush-ms", type=int, default=500, help="Intervalo de flush del lote")
+    parser.add_argument("--target", type=int, default=1000, help="Objetivo en solicitudes/min")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.requests, args.concurrency, args.flush_ms, args.target))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Providers de mensajes por update vs registro compartido
+
+Compara los menús más frecuentes (user_menu VIP/Free y admin_main):
+
+- Por update: un LucienVoiceService nuevo por update (como antes en cada
+  ServiceContainer) y keyboards reconstruidos en cada llamada
+- Registro: get_lucien_voice() compartido + keyboards memoizados
+
+Reporta µs por render y bytes asignados por render (tracemalloc).
+
+Uso:
+    python scripts/benchmark_message_providers.py
+    python scripts/benchmark_message_providers.py --iterations 50000
+"""
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from bot.services.message import LucienVoiceService, get_lucien_voice
+from bot.utils.keyboards import clear_static_keyboards
+
+EXPIRES_AT = datetime.utcnow() + timedelta(days=30)
+
+MENUS = {
+    "user_menu (VIP)": lambda voice: voice.user.menu.vip_menu_greeting(
+        "Juan", vip_expires_at=EXPIRES_AT
+    ),
+    "user_menu (Free)": lambda voice: voice.user.menu.free_menu_greeting(
+        "Ana", free_queue_position=3
+    ),
+    "admin_main": lambda voice: voice.admin.main.admin_menu_greeting(is_configured=True),
+}
+
+
+def _per_update(render):
+    """Render como antes: servicio nuevo y keyboards sin memoizar."""
+    clear_static_keyboards()
+    return render(LucienVoiceService())
+
+
+def _shared(render):
+    """Render con el registro de proceso."""
+    return render(get_lucien_voice())
+
+
+def _measure(call, render, iterations: int):
+    """Retorna (µs por render, bytes asignados por render)."""
+    call(render)  # Calentar imports y caches
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call(render)
+    elapsed_us = (time.perf_counter() - started) / iterations * 1_000_000
+
+    # Asignaciones en una muestra más corta (tracemalloc es lento)
+    sample = max(1, iterations // 10)
+    tracemalloc.start()
+    total = 0
+    for _ in range(sample):
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = call(render)
+        total += tracemalloc.get_traced_memory()[1] - baseline
+        del result
+    tracemalloc.stop()
+
+    return elapsed_us, total / sample
+
+
+def run_benchmark(iterations: int) -> None:
+    """Ejecuta ambos modos para cada menú."""
+    print("=" * 72)
+    print(f"⏱️  Benchmark: Providers de mensajes ({iterations} renders por menú)")
+    print("=" * 72)
+    print(f"{'Menú':<18} {'Por update':>22} {'Registro':>22} {'Mejora':>7}")
+
+    for name, render in MENUS.items():
+        legacy_us, legacy_bytes = _measure(_per_update, render, iterations)
+        shared_us, shared_bytes = _measure(_shared, render, iterations)
+        print(
+            f"{name:<18} {legacy_us:>8.1f} µs {legacy_bytes:>8,.0f} B "
+            f"{shared_us:>8.1f} µs {shared_bytes:>8,.0f} B "
+            f"{legacy_us / shared_us:>6.1f}x"
+        )
+
+    clear_static_keyboards()
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("bot").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark de providers de mensajes")
+    parser.add_argument("--iterations", type=int, default=20000, help="Renders por menú")
+    args = parser.parse_args()
+
+    run_benchmark(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
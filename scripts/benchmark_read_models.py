@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Memoria por fila en recorridos de suscriptores VIP
+
+Carga N suscriptores (default: 100k) sobre SQLite temporal y mide con
+tracemalloc la memoria retenida y el pico de cada forma de leerlos:
+
+- ORM + user (antes): select(VIPSubscriber) con la relación user en
+  selectin (segunda consulta con N objetos User)
+- ORM: select(VIPSubscriber) sin relaciones (user ahora es opt-in)
+- Registros: select_records(VIPSubscriberRecord) → dataclasses con __slots__
+
+Uso:
+    python scripts/benchmark_read_models.py
+    python scripts/benchmark_read_models.py --rows 20000
+"""
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from bot.database.base import Base
+from bot.database.enums import UserRole
+from bot.database.models import InvitationToken, User, VIPSubscriber
+from bot.database.read_models import VIPSubscriberRecord, fetch_records, select_records
+
+
+async def _seed(session_factory, rows: int) -> None:
+    """N usuarios VIP, un token y N suscriptores (inserts por lotes)."""
+    now = datetime.utcnow()
+    async with session_factory() as session:
+        session.add(InvitationToken(id=1, token="BENCH", generated_by=1, used=True))
+        await session.flush()
+        for start in range(0, rows, 10_000):
+            batch = range(start + 1, min(start + 10_000, rows) + 1)
+            await session.execute(insert(User), [
+                {"user_id": user_id, "first_name": f"Usuario {user_id}",
+                 "username": f"user{user_id}", "role": UserRole.VIP}
+                for user_id in batch
+            ])
+            await session.execute(insert(VIPSubscriber), [
+                {"user_id": user_id, "token_id": 1, "join_date": now,
+                 "expiry_date": now + timedelta(days=user_id % 60 - 30), "status": "active"}
+                for user_id in batch
+            ])
+        await session.commit()
+
+
+async def _measure(session_factory, load) -> dict:
+    """Memoria retenida (resultado vivo), pico, tiempo y consultas de `load`."""
+    queries = []
+    engine = session_factory.kw["bind"].sync_engine
+
+    def count_query(*_args):
+        queries.append(1)
+
+    event.listen(engine, "before_cursor_execute", count_query)
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    async with session_factory() as session:
+        result = await load(session)
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    event.remove(engine, "before_cursor_execute", count_query)
+    return {"rows": len(result), "retained": retained, "peak": peak,
+            "elapsed": elapsed, "queries": len(queries)}
+
+
+async def _orm_with_user(session):
+    result = await session.execute(
+        select(VIPSubscriber).options(selectinload(VIPSubscriber.user))
+    )
+    return result.scalars().all()
+
+
+async def _orm(session):
+    result = await session.execute(select(VIPSubscriber))
+    return result.scalars().all()
+
+
+async def _records(session):
+    return await fetch_records(session, VIPSubscriberRecord, select_records(VIPSubscriberRecord))
+
+
+async def run_benchmark(rows: int) -> None:
+    """Ejecuta los tres escenarios sobre la misma BD."""
+    tmp_dir = tempfile.mkdtemp(prefix="read_models_bench_")
+    path = os.path.join(tmp_dir, "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await _seed(session_factory, rows)
+
+    print("=" * 72)
+    print(f"⏱️  Benchmark: Memoria por fila en recorridos VIP ({rows:,} filas)")
+    print("=" * 72)
+    print(f"{'Escenario':<18} {'retenida/fila':>14} {'pico/fila':>12} {'tiempo':>9} {'consultas':>10}")
+
+    baseline = None
+    for name, load in (
+        ("ORM + user (antes)", _orm_with_user),
+        ("ORM", _orm),
+        ("Registros", _records),
+    ):
+        stats = await _measure(session_factory, load)
+        per_row = stats["retained"] / stats["rows"]
+        ratio = f"({baseline / per_row:.1f}x menos)" if baseline else "(base)"
+        baseline = baseline or per_row
+        print(
+            f"{name:<18} {per_row:>11,.0f} B {stats['peak'] / stats['rows']:>9,.0f} B "
+            f"{stats['elapsed']:>8.2f}s {stats['queries']:>10} {ratio}"
+        )
+
+    await engine.dispose()
+    os.remove(path)
+    os.rmdir(tmp_dir)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("bot").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark de memoria de read models")
+    parser.add_argument("--rows", type=int, default=100_000, help="Suscriptores a cargar")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.rows))
+
+
+if __name__ == "__main__":
+    main()
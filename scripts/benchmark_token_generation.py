@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Generación de tokens VIP (individual vs lote)
+
+Mide el throughput de SubscriptionService.generate_vip_tokens_bulk()
+frente a llamadas repetidas a generate_vip_token() sobre una base de
+datos SQLite temporal (archivo, WAL), incluyendo el commit y la
+escritura del CSV de deep links.
+
+Uso:
+    python scripts/benchmark_token_generation.py
+    python scripts/benchmark_token_generation.py --count 10000 --single 500
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bot.database.base import Base
+from bot.services.subscription import SubscriptionService
+from bot.utils.exports import write_csv_tempfile
+
+
+async def run_benchmark(count: int, single: int) -> None:
+    """Ejecuta ambos escenarios y muestra tokens/segundo."""
+    tmp_dir = tempfile.mkdtemp(prefix="token_bench_")
+    db_path = os.path.join(tmp_dir, "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    print("=" * 60)
+    print("⏱️  Benchmark: Generación de tokens VIP")
+    print("=" * 60)
+
+    # Escenario 1: un token por llamada (flujo anterior, un commit por token)
+    async with session_factory() as session:
+        service = SubscriptionService(session, bot=None)
+        started = time.perf_counter()
+        for _ in range(single):
+            await service.generate_vip_token(generated_by=1, duration_hours=24)
+            await session.commit()
+        elapsed = time.perf_counter() - started
+    print(f"Individual: {single} tokens en {elapsed:.2f}s → {single / elapsed:,.0f} tokens/s")
+
+    # Escenario 2: lote en una transacción + CSV
+    async with session_factory() as session:
+        service = SubscriptionService(session, bot=None)
+        started = time.perf_counter()
+        tokens = await service.generate_vip_tokens_bulk(generated_by=1, count=count)
+        await session.commit()
+        generated = time.perf_counter() - started
+
+        csv_path, rows = write_csv_tempfile(
+            ["token", "deep_link"],
+            ((token, f"https://t.me/bench_bot?start={token}") for token in tokens)
+        )
+        total = time.perf_counter() - started
+        size_kb = os.path.getsize(csv_path) / 1024
+        os.remove(csv_path)
+
+    print(
+        f"Lote:       {count} tokens en {generated:.2f}s → {count / generated:,.0f} tokens/s "
+        f"(con CSV: {total:.2f}s, {rows} filas, {size_kb:.0f} KB)"
+    )
+
+    await engine.dispose()
+    for name in os.listdir(tmp_dir):
+        os.remove(os.path.join(tmp_dir, name))
+    os.rmdir(tmp_dir)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("bot").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark de generación de tokens VIP")
+    parser.add_argument("--count", type=int, default=10000, help="Tokens a generar en lote")
+    parser.add_argument("--single", type=int, default=500, help="Tokens a generar uno a uno")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.count, args.single))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Latencia del canje de tokens por deep link
+
+Compara, por canje (incluyendo commit), el flujo anterior de /start
+(validate_token → get_plan_by_id → activate_vip_subscription) con el
+canje atómico claim_and_activate_token() sobre SQLite temporal (WAL).
+
+Además de la latencia local reporta sentencias por canje: en SQLite
+el commit domina, pero con PostgreSQL remoto cada sentencia es un
+round trip de red.
+
+Uso:
+    python scripts/benchmark_token_redemption.py
+    python scripts/benchmark_token_redemption.py --redemptions 2000
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bot.database.base import Base
+from bot.database.enums import UserRole
+from bot.database.models import SubscriptionPlan, User
+from bot.services.pricing import PricingService
+from bot.services.subscription import SubscriptionService
+
+
+async def _legacy_redeem(session, token_str: str, user_id: int) -> None:
+    """Flujo anterior de _activate_token_from_deeplink (sin mensajes)."""
+    service = SubscriptionService(session, bot=None)
+    is_valid, _, token = await service.validate_token(token_str)
+    assert is_valid
+    plan = await PricingService(session).get_plan_by_id(token.plan_id)
+    token.used = True
+    token.used_by = user_id
+    token.used_at = datetime.utcnow()
+    await service.activate_vip_subscription(
+        user_id=user_id,
+        token_id=token.id,
+        duration_hours=plan.duration_days * 24
+    )
+    await session.commit()
+
+
+async def _atomic_redeem(session, token_str: str, user_id: int) -> None:
+    """Canje atómico actual."""
+    success, _, _ = await SubscriptionService(session, bot=None).claim_and_activate_token(
+        token_str, user_id
+    )
+    assert success
+    await session.commit()
+
+
+def _report(label: str, samples_ms: list, statements: int) -> None:
+    samples_ms.sort()
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(
+        f"{label:<10} p50={statistics.median(samples_ms):.2f} ms  "
+        f"p95={p95:.2f} ms  media={statistics.mean(samples_ms):.2f} ms  "
+        f"sentencias/canje={statements / len(samples_ms):.1f}"
+    )
+
+
+async def run_benchmark(redemptions: int) -> None:
+    """Genera tokens y mide cada canje con ambos flujos."""
+    tmp_dir = tempfile.mkdtemp(prefix="redeem_bench_")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    # Round trips a la BD (sin contar COMMIT): lo que domina en PostgreSQL remoto
+    statement_count = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count_statement(*_args):
+        statement_count[0] += 1
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        session.add_all([
+            User(user_id=user_id, first_name=f"U{user_id}", role=UserRole.FREE)
+            for user_id in range(1, 2 * redemptions + 1)
+        ])
+        plan = SubscriptionPlan(name="Mensual", duration_days=30, price=9.99, created_by=1)
+        session.add(plan)
+        await session.flush()
+        tokens = await SubscriptionService(session, bot=None).generate_vip_tokens_bulk(
+            generated_by=1, count=2 * redemptions, duration_hours=24, plan_id=plan.id
+        )
+        await session.commit()
+
+    print("=" * 60)
+    print(f"⏱️  Benchmark: Canje por deep link ({redemptions} canjes por flujo)")
+    print("=" * 60)
+
+    for label, redeem, offset in (("Anterior", _legacy_redeem, 0), ("Atómico", _atomic_redeem, redemptions)):
+        samples = []
+        statement_count[0] = 0
+        for i in range(redemptions):
+            async with session_factory() as session:
+                started = time.perf_counter()
+                await redeem(session, tokens[offset + i], offset + i + 1)
+                samples.append((time.perf_counter() - started) * 1000)
+        _report(label, samples, statement_count[0])
+
+    await engine.dispose()
+    for name in os.listdir(tmp_dir):
+        os.remove(os.path.join(tmp_dir, name))
+    os.rmdir(tmp_dir)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("bot").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark de canje de tokens VIP")
+    parser.add_argument("--redemptions", type=int, default=500, help="Canjes por flujo")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.redemptions))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,25 +3,41 @@
 SQLite to PostgreSQL Migration Script
 
 Migra todos los datos desde SQLite a PostgreSQL sin pérdida.
-Soporta validación de datos, dry-run y generación de reportes.
+Soporta validación de datos, dry-run, reanudación y generación de reportes.
+
+Pipeline en streaming (la memoria no depende del tamaño de las tablas):
+- Lectura por keyset (WHERE pk > último ORDER BY pk LIMIT chunk) desde SQLite,
+  con claves de texto comparadas byte a byte en ambos lados (COLLATE "C")
+- Carga con COPY binario (asyncpg copy_records_to_table)
+- Tablas independientes en paralelo (--workers), respetando el orden de
+  dependencias de FK leído del esquema destino
+- Cada chunk se copia, se verifica (checksum releído del destino) y
+  registra su checkpoint en la misma transacción: --resume continúa
+  exactamente donde quedó
+- Reporte con filas/seg y checksum por tabla
+
+El esquema destino debe existir (alembic upgrade head contra PostgreSQL).
 
 Uso:
     python scripts/migrate_to_postgres.py --source bot.db --target postgresql://...
     python scripts/migrate_to_postgres.py --source bot.db --target postgresql://... --dry-run
+    python scripts/migrate_to_postgres.py --source bot.db --target postgresql://... --resume
     python scripts/migrate_to_postgres.py --source bot.db --target postgresql://... --validate-only
 """
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Type
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy import create_engine, text, inspect
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 
 # Configurar logging
 logging.basicConfig(
@@ -30,6 +46,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tabla de checkpoints en el destino (se elimina al terminar sin errores)
+CHECKPOINT_TABLE = "_migration_checkpoint"
+
+# Tablas que nunca se copian (Alembic ya las gestiona en el destino)
+SKIP_TABLES = {"alembic_version", CHECKPOINT_TABLE}
+
 
 @dataclass
 class MigrationReport:
@@ -41,7 +63,10 @@ class MigrationReport:
     dry_run: bool = False
     tables_migrated: List[str] = field(default_factory=list)
     tables_failed: List[str] = field(default_factory=list)
+    tables_resumed: List[str] = field(default_factory=list)
     row_counts: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # table: (source, target)
+    rows_per_second: Dict[str, float] = field(default_factory=dict)
+    checksums: Dict[str, str] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -58,7 +83,10 @@ class MigrationReport:
             "dry_run": self.dry_run,
             "tables_migrated": self.tables_migrated,
             "tables_failed": self.tables_failed,
+            "tables_resumed": self.tables_resumed,
             "row_counts": self.row_counts,
+            "rows_per_second": self.rows_per_second,
+            "checksums": self.checksums,
             "errors": self.errors,
             "success": len(self.tables_failed) == 0 and len(self.errors) == 0
         }
@@ -81,8 +109,11 @@ class MigrationReport:
 
         if self.end_time:
             duration = (self.end_time - self.start_time).total_seconds()
+            total_rows = sum(source for source, _ in self.row_counts.values())
             lines.append(f"End: {self.end_time}")
             lines.append(f"Duration: {duration:.2f}s")
+            if duration > 0:
+                lines.append(f"Throughput: {total_rows / duration:.0f} rows/s")
 
         lines.extend([
             "-" * 60,
@@ -91,7 +122,13 @@ class MigrationReport:
 
         for table in self.tables_migrated:
             counts = self.row_counts.get(table, (0, 0))
-            lines.append(f"  ✓ {table}: {counts[0]} -> {counts[1]} rows")
+            rate = self.rows_per_second.get(table, 0.0)
+            checksum = self.checksums.get(table, "")[:12]
+            resumed = " (resumed)" if table in self.tables_resumed else ""
+            lines.append(
+                f"  ✓ {table}: {counts[0]} -> {counts[1]} rows, "
+                f"{rate:.0f} rows/s, checksum {checksum}{resumed}"
+            )
 
         if self.tables_failed:
             lines.extend([
@@ -113,42 +150,266 @@ class MigrationReport:
         return "\n".join(lines)
 
 
+# ===== CONVERSIÓN Y CHECKSUMS =====
+
+def _parse_datetime(value: Any, aware: bool) -> datetime:
+    """Texto de SQLite ('2024-01-28 12:00:00.000000') → datetime."""
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+    if aware and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _to_json_text(value: Any) -> str:
+    """asyncpg espera json/jsonb como texto."""
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def column_converter(data_type: str) -> Callable[[Any], Any]:
+    """
+    Conversor valor SQLite → tipo Python que espera COPY binario.
+
+    Args:
+        data_type: information_schema.columns.data_type del destino
+
+    Returns:
+        Función valor → valor convertido (None se conserva)
+    """
+    if data_type == "timestamp without time zone":
+        convert = lambda v: _parse_datetime(v, aware=False)
+    elif data_type == "timestamp with time zone":
+        convert = lambda v: _parse_datetime(v, aware=True)
+    elif data_type == "date":
+        convert = lambda v: v if isinstance(v, date) else date.fromisoformat(str(v))
+    elif data_type == "boolean":
+        convert = bool
+    elif data_type in ("json", "jsonb"):
+        convert = _to_json_text
+    elif data_type == "numeric":
+        convert = lambda v: Decimal(str(v))
+    elif data_type in ("smallint", "integer", "bigint"):
+        convert = int
+    elif data_type in ("real", "double precision"):
+        convert = float
+    else:
+        # text, character varying, enums (USER-DEFINED)...
+        convert = lambda v: v if isinstance(v, str) else str(v)
+
+    return lambda v: None if v is None else convert(v)
+
+
+def column_normalizer(data_type: str) -> Callable[[Any], str]:
+    """
+    Representación canónica de un valor para checksums.
+
+    Iguala lo escrito (tras column_converter) con lo releído del destino:
+    jsonb reordena claves y numeric puede cambiar de escala.
+
+    Args:
+        data_type: information_schema.columns.data_type del destino
+
+    Returns:
+        Función valor → texto canónico
+    """
+    if data_type in ("json", "jsonb"):
+        def normalize(value):
+            parsed = json.loads(value) if isinstance(value, str) else value
+            return json.dumps(parsed, sort_keys=True, separators=(",", ":"))
+    elif data_type == "numeric":
+        normalize = lambda value: str(Decimal(str(value)).normalize())
+    elif data_type.startswith("timestamp") or data_type == "date":
+        normalize = lambda value: value.isoformat()
+    else:
+        normalize = repr
+
+    return lambda value: "\x00" if value is None else normalize(value)
+
+
+def chunk_checksum(rows: Sequence[Sequence[Any]], normalizers: Sequence[Callable]) -> str:
+    """
+    Checksum de un chunk (independiente del orden de llegada de las filas).
+
+    Args:
+        rows: Filas ya convertidas (tuplas en el orden de columnas)
+        normalizers: column_normalizer() por columna
+
+    Returns:
+        blake2b hex de las filas normalizadas y ordenadas
+    """
+    canonical = sorted(
+        "\x1f".join(normalize(value) for normalize, value in zip(normalizers, row))
+        for row in rows
+    )
+    digest = hashlib.blake2b(digest_size=16)
+    for line in canonical:
+        digest.update(line.encode())
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def chain_checksum(previous: str, chunk: str) -> str:
+    """Encadena el checksum de un chunk al acumulado de la tabla."""
+    return hashlib.blake2b(f"{previous}:{chunk}".encode(), digest_size=16).hexdigest()
+
+
+def dependency_order(tables: Sequence[str], foreign_keys: Dict[str, set]) -> List[str]:
+    """
+    Orden topológico por FK (padres antes que hijos).
+
+    Args:
+        tables: Tablas a migrar
+        foreign_keys: tabla → tablas que referencia (auto-referencias ignoradas)
+
+    Returns:
+        Tablas ordenadas
+
+    Raises:
+        ValueError: Si hay un ciclo de FKs entre tablas distintas
+    """
+    pending = {t: {ref for ref in foreign_keys.get(t, set()) if ref != t and ref in tables}
+               for t in tables}
+    ordered: List[str] = []
+    while pending:
+        ready = sorted(t for t, deps in pending.items() if not deps)
+        if not ready:
+            raise ValueError(f"FK cycle between tables: {sorted(pending)}")
+        for table in ready:
+            ordered.append(table)
+            del pending[table]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return ordered
+
+
+@dataclass
+class TablePlan:
+    """Columnas, clave y conversores de una tabla a migrar."""
+    name: str
+    columns: List[str]
+    key: List[str]
+    data_types: List[str]
+    depends_on: set
+
+    def __post_init__(self):
+        self.converters = [column_converter(t) for t in self.data_types]
+        self.normalizers = [column_normalizer(t) for t in self.data_types]
+        self.key_index = [self.columns.index(k) for k in self.key]
+        self.key_types = [self.data_types[i] for i in self.key_index]
+
+    def convert(self, row: Sequence[Any]) -> tuple:
+        """Fila SQLite → tupla lista para COPY."""
+        return tuple(convert(value) for convert, value in zip(self.converters, row))
+
+    def key_of(self, row: Sequence[Any]) -> list:
+        """Valores de la clave de una fila (para el checkpoint)."""
+        return [row[i] for i in self.key_index]
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+# Tipos de texto del destino (information_schema.columns.data_type)
+TEXT_TYPES = {"text", "character varying", "character", "USER-DEFINED"}
+
+
+def key_column_sql(name: str, data_type: str, target: bool) -> str:
+    """
+    Expresión de una columna de clave con orden bytewise.
+
+    SQLite compara TEXT byte a byte (BINARY) y PostgreSQL usa la collation
+    de la base; sin forzar la misma, los rangos de keyset de origen y
+    destino pueden contener filas distintas. Los enums se comparan como
+    texto (en PostgreSQL se ordenan por declaración).
+
+    Args:
+        name: Columna de la clave
+        data_type: information_schema.columns.data_type del destino
+        target: True para PostgreSQL, False para SQLite
+
+    Returns:
+        SQL de la columna (con COLLATE si es texto)
+    """
+    column = _quote(name)
+    if data_type not in TEXT_TYPES:
+        return column
+    if not target:
+        return f"{column} COLLATE BINARY"
+    if data_type == "USER-DEFINED":
+        column = f"CAST({column} AS TEXT)"
+    return f'{column} COLLATE "C"'
+
+
+def key_predicate(
+    key: Sequence[str],
+    data_types: Sequence[str],
+    placeholder: Callable[[int], str],
+    op: str,
+    target: bool
+) -> str:
+    """
+    (k1, k2) > (p1, p2) con orden bytewise y los placeholders del dialecto.
+
+    Args:
+        key: Columnas de la clave
+        data_types: Tipo de cada columna de la clave
+        placeholder: Índice → placeholder (":k0" en SQLite, "$1" en asyncpg)
+        op: Operador de comparación
+        target: True para PostgreSQL, False para SQLite
+
+    Returns:
+        Condición SQL
+    """
+    cols = ", ".join(key_column_sql(k, t, target) for k, t in zip(key, data_types))
+    params = ", ".join(placeholder(i) for i in range(len(key)))
+    if len(key) == 1:
+        return f"{cols} {op} {params}"
+    return f"({cols}) {op} ({params})"
+
+
 class DatabaseMigrator:
     """
     Migrador de base de datos SQLite a PostgreSQL.
 
     Características:
-    - Migración ordenada respetando dependencias
-    - Validación de conteos de filas
+    - Migración en streaming por chunks (keyset sobre la PK)
+    - COPY binario con asyncpg
+    - Tablas independientes en paralelo respetando dependencias de FK
+    - Checkpoints transaccionales (reanudable con --resume)
+    - Verificación por checksum de cada chunk, no solo conteos
     - Soporte para dry-run
     - Reporte detallado en JSON
     """
 
-    # Orden de migración (tablas sin FK primero, luego dependientes)
-    MIGRATION_ORDER = [
-        "bot_config",           # Singleton, no dependencies
-        "users",                # Base table
-        "subscription_plans",   # No FK dependencies
-        "invitation_tokens",    # Depends on subscription_plans
-        "vip_subscribers",      # Depends on users, invitation_tokens
-        "free_channel_requests", # Depends on users
-        "content_packages",     # No FK dependencies
-        "user_interests",       # Depends on users, content_packages
-        "user_role_change_log", # Depends on users
-    ]
-
-    def __init__(self, source_url: str, target_url: str, dry_run: bool = False):
+    def __init__(
+        self,
+        source_url: str,
+        target_url: str,
+        dry_run: bool = False,
+        chunk_size: int = 5000,
+        workers: int = 4,
+        resume: bool = False,
+        verify: bool = True
+    ):
         """
         Inicializa el migrador.
 
         Args:
             source_url: URL de SQLite (sqlite:///bot.db)
             target_url: URL de PostgreSQL (postgresql+asyncpg://...)
-            dry_run: Si True, no escribe datos
+            dry_run: Si True, no escribe datos (solo lee y calcula checksums)
+            chunk_size: Filas por chunk (una transacción por chunk)
+            workers: Tablas migradas en paralelo
+            resume: Continuar desde los checkpoints de una ejecución anterior
+            verify: Releer cada chunk del destino y comparar checksums
         """
         self.source_url = source_url
         self.target_url = target_url
         self.dry_run = dry_run
+        self.chunk_size = max(1, chunk_size)
+        self.workers = max(1, workers)
+        self.resume = resume
+        self.verify = verify
         self.report = MigrationReport(
             start_time=datetime.utcnow(),
             source_db=source_url,
@@ -156,28 +417,99 @@ class DatabaseMigrator:
             dry_run=dry_run
         )
 
-        # Engines síncronos para migración
         self.source_engine = None
-        self.target_engine = None
+        self.pool = None
+        self.plans: Dict[str, TablePlan] = {}
 
     async def setup(self):
-        """Configura las conexiones a bases de datos."""
-        # Source: SQLite (síncrono)
+        """Configura las conexiones y arma el plan de cada tabla."""
+        import asyncpg
+
+        # Source: SQLite (síncrono, cada chunk se lee en un thread)
         self.source_engine = create_engine(
-            self.source_url.replace("sqlite+aiosqlite://", "sqlite://").replace("asyncpg", ""),
+            self.source_url.replace("sqlite+aiosqlite://", "sqlite://"),
             echo=False
         )
 
-        # Target: PostgreSQL (síncrono para migración)
-        # Convertir asyncpg URL a psycopg2 URL
-        target_sync = self.target_url.replace("postgresql+asyncpg://", "postgresql://")
-        target_sync = target_sync.replace("postgresql+psycopg2://", "postgresql://")
-
-        self.target_engine = create_engine(target_sync, echo=False)
+        # Target: PostgreSQL vía asyncpg (COPY binario)
+        dsn = self.target_url
+        for driver in ("postgresql+asyncpg://", "postgresql+psycopg2://"):
+            dsn = dsn.replace(driver, "postgresql://")
+        self.pool = await asyncpg.create_pool(dsn, min_size=1, max_size=self.workers + 1)
 
         logger.info(f"🔌 Connected to source: {self.source_url}")
         logger.info(f"🔌 Connected to target: {self.target_url}")
 
+        await self._build_plans()
+
+    async def _build_plans(self):
+        """Lee columnas, PKs y FKs del destino y las cruza con el origen."""
+        async with self.pool.acquire() as conn:
+            columns = await conn.fetch("""
+                SELECT table_name, column_name, data_type, is_generated
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                ORDER BY table_name, ordinal_position
+            """)
+            primary_keys = await conn.fetch("""
+                SELECT kcu.table_name, kcu.column_name
+                FROM information_schema.table_constraints tc
+                JOIN information_schema.key_column_usage kcu
+                  ON tc.constraint_name = kcu.constraint_name
+                 AND tc.table_schema = kcu.table_schema
+                WHERE tc.constraint_type = 'PRIMARY KEY'
+                  AND tc.table_schema = current_schema()
+                ORDER BY kcu.table_name, kcu.ordinal_position
+            """)
+            foreign_keys = await conn.fetch("""
+                SELECT DISTINCT tc.table_name, ccu.table_name AS referenced
+                FROM information_schema.table_constraints tc
+                JOIN information_schema.constraint_column_usage ccu
+                  ON tc.constraint_name = ccu.constraint_name
+                 AND tc.table_schema = ccu.table_schema
+                WHERE tc.constraint_type = 'FOREIGN KEY'
+                  AND tc.table_schema = current_schema()
+            """)
+
+        target_columns: Dict[str, List[Tuple[str, str]]] = {}
+        for row in columns:
+            if row["is_generated"] == "ALWAYS":
+                continue  # Columnas generadas (p. ej. tsvector de búsqueda)
+            target_columns.setdefault(row["table_name"], []).append(
+                (row["column_name"], row["data_type"])
+            )
+        keys: Dict[str, List[str]] = {}
+        for row in primary_keys:
+            keys.setdefault(row["table_name"], []).append(row["column_name"])
+        references: Dict[str, set] = {}
+        for row in foreign_keys:
+            references.setdefault(row["table_name"], set()).add(row["referenced"])
+
+        source_inspector = await asyncio.to_thread(inspect, self.source_engine)
+        source_tables = set(await asyncio.to_thread(source_inspector.get_table_names))
+
+        for table in sorted(set(target_columns) & source_tables - SKIP_TABLES):
+            if table not in keys:
+                self.report.errors.append(f"{table}: no primary key in target, skipped")
+                continue
+
+            source_cols = {
+                col["name"] for col in
+                await asyncio.to_thread(source_inspector.get_columns, table)
+            }
+            shared = [(name, kind) for name, kind in target_columns[table] if name in source_cols]
+            self.plans[table] = TablePlan(
+                name=table,
+                columns=[name for name, _ in shared],
+                key=keys[table],
+                data_types=[kind for _, kind in shared],
+                depends_on=references.get(table, set())
+            )
+
+        order = dependency_order(list(self.plans), {t: p.depends_on for t, p in self.plans.items()})
+        self.plans = {table: self.plans[table] for table in order}
+        logger.info(f"📋 {len(self.plans)} tables, order: {', '.join(order)}")
+
     async def migrate(self) -> MigrationReport:
         """
         Ejecuta la migración completa.
@@ -186,23 +518,40 @@ class DatabaseMigrator:
             MigrationReport con resultados
         """
         logger.info("🚀 Starting migration...")
-        logger.info(f"   Dry run: {self.dry_run}")
+        logger.info(f"   Dry run: {self.dry_run}, resume: {self.resume}, "
+                    f"chunk: {self.chunk_size}, workers: {self.workers}")
 
         try:
             await self.setup()
 
-            # Verificar conexiones (ejecutar en executor)
-            loop = asyncio.get_event_loop()
-            if not await loop.run_in_executor(None, self._verify_connections_sync):
-                self.report.errors.append("Failed to verify database connections")
-                return self.report
-
-            # Migrar cada tabla en orden
-            for table_name in self.MIGRATION_ORDER:
-                await self._migrate_table(table_name)
-
-            # Validar migración
-            await self.validate_migration()
+            checkpoints = await self._prepare_target()
+
+            # Cada tabla espera a las que referencia; las independientes
+            # corren en paralelo (máximo self.workers a la vez)
+            semaphore = asyncio.Semaphore(self.workers)
+            finished: Dict[str, asyncio.Future] = {
+                table: asyncio.get_running_loop().create_future() for table in self.plans
+            }
+
+            async def run(plan: TablePlan):
+                deps = [finished[d] for d in plan.depends_on if d in finished and d != plan.name]
+                ok = all([await dep for dep in deps])
+                if not ok:
+                    self.report.tables_failed.append(plan.name)
+                    self.report.errors.append(f"{plan.name}: skipped, a referenced table failed")
+                    finished[plan.name].set_result(False)
+                    return
+                async with semaphore:
+                    result = await self._migrate_table(plan, checkpoints.get(plan.name))
+                finished[plan.name].set_result(result)
+
+            await asyncio.gather(*(run(plan) for plan in self.plans.values()))
+
+            if not self.dry_run:
+                await self._reset_sequences()
+                if not self.report.tables_failed and not self.report.errors:
+                    async with self.pool.acquire() as conn:
+                        await conn.execute(f"DROP TABLE IF EXISTS {CHECKPOINT_TABLE}")
 
         except Exception as e:
             logger.exception("Migration failed")
@@ -214,174 +563,316 @@ class DatabaseMigrator:
 
         return self.report
 
-    def _verify_connections_sync(self) -> bool:
-        """Verifica que ambas bases de datos son accesibles."""
-        try:
-            # Verificar source
-            with self.source_engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                result.scalar()
-
-            # Verificar target
-            with self.target_engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                result.scalar()
+    async def _prepare_target(self) -> Dict[str, dict]:
+        """
+        Prepara la tabla de checkpoints.
 
-            logger.info("✅ Database connections verified")
-            return True
+        Sin --resume vacía todas las tablas destino en un solo TRUNCATE (sin
+        CASCADE: solo se vacían las tablas migradas).
 
-        except Exception as e:
-            logger.error(f"❌ Connection verification failed: {e}")
-            return False
+        Returns:
+            Checkpoints previos por tabla (vacío si no se reanuda)
+        """
+        if self.dry_run:
+            return {}
+
+        async with self.pool.acquire() as conn:
+            if not self.resume:
+                await conn.execute(f"DROP TABLE IF EXISTS {CHECKPOINT_TABLE}")
+                if self.plans:
+                    await conn.execute(
+                        f"TRUNCATE TABLE {', '.join(_quote(t) for t in self.plans)}"
+                    )
+
+            await conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+                    table_name TEXT PRIMARY KEY,
+                    last_key JSONB,
+                    rows BIGINT NOT NULL DEFAULT 0,
+                    checksum TEXT NOT NULL DEFAULT '',
+                    done BOOLEAN NOT NULL DEFAULT FALSE,
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+            """)
+            rows = await conn.fetch(f"SELECT * FROM {CHECKPOINT_TABLE}")
+
+        checkpoints = {
+            row["table_name"]: {
+                "last_key": json.loads(row["last_key"]) if row["last_key"] else None,
+                "rows": row["rows"],
+                "checksum": row["checksum"],
+                "done": row["done"],
+            }
+            for row in rows
+        }
+        if checkpoints:
+            logger.info(f"⏯️ Resuming: {len(checkpoints)} table(s) with checkpoints")
+        return checkpoints
+
+    @staticmethod
+    def _key_predicate(
+        plan: TablePlan, placeholder: Callable[[int], str], op: str, target: bool
+    ) -> str:
+        """Condición de keyset sobre la clave de la tabla (ver key_predicate())."""
+        return key_predicate(plan.key, plan.key_types, placeholder, op, target)
+
+    def _fetch_source_chunk_sync(self, plan: TablePlan, last_key: Optional[list]) -> List[tuple]:
+        """Lee el siguiente chunk de SQLite por keyset."""
+        where = ""
+        params: Dict[str, Any] = {"limit": self.chunk_size}
+        if last_key is not None:
+            where = "WHERE " + self._key_predicate(plan, lambda i: f":k{i}", ">", target=False)
+            params.update({f"k{i}": value for i, value in enumerate(last_key)})
+
+        order_by = ", ".join(
+            key_column_sql(k, t, target=False) for k, t in zip(plan.key, plan.key_types)
+        )
+        sql = (
+            f"SELECT {', '.join(_quote(c) for c in plan.columns)} FROM {_quote(plan.name)} "
+            f"{where} ORDER BY {order_by} LIMIT :limit"
+        )
+        with self.source_engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(text(sql), params)]
+
+    async def _fetch_target_range(
+        self, conn, plan: TablePlan, after: Optional[list], until: list
+    ) -> List[tuple]:
+        """Relee del destino las filas con clave en (after, until] (orden bytewise)."""
+        n = len(plan.key)
+        conditions = [self._key_predicate(plan, lambda i: f"${i + 1}", "<=", target=True)]
+        args = list(until)
+        if after is not None:
+            conditions.append(
+                self._key_predicate(plan, lambda i: f"${n + i + 1}", ">", target=True)
+            )
+            args.extend(after)
+        sql = (
+            f"SELECT {', '.join(_quote(c) for c in plan.columns)} FROM {_quote(plan.name)} "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+        return [tuple(row) for row in await conn.fetch(sql, *args)]
 
-    async def _migrate_table(self, table_name: str):
+    async def _migrate_table(self, plan: TablePlan, checkpoint: Optional[dict]) -> bool:
         """
-        Migra una tabla específica.
+        Migra una tabla chunk por chunk.
 
         Args:
-            table_name: Nombre de la tabla a migrar
+            plan: Plan de la tabla
+            checkpoint: Progreso previo (None = desde el principio)
+
+        Returns:
+            True si la tabla quedó completa y verificada
         """
-        logger.info(f"📦 Migrating table: {table_name}")
+        table = plan.name
+        if checkpoint and checkpoint["done"]:
+            logger.info(f"⏭️ {table}: already migrated ({checkpoint['rows']} rows)")
+            self.report.tables_migrated.append(table)
+            self.report.tables_resumed.append(table)
+            self.report.row_counts[table] = (checkpoint["rows"], checkpoint["rows"])
+            self.report.checksums[table] = checkpoint["checksum"]
+            return True
 
-        try:
-            # Obtener datos de source (ejecutar en executor para no bloquear)
-            loop = asyncio.get_event_loop()
-            source_data = await loop.run_in_executor(
-                None, self._fetch_table_data_sync, table_name
-            )
-            source_count = len(source_data)
+        last_key = checkpoint["last_key"] if checkpoint else None
+        rows_done = checkpoint["rows"] if checkpoint else 0
+        checksum = checkpoint["checksum"] if checkpoint else ""
+        if checkpoint:
+            self.report.tables_resumed.append(table)
+            logger.info(f"⏯️ {table}: resuming after {rows_done} rows")
+        else:
+            logger.info(f"📦 Migrating table: {table}")
 
-            logger.info(f"   Source rows: {source_count}")
+        started = time.perf_counter()
+        copied = 0
 
-            if self.dry_run:
-                logger.info(f"   [DRY-RUN] Would insert {source_count} rows")
-                self.report.tables_migrated.append(table_name)
-                self.report.row_counts[table_name] = (source_count, 0)
-                return
+        try:
+            while True:
+                raw = await asyncio.to_thread(self._fetch_source_chunk_sync, plan, last_key)
+                if not raw:
+                    break
 
-            # Limpiar tabla target (ejecutar en executor)
-            await loop.run_in_executor(
-                None, self._clear_target_table_sync, table_name
-            )
+                records = [plan.convert(row) for row in raw]
+                chunk_last = plan.key_of(records[-1])
+                digest = chunk_checksum(records, plan.normalizers)
 
-            # Insertar datos (ejecutar en executor)
-            if source_data:
-                await loop.run_in_executor(
-                    None, self._insert_data_sync, table_name, source_data
-                )
+                if not self.dry_run:
+                    await self._write_chunk(
+                        plan, records, last_key, chunk_last, digest,
+                        rows_done + len(records), chain_checksum(checksum, digest)
+                    )
 
-            # Verificar conteo (ejecutar en executor)
-            target_count = await loop.run_in_executor(
-                None, self._count_target_rows_sync, table_name
-            )
-            self.report.row_counts[table_name] = (source_count, target_count)
+                checksum = chain_checksum(checksum, digest)
+                rows_done += len(records)
+                copied += len(records)
+                last_key = [self._jsonable(v) for v in chunk_last]
 
-            if source_count == target_count:
-                logger.info(f"   ✅ Migrated: {source_count} rows")
-                self.report.tables_migrated.append(table_name)
-            else:
-                error = f"Row count mismatch: {source_count} -> {target_count}"
-                logger.error(f"   ❌ {error}")
-                self.report.tables_failed.append(table_name)
-                self.report.errors.append(f"{table_name}: {error}")
+                if len(raw) < self.chunk_size:
+                    break
+
+            target_count = rows_done
+            if not self.dry_run:
+                async with self.pool.acquire() as conn:
+                    target_count = await conn.fetchval(f"SELECT COUNT(*) FROM {_quote(table)}")
+                    await conn.execute(
+                        f"UPDATE {CHECKPOINT_TABLE} SET done = TRUE, updated_at = now() "
+                        f"WHERE table_name = $1",
+                        table
+                    )
 
         except Exception as e:
-            logger.exception(f"   ❌ Failed to migrate {table_name}")
-            self.report.tables_failed.append(table_name)
-            self.report.errors.append(f"{table_name}: {str(e)}")
+            logger.exception(f"   ❌ Failed to migrate {table}")
+            self.report.tables_failed.append(table)
+            self.report.errors.append(f"{table}: {str(e)}")
+            return False
 
-    def _fetch_table_data_sync(self, table_name: str) -> List[Dict[str, Any]]:
-        """Obtiene todos los datos de una tabla SQLite en batches."""
-        with self.source_engine.connect() as conn:
-            result = conn.execution_options(stream_results=True).execute(text(f"SELECT * FROM {table_name}"))
-            all_data = []
-            while True:
-                batch = result.mappings().fetchmany(1000)
-                if not batch:
-                    break
-                all_data.extend([dict(row) for row in batch])
-            return all_data
-
-    def _clear_target_table_sync(self, table_name: str):
-        """Limpia la tabla en PostgreSQL."""
-        with self.target_engine.connect() as conn:
-            # Deshabilitar FK checks temporalmente
-            # Nota: Sin CASCADE para evitar borrado accidental de datos relacionados
-            conn.execute(text(f"TRUNCATE TABLE {table_name}"))
-            conn.commit()
-
-    def _insert_data_sync(self, table_name: str, data: List[Dict[str, Any]]):
-        """Inserta datos en PostgreSQL."""
-        if not data:
-            return
-
-        with self.target_engine.connect() as conn:
-            # Construir INSERT
-            columns = list(data[0].keys())
-            col_names = ", ".join(columns)
-            placeholders = ", ".join([f":{col}" for col in columns])
-
-            insert_sql = f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
-
-            # Insertar en batch
-            batch_size = 100
-            for i in range(0, len(data), batch_size):
-                batch = data[i:i + batch_size]
-                conn.execute(text(insert_sql), batch)
-
-            conn.commit()
-
-    def _count_target_rows_sync(self, table_name: str) -> int:
-        """Cuenta filas en tabla target."""
-        with self.target_engine.connect() as conn:
-            result = conn.execute(text(f"SELECT COUNT(*) FROM {table_name}"))
-            return result.scalar()
+        elapsed = time.perf_counter() - started
+        rate = copied / elapsed if elapsed > 0 else 0.0
+        self.report.row_counts[table] = (rows_done, 0 if self.dry_run else target_count)
+        self.report.rows_per_second[table] = round(rate, 1)
+        self.report.checksums[table] = checksum
+
+        if not self.dry_run and target_count != rows_done:
+            error = f"Row count mismatch: {rows_done} -> {target_count}"
+            logger.error(f"   ❌ {table}: {error}")
+            self.report.tables_failed.append(table)
+            self.report.errors.append(f"{table}: {error}")
+            return False
+
+        prefix = "[DRY-RUN] Would copy" if self.dry_run else "✅ Migrated"
+        logger.info(f"   {prefix} {table}: {rows_done} rows ({rate:.0f} rows/s)")
+        self.report.tables_migrated.append(table)
+        return True
+
+    async def _write_chunk(
+        self,
+        plan: TablePlan,
+        records: List[tuple],
+        after: Optional[list],
+        until: list,
+        digest: str,
+        rows: int,
+        checksum: str
+    ):
+        """
+        COPY del chunk + verificación + checkpoint en una sola transacción.
+
+        Si el checksum releído no coincide, la transacción se revierte y
+        el checkpoint queda en el chunk anterior.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.copy_records_to_table(
+                    plan.name, records=records, columns=plan.columns
+                )
+
+                if self.verify:
+                    written = await self._fetch_target_range(conn, plan, after, until)
+                    if chunk_checksum(written, plan.normalizers) != digest:
+                        raise ValueError(
+                            f"checksum mismatch in chunk ending at {until} "
+                            f"({len(records)} rows copied, {len(written)} read back)"
+                        )
+
+                await conn.execute(
+                    f"""
+                    INSERT INTO {CHECKPOINT_TABLE} (table_name, last_key, rows, checksum)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (table_name) DO UPDATE
+                    SET last_key = EXCLUDED.last_key, rows = EXCLUDED.rows,
+                        checksum = EXCLUDED.checksum, updated_at = now()
+                    """,
+                    plan.name,
+                    json.dumps([self._jsonable(v) for v in until]),
+                    rows,
+                    checksum
+                )
+
+    @staticmethod
+    def _jsonable(value: Any) -> Any:
+        """Valor de clave serializable en el checkpoint."""
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    async def _reset_sequences(self):
+        """Ajusta las secuencias de PKs enteras al máximo copiado."""
+        async with self.pool.acquire() as conn:
+            for plan in self.plans.values():
+                if len(plan.key) != 1:
+                    continue
+                sequence = await conn.fetchval(
+                    "SELECT pg_get_serial_sequence($1, $2)", plan.name, plan.key[0]
+                )
+                if sequence:
+                    await conn.execute(
+                        f"SELECT setval($1, COALESCE((SELECT MAX({_quote(plan.key[0])}) "
+                        f"FROM {_quote(plan.name)}), 0) + 1, false)",
+                        sequence
+                    )
 
     async def validate_migration(self) -> bool:
         """
         Valida que la migración fue exitosa.
 
+        Compara conteos y checksums por chunk de origen y destino.
+
         Returns:
             True si todas las validaciones pasan
         """
         logger.info("🔍 Validating migration...")
 
         all_valid = True
-        loop = asyncio.get_event_loop()
 
-        for table_name in self.MIGRATION_ORDER:
-            if table_name in self.report.tables_failed:
+        for plan in self.plans.values():
+            if plan.name in self.report.tables_failed:
                 continue
 
-            source_count = await loop.run_in_executor(
-                None, self._count_source_rows_sync, table_name
-            )
-            target_count = await loop.run_in_executor(
-                None, self._count_target_rows_sync, table_name
-            )
-
-            if source_count != target_count:
+            source_rows, source_checksum = 0, ""
+            target_rows, target_checksum = 0, ""
+            last_key = None
+
+            async with self.pool.acquire() as conn:
+                while True:
+                    raw = await asyncio.to_thread(self._fetch_source_chunk_sync, plan, last_key)
+                    if not raw:
+                        break
+                    records = [plan.convert(row) for row in raw]
+                    chunk_last = plan.key_of(records[-1])
+                    written = await self._fetch_target_range(conn, plan, last_key, chunk_last)
+
+                    source_rows += len(records)
+                    target_rows += len(written)
+                    source_checksum = chain_checksum(
+                        source_checksum, chunk_checksum(records, plan.normalizers)
+                    )
+                    target_checksum = chain_checksum(
+                        target_checksum, chunk_checksum(written, plan.normalizers)
+                    )
+                    last_key = chunk_last
+                    if len(raw) < self.chunk_size:
+                        break
+
+                target_total = await conn.fetchval(f"SELECT COUNT(*) FROM {_quote(plan.name)}")
+
+            if target_total != source_rows or source_checksum != target_checksum:
                 logger.error(
-                    f"   ❌ {table_name}: Count mismatch ({source_count} != {target_count})"
+                    f"   ❌ {plan.name}: mismatch ({source_rows} rows / {source_checksum[:12]} "
+                    f"!= {target_total} rows / {target_checksum[:12]})"
                 )
                 all_valid = False
             else:
-                logger.info(f"   ✅ {table_name}: {source_count} rows match")
+                logger.info(f"   ✅ {plan.name}: {source_rows} rows, checksum {source_checksum[:12]}")
 
         return all_valid
 
-    def _count_source_rows_sync(self, table_name: str) -> int:
-        """Cuenta filas en tabla source."""
-        with self.source_engine.connect() as conn:
-            result = conn.execute(text(f"SELECT COUNT(*) FROM {table_name}"))
-            return result.scalar()
-
     async def cleanup(self):
         """Limpia recursos."""
         if self.source_engine:
             self.source_engine.dispose()
-        if self.target_engine:
-            self.target_engine.dispose()
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
 
 
 def parse_args() -> argparse.Namespace:
@@ -402,13 +893,35 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Simulate migration without writing data"
+        help="Simulate migration without writing data (reads and checksums the source)"
     )
     parser.add_argument(
         "--validate-only",
         action="store_true",
         help="Only validate existing migration (no data transfer)"
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the checkpoints of an interrupted run"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=5000,
+        help="Rows per chunk / transaction (default: 5000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Independent tables migrated in parallel (default: 4)"
+    )
+    parser.add_argument(
+        "--no-verify",
+        action="store_true",
+        help="Skip the per-chunk checksum read-back (faster, counts only)"
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -435,15 +948,21 @@ async def main():
     migrator = DatabaseMigrator(
         source_url=args.source,
         target_url=args.target,
-        dry_run=args.dry_run or args.validate_only
+        dry_run=args.dry_run or args.validate_only,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        resume=args.resume,
+        verify=not args.no_verify
     )
 
     # Ejecutar migración
     if args.validate_only:
         logger.info("🔍 Running validation only...")
         await migrator.setup()
-        await migrator.validate_migration()
+        valid = await migrator.validate_migration()
         await migrator.cleanup()
+        if not valid:
+            sys.exit(1)
     else:
         report = await migrator.migrate()
 
@@ -0,0 +1,159 @@
+"""
+Tests del dispatcher de notificaciones a admins.
+
+Valida:
+- notify_admins() retorna sin esperar a Telegram
+- Concurrencia acotada por número de workers
+- Digest: ráfagas se resumen en un mensaje por admin
+- Métricas: enviados, fallidos, descartados y latencia
+"""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bot.background.notifications import (
+    AdminNotificationDispatcher,
+    get_notification_dispatcher,
+    start_notification_dispatcher,
+    stop_notification_dispatcher,
+)
+from bot.handlers.utils.notifications import send_admin_interest_notification
+
+
+class SlowBot:
+    """Bot falso con latencia y medición de concurrencia."""
+
+    def __init__(self, delay=0.05, fail_for=()):
+        self.delay = delay
+        self.fail_for = set(fail_for)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sent = []
+
+    async def send_message(self, chat_id, text, parse_mode=None, reply_markup=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if chat_id in self.fail_for:
+                raise RuntimeError("Forbidden: bot was blocked by the user")
+            self.sent.append((chat_id, text, reply_markup))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_notify_returns_immediately_with_bounded_concurrency():
+    """Test: Encolar no espera el envío; los workers limitan la concurrencia."""
+    bot = SlowBot(delay=0.05)
+    dispatcher = AdminNotificationDispatcher(bot, concurrency=2)
+    await dispatcher.start()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    accepted = dispatcher.notify_admins("hola", admin_ids=[1, 2, 3, 4, 5, 6])
+    assert loop.time() - started < 0.01
+    assert accepted == 6
+    assert dispatcher.get_stats()["queue_depth"] == 6
+
+    await dispatcher.stop(timeout=2)
+
+    assert len(bot.sent) == 6
+    assert bot.max_in_flight == 2
+    stats = dispatcher.get_stats()
+    assert (stats["sent"], stats["failed"], stats["queue_depth"]) == (6, 0, 0)
+    assert stats["latency_max_ms"] >= 50
+    assert stats["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_failures_and_full_queue_are_counted():
+    """Test: Un admin que bloqueó el bot no frena al resto; la cola llena descarta."""
+    bot = SlowBot(delay=0, fail_for={2})
+    dispatcher = AdminNotificationDispatcher(bot, concurrency=1, max_queue=3)
+
+    # Sin workers corriendo la cola se llena
+    assert dispatcher.notify_admins("x", admin_ids=[1, 2, 3, 4]) == 3
+    assert dispatcher.get_stats()["dropped"] == 1
+
+    await dispatcher.start()
+    await dispatcher.stop(timeout=2)
+
+    assert [chat_id for chat_id, _, _ in bot.sent] == [1, 3]
+    stats = dispatcher.get_stats()
+    assert (stats["sent"], stats["failed"], stats["dropped"]) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_digest_coalesces_burst_per_admin():
+    """Test: En modo digest una ráfaga produce un resumen por admin."""
+    bot = SlowBot(delay=0)
+    dispatcher = AdminNotificationDispatcher(bot, concurrency=2, digest_seconds=300)
+    await dispatcher.start()
+
+    for i in range(12):
+        dispatcher.notify_admins(
+            f"detalle {i}", digest_key="interest", digest_line=f"@user{i} → 📦 Pack {i}",
+            admin_ids=[10, 20]
+        )
+    # Sin digest_key se envía individualmente
+    dispatcher.notify_admins("urgente", admin_ids=[10])
+
+    assert dispatcher.get_stats()["digest_pending"] == 24
+    await dispatcher.stop(timeout=2)
+
+    texts = {chat_id: [] for chat_id in (10, 20)}
+    for chat_id, text, _ in bot.sent:
+        texts[chat_id].append(text)
+
+    assert len(texts[20]) == 1
+    assert "12 nuevas expresiones de interés" in texts[20][0]
+    assert "en los últimos 5 min" in texts[20][0]
+    assert "@user11 → 📦 Pack 11" in texts[20][0]
+    assert sorted(texts[10]) == sorted(["urgente", texts[20][0]])
+    assert dispatcher.get_stats()["digests_sent"] == 2
+
+
+@pytest.mark.asyncio
+async def test_digest_single_event_sends_original():
+    """Test: Una sola notificación en la ventana se envía con su formato original."""
+    bot = SlowBot(delay=0)
+    dispatcher = AdminNotificationDispatcher(bot, digest_seconds=60)
+    await dispatcher.start()
+
+    dispatcher.notify_admins(
+        "detalle completo", reply_markup="kb", digest_key="interest",
+        digest_line="@solo → 📦 Pack", admin_ids=[10]
+    )
+    await dispatcher.stop(timeout=2)
+
+    assert bot.sent == [(10, "detalle completo", "kb")]
+    assert dispatcher.get_stats()["digests_sent"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interest_notification_uses_running_dispatcher(mock_bot):
+    """Test: send_admin_interest_notification encola cuando hay dispatcher."""
+    user = SimpleNamespace(id=777, username="fan")
+    package = SimpleNamespace(
+        id=5, name="Pack Especial", description=None, price=None, category=None
+    )
+    interest = SimpleNamespace(id=9, created_at=datetime(2026, 1, 1))
+
+    mock_bot.send_message = AsyncMock()
+    with patch("config.Config.ADMIN_USER_IDS", [1, 2]):
+        await start_notification_dispatcher(mock_bot)
+        try:
+            dispatcher = get_notification_dispatcher()
+            await send_admin_interest_notification(
+                mock_bot, None, user, package, interest, user_role="Free"
+            )
+            assert dispatcher.get_stats()["queue_depth"] + dispatcher.sent == 2
+        finally:
+            await stop_notification_dispatcher(timeout=2)
+
+    assert mock_bot.send_message.await_count == 2
+    assert get_notification_dispatcher() is None
@@ -22,13 +22,15 @@ async def test_scheduler_starts_with_utc_timezone(mock_bot):
     Escenario:
     1. Iniciar scheduler
     2. Verificar que está corriendo
-    3. Verificar que tiene 3 jobs programados
+    3. Verificar que tiene 7 jobs programados
     4. Detener scheduler
 
     Expected:
     - start_background_tasks() no arroja ZoneInfoNotFoundError
     - Scheduler está running=True
-    - 3 jobs activos (expire_vip, process_free_queue, cleanup_old_data)
+    - 7 jobs activos (expire_vip, process_free_queue, cleanup_old_data,
+      sweep_session_history, refresh_chat_metadata, maintain_vip_invite_pool,
+      maintain_sqlite)
     - stop_background_tasks() limpia correctamente
     """
     print("\n[TEST] Scheduler starts with UTC timezone")
@@ -47,15 +49,19 @@ async def test_scheduler_starts_with_utc_timezone(mock_bot):
 
         # Paso 3: Verificar jobs
         print("  3. Verificando jobs programados...")
-        assert status["jobs_count"] == 3, f"Deben haber 3 jobs, encontrados: {status['jobs_count']}"
+        assert status["jobs_count"] == 8, f"Deben haber 8 jobs, encontrados: {status['jobs_count']}"
 
         job_ids = [job["id"] for job in status["jobs"]]
-        expected_jobs = ["expire_vip", "process_free_queue", "cleanup_old_data"]
+        expected_jobs = [
+            "expire_vip", "process_free_queue", "cleanup_old_data", "sweep_session_history",
+            "refresh_chat_metadata", "maintain_vip_invite_pool", "maintain_sqlite",
+            "backup_database"
+        ]
 
         for expected_id in expected_jobs:
             assert expected_id in job_ids, f"Job '{expected_id}' no encontrado"
 
-        print(f"     OK: 3 jobs activos: {', '.join(job_ids)}")
+        print(f"     OK: 8 jobs activos: {', '.join(job_ids)}")
 
         # Paso 4: Verificar que todos los jobs tienen next_run_time
         print("  4. Verificando que jobs están programados...")
@@ -83,12 +89,12 @@ async def test_scheduler_handles_multiple_start_calls(mock_bot):
     Escenario:
     1. Iniciar scheduler
     2. Intentar iniciar nuevamente (debe ser ignorado)
-    3. Verificar que sigue con 3 jobs (no duplicados)
+    3. Verificar que sigue con 7 jobs (no duplicados)
     4. Detener scheduler
 
     Expected:
     - Segunda llamada a start_background_tasks() no crea jobs duplicados
-    - Scheduler sigue con 3 jobs únicos
+    - Scheduler sigue con 7 jobs únicos
     """
     print("\n[TEST] Scheduler handles multiple start calls")
 
@@ -99,8 +105,8 @@ async def test_scheduler_handles_multiple_start_calls(mock_bot):
 
         status = get_scheduler_status()
         assert status["running"] is True
-        assert status["jobs_count"] == 3
-        print("     OK: Scheduler iniciado con 3 jobs")
+        assert status["jobs_count"] == 8
+        print("     OK: Scheduler iniciado con 7 jobs")
 
         # Paso 2: Intentar iniciar nuevamente
         print("  2. Segunda llamada a start_background_tasks (debe ser ignorada)...")
@@ -110,7 +116,7 @@ async def test_scheduler_handles_multiple_start_calls(mock_bot):
         print("  3. Verificando que no se duplicaron jobs...")
         status = get_scheduler_status()
         assert status["running"] is True
-        assert status["jobs_count"] == 3, f"Deben seguir 3 jobs, encontrados: {status['jobs_count']}"
+        assert status["jobs_count"] == 8, f"Deben seguir 8 jobs, encontrados: {status['jobs_count']}"
         print("     OK: No se duplicaron jobs (idempotencia correcta)")
 
     finally:
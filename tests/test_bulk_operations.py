@@ -0,0 +1,160 @@
+"""
+Tests de las operaciones masivas de admin.
+
+Valida:
+- extend_vip extiende por lotes solo a VIP activos y se reanuda desde los
+  pendientes de un job interrumpido
+- change_role omite admins protegidos y registra la auditoría
+- expel reintenta tras RetryAfter, guarda el error por objetivo y deshace
+  los bans parciales (como la expulsión individual)
+"""
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import BanChatMember
+from sqlalchemy import select, update
+
+import bot.background.bulk_jobs as bulk_jobs
+from bot.database.enums import UserRole
+from bot.database.models import (
+    BulkJob,
+    BulkJobTarget,
+    InvitationToken,
+    User,
+    UserRoleChangeLog,
+    VIPSubscriber,
+)
+from bot.services.bulk_operations import BotApiLimiter, BulkOperationService
+from bot.services.channel import ChannelService
+from config import Config
+
+ADMIN_ID = 999
+EXPIRY = datetime(2030, 1, 1)
+
+
+async def _seed(session_factory):
+    """Usuarios 1-4 VIP activos, 5 Free y 6 admin."""
+    async with session_factory() as session:
+        token = InvitationToken(token="BULK", generated_by=ADMIN_ID, used=True)
+        session.add(token)
+        await session.flush()
+        for user_id in range(1, 5):
+            session.add(User(user_id=user_id, first_name=f"V{user_id}", role=UserRole.VIP))
+            session.add(VIPSubscriber(
+                user_id=user_id, token_id=token.id, status="active", expiry_date=EXPIRY
+            ))
+        session.add(User(user_id=5, first_name="Free", role=UserRole.FREE))
+        session.add(User(user_id=6, first_name="Admin", role=UserRole.ADMIN))
+        await session.commit()
+
+
+async def _create_job(session_factory, operation, params, **targets) -> int:
+    async with session_factory() as session:
+        job = await BulkOperationService(session, None).create_job(
+            operation, params, created_by=ADMIN_ID, chat_id=ADMIN_ID, **targets
+        )
+        await session.commit()
+        return job.id
+
+
+@pytest.mark.asyncio
+async def test_extend_vip_resumes_from_pending(test_db, mock_bot, monkeypatch):
+    monkeypatch.setattr(Config, "BULK_BATCH_SIZE", 2)
+    mock_bot.send_message = AsyncMock()
+    mock_bot.send_document = AsyncMock()
+    await _seed(test_db)
+    job_id = await _create_job(test_db, "extend_vip", {"days": 3}, user_ids=[1, 2, 3, 4, 5, 1])
+
+    # Simula un reinicio después del primer objetivo
+    async with test_db() as session:
+        await session.execute(update(BulkJob).where(BulkJob.id == job_id).values(status="running"))
+        first = (await session.execute(
+            select(BulkJobTarget).where(BulkJobTarget.job_id == job_id).order_by(BulkJobTarget.id)
+        )).scalars().first()
+        first.status = "done"
+        await session.commit()
+
+    assert await bulk_jobs.resume_bulk_jobs(mock_bot, session_factory=test_db) == 1
+    await asyncio.gather(*bulk_jobs._running.values())
+
+    async with test_db() as session:
+        expiries = dict((await session.execute(
+            select(VIPSubscriber.user_id, VIPSubscriber.expiry_date)
+        )).all())
+        job = await session.get(BulkJob, job_id)
+
+    assert expiries[1] == EXPIRY
+    assert all(expiries[user_id] == EXPIRY + timedelta(days=3) for user_id in (2, 3, 4))
+    assert (job.status, job.total, job.succeeded, job.skipped) == ("completed", 5, 3, 1)
+    mock_bot.send_document.assert_awaited_once()  # CSV con el Free omitido
+
+
+@pytest.mark.asyncio
+async def test_change_role_skips_protected_and_logs(test_db, mock_bot):
+    mock_bot.send_message = AsyncMock()
+    mock_bot.send_document = AsyncMock()
+    await _seed(test_db)
+    job_id = await _create_job(test_db, "change_role", {"role": "FREE"}, target_filter="vip_active")
+
+    async with test_db() as session:
+        await BulkOperationService(session, None).create_job(
+            "change_role", {"role": "FREE"}, created_by=ADMIN_ID, chat_id=ADMIN_ID,
+            user_ids=[6, ADMIN_ID]
+        )
+        await session.commit()
+
+    report = await bulk_jobs.run_bulk_job(mock_bot, job_id, session_factory=test_db)
+    admin_report = await bulk_jobs.run_bulk_job(mock_bot, job_id + 1, session_factory=test_db)
+
+    async with test_db() as session:
+        roles = dict((await session.execute(select(User.user_id, User.role))).all())
+        logs = (await session.execute(select(UserRoleChangeLog))).scalars().all()
+
+    assert report["succeeded"] == 4
+    assert all(roles[user_id] == UserRole.FREE for user_id in (1, 2, 3, 4))
+    assert {log.change_metadata["bulk_job_id"] for log in logs} == {job_id}
+    assert (admin_report["succeeded"], admin_report["skipped"]) == (0, 2)
+    assert roles[6] == UserRole.ADMIN
+
+
+@pytest.mark.asyncio
+async def test_expel_retries_and_records_errors(test_db, mock_bot, monkeypatch):
+    await _seed(test_db)
+    monkeypatch.setattr(ChannelService, "get_vip_channel_id", AsyncMock(return_value="-100"))
+    monkeypatch.setattr(ChannelService, "get_free_channel_id", AsyncMock(return_value="-200"))
+
+    calls = []
+
+    async def ban_chat_member(chat_id, user_id):
+        calls.append(user_id)
+        if user_id == 1 and calls.count(1) == 1:
+            raise TelegramRetryAfter(
+                BanChatMember(chat_id=chat_id, user_id=user_id), "Too Many Requests", 0
+            )
+        if user_id == 2 and chat_id == "-200":
+            raise RuntimeError("user not found")
+
+    mock_bot.ban_chat_member = AsyncMock(side_effect=ban_chat_member)
+    mock_bot.unban_chat_member = AsyncMock()
+    job_id = await _create_job(test_db, "expel", {}, user_ids=[1, 2, 3])
+
+    async with test_db() as session:
+        service = BulkOperationService(session, mock_bot)
+        job = await service.start_job(job_id)
+        batch = await service.next_batch(job_id, 10)
+        results = await service.apply_batch(job, batch, BotApiLimiter(concurrency=2, per_second=0))
+        counts = await service.record_results(job_id, results)
+        await session.commit()
+
+    assert counts == {"done": 2, "failed": 1}
+    assert calls.count(1) == 3
+    assert [error for status, error in results.values() if status == "failed"] == [
+        "Free: user not found (se deshizo la expulsión de VIP)"
+    ]
+    # El ban en VIP del usuario 2 se deshizo
+    mock_bot.unban_chat_member.assert_awaited_once_with(
+        chat_id="-100", user_id=2, only_if_banned=True
+    )
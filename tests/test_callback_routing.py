@@ -0,0 +1,129 @@
+"""
+Tests del ruteo indexado de callbacks.
+
+Valida:
+- Extracción de patrones F.data == / F.data.startswith
+- Candidatos del hash + trie en orden de registro
+- Mismo handler que la cadena lineal (filtros de estado, SkipHandler)
+- callback_args tipados y detección de solapamientos
+"""
+from datetime import datetime
+
+import pytest
+from aiogram import F, Router
+from aiogram.dispatcher.event.bases import SkipHandler
+from aiogram.types import CallbackQuery, Chat, Message, User
+
+from bot.utils.callback_routing import (
+    CallbackArgs,
+    EXACT,
+    PREFIX,
+    extract_data_pattern,
+    install_callback_routing,
+)
+
+
+def _callback(data):
+    user = User(id=1, is_bot=False, first_name="Test")
+    message = Message(message_id=1, date=datetime.now(), chat=Chat(id=1, type="private"))
+    return CallbackQuery(id="1", from_user=user, chat_instance="1", data=data, message=message)
+
+
+def _build_routers(calls):
+    root = Router(name="root")
+    child = Router(name="child")
+    root.include_router(child)
+
+    @root.callback_query(F.data == "admin:main")
+    async def admin_main(callback: CallbackQuery):
+        calls.append(("admin_main", None))
+
+    @root.callback_query(F.data.startswith("admin:user:view:"), F.data.endswith(":skip"))
+    async def skipper(callback: CallbackQuery):
+        raise SkipHandler()
+
+    @root.callback_query(F.data.startswith("admin:user:view:"))
+    async def user_view(callback: CallbackQuery, callback_args: CallbackArgs):
+        calls.append(("user_view", callback_args.parts))
+
+    @root.callback_query(lambda c: c.data == "legacy")
+    async def legacy(callback: CallbackQuery):
+        calls.append(("legacy", None))
+
+    @child.callback_query(F.data.startswith("admin:"))
+    async def child_fallback(callback: CallbackQuery):
+        calls.append(("child_fallback", callback.data))
+
+    return root
+
+
+def test_extract_data_pattern():
+    """Test: Solo F.data == y F.data.startswith son indexables."""
+    router = Router()
+    router.callback_query.register(lambda c: None, F.data == "a:b")
+    router.callback_query.register(lambda c: None, F.state == "x", F.data.startswith("a:"))
+    router.callback_query.register(lambda c: None, lambda c: c.data == "a")
+
+    patterns = [extract_data_pattern(h) for h in router.callback_query.handlers]
+    assert patterns == [(EXACT, "a:b"), (PREFIX, "a:"), None]
+
+
+def test_callback_args_parse():
+    """Test: Segmentos tras el patrón, numéricos como int."""
+    args = CallbackArgs.parse("admin:users:page:3:vip", "admin:users:page:")
+    assert args.parts == (3, "vip")
+    assert args.get_int(0) == 3
+    assert args.get_int(1) is None
+    assert args.get_str(2, default="all") == "all"
+
+
+@pytest.mark.asyncio
+async def test_indexed_dispatch_matches_linear_chain():
+    """Test: Mismo handler que aiogram, evaluando solo candidatos."""
+    calls = []
+    root = _build_routers(calls)
+    stats = install_callback_routing(root)
+    assert (stats["routers"], stats["handlers"], stats["indexed"]) == (2, 5, 4)
+
+    for data in ("admin:main", "admin:user:view:42:overview", "admin:user:view:7:skip",
+                 "legacy", "admin:other", "nothing"):
+        await root.propagate_event("callback_query", _callback(data))
+
+    assert calls == [
+        ("admin_main", None),
+        ("user_view", (42, "overview")),
+        ("user_view", (7, "skip")),  # SkipHandler cae al siguiente candidato
+        ("legacy", None),
+        ("child_fallback", "admin:other"),
+    ]
+
+    index = root.callback_query.callback_index
+    assert [position for position, _ in index.candidates("admin:main")] == [0, 3]
+
+
+@pytest.mark.asyncio
+async def test_index_rebuilds_when_handlers_added():
+    """Test: Handlers registrados después de instalar se indexan solos."""
+    calls = []
+    root = _build_routers(calls)
+    install_callback_routing(root)
+
+    @root.callback_query(F.data == "late")
+    async def late(callback: CallbackQuery):
+        calls.append(("late", None))
+
+    await root.propagate_event("callback_query", _callback("late"))
+    assert calls == [("late", None)]
+
+
+def test_overlaps_are_reported(caplog):
+    """Test: Un prefijo incondicional previo eclipsa patrones posteriores."""
+    router = Router()
+    router.callback_query.register(lambda c: None, F.data.startswith("pkg:"))
+    router.callback_query.register(lambda c: None, F.data.startswith("pkg:confirm:"))
+    router.callback_query.register(lambda c: None, F.data == "pkg")
+
+    stats = install_callback_routing(router)
+
+    assert stats["overlaps"] == 1
+    assert "'pkg:confirm:'" in caplog.text
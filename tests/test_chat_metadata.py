@@ -0,0 +1,96 @@
+"""
+Tests del cache de metadata de canales (get_chat / get_chat_member_count).
+
+Valida:
+- Lecturas repetidas no consultan la Bot API
+- Valor vencido se sirve al instante y se refresca en segundo plano
+- Error de la API conserva el valor anterior
+- setup_*_channel invalida el canal anterior y precarga el nuevo
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.services import chat_metadata
+from bot.services.channel import ChannelService
+from bot.services.chat_metadata import ChatMetadataCache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Cache aislado por test."""
+    fresh = ChatMetadataCache(ttl_seconds=60, member_count_ttl_seconds=60)
+    monkeypatch.setattr(chat_metadata, "_chat_metadata", fresh)
+    return fresh
+
+
+def _bot(title="Canal VIP", members=42):
+    bot = MagicMock()
+    bot.get_chat = AsyncMock(return_value=SimpleNamespace(id=-100123, title=title))
+    bot.get_chat_member_count = AsyncMock(return_value=members)
+    return bot
+
+
+async def test_repeated_reads_hit_cache(cache):
+    bot = _bot()
+
+    for _ in range(5):
+        chat = await cache.get_chat(bot, "-100123")
+        members = await cache.get_member_count(bot, -100123)
+
+    assert chat.title == "Canal VIP"
+    assert members == 42
+    assert bot.get_chat.await_count == 1
+    assert bot.get_chat_member_count.await_count == 1
+    assert cache.get_stats()["hits"] == 8
+
+
+async def test_stale_value_served_and_refreshed_in_background(cache):
+    bot = _bot()
+    await cache.get_chat(bot, "-100123")
+    cache._entries["-100123"].chat_loaded_at -= 120
+
+    bot.get_chat.return_value = SimpleNamespace(id=-100123, title="Nuevo título")
+    chat = await cache.get_chat(bot, "-100123")
+    assert chat.title == "Canal VIP"  # No bloquea: sirve el valor vencido
+
+    await asyncio.gather(*cache._refreshing)
+    chat = await cache.get_chat(bot, "-100123")
+    assert chat.title == "Nuevo título"
+    assert cache.get_stats()["stale_hits"] == 1
+
+
+async def test_api_error_keeps_previous_value(cache):
+    bot = _bot()
+    await cache.get_member_count(bot, "-100123")
+    cache._entries["-100123"].count_loaded_at -= 120
+
+    bot.get_chat_member_count.side_effect = RuntimeError("Bad Gateway")
+    assert await cache.refresh(bot, ["-100123", None]) == 1  # get_chat sí respondió
+    assert await cache.get_member_count(bot, "-100123") == 42
+    assert cache.get_stats()["api_errors"] == 1
+
+
+async def test_setup_channel_invalidates_and_primes(cache, monkeypatch):
+    bot = _bot(title="Canal Viejo")
+    await cache.get_chat(bot, "-100111")
+
+    new_chat = SimpleNamespace(id=-100222, title="Canal Nuevo", type="channel")
+    bot.get_chat.return_value = new_chat
+
+    config = SimpleNamespace(vip_channel_id="-100111")
+    service = ChannelService(MagicMock(commit=AsyncMock()), bot)
+    monkeypatch.setattr(service, "get_bot_config", AsyncMock(return_value=config))
+    monkeypatch.setattr(
+        service, "verify_bot_permissions", AsyncMock(return_value=(True, "ok"))
+    )
+
+    success, _ = await service.setup_vip_channel("-100222")
+
+    assert success is True
+    assert "-100111" not in cache._entries
+    calls = bot.get_chat.await_count
+    assert (await service.get_channel_info("-100222")).title == "Canal Nuevo"
+    assert bot.get_chat.await_count == calls  # Precargado por setup
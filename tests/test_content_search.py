@@ -0,0 +1,113 @@
+"""
+Tests de búsqueda full-text de paquetes de contenido.
+
+Valida:
+- Consultas FTS sanitizadas (sin sintaxis MATCH / to_tsquery del usuario)
+- Ranking FTS5: coincidencia en nombre antes que en descripción
+- Búsqueda por prefijo, sin acentos y con varias palabras
+- Filtros por estado, categoría y tipo
+- Índice sincronizado al crear y editar paquetes
+- Respaldo ILIKE cuando no existe la tabla FTS5
+"""
+import pytest
+
+from bot.database.enums import ContentCategory, PackageType
+from bot.database.search import (
+    build_fts5_query,
+    build_tsquery,
+    content_fts_available,
+    ensure_content_search_index,
+)
+from bot.services.content import ContentService
+
+
+async def _seed(session):
+    """Crea paquetes con coincidencias en nombre y en descripción."""
+    service = ContentService(session)
+    in_description = await service.create_package(
+        name="Colección Otoño",
+        category=ContentCategory.FREE_CONTENT,
+        description="Fotos de la playa en verano",
+    )
+    in_name = await service.create_package(
+        name="Pack Verano",
+        category=ContentCategory.VIP_CONTENT,
+        description="Sesión exclusiva",
+        package_type=PackageType.BUNDLE,
+    )
+    inactive = await service.create_package(
+        name="Canción de verano",
+        category=ContentCategory.VIP_PREMIUM,
+    )
+    await service.deactivate_package(inactive.id)
+    await session.commit()
+    return service, in_name, in_description, inactive
+
+
+def test_fts_queries_are_sanitized():
+    """Test: Operadores y comillas del admin no llegan a MATCH/to_tsquery."""
+    assert build_fts5_query('Pack "Verano" OR -x*') == '"pack"* "verano"* "or"* "x"*'
+    assert build_fts5_query("  ¿?  ") == ""
+    assert build_tsquery("Canción & playa:*") == "canción:* & playa:*"
+
+
+@pytest.mark.asyncio
+async def test_fts5_ranking_and_prefix(test_session):
+    """Test: FTS5 ordena por relevancia y acepta prefijos sin acentos."""
+    assert await ensure_content_search_index(test_session)
+    service, in_name, in_description, inactive = await _seed(test_session)
+
+    results = await service.search_packages("vera", is_active=True)
+    assert [p.id for p in results] == [in_name.id, in_description.id]
+
+    results = await service.search_packages("cancion")
+    assert [p.id for p in results] == [inactive.id]
+
+    # Todas las palabras deben coincidir
+    results = await service.search_packages("playa verano")
+    assert [p.id for p in results] == [in_description.id]
+
+    assert await service.search_packages('"') == []
+
+
+@pytest.mark.asyncio
+async def test_fts5_filters(test_session):
+    """Test: Filtros por estado, categoría y tipo sobre el resultado FTS."""
+    await ensure_content_search_index(test_session)
+    service, in_name, in_description, inactive = await _seed(test_session)
+
+    results = await service.search_packages("verano", category=ContentCategory.VIP_CONTENT)
+    assert [p.id for p in results] == [in_name.id]
+
+    results = await service.search_packages("verano", package_type=PackageType.BUNDLE)
+    assert [p.id for p in results] == [in_name.id]
+
+    results = await service.search_packages("verano", is_active=False)
+    assert [p.id for p in results] == [inactive.id]
+
+    results = await service.search_packages("verano", limit=1)
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_index_follows_package_updates(test_session):
+    """Test: update_package reindexa nombre y descripción."""
+    await ensure_content_search_index(test_session)
+    service, in_name, _, _ = await _seed(test_session)
+
+    await service.update_package(in_name.id, name="Pack Invierno")
+    await test_session.commit()
+
+    results = await service.search_packages("invierno")
+    assert [p.id for p in results] == [in_name.id]
+    assert in_name.id not in [p.id for p in await service.search_packages("verano")]
+
+
+@pytest.mark.asyncio
+async def test_ilike_fallback_without_fts(test_session):
+    """Test: Sin tabla FTS5 la búsqueda usa ILIKE con el nombre primero."""
+    assert not await content_fts_available(test_session)
+    service, in_name, in_description, _ = await _seed(test_session)
+
+    results = await service.search_packages("verano", is_active=True)
+    assert [p.id for p in results] == [in_name.id, in_description.id]
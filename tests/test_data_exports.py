@@ -0,0 +1,117 @@
+"""
+Tests del exporte de datos a CSV comprimido.
+
+Valida:
+- export_to_file() escribe todas las filas en un .csv.gz (tarifa del VIP,
+  enums por valor, JSON) y reporta progreso por lotes
+- start_export() envía el documento, elimina el temporal y no permite dos
+  exportes simultáneos en el mismo chat
+"""
+import asyncio
+import csv
+import gzip
+import os
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+import bot.background.exports as exports
+from bot.database.enums import RoleChangeReason, UserRole
+from bot.database.models import (
+    InvitationToken,
+    SubscriptionPlan,
+    User,
+    UserRoleChangeLog,
+    VIPSubscriber,
+)
+from config import Config
+
+
+async def _seed(session_factory):
+    async with session_factory() as session:
+        plan = SubscriptionPlan(name="Mensual", duration_days=30, price=9.99, created_by=1)
+        session.add(plan)
+        await session.flush()
+        for user_id in range(1, 6):
+            token = InvitationToken(
+                token=f"EXPORT{user_id:04d}", generated_by=1, used=True, plan_id=plan.id
+            )
+            session.add(token)
+            await session.flush()
+            session.add(User(user_id=user_id, first_name=f"U{user_id}", role=UserRole.VIP))
+            session.add(VIPSubscriber(
+                user_id=user_id, token_id=token.id, status="active",
+                expiry_date=datetime.utcnow() + timedelta(days=user_id)
+            ))
+        session.add(UserRoleChangeLog(
+            user_id=1, previous_role=UserRole.FREE, new_role=UserRole.VIP, changed_by=0,
+            reason=RoleChangeReason.VIP_REDEEMED, change_source="SYSTEM",
+            change_metadata={"token": "EXPORT0001"}
+        ))
+        await session.commit()
+
+
+def _read(path):
+    with gzip.open(path, "rt", newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+@pytest.mark.asyncio
+async def test_export_to_file_streams_all_rows(test_db, monkeypatch):
+    monkeypatch.setattr(Config, "EXPORT_BATCH_SIZE", 2)
+    monkeypatch.setattr(Config, "EXPORT_PROGRESS_INTERVAL_SECONDS", 0)
+    await _seed(test_db)
+
+    progress = []
+
+    async def on_progress(written, total):
+        progress.append((written, total))
+
+    report = await exports.export_to_file("vip", on_progress=on_progress, session_factory=test_db)
+    try:
+        lines = _read(report["path"])
+    finally:
+        os.remove(report["path"])
+
+    assert report["rows"] == 5 and report["filename"].endswith(".csv.gz")
+    assert lines[0] == list(exports.EXPORTS["vip"].header)
+    assert [line[0] for line in lines[1:]] == ["1", "2", "3", "4", "5"]
+    assert lines[1][6:9] == ["Mensual", "9.99", "$"]
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+
+    report = await exports.export_to_file("role_log", session_factory=test_db)
+    try:
+        row = _read(report["path"])[1]
+    finally:
+        os.remove(report["path"])
+
+    assert row[2:4] == [UserRole.FREE.value, UserRole.VIP.value]
+    assert row[7] == '{"token": "EXPORT0001"}'
+
+
+@pytest.mark.asyncio
+async def test_start_export_sends_document_once_per_chat(test_db, mock_bot, monkeypatch):
+    await _seed(test_db)
+    sent_paths = []
+
+    real_export = exports.export_to_file
+
+    async def export_from_test_db(kind, on_progress=None):
+        return await real_export(kind, on_progress=on_progress, session_factory=test_db)
+
+    async def send_document(chat_id, document, **kwargs):
+        sent_paths.append(document.path)
+        assert os.path.exists(document.path)
+
+    monkeypatch.setattr(exports, "export_to_file", export_from_test_db)
+    mock_bot.send_document = AsyncMock(side_effect=send_document)
+    mock_bot.edit_message_text = AsyncMock()
+
+    assert exports.start_export(mock_bot, chat_id=7, message_id=1, kind="users") is True
+    assert exports.start_export(mock_bot, chat_id=7, message_id=2, kind="users") is False
+    await asyncio.gather(*exports._running.values())
+
+    assert len(sent_paths) == 1 and not os.path.exists(sent_paths[0])
+    assert exports.get_export_stats()["running"] == 0
+    assert exports.get_export_stats()["last"]["rows"] == 5
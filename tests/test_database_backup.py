@@ -0,0 +1,106 @@
+"""
+Tests del respaldo online de la base de datos.
+
+Valida:
+- run_backup() genera un gzip consistente aunque haya escrituras durante la copia
+- restore_backup() devuelve la base al estado respaldado
+- rotate_backups() conserva los N más recientes y descarta los vencidos
+"""
+import asyncio
+import gzip
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from bot.database.backup import (
+    get_backup_stats,
+    list_backups,
+    restore_backup,
+    rotate_backups,
+    run_backup,
+)
+from config import Config
+
+
+@pytest.fixture
+async def file_engine(tmp_path, monkeypatch):
+    """Base en archivo (WAL) con 2000 filas y BACKUP_DIR temporal."""
+    monkeypatch.setattr(Config, "BACKUP_DIR", str(tmp_path / "backups"))
+    monkeypatch.setattr(Config, "BACKUP_PAGES_PER_STEP", 8)
+    monkeypatch.setattr(Config, "BACKUP_STEP_SLEEP_MS", 1)
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'live.db'}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("PRAGMA journal_mode=WAL"))
+        await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        await conn.execute(
+            text("INSERT INTO t (v) VALUES (:v)"),
+            [{"v": "x" * 200} for _ in range(2000)]
+        )
+    yield engine
+    await engine.dispose()
+
+
+async def _count(engine) -> int:
+    async with engine.connect() as conn:
+        return (await conn.execute(text("SELECT count(*) FROM t"))).scalar_one()
+
+
+async def test_backup_is_consistent_under_writes(file_engine, tmp_path):
+    async def writer():
+        for _ in range(20):
+            async with file_engine.begin() as conn:
+                await conn.execute(text("INSERT INTO t (v) VALUES ('new')"))
+            await asyncio.sleep(0.001)
+
+    report, _ = await asyncio.gather(run_backup(engine=file_engine), writer())
+
+    assert report["name"].endswith(".sqlite.gz")
+    assert 0 < report["bytes"] < report["raw_bytes"]
+    assert report["throughput_mb_s"] > 0
+
+    snapshot = tmp_path / "snapshot.db"
+    with gzip.open(report["path"], "rb") as src:
+        snapshot.write_bytes(src.read())
+    conn = sqlite3.connect(snapshot)
+    rows = conn.execute("SELECT count(*) FROM t").fetchone()[0]
+    assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    conn.close()
+
+    # Snapshot de un instante: filas originales más las escritas antes de empezar
+    assert 2000 <= rows <= 2020
+    assert await _count(file_engine) == 2020
+    assert get_backup_stats()["last"]["name"] == report["name"]
+
+
+async def test_restore_returns_to_backup(file_engine):
+    report = await run_backup(engine=file_engine)
+    async with file_engine.begin() as conn:
+        await conn.execute(text("DELETE FROM t WHERE id > 10"))
+
+    await restore_backup(report["name"], engine=file_engine)
+
+    assert await _count(file_engine) == 2000
+    with pytest.raises(ValueError):
+        await restore_backup("../live.db", engine=file_engine)
+
+
+def test_rotation_keeps_latest(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "BACKUP_DIR", str(tmp_path))
+    now = datetime.utcnow()
+    names = [
+        f"backup-{(now - timedelta(days=days)):%Y%m%d}-040000.sqlite.gz"
+        for days in (5, 4, 3, 2, 1)
+    ]
+    names.append("backup-20200101-040000.sqlite.gz")
+    for name in names:
+        (tmp_path / name).write_bytes(b"x")
+
+    removed = rotate_backups(keep=3, retention_days=30)
+
+    assert sorted(removed) == ["backup-20200101-040000.sqlite.gz"] + names[:2]
+    assert [b["name"] for b in list_backups()] == names[2:5][::-1]
@@ -0,0 +1,103 @@
+"""
+Tests del cache de huellas de edit_text.
+
+Valida:
+- Render idéntico sobre el mismo mensaje se omite (sin llamada a la API)
+- Cambios de texto/teclado o edición por otra vía sí editan
+- "message is not modified" se absorbe y se contabiliza
+- LRU acotado por max_messages
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import EditMessageText
+
+from bot.utils import edit_cache
+from bot.utils.edit_cache import EditFingerprintCache, edit_text_if_changed
+from bot.utils.keyboards import create_inline_keyboard
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Cache aislado por test."""
+    fresh = EditFingerprintCache(max_messages=2)
+    monkeypatch.setattr(edit_cache, "_edit_cache", fresh)
+    return fresh
+
+
+def _message(message_id=10, edit_date=None):
+    """Mensaje falso cuyo edit_text devuelve un nuevo edit_date."""
+    message = SimpleNamespace(
+        chat=SimpleNamespace(id=1), message_id=message_id, edit_date=edit_date
+    )
+
+    async def edit_text(**kwargs):
+        message.edit_date = datetime(2026, 1, 1, 12, 0, message.edit_text.await_count)
+        return SimpleNamespace(edit_date=message.edit_date)
+
+    message.edit_text = AsyncMock(side_effect=edit_text)
+    return message
+
+
+def _keyboard(label="Ver"):
+    return create_inline_keyboard([[{"text": label, "callback_data": "x"}]])
+
+
+@pytest.mark.asyncio
+async def test_identical_render_is_skipped(cache):
+    """Test: La segunda edición idéntica no llama a la API."""
+    message = _message()
+
+    assert await edit_text_if_changed(message, "Hola", reply_markup=_keyboard(), parse_mode="HTML")
+    assert not await edit_text_if_changed(message, "Hola", reply_markup=_keyboard(), parse_mode="HTML")
+    assert await edit_text_if_changed(message, "Hola", reply_markup=_keyboard("Otro"), parse_mode="HTML")
+
+    assert message.edit_text.await_count == 2
+    stats = cache.get_stats()
+    assert (stats["edits"], stats["skipped"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_edit_elsewhere_invalidates_fingerprint(cache):
+    """Test: Si edit_date cambió por otra vía, se vuelve a editar."""
+    message = _message()
+    await edit_text_if_changed(message, "Hola")
+
+    message.edit_date = datetime(2030, 1, 1)  # Editado fuera del helper
+    assert await edit_text_if_changed(message, "Hola")
+    assert message.edit_text.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_not_modified_is_absorbed(cache):
+    """Test: "message is not modified" no propaga y evita la próxima llamada."""
+    message = _message()
+    message.edit_text = AsyncMock(side_effect=TelegramBadRequest(
+        method=EditMessageText(text="x"),
+        message="Bad Request: message is not modified"
+    ))
+
+    assert not await edit_text_if_changed(message, "Hola")
+    assert not await edit_text_if_changed(message, "Hola")
+
+    assert message.edit_text.await_count == 1
+    stats = cache.get_stats()
+    assert (stats["not_modified"], stats["skipped"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_other_errors_propagate_and_lru_is_bounded(cache):
+    """Test: Otros errores se propagan; el LRU respeta max_messages."""
+    failing = _message(message_id=99)
+    failing.edit_text = AsyncMock(side_effect=RuntimeError("network"))
+    with pytest.raises(RuntimeError):
+        await edit_text_if_changed(failing, "Hola")
+
+    for message_id in (1, 2, 3):
+        await edit_text_if_changed(_message(message_id=message_id), "Hola")
+
+    stats = cache.get_stats()
+    assert (stats["messages"], stats["evictions"]) == (2, 1)
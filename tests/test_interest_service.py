@@ -0,0 +1,178 @@
+"""
+Tests del Interest Service - Estadísticas agregadas y contadores por paquete.
+
+Valida:
+- get_interest_stats usa COUNT/GROUP BY (pendientes, atendidos, por categoría)
+- get_interests retorna el total correcto con filtros
+- Contadores pre-agregados mantenidos por register/mark_as_attended/cleanup
+- El contador se siembra y se incrementa con un único upsert
+- Reconstrucción de contadores desde user_interests
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from bot.database.enums import ContentCategory, UserRole
+from bot.database.models import ContentPackage, PackageInterestCounter, User, UserInterest
+from bot.services.interest import InterestService
+
+
+async def _seed(session, users=3):
+    """Crea usuarios y dos paquetes (VIP y FREE)."""
+    for i in range(users):
+        session.add(User(user_id=1000 + i, first_name=f"U{i}", role=UserRole.FREE))
+    vip_pkg = ContentPackage(name="Pack VIP", category=ContentCategory.VIP_CONTENT)
+    free_pkg = ContentPackage(name="Pack Free", category=ContentCategory.FREE_CONTENT)
+    session.add_all([vip_pkg, free_pkg])
+    await session.commit()
+    return vip_pkg, free_pkg
+
+
+@pytest.mark.asyncio
+async def test_interest_stats_aggregates(test_session):
+    """Test: Conteos por estado y categoría calculados en BD."""
+    vip_pkg, free_pkg = await _seed(test_session)
+    service = InterestService(test_session, bot=None)
+
+    for user_id in (1000, 1001, 1002):
+        await service.register_interest(user_id, vip_pkg.id)
+    await service.register_interest(1000, free_pkg.id)
+
+    interests, total = await service.get_interests(is_attended=False)
+    await service.mark_as_attended(interests[0].id)
+    await test_session.commit()
+
+    stats = await service.get_interest_stats()
+    assert stats["total_pending"] == 3
+    assert stats["total_attended"] == 1
+    assert stats["by_package_type"] == {"VIP_CONTENT": 3, "FREE_CONTENT": 1}
+    assert stats["top_packages"][0][0].id == vip_pkg.id
+    assert sum(count for _, count in stats["top_packages"]) == 3
+    assert len(stats["recent_interests"]) == 4
+
+    _, vip_total = await service.get_interests(package_type=ContentCategory.VIP_CONTENT)
+    assert vip_total == 3
+    assert total == 4
+
+
+@pytest.mark.asyncio
+async def test_package_counters_maintained(test_session):
+    """Test: register_interest y mark_as_attended mantienen los contadores."""
+    vip_pkg, free_pkg = await _seed(test_session)
+    service = InterestService(test_session, bot=None)
+
+    await service.register_interest(1000, vip_pkg.id)
+    success, status, interest = await service.register_interest(1001, vip_pkg.id)
+    assert status == "created"
+    # Re-click dentro de la ventana de debounce no cambia contadores
+    await service.register_interest(1001, vip_pkg.id)
+
+    counts = await service.get_package_interest_counts()
+    assert counts[vip_pkg.id] == {"total": 2, "pending": 2}
+
+    await service.mark_as_attended(interest.id)
+    # Marcar dos veces no descuenta dos veces
+    await service.mark_as_attended(interest.id)
+
+    counts = await service.get_package_interest_counts([vip_pkg.id, free_pkg.id])
+    assert counts == {vip_pkg.id: {"total": 2, "pending": 1}}
+
+    top = await service.get_top_packages_by_interest(limit=5)
+    assert [(pkg.id, count) for pkg, count in top] == [(vip_pkg.id, 1)]
+
+
+@pytest.mark.asyncio
+async def test_counter_seeded_from_existing_rows(test_session):
+    """Test: Sin fila de contador, se siembra desde los intereses reales."""
+    vip_pkg, _ = await _seed(test_session)
+    # Intereses insertados sin pasar por el service (datos históricos)
+    test_session.add_all([
+        UserInterest(user_id=1000, package_id=vip_pkg.id, is_attended=True),
+        UserInterest(user_id=1001, package_id=vip_pkg.id, is_attended=False),
+    ])
+    await test_session.commit()
+
+    service = InterestService(test_session, bot=None)
+    await service.register_interest(1002, vip_pkg.id)
+
+    counts = await service.get_package_interest_counts([vip_pkg.id])
+    assert counts[vip_pkg.id] == {"total": 3, "pending": 2}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_and_rebuild_counters(test_session):
+    """Test: cleanup_old_attended borra en bloque y ajusta contadores."""
+    vip_pkg, _ = await _seed(test_session)
+    service = InterestService(test_session, bot=None)
+
+    for user_id in (1000, 1001, 1002):
+        await service.register_interest(user_id, vip_pkg.id)
+    interests, _ = await service.get_interests(limit=10)
+    for interest in interests[:2]:
+        await service.mark_as_attended(interest.id)
+        interest.attended_at = datetime.utcnow() - timedelta(days=40)
+    await test_session.commit()
+
+    removed = await service.cleanup_old_attended(days_old=30)
+    await test_session.commit()
+    assert removed == 2
+
+    counts = await service.get_package_interest_counts([vip_pkg.id])
+    assert counts[vip_pkg.id] == {"total": 1, "pending": 1}
+
+    # Rebuild produce el mismo resultado
+    await test_session.execute(
+        PackageInterestCounter.__table__.update().values(total_interests=99)
+    )
+    rebuilt = await service.rebuild_package_counters()
+    assert rebuilt == 1
+    counter = (await test_session.execute(select(PackageInterestCounter))).scalar_one()
+    assert (counter.total_interests, counter.pending_interests) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_counters_replaces_stale_and_missing_rows(test_session):
+    """Test: rebuild_package_counters rehace la tabla con INSERT ... SELECT."""
+    vip_pkg, free_pkg = await _seed(test_session)
+    # Intereses insertados sin pasar por el servicio: no hay contadores
+    test_session.add_all([
+        UserInterest(user_id=1000, package_id=vip_pkg.id, is_attended=False),
+        UserInterest(user_id=1001, package_id=vip_pkg.id, is_attended=True),
+        UserInterest(user_id=1000, package_id=free_pkg.id, is_attended=False),
+    ])
+    # Contador desfasado del paquete FREE; el VIP no tiene contador
+    test_session.add(PackageInterestCounter(
+        package_id=free_pkg.id, total_interests=7, pending_interests=7,
+        updated_at=datetime.utcnow()
+    ))
+    await test_session.commit()
+
+    service = InterestService(test_session, bot=None)
+    rebuilt = await service.rebuild_package_counters()
+    await test_session.commit()
+
+    assert rebuilt == 2
+    counts = await service.get_package_interest_counts([vip_pkg.id, free_pkg.id])
+    assert counts[vip_pkg.id] == {"total": 2, "pending": 1}
+    assert counts[free_pkg.id] == {"total": 1, "pending": 1}
+
+
+@pytest.mark.asyncio
+async def test_counter_upsert_when_row_created_concurrently(test_session):
+    """Test: Si otra transacción ya sembró el contador, el upsert suma el delta."""
+    vip_pkg, _ = await _seed(test_session)
+    test_session.add(UserInterest(user_id=1000, package_id=vip_pkg.id, is_attended=False))
+    # Fila sembrada por el primer interés de una transacción paralela
+    test_session.add(PackageInterestCounter(
+        package_id=vip_pkg.id, total_interests=1, pending_interests=1,
+        updated_at=datetime.utcnow()
+    ))
+    await test_session.commit()
+
+    service = InterestService(test_session, bot=None)
+    success, status, _ = await service.register_interest(1001, vip_pkg.id)
+
+    assert (success, status) == (True, "created")
+    counts = await service.get_package_interest_counts([vip_pkg.id])
+    assert counts[vip_pkg.id] == {"total": 2, "pending": 2}
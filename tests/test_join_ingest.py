@@ -0,0 +1,135 @@
+"""
+Tests de la ingesta en lote de ChatJoinRequest del canal Free.
+
+Valida:
+- register_free_requests_bulk: nuevas, duplicadas y reactivadas en un lote
+- Deduplicación por usuario en el buffer
+- Flush en una transacción + avisos con config cacheada
+- Reintento del lote si la transacción falla
+- Cambios de config del admin invalidan la config cacheada
+"""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from bot.background.join_ingest import JoinRequestIngestor
+from bot.database.enums import UserRole
+from bot.database.models import FreeChannelRequest, User
+from bot.services.subscription import SubscriptionService
+
+
+@pytest.mark.asyncio
+async def test_register_free_requests_bulk_outcomes(test_session, mock_bot):
+    """Test: Un lote aplica las mismas reglas que el flujo individual."""
+    now = datetime.utcnow()
+    for user_id in (1, 2, 3):
+        test_session.add(User(user_id=user_id, first_name=f"U{user_id}", role=UserRole.FREE))
+    test_session.add_all([
+        FreeChannelRequest(user_id=1, request_date=now - timedelta(minutes=1)),   # reciente
+        FreeChannelRequest(user_id=2, request_date=now - timedelta(minutes=7)),   # reactivar
+        FreeChannelRequest(user_id=3, request_date=now - timedelta(minutes=30)),  # vencida
+    ])
+    await test_session.commit()
+
+    service = SubscriptionService(test_session, mock_bot)
+    with patch("config.Config.DEFAULT_WAIT_TIME_MINUTES", 10):
+        outcomes = await service.register_free_requests_bulk({
+            1: ("uno", "Uno", None),
+            2: (None, "Dos", None),
+            3: (None, "Tres", None),
+            4: ("nuevo", "Cuatro", "Apellido"),
+        })
+    await test_session.commit()
+
+    assert {user_id: status for user_id, (status, _) in outcomes.items()} == {
+        1: "duplicate", 2: "reactivated", 3: "created", 4: "created"
+    }
+
+    requests = (await test_session.execute(
+        select(FreeChannelRequest).order_by(FreeChannelRequest.user_id)
+    )).scalars().all()
+    assert [r.user_id for r in requests] == [1, 2, 3, 4]
+    assert all(r.minutes_since_request() == 0 for r in requests[1:])
+
+    new_user = await test_session.get(User, 4)
+    assert (new_user.username, new_user.role) == ("nuevo", UserRole.FREE)
+    assert (await test_session.get(User, 1)).username == "uno"
+
+
+@pytest.mark.asyncio
+async def test_ingestor_dedups_flushes_and_acks(test_db, mock_bot):
+    """Test: Repetidos se deduplican; un flush escribe el lote y avisa a cada usuario."""
+    mock_bot.send_message = AsyncMock()
+    ingestor = JoinRequestIngestor(mock_bot, flush_ms=10_000, session_factory=test_db)
+
+    config = await ingestor.get_config()
+    assert config.free_channel_id == "-1000987654321"
+    assert config.wait_time_minutes == 5
+
+    for i in range(50):
+        ingestor.submit(1000 + i % 20, f"user{i}", "Nombre", None)
+
+    stats = ingestor.get_stats()
+    assert (stats["received"], stats["deduplicated"], stats["buffered"]) == (50, 30, 20)
+
+    assert await ingestor.flush() == 20
+    await ingestor.stop()
+
+    async with test_db() as session:
+        count = len((await session.execute(select(FreeChannelRequest))).scalars().all())
+        latest = await session.get(User, 1019)
+    assert count == 20
+    assert latest.username == "user39"  # El último perfil recibido gana
+
+    assert mock_bot.send_message.await_count == 20
+    stats = ingestor.get_stats()
+    assert (stats["flushed"], stats["batches"], stats["acks_sent"]) == (20, 1, 20)
+
+    # Segunda solicitud del mismo usuario → aviso de duplicado
+    mock_bot.send_message.reset_mock()
+    ingestor.submit(1000, "user0", "Nombre", None)
+    await ingestor.flush()
+    await ingestor.stop()
+    sent = mock_bot.send_message.await_args.kwargs
+    assert sent["chat_id"] == 1000
+    assert sent["reply_markup"] is None
+
+
+@pytest.mark.asyncio
+async def test_ingestor_requeues_failed_batch(test_db, mock_bot):
+    """Test: Si la transacción falla, el lote vuelve al buffer."""
+    mock_bot.send_message = AsyncMock()
+    ingestor = JoinRequestIngestor(mock_bot, session_factory=test_db)
+    ingestor.submit(1, None, "Uno", None)
+
+    with patch.object(
+        SubscriptionService, "register_free_requests_bulk",
+        AsyncMock(side_effect=RuntimeError("database is locked"))
+    ):
+        assert await ingestor.flush() == 0
+
+    stats = ingestor.get_stats()
+    assert (stats["failed_batches"], stats["buffered"]) == (1, 1)
+
+    assert await ingestor.flush() == 1
+    await ingestor.stop()
+    assert ingestor.get_stats()["buffered"] == 0
+
+
+@pytest.mark.asyncio
+async def test_config_change_invalidates_ingestor_cache(test_db, mock_bot, monkeypatch):
+    """Test: Cambiar la espera Free desde ConfigService recarga la config del ingestor."""
+    import bot.background.join_ingest as join_ingest
+    from bot.services.config import ConfigService
+
+    ingestor = JoinRequestIngestor(mock_bot, flush_ms=10_000, session_factory=test_db)
+    monkeypatch.setattr(join_ingest, "_ingestor", ingestor)
+
+    assert (await ingestor.get_config()).wait_time_minutes == 5
+
+    async with test_db() as session:
+        await ConfigService(session).set_wait_time(15)
+
+    assert (await ingestor.get_config()).wait_time_minutes == 15
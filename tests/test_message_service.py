@@ -462,3 +462,58 @@ class TestServiceContainerIntegration:
             "CommonMessages must not store session"
         assert not hasattr(common, 'bot'), \
             "CommonMessages must not store bot"
+
+
+# ===== SHARED PROVIDER REGISTRY TESTS =====
+
+
+class TestProviderRegistry:
+    """Test process-wide provider registry and memoized keyboards."""
+
+    def test_containers_share_registry(self):
+        """Every ServiceContainer gets the same LucienVoiceService."""
+        from bot.services.message import get_lucien_voice
+
+        first = ServiceContainer(object(), object()).message
+        second = ServiceContainer(object(), object()).message
+
+        assert first is second is get_lucien_voice()
+
+    def test_static_keyboards_built_once(self):
+        """Static keyboards are shared across calls and provider instances."""
+        from bot.services.message.user_menu import UserMenuMessages
+        from bot.utils.keyboards import admin_main_menu_keyboard, clear_static_keyboards
+
+        _, kb1 = UserMenuMessages().free_menu_greeting("Ana")
+        _, kb2 = UserMenuMessages().free_menu_greeting("Luis")
+        assert kb1 is kb2
+        assert admin_main_menu_keyboard() is admin_main_menu_keyboard()
+
+        clear_static_keyboards()
+        _, kb3 = UserMenuMessages().free_menu_greeting("Ana")
+        assert kb3 is not kb1
+        assert kb3 == kb1
+
+    def test_warm_up_builds_static_keyboards(self):
+        """warm_up instantiates providers and primes their keyboards."""
+        service = LucienVoiceService()
+
+        assert service.warm_up() > 0
+        assert service._admin._main is not None
+        assert service._user._menu is not None
+
+    def test_precompiled_texts_render_variable_parts(self):
+        """Precompiled templates still render the per-call values."""
+        service = LucienVoiceService()
+
+        text, _ = service.admin.main.admin_menu_greeting(is_configured=True)
+        assert text.startswith("🎩 <b>Lucien:</b>\n\n<i>")
+        assert "Todo está en orden" in text
+
+        text, _ = service.admin.main.admin_menu_greeting(
+            is_configured=False, missing_items=["Canal VIP"]
+        )
+        assert "Canal VIP" in text
+
+        text, _ = service.user.menu.free_menu_greeting("<Ana>", free_queue_position=4)
+        assert "&lt;Ana&gt;" in text and "<code>4</code>" in text
@@ -0,0 +1,209 @@
+"""
+Tests del script de migración SQLite → PostgreSQL (scripts/migrate_to_postgres.py).
+
+Valida:
+- column_converter convierte texto de SQLite al tipo que espera COPY
+- chunk_checksum no depende del orden de las filas y detecta cambios
+- dependency_order pone padres antes que hijos y detecta ciclos
+- Claves de texto compuestas se recorren y comparan byte a byte en
+  origen y destino (COLLATE BINARY / COLLATE "C")
+- Ida y vuelta contra PostgreSQL real si MIGRATION_TEST_POSTGRES_URL
+  apunta a una base de pruebas (se omite si no)
+"""
+import asyncio
+import importlib.util
+import os
+import sqlite3
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).parent.parent / "scripts" / "migrate_to_postgres.py"
+_spec = importlib.util.spec_from_file_location("migrate_to_postgres", _SCRIPT)
+migrate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migrate)
+
+POSTGRES_URL = os.getenv("MIGRATION_TEST_POSTGRES_URL")
+
+# Términos cuyo orden bytewise difiere del orden de una collation de idioma
+TERMS = ["Zoe", "ana", "Ana", "ángel", "beto", "_x", "éclair", "Éric", "zz", "a b"]
+
+
+def test_column_converter():
+    assert migrate.column_converter("timestamp without time zone")(
+        "2024-01-28 12:00:00.000000"
+    ) == datetime(2024, 1, 28, 12, 0)
+    assert migrate.column_converter("timestamp with time zone")(
+        "2024-01-28 12:00:00"
+    ) == datetime(2024, 1, 28, 12, 0, tzinfo=timezone.utc)
+    assert migrate.column_converter("date")("2024-01-28") == date(2024, 1, 28)
+    assert migrate.column_converter("boolean")(1) is True
+    assert migrate.column_converter("jsonb")({"b": 1}) == '{"b": 1}'
+    assert migrate.column_converter("numeric")(9.99) == Decimal("9.99")
+    assert migrate.column_converter("bigint")("42") == 42
+    assert migrate.column_converter("USER-DEFINED")("VIP") == "VIP"
+    assert migrate.column_converter("integer")(None) is None
+
+
+def test_chunk_checksum_is_order_independent():
+    normalizers = [migrate.column_normalizer(t) for t in ("integer", "text", "jsonb")]
+    rows = [(1, "a", '{"x": 1, "y": 2}'), (2, None, "{}")]
+
+    digest = migrate.chunk_checksum(rows, normalizers)
+
+    assert digest == migrate.chunk_checksum(list(reversed(rows)), normalizers)
+    # jsonb releído con otro orden de claves da el mismo checksum
+    assert digest == migrate.chunk_checksum(
+        [(1, "a", '{"y": 2, "x": 1}'), (2, None, "{}")], normalizers
+    )
+    assert digest != migrate.chunk_checksum(
+        [(1, "a", '{"x": 1, "y": 2}'), (2, "", "{}")], normalizers
+    )
+    assert digest != migrate.chunk_checksum(rows[:1], normalizers)
+
+
+def test_dependency_order():
+    foreign_keys = {
+        "vip_subscribers": {"users", "invitation_tokens"},
+        "invitation_tokens": {"subscription_plans"},
+        "users": {"users"},  # auto-referencia ignorada
+        "user_interests": {"users", "content_packages"},
+    }
+    tables = ["user_interests", "vip_subscribers", "invitation_tokens", "users",
+              "subscription_plans", "content_packages"]
+
+    order = migrate.dependency_order(tables, foreign_keys)
+
+    assert sorted(order) == sorted(tables)
+    for table, refs in foreign_keys.items():
+        for ref in refs - {table}:
+            assert order.index(ref) < order.index(table)
+
+    with pytest.raises(ValueError):
+        migrate.dependency_order(["a", "b"], {"a": {"b"}, "b": {"a"}})
+
+
+def test_key_predicate_forces_bytewise_collation():
+    types = ["bigint", "character varying", "USER-DEFINED"]
+    target = migrate.key_predicate(
+        ["user_id", "term", "field"], types, lambda i: f"${i + 1}", ">", target=True
+    )
+    source = migrate.key_predicate(
+        ["user_id", "term", "field"], types, lambda i: f":k{i}", ">", target=False
+    )
+
+    assert target == (
+        '("user_id", "term" COLLATE "C", CAST("field" AS TEXT) COLLATE "C") > ($1, $2, $3)'
+    )
+    assert source == (
+        '("user_id", "term" COLLATE BINARY, "field" COLLATE BINARY) > (:k0, :k1, :k2)'
+    )
+
+
+def _text_key_plan():
+    return migrate.TablePlan(
+        name="user_search_terms",
+        columns=["user_id", "term", "field"],
+        key=["user_id", "term", "field"],
+        data_types=["bigint", "text", "character varying"],
+        depends_on=set(),
+    )
+
+
+def _create_source(path):
+    rows = [(user_id, term, field) for user_id in (1, 2) for term in TERMS
+            for field in ("first_name", "username")]
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE user_search_terms (user_id INTEGER NOT NULL, "
+        "term TEXT NOT NULL, field TEXT NOT NULL, "
+        "PRIMARY KEY (user_id, term, field))"
+    )
+    conn.executemany("INSERT INTO user_search_terms VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return rows
+
+
+def test_text_composite_key_round_trip_by_chunks(tmp_path):
+    """Cada chunk del origen coincide con el rango bytewise (after, until] del destino."""
+    rows = _create_source(tmp_path / "source.db")
+    plan = _text_key_plan()
+    migrator = migrate.DatabaseMigrator(
+        f"sqlite:///{tmp_path / 'source.db'}", "postgresql://unused", chunk_size=3
+    )
+    migrator.source_engine = migrate.create_engine(f"sqlite:///{tmp_path / 'source.db'}")
+
+    # Destino simulado: copia de las filas convertidas; los rangos se
+    # evalúan con la comparación de tuplas de Python (por code point, igual
+    # que bytewise en UTF-8 y que COLLATE "C")
+    target = [plan.convert(row) for row in rows]
+    read, last_key = [], None
+    source_checksum = target_checksum = ""
+    try:
+        while True:
+            raw = migrator._fetch_source_chunk_sync(plan, last_key)
+            if not raw:
+                break
+            records = [plan.convert(row) for row in raw]
+            chunk_last = tuple(plan.key_of(records[-1]))
+            written = [row for row in target
+                       if (last_key is None or row > tuple(last_key)) and row <= chunk_last]
+
+            source_checksum = migrate.chain_checksum(
+                source_checksum, migrate.chunk_checksum(records, plan.normalizers)
+            )
+            target_checksum = migrate.chain_checksum(
+                target_checksum, migrate.chunk_checksum(written, plan.normalizers)
+            )
+            read.extend(records)
+            last_key = list(chunk_last)
+            if len(raw) < migrator.chunk_size:
+                break
+    finally:
+        migrator.source_engine.dispose()
+
+    assert read == sorted(rows)
+    assert source_checksum == target_checksum
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="MIGRATION_TEST_POSTGRES_URL no configurada")
+def test_text_composite_key_round_trip_postgres(tmp_path):
+    """Migración y validación completas contra PostgreSQL (collation de idioma)."""
+    import asyncpg
+
+    _create_source(tmp_path / "source.db")
+
+    async def run():
+        conn = await asyncpg.connect(POSTGRES_URL)
+        try:
+            await conn.execute("DROP TABLE IF EXISTS user_search_terms")
+            await conn.execute(
+                "CREATE TABLE user_search_terms (user_id BIGINT NOT NULL, "
+                "term VARCHAR(100) NOT NULL, field VARCHAR(20) NOT NULL, "
+                "PRIMARY KEY (user_id, term, field))"
+            )
+        finally:
+            await conn.close()
+
+        migrator = migrate.DatabaseMigrator(
+            f"sqlite:///{tmp_path / 'source.db'}", POSTGRES_URL, chunk_size=3, workers=1
+        )
+        report = await migrator.migrate()
+
+        validator = migrate.DatabaseMigrator(
+            f"sqlite:///{tmp_path / 'source.db'}", POSTGRES_URL, chunk_size=3, workers=1
+        )
+        await validator.setup()
+        try:
+            valid = await validator.validate_migration()
+        finally:
+            await validator.cleanup()
+        return report, valid
+
+    report, valid = asyncio.run(run())
+
+    assert report.errors == [] and "user_search_terms" in report.tables_migrated
+    assert valid
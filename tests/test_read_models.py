@@ -0,0 +1,85 @@
+"""
+Tests de los registros livianos (read models).
+
+Valida:
+- select_records() consulta solo las columnas del registro
+- La relación VIPSubscriber.user es opt-in (selectinload) y falla sin SQL implícito
+- expire_vip_subscribers() marca expirados con un UPDATE por lotes
+"""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from bot.database.enums import UserRole
+from bot.database.models import InvitationToken, User, VIPSubscriber
+from bot.database.read_models import VIPSubscriberRecord, fetch_records, select_records
+from bot.services.subscription import SubscriptionService
+
+
+async def _seed(session):
+    session.add_all([
+        User(user_id=1, first_name="Uno", role=UserRole.VIP),
+        User(user_id=2, first_name="Dos", role=UserRole.VIP),
+    ])
+    token = InvitationToken(token="READ_MODELS", generated_by=9, used=True)
+    session.add(token)
+    await session.flush()
+    session.add_all([
+        VIPSubscriber(user_id=1, token_id=token.id, status="active",
+                      expiry_date=datetime.utcnow() - timedelta(days=1)),
+        VIPSubscriber(user_id=2, token_id=token.id, status="active",
+                      expiry_date=datetime.utcnow() + timedelta(days=1)),
+    ])
+    await session.commit()
+    session.expunge_all()
+
+
+@pytest.mark.asyncio
+async def test_records_select_only_their_columns(test_session):
+    await _seed(test_session)
+    stmt = select_records(VIPSubscriberRecord).order_by(VIPSubscriber.user_id)
+
+    assert [c.name for c in stmt.selected_columns] == [
+        "id", "user_id", "status", "expiry_date", "vip_entry_stage"
+    ]
+    records = await fetch_records(test_session, VIPSubscriberRecord, stmt)
+
+    assert [r.user_id for r in records] == [1, 2]
+    assert [r.is_expired() for r in records] == [True, False]
+    assert not hasattr(records[0], "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_user_relationship_is_opt_in(test_session):
+    await _seed(test_session)
+
+    subscriber = (await test_session.execute(
+        select(VIPSubscriber).where(VIPSubscriber.user_id == 1)
+    )).scalar_one()
+    with pytest.raises(InvalidRequestError):
+        subscriber.user
+
+    test_session.expunge_all()
+    subscriber = (await test_session.execute(
+        select(VIPSubscriber)
+        .where(VIPSubscriber.user_id == 1)
+        .options(selectinload(VIPSubscriber.user))
+    )).scalar_one()
+    assert subscriber.user.first_name == "Uno"
+
+
+@pytest.mark.asyncio
+async def test_expire_uses_batch_update(test_session):
+    await _seed(test_session)
+
+    expired = await SubscriptionService(test_session, AsyncMock()).expire_vip_subscribers()
+
+    assert expired == 1
+    statuses = dict((await test_session.execute(
+        select(VIPSubscriber.user_id, VIPSubscriber.status)
+    )).all())
+    assert statuses == {1: "expired", 2: "active"}
@@ -0,0 +1,121 @@
+"""
+Tests del pipeline de retención por lotes.
+
+Valida:
+- Cada política borra solo filas vencidas, por lotes de chunk_size
+- Tokens referenciados por un suscriptor se conservan
+- Intereses atendidos se borran ajustando los contadores por paquete
+- dry_run solo cuenta y días = 0 desactiva la política
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from bot.background.retention import RetentionPipeline
+from bot.database.enums import ContentCategory, RoleChangeReason, UserRole
+from bot.database.models import (
+    ContentPackage,
+    FreeChannelRequest,
+    InvitationToken,
+    User,
+    UserInterest,
+    UserRoleChangeLog,
+    VIPSubscriber,
+)
+from bot.services.interest import InterestService
+from config import Config
+
+OLD = datetime.utcnow() - timedelta(days=400)
+RECENT = datetime.utcnow() - timedelta(days=1)
+
+
+async def _seed(session):
+    """Una fila vencida y una reciente (o protegida) por tabla."""
+    for user_id in (1, 2, 3):
+        session.add(User(user_id=user_id, first_name=f"U{user_id}", role=UserRole.FREE))
+    package = ContentPackage(name="Pack", category=ContentCategory.VIP_CONTENT)
+    session.add(package)
+    await session.flush()
+
+    session.add_all([
+        FreeChannelRequest(user_id=1, processed=True, processed_at=OLD),
+        FreeChannelRequest(user_id=2, processed=True, processed_at=OLD),
+        FreeChannelRequest(user_id=3, processed=True, processed_at=OLD),
+        FreeChannelRequest(user_id=1, processed=False),
+    ])
+    for changed_at in (OLD, RECENT):
+        session.add(UserRoleChangeLog(
+            user_id=1, new_role=UserRole.VIP, changed_by=0,
+            reason=RoleChangeReason.VIP_REDEEMED, change_source="SYSTEM",
+            changed_at=changed_at
+        ))
+
+    used_old = InvitationToken(token="USED_OLD", generated_by=9, used=True, used_at=OLD, created_at=OLD)
+    unused_old = InvitationToken(token="UNUSED_OLD", generated_by=9, created_at=OLD)
+    referenced = InvitationToken(token="REFERENCED", generated_by=9, used=True, used_at=OLD, created_at=OLD)
+    fresh = InvitationToken(token="FRESH", generated_by=9)
+    session.add_all([used_old, unused_old, referenced, fresh])
+    await session.flush()
+
+    session.add_all([
+        VIPSubscriber(user_id=1, expiry_date=OLD, status="expired", token_id=used_old.id),
+        VIPSubscriber(user_id=2, expiry_date=RECENT, status="expired", token_id=referenced.id),
+    ])
+
+    interests = InterestService(session, bot=None)
+    for user_id in (1, 2, 3):
+        await interests.register_interest(user_id, package.id)
+    for interest in (await session.execute(select(UserInterest))).scalars().all()[:2]:
+        await interests.mark_as_attended(interest.id)
+        interest.attended_at = OLD
+
+    await session.commit()
+    return package.id
+
+
+async def _count(session, model):
+    return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_retention_purges_in_chunks(test_db, test_session):
+    package_id = await _seed(test_session)
+    pipeline = RetentionPipeline(chunk_size=2, pause_ms=0, session_factory=test_db)
+
+    report = await pipeline.run(dry_run=False)
+
+    assert report["free_channel_requests"]["removed"] == 3
+    assert report["free_channel_requests"]["chunks"] == 2
+    assert report["user_role_change_log"]["removed"] == 1
+    assert report["vip_subscribers"]["removed"] == 1
+    assert report["user_interests"]["removed"] == 2
+    # USED_OLD quedó libre al borrar su suscriptor; REFERENCED se conserva
+    assert report["invitation_tokens"]["removed"] == 2
+
+    test_session.expire_all()
+    tokens = (await test_session.execute(select(InvitationToken.token))).scalars().all()
+    assert sorted(tokens) == ["FRESH", "REFERENCED"]
+    assert await _count(test_session, FreeChannelRequest) == 1
+    assert await _count(test_session, UserRoleChangeLog) == 1
+    assert await _count(test_session, VIPSubscriber) == 1
+
+    counts = await InterestService(test_session, bot=None).get_package_interest_counts([package_id])
+    assert counts[package_id] == {"total": 1, "pending": 1}
+
+    assert pipeline.get_stats()["total_removed"]["free_channel_requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_retention_dry_run_and_disabled_policy(test_db, test_session, monkeypatch):
+    await _seed(test_session)
+    monkeypatch.setattr(Config, "RETENTION_ROLE_LOG_DAYS", 0)
+    pipeline = RetentionPipeline(chunk_size=2, pause_ms=0, session_factory=test_db)
+
+    report = await pipeline.run(dry_run=True)
+
+    assert "user_role_change_log" not in report
+    assert report["free_channel_requests"]["matched"] == 3
+    assert report["invitation_tokens"]["matched"] == 1  # USED_OLD sigue referenciado
+    assert await _count(test_session, FreeChannelRequest) == 4
+    assert pipeline.get_stats()["runs"] == 1
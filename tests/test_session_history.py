@@ -152,35 +152,67 @@ class TestSessionMessageHistory:
         variant_indices = [e.variant_index for e in entries]
         assert variant_indices == [2, 3, 4]
 
-    def test_lazy_cleanup_triggered_sometimes(self):
-        """Lazy cleanup triggered on ~10% of add_entry calls (hash-based)."""
-        history = SessionMessageHistory(ttl_seconds=1, max_entries=10)
+    def test_global_cap_evicts_least_recently_active(self):
+        """Beyond max_users the least recently active user is evicted."""
+        history = SessionMessageHistory(ttl_seconds=300, max_users=3)
+
+        for user_id in (1, 2, 3):
+            history.add_entry(user_id=user_id, method_name="greeting", variant_index=0)
+        # User 1 becomes most recent
+        history.add_entry(user_id=1, method_name="greeting", variant_index=1)
+        history.add_entry(user_id=4, method_name="greeting", variant_index=0)
+
+        assert list(history._sessions) == [3, 1, 4]
+        assert history.get_recent_variants(2, "greeting") == []
+        assert history.get_recent_variants(1, "greeting") == [1, 0]
+        assert history.get_stats()["evictions"] == 1
+
+    def test_sweep_removes_only_expired_users(self):
+        """sweep() drops fully expired users from the LRU head."""
+        history = SessionMessageHistory(ttl_seconds=1)
 
-        # Find a user_id that triggers cleanup (hash % 10 == 0)
-        # We know user_id=10 works based on hash behavior
-        user_id = 10
+        history.add_entry(user_id=1, method_name="greeting", variant_index=0)
+        history.add_entry(user_id=2, method_name="greeting", variant_index=0)
+        time.sleep(1.1)
+        history.add_entry(user_id=3, method_name="greeting", variant_index=0)
+        # User 2 has an expired and a live entry: kept
+        history.add_entry(user_id=2, method_name="greeting", variant_index=1)
 
-        # Add expired entry
-        history.add_entry(user_id=user_id, method_name="old", variant_index=0)
-        old_count = len(history._sessions[user_id])
-        time.sleep(1.1)  # Expire the entry
+        assert history.sweep() == 1
+        assert list(history._sessions) == [3, 2]
 
-        # Add new entry - this should trigger lazy cleanup BEFORE adding
-        history.add_entry(user_id=user_id, method_name="new", variant_index=1)
+        stats = history.get_stats()
+        assert (stats["sweeps"], stats["swept_users"]) == (1, 1)
 
-        # After adding, the session should have the old (expired) entry removed
-        # because lazy cleanup happened at the start of add_entry
-        entries = list(history._sessions[user_id])
-        variant_indices = [e.variant_index for e in entries]
+    def test_snapshot_roundtrip(self, tmp_path):
+        """Snapshot restores live entries in LRU order and skips expired ones."""
+        path = str(tmp_path / "history.json")
+        history = SessionMessageHistory(ttl_seconds=300)
+        history.add_entry(user_id=1, method_name="greeting", variant_index=2)
+        history.add_entry(user_id=2, method_name="success", variant_index=1)
+        history.add_entry(user_id=1, method_name="greeting", variant_index=0)
+        history._sessions[2][0].timestamp -= 600  # Expired
 
-        # The expired entry (variant 0) should have been cleaned up
-        # Only the new entry (variant 1) should remain
-        # Note: Due to timing, we might have 2 entries, but the old one should be expired
-        assert 1 in variant_indices  # New entry exists
+        assert history.save_snapshot(path) == 1
 
-        # Active entries should only count non-expired ones
-        stats = history.get_stats()
-        assert stats["active_entries"] >= 1  # At least the new entry is active
+        restored = SessionMessageHistory(ttl_seconds=300)
+        assert restored.load_snapshot(path) == 1
+        assert restored.get_recent_variants(1, "greeting") == [0, 2]
+        assert 2 not in restored._sessions
+
+        assert restored.load_snapshot(str(tmp_path / "missing.json")) == 0
+
+    def test_containers_share_process_store(self):
+        """Every ServiceContainer sees the same history across updates."""
+        from unittest.mock import Mock
+
+        from bot.services.container import ServiceContainer
+        from bot.services.message.session_history import get_session_history
+
+        first = ServiceContainer(Mock(), Mock()).session_history
+        second = ServiceContainer(Mock(), Mock()).session_history
+
+        assert first is second is get_session_history()
 
     def test_multiple_users_independent_sessions(self):
         """Each user has independent session history."""
@@ -0,0 +1,104 @@
+"""
+Tests del middleware singleflight de la Bot API.
+
+Valida:
+- Llamadas idénticas concurrentes hacen un solo request
+- Parámetros distintos o métodos fuera de la allowlist no se combinan
+- Las excepciones llegan a todos los llamadores
+- Cancelar un llamador no cancela el request de los demás
+"""
+import asyncio
+
+import pytest
+from aiogram import Bot
+from aiogram.methods import GetChatMember, SendMessage
+
+from bot.middlewares.singleflight import SingleflightRequestMiddleware
+
+
+@pytest.fixture
+def bot():
+    return Bot(token="42:TEST")
+
+
+@pytest.fixture
+def middleware():
+    return SingleflightRequestMiddleware({"getChatMember"})
+
+
+def _make_request(calls, result="ok", error=None, delay=0.01):
+    async def make_request(bot, method):
+        calls.append(method)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+    return make_request
+
+
+async def test_identical_calls_coalesced(bot, middleware):
+    calls = []
+    make_request = _make_request(calls)
+    method = GetChatMember(chat_id=-100123, user_id=7)
+
+    results = await asyncio.gather(*[
+        middleware(make_request, bot, GetChatMember(chat_id=-100123, user_id=7))
+        for _ in range(10)
+    ])
+
+    assert results == ["ok"] * 10
+    assert len(calls) == 1
+    assert middleware.get_stats()["coalesced"] == 9
+    assert middleware.get_stats()["in_flight"] == 0
+
+    # Terminado el request, la siguiente llamada vuelve a la API
+    await middleware(make_request, bot, method)
+    assert len(calls) == 2
+
+
+async def test_distinct_calls_not_coalesced(bot, middleware):
+    calls = []
+    make_request = _make_request(calls)
+
+    await asyncio.gather(
+        middleware(make_request, bot, GetChatMember(chat_id=-100123, user_id=7)),
+        middleware(make_request, bot, GetChatMember(chat_id=-100123, user_id=8)),
+        middleware(make_request, bot, SendMessage(chat_id=1, text="hola")),
+        middleware(make_request, bot, SendMessage(chat_id=1, text="hola")),
+    )
+
+    assert len(calls) == 4
+    assert middleware.get_stats()["coalesced"] == 0
+
+
+async def test_error_fans_out(bot, middleware):
+    calls = []
+    make_request = _make_request(calls, error=RuntimeError("Bad Gateway"))
+
+    results = await asyncio.gather(
+        *[
+            middleware(make_request, bot, GetChatMember(chat_id=-100123, user_id=7))
+            for _ in range(3)
+        ],
+        return_exceptions=True
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelled_caller_does_not_cancel_others(bot, middleware):
+    calls = []
+    make_request = _make_request(calls, delay=0.05)
+
+    first = asyncio.create_task(
+        middleware(make_request, bot, GetChatMember(chat_id=-100123, user_id=7))
+    )
+    second = asyncio.create_task(
+        middleware(make_request, bot, GetChatMember(chat_id=-100123, user_id=7))
+    )
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "ok"
+    assert len(calls) == 1
@@ -0,0 +1,72 @@
+"""
+Tests del mantenimiento de SQLite.
+
+Valida:
+- get_sqlite_stats() reporta páginas, fragmentación y modo auto_vacuum
+- run_sqlite_maintenance() trunca el WAL y libera páginas con
+  incremental_vacuum
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from bot.database.maintenance import (
+    get_last_maintenance_report,
+    get_sqlite_stats,
+    run_sqlite_maintenance,
+)
+
+
+@pytest.fixture
+async def fragmented_engine(tmp_path):
+    """Base en archivo con auto_vacuum=INCREMENTAL y filas borradas."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'maint.db'}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+        await conn.execute(text("PRAGMA journal_mode=WAL"))
+        await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        await conn.execute(
+            text("INSERT INTO t (v) VALUES (:v)"),
+            [{"v": "x" * 500} for _ in range(1000)]
+        )
+    yield engine
+    await engine.dispose()
+
+
+async def _delete_rows(engine):
+    async with engine.begin() as conn:
+        await conn.execute(text("DELETE FROM t WHERE id > 100"))
+
+
+async def test_stats_report_fragmentation(fragmented_engine):
+    await _delete_rows(fragmented_engine)
+    stats = await get_sqlite_stats(fragmented_engine)
+
+    assert stats["auto_vacuum"] == "incremental"
+    assert stats["freelist_count"] > 0
+    assert 0 < stats["fragmentation_pct"] <= 100
+    assert stats["db_bytes"] == stats["page_size"] * stats["page_count"]
+
+
+async def test_maintenance_truncates_wal_and_vacuums(fragmented_engine):
+    # Una conexión abierta impide el checkpoint automático al cerrar
+    async with fragmented_engine.connect() as reader:
+        await reader.execute(text("SELECT count(*) FROM t"))
+        await reader.commit()
+        await _delete_rows(fragmented_engine)
+        assert (await get_sqlite_stats(fragmented_engine))["wal_bytes"] > 0
+
+        report = await run_sqlite_maintenance(vacuum_pages=10, engine=fragmented_engine)
+
+    assert report["checkpoint"]["busy"] == 0
+    assert report["after"]["wal_bytes"] == 0
+    assert report["vacuumed_pages"] == 10
+    assert report["after"]["freelist_count"] < report["before"]["freelist_count"]
+    assert set(report["elapsed_ms"]) == {"wal_checkpoint", "analyze", "incremental_vacuum"}
+    assert get_last_maintenance_report() is report
+
+
+async def test_memory_database_has_no_wal(test_engine):
+    stats = await get_sqlite_stats(test_engine)
+    assert stats["wal_bytes"] == 0
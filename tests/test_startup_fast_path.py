@@ -0,0 +1,192 @@
+"""
+Tests del arranque rápido (chequeo de migraciones in-process).
+
+Valida:
+- get_script_head() resuelve el head sin subprocesos
+- Con alembic_version en head no se lanza ningún comando de Alembic
+- Fuera de head en desarrollo se omite el upgrade y se reporta False
+- StartupTimer registra las fases
+- run_graph() corre fases independientes en paralelo y respeta dependencias
+- LazyRouter importa el router real en su primer update
+"""
+import asyncio
+import sqlite3
+import sys
+from datetime import datetime
+
+import pytest
+
+from aiogram import F, Router
+from aiogram.types import CallbackQuery, Chat, Message, User
+
+from bot.database import migrations
+from bot.handlers.lazy import LazyRouter
+from bot.utils.startup_timing import StartupTimer, parse_importtime
+from config import Config
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch):
+    """Base SQLite en archivo (la URL de tests es :memory:)."""
+    path = tmp_path / "startup.db"
+    monkeypatch.setattr(Config, "DATABASE_URL", f"sqlite:///{path}")
+    monkeypatch.setattr(
+        migrations, "run_alembic_command",
+        lambda args: pytest.fail(f"subproceso de Alembic inesperado: {args}")
+    )
+    return path
+
+
+def _stamp(path, revision):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+        conn.execute("INSERT INTO alembic_version VALUES (?)", (revision,))
+
+
+def test_script_head_in_process():
+    head = migrations.get_script_head()
+    assert head is not None and len(head) == 12
+
+
+async def test_at_head_skips_alembic(file_db, monkeypatch):
+    monkeypatch.setenv("ENV", "production")
+    _stamp(file_db, migrations.get_script_head())
+
+    revision = await migrations.check_schema_revision()
+
+    assert revision.at_head
+    assert await migrations.run_migrations_if_needed() is True
+
+
+async def test_behind_head_in_development(file_db, monkeypatch):
+    monkeypatch.delenv("ENV", raising=False)
+    _stamp(file_db, "e5b27d6c0f93")
+
+    revision = await migrations.check_schema_revision()
+
+    assert revision.current == "e5b27d6c0f93"
+    assert not revision.at_head
+    assert await migrations.run_migrations_if_needed() is False
+
+
+async def test_unmigrated_database(file_db):
+    revision = await migrations.check_schema_revision()
+    assert revision.current is None
+    assert not revision.at_head
+
+
+def test_startup_timer_phases():
+    timer = StartupTimer()
+    with timer.phase("migraciones"):
+        pass
+    with pytest.raises(RuntimeError):
+        with timer.phase("base de datos"):
+            raise RuntimeError("boom")
+
+    assert [name for name, _ in timer.phases] == ["migraciones", "base de datos"]
+    assert set(timer.as_dict()["phases"]) == {"migraciones", "base de datos"}
+    assert "migraciones" in timer.summary()
+
+
+async def test_run_graph_parallel_with_dependencies():
+    timer = StartupTimer()
+    order = []
+
+    async def phase(name, result):
+        order.append(f"{name}:inicio")
+        await asyncio.sleep(0.05)
+        order.append(f"{name}:fin")
+        return result
+
+    started = asyncio.get_running_loop().time()
+    results = await timer.run_graph({
+        "migraciones": ((), lambda r: phase("migraciones", True)),
+        "base de datos": (("migraciones",), lambda r: phase("base de datos", r["migraciones"])),
+        "health API": ((), lambda r: phase("health API", None)),
+    })
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert results["base de datos"] is True
+    assert order.index("base de datos:inicio") > order.index("migraciones:fin")
+    assert order.index("health API:inicio") < order.index("migraciones:fin")
+    assert elapsed < 0.14  # Dos niveles, no tres fases en serie
+    assert len(timer.phases) == 3
+
+
+async def test_run_graph_failure_cancels_rest():
+    timer = StartupTimer()
+    cancelled = asyncio.Event()
+
+    async def slow(r):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def boom(r):
+        raise RuntimeError("migración fallida")
+
+    with pytest.raises(RuntimeError, match="migración fallida"):
+        await timer.run_graph({
+            "migraciones": ((), boom),
+            "caches": ((), slow),
+            "base de datos": (("migraciones",), slow),
+        })
+
+    assert cancelled.is_set()
+
+    with pytest.raises(ValueError):
+        await timer.run_graph({"base de datos": (("migraciones",), slow)})
+
+
+def test_parse_importtime():
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   config",
+        "import time:      3000 |       5000 | aiogram",
+        "import time:        50 |       5170 | main",
+    ])
+
+    costs = parse_importtime(output)
+
+    assert costs[0] == ("main", 50, 5170)
+    assert [module for module, _, _ in costs] == ["main", "aiogram", "config"]
+
+
+async def test_lazy_router_loads_on_first_update(tmp_path, monkeypatch):
+    (tmp_path / "lazy_admin_mod.py").write_text(
+        "from aiogram import F, Router\n"
+        "lazy_router = Router(name='lazy_admin')\n"
+        "calls = []\n"
+        "@lazy_router.callback_query(F.data.startswith('pricing:'))\n"
+        "async def handler(callback):\n"
+        "    calls.append(callback.data)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_admin_mod", raising=False)
+
+    root = Router(name="root")
+    lazy = LazyRouter("lazy_admin_mod", "lazy_router", callback_prefixes=("pricing:",))
+    root.include_router(lazy)
+
+    @root.callback_query(F.data == "admin:main")
+    async def admin_main(callback):
+        pass
+
+    user = User(id=1, is_bot=False, first_name="Test")
+    message = Message(message_id=1, date=datetime.now(), chat=Chat(id=1, type="private"))
+
+    def callback(data):
+        return CallbackQuery(id="1", from_user=user, chat_instance="1", data=data, message=message)
+
+    await root.propagate_event("callback_query", callback("admin:main"))
+    assert "lazy_admin_mod" not in sys.modules
+    assert not lazy.loaded
+
+    await root.propagate_event("callback_query", callback("pricing:list"))
+    await root.propagate_event("callback_query", callback("pricing:create"))
+
+    assert lazy.loaded
+    assert sys.modules["lazy_admin_mod"].calls == ["pricing:list", "pricing:create"]
+    assert not lazy.callback_query.handlers
@@ -0,0 +1,109 @@
+"""
+Tests de los recorridos en streaming.
+
+Valida:
+- stream_scalars()/stream_records() recorren todo el resultado por lotes
+- iter_key_batches() tolera que el consumidor modifique las filas del lote
+- write_csv_tempfile_async() consume un async iterable
+- count_vip_subscribers() cuenta con COUNT
+"""
+import csv
+import os
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import insert, select, update
+
+from bot.database.enums import UserRole
+from bot.database.models import FreeChannelRequest, InvitationToken, User, VIPSubscriber
+from bot.database.read_models import FreeRequestRecord, select_records
+from bot.database.streaming import iter_key_batches, stream_records, stream_scalars
+from bot.services.subscription import SubscriptionService
+from bot.utils.exports import write_csv_tempfile_async
+
+ROWS = 1200
+
+
+async def _seed_requests(session):
+    await session.execute(insert(User), [
+        {"user_id": user_id, "first_name": f"U{user_id}", "role": UserRole.FREE}
+        for user_id in range(1, ROWS + 1)
+    ])
+    await session.execute(insert(FreeChannelRequest), [
+        {"user_id": user_id, "request_date": datetime.utcnow(), "processed": False}
+        for user_id in range(1, ROWS + 1)
+    ])
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_stream_scalars_and_records(test_session):
+    await _seed_requests(test_session)
+
+    user_ids = [
+        user_id async for user_id in
+        stream_scalars(test_session, select(FreeChannelRequest.user_id), batch_size=100)
+    ]
+    assert user_ids == list(range(1, ROWS + 1))
+
+    records = stream_records(
+        test_session, FreeRequestRecord, select_records(FreeRequestRecord), batch_size=100
+    )
+    assert sum([1 async for record in records if record.minutes_since_request() == 0]) == ROWS
+
+
+@pytest.mark.asyncio
+async def test_key_batches_allow_updating_rows(test_session):
+    await _seed_requests(test_session)
+    pending = select_records(FreeRequestRecord).where(FreeChannelRequest.processed == False)
+
+    sizes = []
+    async for batch in iter_key_batches(
+        test_session, FreeRequestRecord, pending, FreeChannelRequest.id, batch_size=500
+    ):
+        sizes.append(len(batch))
+        await test_session.execute(
+            update(FreeChannelRequest)
+            .where(FreeChannelRequest.id.in_([r.id for r in batch]))
+            .values(processed=True)
+        )
+
+    assert sizes == [500, 500, 200]
+
+
+@pytest.mark.asyncio
+async def test_async_csv_export_from_stream(test_session):
+    await _seed_requests(test_session)
+
+    async def rows():
+        async for user_id in stream_scalars(test_session, select(FreeChannelRequest.user_id)):
+            yield (user_id,)
+
+    path, count = await write_csv_tempfile_async(["user_id"], rows())
+    try:
+        with open(path, newline="", encoding="utf-8") as file:
+            lines = list(csv.reader(file))
+    finally:
+        os.remove(path)
+
+    assert count == ROWS
+    assert lines[0] == ["user_id"] and lines[-1] == [str(ROWS)]
+
+
+@pytest.mark.asyncio
+async def test_count_vip_subscribers(test_session):
+    token = InvitationToken(token="COUNT_TOKEN", generated_by=9, used=True)
+    test_session.add(token)
+    await test_session.flush()
+    for user_id, status in ((1, "active"), (2, "active"), (3, "expired")):
+        test_session.add(User(user_id=user_id, first_name="U", role=UserRole.VIP))
+        test_session.add(VIPSubscriber(
+            user_id=user_id, token_id=token.id, status=status,
+            expiry_date=datetime.utcnow() + timedelta(days=1)
+        ))
+    await test_session.commit()
+
+    service = SubscriptionService(test_session, AsyncMock())
+    assert await service.count_vip_subscribers(status="active") == 2
+    assert await service.count_vip_subscribers() == 3
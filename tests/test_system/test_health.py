@@ -309,3 +309,20 @@ async def test_health_app_has_no_docs():
     assert app.docs_url is None
     # ReDoc should be disabled
     assert app.redoc_url is None
+
+
+async def test_get_health_summary_isolates_stats_errors():
+    """Verify a failing subsystem stats call does not break the summary."""
+    from bot.health.check import get_health_summary, HealthStatus
+
+    with patch("bot.health.check.check_bot_health", return_value=HealthStatus.HEALTHY):
+        with patch("bot.health.check.check_database_health", return_value=HealthStatus.HEALTHY):
+            with patch(
+                "bot.health.check.get_export_stats",
+                side_effect=RuntimeError("dictionary changed size during iteration")
+            ):
+                summary = await get_health_summary()
+
+    assert summary["status"] == "healthy"
+    assert summary["exports"] == {"error": "dictionary changed size during iteration"}
+    assert "bulk_jobs" in summary and "error" not in summary["bulk_jobs"]
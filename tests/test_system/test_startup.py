@@ -181,7 +181,7 @@ async def test_background_tasks_scheduler_initialization():
         # Verify scheduler is running
         status = get_scheduler_status()
         assert status["running"] is True
-        assert status["jobs_count"] == 3  # Three scheduled jobs
+        assert status["jobs_count"] == 8  # Eight scheduled jobs
     finally:
         # Stop background tasks to ensure cleanup
         stop_background_tasks()
@@ -207,9 +207,9 @@ async def test_background_tasks_scheduler_no_duplicate_start():
         start_background_tasks(mock_bot)
         start_background_tasks(mock_bot)  # Should warn but not duplicate
 
-        # Should still have only 3 jobs
+        # Should still have only 8 jobs
         status = get_scheduler_status()
-        assert status["jobs_count"] == 3
+        assert status["jobs_count"] == 8
     finally:
         # Cleanup
         stop_background_tasks()
@@ -3,6 +3,8 @@ VIP Token Flow Tests - Comprehensive tests for VIP token lifecycle.
 
 Tests cover:
 - Token generation (unique, 16-character tokens)
+- Bulk token generation (single transaction, collision retry)
+- Bulk CSV resend after a failed send (no second batch issued)
 - Token validation (valid, expired, used)
 - Token redemption (creates VIP subscription)
 - Double redemption prevention
@@ -261,6 +263,101 @@ async def test_token_uniqueness(test_session, mock_bot):
     assert len(tokens) == len(set(tokens)), "Generated tokens should be unique"
 
 
+async def test_generate_vip_token_retries_on_collision(test_session, mock_bot, monkeypatch):
+    """Verify a colliding token is retried via the unique constraint."""
+    subscription_service = SubscriptionService(test_session, mock_bot)
+    first = await subscription_service.generate_vip_token(generated_by=1, duration_hours=24)
+
+    candidates = iter([first.token, "FRESHTOKEN000001"])
+    monkeypatch.setattr(SubscriptionService, "_new_token_string", staticmethod(lambda: next(candidates)))
+
+    second = await subscription_service.generate_vip_token(generated_by=1, duration_hours=24)
+    assert second.token == "FRESHTOKEN000001"
+
+
+async def test_generate_vip_tokens_bulk(test_session, mock_bot):
+    """Verify bulk generation inserts N unique tokens linked to the plan."""
+    subscription_service = SubscriptionService(test_session, mock_bot)
+    subscription_service.BULK_TOKEN_BATCH_SIZE = 40
+
+    tokens = await subscription_service.generate_vip_tokens_bulk(
+        generated_by=123456789,
+        count=100,
+        duration_hours=48
+    )
+    await test_session.commit()
+
+    assert len(tokens) == 100
+    assert len(set(tokens)) == 100
+    assert all(len(token) == 16 for token in tokens)
+
+    stored = (await test_session.execute(select(InvitationToken))).scalars().all()
+    assert len(stored) == 100
+    assert {t.duration_hours for t in stored} == {48}
+    assert all(t.is_valid() for t in stored)
+
+
+async def test_generate_vip_tokens_bulk_collisions(test_session, mock_bot, monkeypatch):
+    """Verify colliding candidates are regenerated instead of failing the batch."""
+    subscription_service = SubscriptionService(test_session, mock_bot)
+    existing = await subscription_service.generate_vip_token(generated_by=1)
+
+    candidates = iter([existing.token, "BULKTOKEN0000001", "BULKTOKEN0000002", "BULKTOKEN0000003"])
+    monkeypatch.setattr(SubscriptionService, "_new_token_string", staticmethod(lambda: next(candidates)))
+
+    tokens = await subscription_service.generate_vip_tokens_bulk(generated_by=1, count=2)
+    assert sorted(tokens) == ["BULKTOKEN0000001", "BULKTOKEN0000002"]
+
+    with pytest.raises(ValueError):
+        await subscription_service.generate_vip_tokens_bulk(generated_by=1, count=0)
+    with pytest.raises(ValueError):
+        await subscription_service.generate_vip_tokens_bulk(
+            generated_by=1, count=SubscriptionService.MAX_BULK_TOKENS + 1
+        )
+
+
+async def test_bulk_tokens_send_failure_resends_same_batch(test_session, mock_bot):
+    """Verify a failed CSV send offers a resend of the committed batch, not a new one."""
+    from unittest.mock import AsyncMock, Mock
+
+    from bot.database.models import SubscriptionPlan
+    from bot.handlers.admin.vip import callback_bulk_tokens_resend, process_bulk_tokens_count
+
+    plan = SubscriptionPlan(name="Mensual", duration_days=30, price=9.99, created_by=1)
+    test_session.add(plan)
+    await test_session.commit()
+
+    sent = []
+
+    async def answer_document(document, **kwargs):
+        if not sent:
+            sent.append(None)
+            raise RuntimeError("Telegram timeout")
+        with open(document.path, encoding="utf-8") as file:
+            sent.append([line.split(",")[0] for line in file.read().splitlines()[1:]])
+
+    mock_bot.me = AsyncMock(return_value=Mock(username="test_bot"))
+    message = Mock(text="3", bot=mock_bot, from_user=Mock(id=1))
+    message.answer = AsyncMock()
+    message.answer_document = AsyncMock(side_effect=answer_document)
+    state = AsyncMock()
+    state.get_data.return_value = {"plan_id": plan.id}
+
+    await process_bulk_tokens_count(message, state, test_session)
+
+    keyboard = message.answer.await_args.kwargs["reply_markup"]
+    resend_data = keyboard.inline_keyboard[0][0].callback_data
+    assert resend_data.startswith(f"vip:bulk:resend:{plan.id}:")
+
+    callback = Mock(data=resend_data, bot=mock_bot, from_user=Mock(id=1), message=message)
+    callback.answer = AsyncMock()
+    await callback_bulk_tokens_resend(callback, test_session)
+
+    stored = (await test_session.execute(select(InvitationToken.token))).scalars().all()
+    assert len(stored) == 3
+    assert sorted(sent[1]) == sorted(stored)
+
+
 async def test_redeem_token_extends_existing_vip(test_session, mock_bot):
     """Verify redeeming token extends existing VIP subscription."""
     subscription_service = SubscriptionService(test_session, mock_bot)
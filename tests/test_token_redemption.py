@@ -0,0 +1,193 @@
+"""
+Tests del canje atómico de tokens (deep link /start).
+
+Valida:
+- Alta de suscriptor con stage=1 y duración del plan
+- Renovación: extiende si está vigente, parte de now si expiró (con unban)
+- status "expired" con expiry_date futura: conserva el tiempo restante y desbanea
+- Motivos de rechazo sin consumir el token (usado, expirado, sin plan, plan inactivo)
+- Dos canjes concurrentes del mismo token: solo uno gana
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from bot.database.base import Base
+from bot.database.enums import UserRole
+from bot.database.models import InvitationToken, SubscriptionPlan, User, VIPSubscriber
+from bot.services.subscription import SubscriptionService
+
+
+async def _seed(session, plan_active=True, users=(5001,)):
+    """Crea usuarios y un plan de 30 días."""
+    for user_id in users:
+        session.add(User(user_id=user_id, first_name=f"U{user_id}", role=UserRole.FREE))
+    plan = SubscriptionPlan(
+        name="Mensual", duration_days=30, price=9.99, active=plan_active, created_by=1
+    )
+    session.add(plan)
+    await session.commit()
+    return plan
+
+
+async def _token(service, session, plan_id, **overrides):
+    token = await service.generate_vip_token(generated_by=1, plan_id=plan_id)
+    for key, value in overrides.items():
+        setattr(token, key, value)
+    await session.commit()
+    return token
+
+
+@pytest.mark.asyncio
+async def test_claim_creates_subscriber(test_session, mock_bot):
+    """Test: Canje de token nuevo crea suscriptor y marca el token."""
+    plan = await _seed(test_session)
+    service = SubscriptionService(test_session, mock_bot)
+    token = await _token(service, test_session, plan.id)
+
+    success, plan_name, subscriber = await service.claim_and_activate_token(token.token, 5001)
+    await test_session.commit()
+
+    assert success is True
+    assert plan_name == "Mensual"
+    assert subscriber.vip_entry_stage == 1
+    assert subscriber.token_id == token.id
+    remaining = subscriber.expiry_date - datetime.utcnow()
+    assert timedelta(days=29, hours=23) < remaining <= timedelta(days=30)
+
+    await test_session.refresh(token)
+    assert (token.used, token.used_by) == (True, 5001)
+
+    # Segundo canje del mismo token
+    success, reason, _ = await service.claim_and_activate_token(token.token, 5001)
+    assert (success, reason) == (False, "used")
+
+
+@pytest.mark.asyncio
+async def test_claim_renews_existing_subscriber(test_session, mock_bot):
+    """Test: Renovación extiende vigentes y reinicia expirados (con unban)."""
+    plan = await _seed(test_session)
+    service = SubscriptionService(test_session, mock_bot)
+
+    first = await _token(service, test_session, plan.id)
+    _, _, subscriber = await service.claim_and_activate_token(first.token, 5001)
+    subscriber.vip_entry_stage = None  # Ritual completado
+    await test_session.commit()
+    original_expiry = subscriber.expiry_date
+
+    second = await _token(service, test_session, plan.id)
+    success, _, renewed = await service.claim_and_activate_token(second.token, 5001)
+    await test_session.commit()
+
+    assert success is True
+    assert renewed.id == subscriber.id
+    assert renewed.vip_entry_stage is None
+    assert renewed.expiry_date - original_expiry == timedelta(days=30)
+    mock_bot.unban_chat_member.assert_not_called()
+
+    # Suscripción expirada: parte desde ahora y desbanea
+    renewed.expiry_date = datetime.utcnow() - timedelta(days=1)
+    renewed.status = "expired"
+    await test_session.commit()
+
+    third = await _token(service, test_session, plan.id)
+    success, _, renewed = await service.claim_and_activate_token(third.token, 5001)
+    await test_session.commit()
+
+    assert renewed.status == "active"
+    assert renewed.token_id == third.id
+    assert timedelta(days=29) < renewed.expiry_date - datetime.utcnow() <= timedelta(days=30)
+    mock_bot.unban_chat_member.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_claim_expired_status_with_future_expiry(test_session, mock_bot):
+    """Test: Igual que activate_vip_subscription(), extiende por fecha y desbanea por status."""
+    plan = await _seed(test_session)
+    service = SubscriptionService(test_session, mock_bot)
+
+    first = await _token(service, test_session, plan.id)
+    _, _, subscriber = await service.claim_and_activate_token(first.token, 5001)
+    subscriber.status = "expired"  # Expulsado antes de su fecha
+    await test_session.commit()
+    original_expiry = subscriber.expiry_date
+
+    second = await _token(service, test_session, plan.id)
+    success, _, renewed = await service.claim_and_activate_token(second.token, 5001)
+    await test_session.commit()
+
+    assert success is True
+    assert renewed.status == "active"
+    assert renewed.expiry_date - original_expiry == timedelta(days=30)
+    mock_bot.unban_chat_member.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_claim_rejection_reasons(test_session, mock_bot):
+    """Test: Rechazos explican el motivo y no consumen el token."""
+    plan = await _seed(test_session)
+    inactive_plan = SubscriptionPlan(
+        name="Viejo", duration_days=7, price=1.0, active=False, created_by=1
+    )
+    test_session.add(inactive_plan)
+    await test_session.commit()
+    service = SubscriptionService(test_session, mock_bot)
+
+    expired = await _token(
+        service, test_session, plan.id, created_at=datetime.utcnow() - timedelta(hours=25)
+    )
+    no_plan = await _token(service, test_session, None)
+    inactive = await _token(service, test_session, inactive_plan.id)
+
+    cases = [
+        ("NOEXISTE12345678", "invalid"),
+        (expired.token, "expired"),
+        (no_plan.token, "no_plan"),
+        (inactive.token, "plan_inactive"),
+    ]
+    for token_str, expected in cases:
+        success, reason, subscriber = await service.claim_and_activate_token(token_str, 5001)
+        assert (success, reason, subscriber) == (False, expected, None)
+
+    used = (await test_session.execute(
+        select(InvitationToken).where(InvitationToken.used.is_(True))
+    )).scalars().all()
+    assert used == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_single_winner(tmp_path, mock_bot):
+    """Test: Dos canjes simultáneos del mismo token → solo uno tiene éxito."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'redeem.db'}",
+        connect_args={"timeout": 10}
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        plan = await _seed(session, users=(6001, 6002))
+        service = SubscriptionService(session, mock_bot)
+        token_str = (await _token(service, session, plan.id)).token
+
+    async def redeem(user_id):
+        async with session_factory() as session:
+            result = await SubscriptionService(session, mock_bot).claim_and_activate_token(
+                token_str, user_id
+            )
+            await session.commit()
+            return result
+
+    results = await asyncio.gather(redeem(6001), redeem(6002))
+    assert sorted(success for success, _, _ in results) == [False, True]
+    assert [reason for success, reason, _ in results if not success] == ["used"]
+
+    async with session_factory() as session:
+        subscribers = (await session.execute(select(VIPSubscriber))).scalars().all()
+        assert len(subscribers) == 1
+
+    await engine.dispose()
@@ -0,0 +1,130 @@
+"""
+Tests del User Search Service - Directorio de usuarios indexado.
+
+Valida:
+- Normalización de términos (minúsculas, sin acentos, sin '@')
+- Índice sincronizado en cada alta/edición de User (get_or_create_user)
+- Búsqueda por ID, prefijo de username y de nombre/apellido
+- Ranking (exacto > prefijo > difuso) y búsqueda difusa con errores de tipeo
+- Reconstrucción del índice
+"""
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import select
+
+from bot.database.enums import UserRole
+from bot.database.models import User, UserSearchTerm
+from bot.services.user import UserService
+from bot.services.user_management import UserManagementService
+from bot.database.search import build_user_search_terms, normalize_search_text
+from bot.services.user_search import UserSearchService
+
+
+def _telegram_user(user_id, username, first_name, last_name=None):
+    tg_user = Mock()
+    tg_user.id = user_id
+    tg_user.username = username
+    tg_user.first_name = first_name
+    tg_user.last_name = last_name
+    return tg_user
+
+
+async def _create_users(session):
+    service = UserService(session)
+    for tg_user in (
+        _telegram_user(1, "juanito", "Juan", "Pérez"),
+        _telegram_user(2, "mariana_g", "Mariana", "Gómez"),
+        _telegram_user(3, "juan", "Carlos", "Ruiz"),
+        _telegram_user(4, None, "José Luis", "Juárez"),
+    ):
+        await service.get_or_create_user(tg_user)
+    await session.commit()
+
+
+def test_normalize_and_build_terms():
+    """Test: Términos normalizados sin acentos ni '@'."""
+    assert normalize_search_text("@José_Pérez") == "jose_perez"
+    assert normalize_search_text(None) == ""
+    assert build_user_search_terms("Pepe_99", "José Luis", "Núñez") == {
+        ("pepe_99", "username"),
+        ("99", "part"),
+        ("jose", "name"),
+        ("luis", "name"),
+        ("nunez", "name"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_prefix_search_ranked(test_session):
+    """Test: Username exacto primero, luego prefijos de username y nombre."""
+    await _create_users(test_session)
+    service = UserSearchService(test_session)
+
+    results = await service.search("juan")
+    assert [u.user_id for u in results] == [3, 1, 4]
+
+    # Nombre + apellido, sin acentos y en mayúsculas
+    results = await service.search("JOSE jua")
+    assert [u.user_id for u in results] == [4]
+
+    results = await service.search("@mari")
+    assert [u.user_id for u in results] == [2]
+
+
+@pytest.mark.asyncio
+async def test_search_by_id_and_fuzzy(test_session):
+    """Test: ID exacto y coincidencia difusa con error de tipeo."""
+    await _create_users(test_session)
+    management = UserManagementService(test_session, bot=Mock())
+
+    results = await management.search_users("2")
+    assert [u.user_id for u in results] == [2]
+
+    # "gomes" no es prefijo de nada, pero es similar a "gomez"
+    results = await management.search_users("gomes")
+    assert [u.user_id for u in results] == [2]
+
+    assert await management.search_users("zzzzzz") == []
+
+
+@pytest.mark.asyncio
+async def test_index_follows_profile_updates(test_session):
+    """Test: Cambios de username/nombre actualizan el índice."""
+    await _create_users(test_session)
+    service = UserService(test_session)
+
+    await service.get_or_create_user(_telegram_user(2, "mgomez", "Mariana", "Gómez"))
+    await test_session.commit()
+
+    terms = (await test_session.execute(
+        select(UserSearchTerm.term).where(
+            UserSearchTerm.user_id == 2, UserSearchTerm.field == "username"
+        )
+    )).scalars().all()
+    assert terms == ["mgomez"]
+
+    search = UserSearchService(test_session)
+    assert [u.user_id for u in await search.search("mgo")] == [2]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_index(test_session):
+    """Test: rebuild_index indexa usuarios insertados fuera del ORM."""
+    await test_session.execute(User.__table__.insert().values(
+        user_id=10, username="ghost", first_name="Fantasma", role=UserRole.FREE,
+        created_at=datetime.utcnow(), updated_at=datetime.utcnow()
+    ))
+    await test_session.commit()
+
+    service = UserSearchService(test_session)
+    assert await service.search("ghost") == []
+
+    indexed = await service.rebuild_index(batch_size=1)
+    await test_session.commit()
+
+    assert indexed == 1
+    assert [u.user_id for u in await service.search("fantas")] == [10]
+    terms = (await test_session.execute(select(UserSearchTerm))).scalars().all()
+    assert len(terms) == 2
@@ -6,15 +6,20 @@ Valida:
 - Obtención de usuarios
 - Cambio de roles
 - Verificación de roles
+- Upsert de una sentencia y write-behind de perfiles
 """
+import asyncio
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from bot.database.models import User
+from bot.database.base import Base
+from bot.database.models import User, UserSearchTerm
 from bot.database.enums import UserRole
-from bot.services.user import UserService
+from bot.services.user import UserService, profile_buffer
 
 
 @pytest.mark.asyncio
@@ -278,3 +283,98 @@ async def test_get_users_by_role(test_session):
     assert len(free_users) >= 2
     assert len(vip_users) >= 1
     assert len(admin_users) >= 1
+
+
+def _telegram_user(user_id, username, first_name, last_name=None):
+    telegram_user = Mock()
+    telegram_user.id = user_id
+    telegram_user.username = username
+    telegram_user.first_name = first_name
+    telegram_user.last_name = last_name
+    return telegram_user
+
+
+async def _search_terms(session, user_id):
+    result = await session.execute(
+        select(UserSearchTerm.term).where(UserSearchTerm.user_id == user_id)
+    )
+    return set(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_upsert_user_skips_unchanged_and_reindexes_changes(test_session):
+    """Test: Perfil igual no reescribe la fila; perfil nuevo actualiza e indexa."""
+    service = UserService(test_session)
+
+    user = await service.get_or_create_user(
+        _telegram_user(300, "old_name", "Ana"), default_role=UserRole.VIP
+    )
+    await test_session.commit()
+    created_updated_at = user.updated_at
+    assert await _search_terms(test_session, 300) == {"old_name", "name", "ana"}
+
+    same = await service.get_or_create_user(_telegram_user(300, "old_name", "Ana"))
+    assert same is user
+    assert same.updated_at == created_updated_at
+
+    changed = await service.upsert_user(300, "nuevo", "Ana", "López")
+    await test_session.commit()
+
+    assert changed is user
+    assert (changed.username, changed.last_name) == ("nuevo", "López")
+    assert changed.role == UserRole.VIP  # El rol solo se aplica al crear
+    assert changed.updated_at > created_updated_at
+    assert await _search_terms(test_session, 300) == {"nuevo", "ana", "lopez"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upserts_single_user(tmp_path):
+    """Test: Altas simultáneas del mismo usuario no chocan en el INSERT."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'users.db'}",
+        connect_args={"timeout": 10}
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def join(first_name):
+        async with session_factory() as session:
+            user = await UserService(session).upsert_user(400, "burst", first_name, None)
+            await session.commit()
+            return user.user_id
+
+    assert await asyncio.gather(*(join(f"N{i}") for i in range(5))) == [400] * 5
+
+    async with session_factory() as session:
+        users = (await session.execute(select(User))).scalars().all()
+        assert len(users) == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_profile_write_behind_coalesces(test_session):
+    """Test: Con write-behind, refrescos repetidos se escriben una sola vez."""
+    service = UserService(test_session)
+    await service.get_or_create_user(_telegram_user(500, "first", "Leo"))
+    await service.get_or_create_user(_telegram_user(501, "steady", "Mia"))
+    await test_session.commit()
+
+    profile_buffer.drain()
+    coalesced_before = profile_buffer.coalesced
+    with patch("config.Config.USER_PROFILE_FLUSH_SECONDS", 30):
+        for username in ("second", "third", "fourth"):
+            user = await service.get_or_create_user(_telegram_user(500, username, "Leo"))
+            assert user.username == "first"  # Aún no escrito
+        await service.get_or_create_user(_telegram_user(501, "steady", "Mia"))
+
+        assert len(profile_buffer) == 1
+        assert profile_buffer.coalesced - coalesced_before == 2
+
+        assert await service.flush_profile_updates() == 1
+        await test_session.commit()
+
+    assert len(profile_buffer) == 0
+    assert user.username == "fourth"
+    assert await _search_terms(test_session, 500) == {"fourth", "leo"}
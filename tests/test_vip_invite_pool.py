@@ -0,0 +1,114 @@
+"""
+Tests del pool de enlaces de invitación VIP pre-generados.
+
+Valida:
+- replenish() llena el pool por lotes con enlaces de un solo uso
+- claim() entrega cada enlace una sola vez y respeta la validez mínima
+- retire_stale() revoca enlaces que ya no cubren la validez mínima
+- create_24h_invite_link() usa el pool y vuelve a la API si está vacío
+"""
+import itertools
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import select
+
+from bot.database.models import VIPInviteLink, VIPSubscriber
+from bot.services.vip_invite_pool import VIPInvitePoolService
+from config import Config
+
+CHANNEL_ID = "-1001234567890"
+
+
+@pytest.fixture
+def pool_bot(mock_bot):
+    """Bot cuyo create_chat_invite_link devuelve enlaces distintos."""
+    counter = itertools.count(1)
+    mock_bot.create_chat_invite_link = AsyncMock(
+        side_effect=lambda **kwargs: Mock(invite_link=f"https://t.me/+pool{next(counter)}")
+    )
+    mock_bot.revoke_chat_invite_link = AsyncMock()
+    return mock_bot
+
+
+@pytest.fixture
+def pool_config(monkeypatch):
+    monkeypatch.setattr(Config, "VIP_INVITE_POOL_SIZE", 4)
+    monkeypatch.setattr(Config, "VIP_INVITE_POOL_BATCH_SIZE", 3)
+
+
+async def test_replenish_in_batches(test_session, pool_bot, pool_config):
+    pool = VIPInvitePoolService(test_session, pool_bot)
+
+    assert await pool.replenish(CHANNEL_ID) == 3
+    assert await pool.replenish(CHANNEL_ID) == 1
+    assert await pool.replenish(CHANNEL_ID) == 0
+    assert await pool.count_available(CHANNEL_ID) == 4
+
+    kwargs = pool_bot.create_chat_invite_link.await_args.kwargs
+    assert kwargs["member_limit"] == 1
+
+
+async def test_claim_is_single_use(test_session, pool_bot, pool_config):
+    pool = VIPInvitePoolService(test_session, pool_bot)
+    await pool.replenish(CHANNEL_ID)
+
+    claimed = [await pool.claim(CHANNEL_ID, user_id) for user_id in (1, 2, 3, 4)]
+
+    assert len({link.invite_link for link in claimed[:3]}) == 3
+    assert [link.claimed_by for link in claimed[:3]] == [1, 2, 3]
+    assert claimed[3] is None  # Pool agotado
+    assert await pool.count_available(CHANNEL_ID) == 0
+
+
+async def test_stale_links_revoked_not_claimed(test_session, pool_bot, pool_config):
+    pool = VIPInvitePoolService(test_session, pool_bot)
+    test_session.add(VIPInviteLink(
+        channel_id=CHANNEL_ID,
+        invite_link="https://t.me/+casi_vencido",
+        expire_date=datetime.utcnow() + timedelta(hours=2)
+    ))
+    await test_session.flush()
+
+    assert await pool.claim(CHANNEL_ID, 1) is None
+
+    result = await pool.maintain(CHANNEL_ID)
+    assert result == {"retired": 1, "created": 3, "depth": 3}
+    pool_bot.revoke_chat_invite_link.assert_awaited_once()
+
+    links = (await test_session.execute(select(VIPInviteLink.invite_link))).scalars().all()
+    assert "https://t.me/+casi_vencido" not in links
+
+
+async def test_entry_link_from_pool_with_fallback(
+    test_session, pool_bot, pool_config, test_vip_user, test_invitation_token
+):
+    from bot.services.config import ConfigService
+    from bot.services.vip_entry import VIPEntryService
+
+    config = await ConfigService(test_session).get_config()
+    config.vip_channel_id = CHANNEL_ID
+    subscriber = VIPSubscriber(
+        user_id=test_vip_user.user_id,
+        expiry_date=datetime.utcnow() + timedelta(days=30),
+        token_id=test_invitation_token.id,
+        vip_entry_stage=3
+    )
+    test_session.add(subscriber)
+    await test_session.flush()
+
+    service = VIPEntryService(test_session, pool_bot)
+
+    # Pool vacío: se crea en el momento
+    fallback = await service.create_24h_invite_link(test_vip_user.user_id)
+    assert fallback.invite_link == "https://t.me/+pool1"
+
+    await service.invite_pool.replenish(CHANNEL_ID)
+    calls = pool_bot.create_chat_invite_link.await_count
+    pooled = await service.create_24h_invite_link(test_vip_user.user_id)
+
+    assert pooled.invite_link.startswith("https://t.me/+pool")
+    assert pooled.member_limit == 1
+    assert pool_bot.create_chat_invite_link.await_count == calls
+    assert subscriber.invite_link_sent_at is not None